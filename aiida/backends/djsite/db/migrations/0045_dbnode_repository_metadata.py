@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add the `repository_metadata` column to the `DbNode` database model."""
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error,no-member
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations
+
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.45'
+DOWN_REVISION = '1.0.44'
+
+
+class Migration(migrations.Migration):
+    """Add the `repository_metadata` column to the `DbNode` database model."""
+
+    dependencies = [
+        ('db', '0044_dbgroup_type_string'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dbnode',
+            name='repository_metadata',
+            field=django.contrib.postgres.fields.jsonb.JSONField(default=None, null=True),
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
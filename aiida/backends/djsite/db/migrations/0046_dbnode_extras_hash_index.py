@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add an expression index on the `_aiida_hash` extra of the `DbNode` database model.
+
+The index is used to look up nodes with the same hash when caching is enabled, which would otherwise require a
+sequential scan of the node table. Note that the expression has to be identical to the one generated by the query
+builder for an equality filter on the extra: `extras #>> '{_aiida_hash}'`.
+"""
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.46'
+DOWN_REVISION = '1.0.45'
+
+
+class Migration(migrations.Migration):
+    """Add an expression index on the `_aiida_hash` extra of the `DbNode` database model."""
+
+    dependencies = [
+        ('db', '0045_dbnode_repository_metadata'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=r"""CREATE INDEX db_dbnode_extras_aiida_hash_idx ON db_dbnode ((extras #>> '{_aiida_hash}'));""",
+            reverse_sql=r"""DROP INDEX db_dbnode_extras_aiida_hash_idx;"""
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add the `db_dbnodestatistics` table with the node creation statistics and the triggers that maintain it.
+
+The table is populated with the statistics of the existing nodes. See
+:mod:`aiida.backends.general.migrations.node_statistics` for a description of the table.
+"""
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations, models
+
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+from aiida.backends.general.migrations.node_statistics import (
+    CREATE_NODE_STATISTICS, POPULATE_NODE_STATISTICS, DROP_NODE_STATISTICS
+)
+
+REVISION = '1.0.47'
+DOWN_REVISION = '1.0.46'
+
+
+class Migration(migrations.Migration):
+    """Add the `db_dbnodestatistics` table with the node creation statistics and the triggers that maintain it."""
+
+    dependencies = [
+        ('db', '0046_dbnode_extras_hash_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=CREATE_NODE_STATISTICS + POPULATE_NODE_STATISTICS,
+            reverse_sql=DROP_NODE_STATISTICS,
+            state_operations=[
+                migrations.CreateModel(
+                    name='DbNodeStatistics',
+                    fields=[
+                        (
+                            'id',
+                            models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')
+                        ),
+                        ('user_id', models.IntegerField(db_index=True)),
+                        ('day', models.DateField()),
+                        ('node_type', models.CharField(max_length=255)),
+                        ('count', models.IntegerField()),
+                        ('compacted', models.BooleanField(default=False)),
+                    ],
+                ),
+            ]
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,too-few-public-methods
+"""Add expression indexes on the `process_state`, `process_label` and `paused` attributes of the `DbNode` model.
+
+These are the attributes that `verdi process list` filters on, which would otherwise require a sequential scan of the
+node table. Note that the expressions have to be identical to the ones generated by the query builder for an equality
+filter on the attributes, e.g. `attributes #>> '{process_state}'`.
+"""
+
+# Remove when https://github.com/PyCQA/pylint/issues/1931 is fixed
+# pylint: disable=no-name-in-module,import-error
+from django.db import migrations
+from aiida.backends.djsite.db.migrations import upgrade_schema_version
+
+REVISION = '1.0.48'
+DOWN_REVISION = '1.0.47'
+
+
+class Migration(migrations.Migration):
+    """Add expression indexes on the `process_state`, `process_label` and `paused` attributes of `DbNode`."""
+
+    dependencies = [
+        ('db', '0047_dbnode_statistics'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=r"""
+                CREATE INDEX db_dbnode_attributes_process_state_idx ON db_dbnode ((attributes #>> '{process_state}'));
+                CREATE INDEX db_dbnode_attributes_process_label_idx ON db_dbnode ((attributes #>> '{process_label}'));
+                CREATE INDEX db_dbnode_attributes_paused_idx ON db_dbnode ((attributes #>> '{paused}'));
+                """,
+            reverse_sql=r"""
+                DROP INDEX db_dbnode_attributes_paused_idx;
+                DROP INDEX db_dbnode_attributes_process_label_idx;
+                DROP INDEX db_dbnode_attributes_process_state_idx;
+                """
+        ),
+        upgrade_schema_version(REVISION, DOWN_REVISION)
+    ]
@@ -21,7 +21,7 @@ class DeserializationException(AiidaException):
     pass
 
 
-LATEST_MIGRATION = '0044_dbgroup_type_string'
+LATEST_MIGRATION = '0048_dbnode_process_attributes_indexes'
 
 
 def _update_schema_version(version, apps, _):
@@ -127,6 +127,8 @@ class DbNode(m.Model):
     attributes = JSONField(default=dict, null=True)
     # JSON Extras
     extras = JSONField(default=dict, null=True)
+    # Virtual file hierarchy of the objects in the repository object store, `None` if stored in a repository folder
+    repository_metadata = JSONField(default=None, null=True)
 
     objects = m.Manager()
     # Return aiida Node instances or their subclasses instead of DbNode instances
@@ -364,6 +366,19 @@ class DbLog(m.Model):
         return 'DbLog: {} for node {}: {}'.format(self.levelname, self.dbnode.id, self.message)
 
 
+class DbNodeStatistics(m.Model):
+    """Class to store the node creation statistics.
+
+    The rows are inserted by database triggers on the node table, see
+    :mod:`aiida.backends.general.migrations.node_statistics`, and are not meant to be created through this model.
+    """
+    user_id = m.IntegerField(db_index=True)
+    day = m.DateField()
+    node_type = m.CharField(max_length=255)
+    count = m.IntegerField()
+    compacted = m.BooleanField(default=False)
+
+
 @contextlib.contextmanager
 def suppress_auto_now(list_of_models_fields):
     """
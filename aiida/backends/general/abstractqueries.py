@@ -14,6 +14,9 @@ import abc
 class AbstractQueryManager(abc.ABC):
     """Manage AiiDA queries."""
 
+    # Number of rows of the node statistics table that are not compacted yet, beyond which they are compacted on read
+    CREATION_STATISTICS_COMPACT_THRESHOLD = 10000
+
     def __init__(self, backend):
         """
         :param backend: The AiiDA backend
@@ -43,11 +46,131 @@ class AbstractQueryManager(abc.ABC):
             with self._backend.cursor() as cursor:
                 cursor.execute(query)
 
+    def traverse_graph(self, starting_pks, links_forward=(), links_backward=(), max_iterations=None, get_links=False):
+        """Return the nodes that can be reached from the starting nodes by following links of the given types.
+
+        The traversal runs in the database: the visited nodes are collected in a temporary table, which is extended
+        with the neighbours of the nodes found in the previous iteration by a single statement per iteration, such
+        that only the final sets of nodes and links are sent back. The result is the same as that of the rule based
+        implementation in :py:func:`aiida.tools.graph.graph_traversers.traverse_graph`.
+
+        :param starting_pks: the pks of the starting nodes
+        :param links_forward: the values of the link types that should be traversed in the forward direction
+        :param links_backward: the values of the link types that should be traversed in the backward direction
+        :param max_iterations: the maximum number of iterations, or None to iterate until no new nodes are found
+        :param get_links: if True, also return the links that were traversed
+        :return: tuple of the set of node pks and the set of link tuples `(input_id, output_id, type, label)`, where the
+            latter is None if `get_links` is False
+        :raises `~aiida.common.exceptions.NotExistent`: if any of the starting nodes does not exist
+        """
+        from sqlalchemy import text
+        from aiida.common import exceptions
+
+        session = self._backend.get_session()
+        parameters = {'pks': list(starting_pks), 'forward': list(links_forward), 'backward': list(links_backward)}
+
+        # For each direction, the links that are traversed from the nodes at depth `:depth` of the table
+        traversals = []
+        if links_forward:
+            traversals.append(
+                'SELECT link.input_id, link.output_id, link.type, link.label, link.output_id AS neighbour '
+                'FROM traverse_graph_nodes AS walker JOIN db_dblink AS link ON link.input_id = walker.id '
+                'WHERE walker.depth {} :depth AND link.type = ANY(:forward)'
+            )
+        if links_backward:
+            traversals.append(
+                'SELECT link.input_id, link.output_id, link.type, link.label, link.input_id AS neighbour '
+                'FROM traverse_graph_nodes AS walker JOIN db_dblink AS link ON link.output_id = walker.id '
+                'WHERE walker.depth {} :depth AND link.type = ANY(:backward)'
+            )
+
+        # The statements run within a savepoint, such that if any of them fails, only the savepoint is rolled back,
+        # which also removes the temporary table, and the caller neither is left with an aborted transaction nor loses
+        # the changes that are pending in its session
+        with session.begin_nested():
+            session.execute(text('DROP TABLE IF EXISTS traverse_graph_nodes'))
+            session.execute(
+                text(
+                    'CREATE TEMPORARY TABLE traverse_graph_nodes (id integer PRIMARY KEY, depth integer NOT NULL) '
+                    'ON COMMIT DROP'
+                )
+            )
+            inserted = session.execute(
+                text('INSERT INTO traverse_graph_nodes (id, depth) SELECT id, 0 FROM db_dbnode WHERE id = ANY(:pks)'),
+                parameters
+            ).rowcount
+
+            if inserted != len(set(starting_pks)):
+                missing_pks = set(starting_pks).difference(
+                    pk for pk, in session.execute(text('SELECT id FROM traverse_graph_nodes'))
+                )
+            else:
+                missing_pks = None
+                nodes, links = self._traverse_graph_nodes(session, traversals, parameters, max_iterations, get_links)
+
+            session.execute(text('DROP TABLE IF EXISTS traverse_graph_nodes'))
+
+        if missing_pks:
+            raise exceptions.NotExistent(
+                'The following pks are not in the database and must be pruned before this call: {}'.format(missing_pks)
+            )
+
+        return nodes, links
+
     @staticmethod
-    def get_creation_statistics(user_pk=None):
+    def _traverse_graph_nodes(session, traversals, parameters, max_iterations, get_links):
+        """Extend the `traverse_graph_nodes` table with the neighbours of its nodes until no new nodes are found.
+
+        :param session: the session in which the temporary table was created
+        :param traversals: the statements that select the links traversed from the nodes at a given depth
+        :param parameters: the parameters of the traversal statements
+        :param max_iterations: the maximum number of iterations, or None to iterate until no new nodes are found
+        :param get_links: if True, also return the links that were traversed
+        :return: tuple of the set of node pks and the set of link tuples or None
+        """
+        from sqlalchemy import text
+
+        # The nodes at the current depth are the walkers: each iteration adds their neighbours that were not yet
+        # visited with an incremented depth, until no new nodes are found or the maximum number of iterations is done
+        insert_neighbours = text(
+            'INSERT INTO traverse_graph_nodes (id, depth) SELECT DISTINCT neighbour, :depth + 1 FROM ({}) AS links '
+            'WHERE NOT EXISTS (SELECT 1 FROM traverse_graph_nodes AS node WHERE node.id = links.neighbour)'.format(
+                ' UNION ALL '.join(traversal.format('=') for traversal in traversals)
+            )
+        )
+
+        depth = 0
+        while traversals and (max_iterations is None or depth < max_iterations):
+            inserted = session.execute(insert_neighbours, dict(parameters, depth=depth)).rowcount
+            depth += 1
+            if not inserted:
+                break
+
+        nodes = {pk for pk, in session.execute(text('SELECT id FROM traverse_graph_nodes'))}
+        links = set() if get_links else None
+
+        if get_links and traversals:
+            # The links that were traversed from the nodes that were walkers in any of the iterations
+            select_links = text(
+                'SELECT DISTINCT input_id, output_id, type, label FROM ({}) AS links'.format(
+                    ' UNION ALL '.join(traversal.format('<') for traversal in traversals)
+                )
+            )
+            links = {tuple(row) for row in session.execute(select_links, dict(parameters, depth=depth))}
+
+        return nodes, links
+
+    def get_creation_statistics(self, user_pk=None):
         """
         Return a dictionary with the statistics of node creation, summarized by day.
 
+        The statistics are read from the `db_dbnodestatistics` table, which is maintained by triggers on the node
+        table, such that they do not require a scan of the node table. The session of the caller only reads from the
+        table. Once the number of rows that the triggers added since the last compaction reaches
+        `CREATION_STATISTICS_COMPACT_THRESHOLD`, they are first compacted by :meth:`refresh_creation_statistics`, which
+        runs on a dedicated connection, such that the cost of reading the statistics does not grow with the number of
+        nodes that were stored.
+
         :note: Days when no nodes were created are not present in the returned `ctime_by_day` dictionary.
 
         :param user_pk: If None (default), return statistics for all users.
@@ -61,63 +184,73 @@ class AbstractQueryManager(abc.ABC):
                    "types": {TYPESTRING1: count, TYPESTRING2: count, ...},
                    "ctime_by_day": {'YYYY-MMM-DD': count, ...}
 
-            where in `ctime_by_day` the key is a string in the format 'YYYY-MM-DD' and the value is
-            an integer with the number of nodes created that day.
+            where in `ctime_by_day` the key is a string in the format 'YYYY-MM-DD' of the day in UTC and the value
+            is an integer with the number of nodes created that day.
         """
-        import datetime
-        from collections import Counter
-        from aiida.orm import User, Node, QueryBuilder
-
-        def count_statistics(dataset):
-
-            def get_statistics_dict(dataset):
-                results = {}
-                for count, typestring in sorted((v, k) for k, v in dataset.items())[::-1]:
-                    results[typestring] = count
-                return results
+        from sqlalchemy import text
 
-            count_dict = {}
+        session = self._backend.get_session()
 
-            types = Counter([r[2] for r in dataset])
-            count_dict['types'] = get_statistics_dict(types)
+        # The count is bounded by the threshold, such that it only scans the partial index of uncompacted rows up to it
+        limit = self.CREATION_STATISTICS_COMPACT_THRESHOLD
+        sql = 'SELECT COUNT(*) FROM (SELECT 1 FROM db_dbnodestatistics WHERE NOT compacted LIMIT :limit) AS rows'
 
-            ctimelist = [r[1].strftime('%Y-%m-%d') for r in dataset]
-            ctime = Counter(ctimelist)
+        if session.execute(text(sql), {'limit': limit}).scalar() >= limit:
+            self.refresh_creation_statistics(rebuild=False)
 
-            if ctimelist:
+        condition = '' if user_pk is None else 'WHERE user_id = :user_pk'
+        parameters = {'user_pk': user_pk}
 
-                # For the way the string is formatted, we can just sort it alphabetically
-                firstdate = datetime.datetime.strptime(sorted(ctimelist)[0], '%Y-%m-%d')
-                lastdate = datetime.datetime.strptime(sorted(ctimelist)[-1], '%Y-%m-%d')
-
-                curdate = firstdate
-                outdata = {}
-
-                while curdate <= lastdate:
-                    curdatestring = curdate.strftime('%Y-%m-%d')
-                    outdata[curdatestring] = ctime.get(curdatestring, 0)
-                    curdate += datetime.timedelta(days=1)
-                count_dict['ctime_by_day'] = outdata
+        types = session.execute(
+            text(
+                'SELECT node_type, SUM(count) FROM db_dbnodestatistics {} GROUP BY node_type '
+                'HAVING SUM(count) <> 0'.format(condition)
+            ), parameters
+        )
+        days = session.execute(
+            text(
+                'SELECT day, SUM(count) FROM db_dbnodestatistics {} GROUP BY day HAVING SUM(count) <> 0 '
+                'ORDER BY day'.format(condition)
+            ), parameters
+        )
 
-            else:
-                count_dict['ctime_by_day'] = {}
+        retdict = {}
+        retdict['types'] = {node_type: int(count) for node_type, count in types}
+        retdict['ctime_by_day'] = {day.strftime('%Y-%m-%d'): int(count) for day, count in days}
+        retdict['total'] = sum(retdict['types'].values())
 
-            return count_dict
+        return retdict
 
-        statistics = {}
+    def refresh_creation_statistics(self, rebuild=True):
+        """
+        Compact or rebuild the `db_dbnodestatistics` table, which contains the statistics of node creation.
 
-        q_build = QueryBuilder()
-        q_build.append(Node, project=['id', 'ctime', 'type'], tag='node')
+        The statements run on a dedicated connection and transaction, such that no pending changes of the session of
+        the caller are committed.
 
-        if user_pk is not None:
-            q_build.append(User, with_node='node', project='email', filters={'pk': user_pk})
-        qb_res = q_build.all()
+        :param rebuild: if True, rebuild the table from the node table, which is locked against concurrent changes while
+            the statistics are rebuilt. If False, only compact the rows that were added by the triggers into a single
+            row per user, day and node type, which does not lock the node table.
+        """
+        from sqlalchemy import text
+        from aiida.backends.general.migrations.node_statistics import POPULATE_NODE_STATISTICS
 
-        # total count
-        statistics['total'] = len(qb_res)
-        statistics.update(count_statistics(qb_res))
+        engine = self._backend.get_session().get_bind().engine
 
-        return statistics
+        with engine.begin() as connection:
+            if rebuild:
+                connection.execute(text('LOCK TABLE db_dbnode IN SHARE MODE'))
+                connection.execute(text('DELETE FROM db_dbnodestatistics'))
+                connection.execute(text(POPULATE_NODE_STATISTICS))
+            else:
+                connection.execute(
+                    text(
+                        'WITH deleted AS (DELETE FROM db_dbnodestatistics RETURNING user_id, day, node_type, count) '
+                        'INSERT INTO db_dbnodestatistics (user_id, day, node_type, count, compacted) '
+                        'SELECT user_id, day, node_type, SUM(count), true FROM deleted '
+                        'GROUP BY user_id, day, node_type HAVING SUM(count) <> 0'
+                    )
+                )
 
     @staticmethod
     def _extract_formula(akinds, asites, args):
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""SQL statements for the table of node creation statistics, which are shared by the migrations of both backends.
+
+The table contains the number of nodes per user, day of creation and node type. It is maintained by triggers on the
+node table, that insert a row with a count of +1 for every node that is stored and a row with a count of -1 for every
+node that is deleted. Since rows are only ever inserted, concurrent transactions that store nodes never wait for each
+other, which is also why the primary key is a surrogate `id` rather than the user, day and node type. The rows with the
+same user, day and node type are summed by
+:meth:`aiida.backends.general.abstractqueries.AbstractQueryManager.get_creation_statistics` and compacted by
+:meth:`aiida.backends.general.abstractqueries.AbstractQueryManager.refresh_creation_statistics` into a single row that
+is marked as `compacted`. The partial index on the rows that are not compacted yet allows to count them cheaply, such
+that they can be compacted once they accumulate. The day is that of the creation time in UTC. The table is mirrored by
+the `DbNodeStatistics` models of both backends.
+"""
+
+CREATE_NODE_STATISTICS = """
+    CREATE TABLE db_dbnodestatistics (
+        id serial PRIMARY KEY,
+        user_id integer NOT NULL,
+        day date NOT NULL,
+        node_type varchar(255) NOT NULL,
+        count integer NOT NULL,
+        compacted boolean NOT NULL DEFAULT false
+    );
+
+    CREATE INDEX db_dbnodestatistics_user_id_idx ON db_dbnodestatistics (user_id);
+    CREATE INDEX db_dbnodestatistics_uncompacted_idx ON db_dbnodestatistics (id) WHERE NOT compacted;
+
+    CREATE FUNCTION update_node_statistics() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            INSERT INTO db_dbnodestatistics (user_id, day, node_type, count)
+            VALUES (OLD.user_id, CAST(OLD.ctime AT TIME ZONE 'UTC' AS date), OLD.node_type, -1);
+        END IF;
+        IF TG_OP IN ('UPDATE', 'INSERT') THEN
+            INSERT INTO db_dbnodestatistics (user_id, day, node_type, count)
+            VALUES (NEW.user_id, CAST(NEW.ctime AT TIME ZONE 'UTC' AS date), NEW.node_type, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE TRIGGER db_dbnode_statistics AFTER INSERT OR DELETE ON db_dbnode
+        FOR EACH ROW EXECUTE PROCEDURE update_node_statistics();
+
+    CREATE TRIGGER db_dbnode_statistics_update AFTER UPDATE OF user_id, ctime, node_type ON db_dbnode
+        FOR EACH ROW WHEN (
+            OLD.user_id IS DISTINCT FROM NEW.user_id OR
+            OLD.ctime IS DISTINCT FROM NEW.ctime OR
+            OLD.node_type IS DISTINCT FROM NEW.node_type
+        )
+        EXECUTE PROCEDURE update_node_statistics();
+"""
+
+POPULATE_NODE_STATISTICS = """
+    INSERT INTO db_dbnodestatistics (user_id, day, node_type, count, compacted)
+    SELECT user_id, CAST(ctime AT TIME ZONE 'UTC' AS date), node_type, COUNT(*), true FROM db_dbnode GROUP BY 1, 2, 3;
+"""
+
+DROP_NODE_STATISTICS = """
+    DROP TRIGGER db_dbnode_statistics_update ON db_dbnode;
+    DROP TRIGGER db_dbnode_statistics ON db_dbnode;
+    DROP FUNCTION update_node_statistics();
+    DROP TABLE db_dbnodestatistics;
+"""
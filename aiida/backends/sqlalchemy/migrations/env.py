@@ -19,6 +19,7 @@ from aiida.backends.sqlalchemy.models.group import DbGroup
 from aiida.backends.sqlalchemy.models.log import DbLog
 from aiida.backends.sqlalchemy.models.node import DbLink, DbNode
 from aiida.backends.sqlalchemy.models.settings import DbSetting
+from aiida.backends.sqlalchemy.models.statistics import DbNodeStatistics
 from aiida.backends.sqlalchemy.models.user import DbUser
 from aiida.common.exceptions import DbContentError
 from aiida.backends.sqlalchemy.models.base import Base
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add an expression index on the `_aiida_hash` extra of the `DbNode` database model.
+
+The index is used to look up nodes with the same hash when caching is enabled, which would otherwise require a
+sequential scan of the node table. Note that the expression has to be identical to the one generated by the query
+builder for an equality filter on the extra: `extras #>> '{_aiida_hash}'`.
+
+Revision ID: 3b8a1e9c2f4d
+Revises: 7536a82b2cc4
+Create Date: 2026-10-18 14:03:52.128394
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '3b8a1e9c2f4d'
+down_revision = '7536a82b2cc4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.execute("CREATE INDEX db_dbnode_extras_aiida_hash_idx ON db_dbnode ((extras #>> '{_aiida_hash}'));")
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.execute('DROP INDEX db_dbnode_extras_aiida_hash_idx;')
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add the `db_dbnodestatistics` table with the node creation statistics and the triggers that maintain it.
+
+The table is populated with the statistics of the existing nodes. See
+:mod:`aiida.backends.general.migrations.node_statistics` for a description of the table.
+
+Revision ID: 5d1c6a4e8b27
+Revises: 3b8a1e9c2f4d
+Create Date: 2026-10-18 21:37:05.291846
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+
+from alembic import op
+
+from aiida.backends.general.migrations.node_statistics import (
+    CREATE_NODE_STATISTICS, POPULATE_NODE_STATISTICS, DROP_NODE_STATISTICS
+)
+
+# revision identifiers, used by Alembic.
+revision = '5d1c6a4e8b27'
+down_revision = '3b8a1e9c2f4d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.execute(CREATE_NODE_STATISTICS)
+    op.execute(POPULATE_NODE_STATISTICS)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.execute(DROP_NODE_STATISTICS)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add the `repository_metadata` column to the `DbNode` database model.
+
+Revision ID: 7536a82b2cc4
+Revises: bf591f31dd12
+Create Date: 2026-10-18 10:12:31.412871
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '7536a82b2cc4'
+down_revision = 'bf591f31dd12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.add_column('db_dbnode', sa.Column('repository_metadata', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_column('db_dbnode', 'repository_metadata')
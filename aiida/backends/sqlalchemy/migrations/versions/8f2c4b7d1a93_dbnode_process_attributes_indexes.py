@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add expression indexes on the `process_state`, `process_label` and `paused` attributes of the `DbNode` model.
+
+These are the attributes that `verdi process list` filters on, which would otherwise require a sequential scan of the
+node table. Note that the expressions have to be identical to the ones generated by the query builder for an equality
+filter on the attributes, e.g. `attributes #>> '{process_state}'`.
+
+Revision ID: 8f2c4b7d1a93
+Revises: 5d1c6a4e8b27
+Create Date: 2026-10-18 23:12:41.583027
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '8f2c4b7d1a93'
+down_revision = '5d1c6a4e8b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.execute("CREATE INDEX db_dbnode_attributes_process_state_idx ON db_dbnode ((attributes #>> '{process_state}'));")
+    op.execute("CREATE INDEX db_dbnode_attributes_process_label_idx ON db_dbnode ((attributes #>> '{process_label}'));")
+    op.execute("CREATE INDEX db_dbnode_attributes_paused_idx ON db_dbnode ((attributes #>> '{paused}'));")
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.execute('DROP INDEX db_dbnode_attributes_paused_idx;')
+    op.execute('DROP INDEX db_dbnode_attributes_process_label_idx;')
+    op.execute('DROP INDEX db_dbnode_attributes_process_state_idx;')
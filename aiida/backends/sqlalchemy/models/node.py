@@ -41,6 +41,8 @@ class DbNode(Base):
     mtime = Column(DateTime(timezone=True), default=timezone.now, onupdate=timezone.now)
     attributes = Column(JSONB)
     extras = Column(JSONB)
+    # Virtual file hierarchy of the objects in the repository object store, `None` if stored in a repository folder
+    repository_metadata = Column(JSONB, nullable=True)
 
     dbcomputer_id = Column(
         Integer,
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=import-error,no-name-in-module
+"""Module to manage the node creation statistics for the SQLA backend."""
+
+from sqlalchemy.schema import Column
+from sqlalchemy.types import Boolean, Integer, Date, String
+
+from aiida.backends.sqlalchemy.models.base import Base
+
+
+class DbNodeStatistics(Base):
+    """Class to store the node creation statistics using the SQLA backend.
+
+    The rows are inserted by database triggers on the node table, see
+    :mod:`aiida.backends.general.migrations.node_statistics`, and are not meant to be created through this model.
+    """
+    __tablename__ = 'db_dbnodestatistics'
+
+    id = Column(Integer, primary_key=True)  # pylint: disable=invalid-name
+    user_id = Column(Integer, nullable=False, index=True)
+    day = Column(Date, nullable=False)
+    node_type = Column(String(255), nullable=False)
+    count = Column(Integer, nullable=False)
+    compacted = Column(Boolean, nullable=False, default=False)
@@ -76,6 +76,52 @@ def database_migrate(force):
             echo.echo_success('migration completed')
 
 
+@verdi_database.command('pack-repository')
+@decorators.with_dbenv()
+def database_pack_repository():
+    """Pack the loose objects of the repository object store."""
+    from aiida.manage.manager import get_manager
+
+    object_store = get_manager().get_object_store()
+    count = object_store.pack_loose_objects()
+    statistics = object_store.count_objects()
+
+    echo.echo_success(
+        'packed {} loose objects: the object store now contains {} packed objects in {} pack files'.format(
+            count, statistics['packed'], statistics['pack_files']
+        )
+    )
+
+
+@verdi_database.command('refresh-statistics')
+@click.option(
+    '--compact',
+    is_flag=True,
+    help='Only compact the statistics that were recorded since the last refresh, instead of rebuilding them. This does '
+    'not prevent nodes from being stored or deleted.'
+)
+@decorators.with_dbenv()
+def database_refresh_statistics(compact):
+    """Rebuild or compact the node creation statistics.
+
+    The statistics are normally kept up to date automatically when nodes are stored and deleted, by recording every
+    change in the statistics table. This command rebuilds them from the node table, during which nodes cannot be stored
+    or deleted. With `--compact` it only merges the recorded changes, which also happens automatically when the
+    statistics are read once enough changes have been recorded.
+    """
+    from aiida.manage.manager import get_manager
+
+    query_manager = get_manager().get_backend().query_manager
+    query_manager.refresh_creation_statistics(rebuild=not compact)
+    statistics = query_manager.get_creation_statistics()
+
+    echo.echo_success(
+        '{} the creation statistics of {} nodes of {} types'.format(
+            'compacted' if compact else 'rebuilt', statistics['total'], len(statistics['types'])
+        )
+    )
+
+
 @verdi_database.group('integrity')
 def verdi_database_integrity():
     """Check the integrity of the database and fix potential issues."""
@@ -79,10 +79,17 @@ def inspect(archive, version, data, meta_data):
     show_default=True,
     help='Include or exclude comments for node(s) in export. (Will also export extra users who commented).'
 )
+@click.option(
+    '--stream',
+    is_flag=True,
+    default=False,
+    help='Write the database entries and repository files in batches, such that the memory usage does not depend on '
+    'the size of the archive.'
+)
 @decorators.with_dbenv()
 def create(
     output_file, codes, computers, groups, nodes, archive_format, force, input_calc_forward, input_work_forward,
-    create_backward, return_backward, call_calc_backward, call_work_backward, include_comments, include_logs
+    create_backward, return_backward, call_calc_backward, call_work_backward, include_comments, include_logs, stream
 ):
     """
     Export subsets of the provenance graph to file for sharing.
@@ -119,7 +126,8 @@ def create(
         'call_work_backward': call_work_backward,
         'include_comments': include_comments,
         'include_logs': include_logs,
-        'overwrite': force
+        'overwrite': force,
+        'stream': stream
     }
 
     if archive_format == 'zip':
@@ -331,14 +331,37 @@ def node_delete(nodes, dry_run, verbose, force, **kwargs):
     default=None,
     help='Only include nodes that are class or sub class of the class identified by this entry point.'
 )
+@click.option(
+    '-p',
+    '--processes',
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help='Number of worker processes that compute the hashes in parallel.'
+)
+@click.option(
+    '-b',
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help='Number of nodes whose hashes are computed and written to the database together.'
+)
+@click.option(
+    '--resume',
+    is_flag=True,
+    default=False,
+    help='Continue an interrupted rehash with the same filters, skipping the nodes that were already rehashed.'
+)
 @options.FORCE()
 @with_dbenv()
-def rehash(nodes, entry_point, force):
+def rehash(nodes, entry_point, processes, batch_size, resume, force):
     """Recompute the hash for nodes in the database.
 
     The set of nodes that will be rehashed can be filtered by their identifier and/or based on their class.
     """
-    from aiida.orm import Data, ProcessNode, QueryBuilder
+    from aiida.manage.database.rehash import count_nodes_to_rehash, rehash_nodes
+    from aiida.orm import Data, ProcessNode
 
     if not force:
         echo.echo_warning('This command will recompute and overwrite the hashes of all nodes.')
@@ -358,23 +381,19 @@ def rehash(nodes, entry_point, force):
     if entry_point is None:
         entry_point = (Data, ProcessNode)
 
-    if nodes:
-        to_hash = [(node,) for node in nodes if isinstance(node, entry_point)]
-        num_nodes = len(to_hash)
-    else:
-        builder = QueryBuilder()
-        builder.append(entry_point, tag='node')
-        to_hash = builder.all()
-        num_nodes = builder.count()
+    pks = [node.pk for node in nodes] if nodes else None
+    num_nodes = count_nodes_to_rehash(entry_point, pks=pks, resume=resume)
 
-    if not to_hash:
+    if not num_nodes:
         echo.echo_critical('no matching nodes found')
 
-    with click.progressbar(to_hash, label='Rehashing Nodes:') as iter_hash:
-        for node, in iter_hash:
-            node.rehash()
+    with click.progressbar(length=num_nodes, label='Rehashing Nodes:') as progress:
+        report = rehash_nodes(
+            entry_point, pks=pks, batch_size=batch_size, processes=processes, resume=resume, callback=progress.update
+        )
 
-    echo.echo_success('{} nodes re-hashed.'.format(num_nodes))
+    echo.echo_success('{} nodes re-hashed.'.format(report.num_nodes))
+    echo.echo_info('Rehashed in {:.1f} seconds ({:.1f} nodes/s).'.format(report.duration, report.throughput))
 
 
 @verdi_node.group('graph')
@@ -42,10 +42,16 @@ def verdi_process():
 @options.PAST_DAYS()
 @options.LIMIT()
 @options.RAW()
+@click.option(
+    '--summary',
+    is_flag=True,
+    default=False,
+    help='Only show the number of entries per process state, which are counted by the database.'
+)
 @decorators.with_dbenv()
 def process_list(
     all_entries, group, process_state, process_label, paused, exit_status, failed, past_days, limit, project, raw,
-    order_by, order_dir
+    order_by, order_dir, summary
 ):
     """Show a list of running or terminated processes.
 
@@ -62,6 +68,18 @@ def process_list(
 
     builder = CalculationQueryBuilder()
     filters = builder.get_filters(all_entries, process_state, process_label, paused, exit_status, failed)
+
+    if summary:
+        counts = builder.get_summary(relationships=relationships, filters=filters, past_days=past_days)
+        headers = ['State', 'Count']
+
+        if raw:
+            echo.echo(tabulate(counts, tablefmt='plain'))
+        else:
+            echo.echo(tabulate(counts, headers=headers))
+            echo.echo('\nTotal results: {}\n'.format(sum(count for _, count in counts)))
+        return
+
     query_set = builder.get_query_set(
         relationships=relationships, filters=filters, order_by={order_by: order_dir}, past_days=past_days, limit=limit
     )
@@ -77,14 +95,11 @@ def process_list(
         echo.echo(tabulated)
         echo.echo('\nTotal results: {}\n'.format(len(projected)))
         print_last_process_state_change()
-        # Second query to get active process count
-        # Currently this is slow but will be fixed wiith issue #2770
+        # Second query to get active process count, which is counted by the database using the process state index.
         # We place it at the end so that the user can Ctrl+C after getting the process table.
         builder = CalculationQueryBuilder()
         filters = builder.get_filters(process_state=('created', 'waiting', 'running'))
-        query_set = builder.get_query_set(filters=filters)
-        projected = builder.get_projected(query_set, projections=['pk'])
-        worker_slot_use = len(projected) - 1
+        worker_slot_use = builder.get_count(filters=filters)
         check_worker_load(worker_slot_use)
 
 
@@ -26,6 +26,7 @@ from operator import itemgetter
 import pytz
 
 from aiida.common.constants import AIIDA_FLOAT_PRECISION
+from aiida.repository import ObjectTree
 from .folders import Folder
 
 # The prefix of the hashed using pbkdf2_sha256 algorithm in Django
@@ -136,6 +137,25 @@ def _single_digest(obj_type, obj_bytes=b''):
 
 _END_DIGEST = _single_digest(')')
 
+# Size of the chunks in which the content of files is read to compute its digest
+_FILE_CHUNK_SIZE = 64 * 1024
+
+# Name under which the file content digests are persisted by the object store, see `_file_content_hasher`
+_FILE_CONTENT_ALGORITHM = 'blake2b-fcontent'
+
+
+def _file_content_hasher():
+    """Return a new hash object for the content of a file, which is equivalent to `_single_digest('fcontent', ...)`."""
+    return blake2b(person=b'fcontent', node_depth=0, **BLAKE2B_OPTIONS)
+
+
+def _file_content_digest(fhandle):
+    """Return the digest of the content of a binary file handle, reading it in chunks to bound the memory usage."""
+    hasher = _file_content_hasher()
+    for chunk in iter(lambda: fhandle.read(_FILE_CHUNK_SIZE), b''):
+        hasher.update(chunk)
+    return hasher.digest()
+
 
 @_make_hash.register(bytes)
 def _(bytes_obj, **kwargs):
@@ -274,7 +294,7 @@ def _(folder, **kwargs):
             if isfile:
                 yield _single_digest('fname', name.encode('utf-8'))
                 with subfolder.open(name, mode='rb') as fhandle:
-                    yield _single_digest('fcontent', fhandle.read())
+                    yield _file_content_digest(fhandle)
             else:
                 yield _single_digest('dir(', name.encode('utf-8'))
                 for digest in folder_digests(subfolder.get_subfolder(name)):
@@ -284,6 +304,36 @@ def _(folder, **kwargs):
     return [_single_digest('folder')] + list(folder_digests(folder))
 
 
+@_make_hash.register(ObjectTree)
+def _(tree, **kwargs):
+    """
+    Hash the content of an ObjectTree, yielding the same hash as for a Folder with the same content.
+    The content digests of the files are persisted by the object store, so they are only computed once per object.
+    :param ignored_folder_content: list of filenames to be ignored for the hashing
+    """
+    ignored_folder_content = kwargs.get('ignored_folder_content', [])
+    content_digests = tree.object_store.get_object_digests(
+        tree.iter_hashkeys(ignored=ignored_folder_content), _FILE_CONTENT_ALGORITHM, _file_content_hasher
+    )
+
+    def directory_digests(directory):
+        """traverses the given directory and yields digests for the contained objects"""
+        for name, entry in sorted(directory.items(), key=itemgetter(0)):
+            if name in ignored_folder_content:
+                continue
+
+            if isinstance(entry, dict):
+                yield _single_digest('dir(', name.encode('utf-8'))
+                for digest in directory_digests(entry):
+                    yield digest
+                yield _END_DIGEST
+            else:
+                yield _single_digest('fname', name.encode('utf-8'))
+                yield content_digests[entry]
+
+    return [_single_digest('folder')] + list(directory_digests(tree.directory))
+
+
 def float_to_text(value, sig):
     """
     Convert float to text string for computing hash.
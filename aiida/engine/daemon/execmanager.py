@@ -13,7 +13,9 @@ results. These are general and contain only the main logic; where appropriate,
 the routines make reference to the suitable plugins for all
 plugin-specific operations.
 """
+import collections
 import os
+import time
 
 from aiida.common import AIIDA_LOGGER, exceptions
 from aiida.common.datastructures import CalcJobState
@@ -23,12 +25,25 @@ from aiida.orm import FolderData, Node
 from aiida.orm.utils.log import get_dblogger_extra
 from aiida.plugins import DataFactory
 from aiida.schedulers.datastructures import JobState
+from aiida.transports.transport import get_local_size
 
 REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
 
 execlogger = AIIDA_LOGGER.getChild('execmanager')
 
 
+def _log_transfer_rate(logger, message, num_bytes, duration):
+    """Log the number of bytes that were transferred and the rate at which this happened.
+
+    :param logger: the logger to use
+    :param message: description of the transfer, to which the number of bytes and the rate are appended
+    :param num_bytes: the number of bytes that were transferred
+    :param duration: the duration of the transfer in seconds
+    """
+    rate = num_bytes / duration if duration > 0 else float(num_bytes)
+    logger.info('{}: {} bytes in {:.3f} s ({:.0f} bytes/s)'.format(message, num_bytes, duration, rate))
+
+
 def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=False):
     """Upload a `CalcJob` instance
 
@@ -137,28 +152,43 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
         workdir = transport.getcwd()
         node.set_remote_workdir(workdir)
 
+    # The files are put in three consecutive batches: the code files, the input files written by the plugin and the
+    # files of the `local_copy_list`, such that later batches overwrite earlier ones. Within a batch, the transport may
+    # transfer the files concurrently, so each target is put only once, with the content that would have been put last.
+    num_bytes = 0
+    time_start = time.time()
+
     # I first create the code files, so that the code can put
     # default files to be overwritten by the plugin itself.
     # Still, beware! The code file itself could be overwritten...
     # But I checked for this earlier.
+    with SandboxFolder() as staging:
+        transfers = collections.OrderedDict()
+
+        for code in input_codes:
+            if code.is_local():
+                # Note: this will possibly overwrite files
+                for filename in code.list_object_names():
+                    # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file
+                    # in combination with the new `Transport.put_object_from_filelike`
+                    # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
+                    with NamedTemporaryFile(mode='wb', dir=staging.abspath, delete=False) as handle:
+                        handle.write(code.get_object_content(filename, mode='rb'))
+                    transfers[filename] = handle.name
+
+        num_bytes += transport.put_many([(source, target) for target, source in transfers.items()])
+
     for code in input_codes:
         if code.is_local():
-            # Note: this will possibly overwrite files
-            for filename in code.list_object_names():
-                # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-                # combination with the new `Transport.put_object_from_filelike`
-                # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-                with NamedTemporaryFile(mode='wb+') as handle:
-                    handle.write(code.get_object_content(filename, mode='rb'))
-                    handle.flush()
-                    transport.put(handle.name, filename)
             transport.chmod(code.get_local_executable(), 0o755)  # rwxr-xr-x
 
     # In a dry_run, the working directory is the raw input folder, which will already contain these resources
     if not dry_run:
+        transfers = []
         for filename in folder.get_content_list():
             logger.debug('[submission of calculation {}] copying file/folder {}...'.format(node.pk, filename))
-            transport.put(folder.get_abs_path(filename), filename)
+            transfers.append((folder.get_abs_path(filename), filename))
+        num_bytes += transport.put_many(transfers)
 
     # local_copy_list is a list of tuples, each with (uuid, dest_rel_path)
     # NOTE: validation of these lists are done inside calculation.presubmit()
@@ -166,44 +196,51 @@ def upload_calculation(node, transport, calc_info, folder, inputs=None, dry_run=
     remote_copy_list = calc_info.remote_copy_list or []
     remote_symlink_list = calc_info.remote_symlink_list or []
 
-    for uuid, filename, target in local_copy_list:
-        logger.debug('[submission of calculation {}] copying local file/folder to {}'.format(node.uuid, target))
+    with SandboxFolder() as staging:
+        transfers = collections.OrderedDict()
 
-        def find_data_node(inputs, uuid):
-            """Find and return the node with the given UUID from a nested mapping of input nodes.
+        for uuid, filename, target in local_copy_list:
+            logger.debug('[submission of calculation {}] copying local file/folder to {}'.format(node.uuid, target))
 
-            :param inputs: (nested) mapping of nodes
-            :param uuid: UUID of the node to find
-            :return: instance of `Node` or `None` if not found
-            """
-            from collections.abc import Mapping
-            data_node = None
+            def find_data_node(inputs, uuid):
+                """Find and return the node with the given UUID from a nested mapping of input nodes.
 
-            for input_node in inputs.values():
-                if isinstance(input_node, Mapping):
-                    data_node = find_data_node(input_node, uuid)
-                elif isinstance(input_node, Node) and input_node.uuid == uuid:
-                    data_node = input_node
-                if data_node is not None:
-                    break
+                :param inputs: (nested) mapping of nodes
+                :param uuid: UUID of the node to find
+                :return: instance of `Node` or `None` if not found
+                """
+                from collections.abc import Mapping
+                data_node = None
 
-            return data_node
+                for input_node in inputs.values():
+                    if isinstance(input_node, Mapping):
+                        data_node = find_data_node(input_node, uuid)
+                    elif isinstance(input_node, Node) and input_node.uuid == uuid:
+                        data_node = input_node
+                    if data_node is not None:
+                        break
 
-        try:
-            data_node = load_node(uuid=uuid)
-        except exceptions.NotExistent:
-            data_node = find_data_node(inputs, uuid)
+                return data_node
 
-        if data_node is None:
-            logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
-        else:
-            # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-            # combination with the new `Transport.put_object_from_filelike`
-            # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
-            with NamedTemporaryFile(mode='wb+') as handle:
-                handle.write(data_node.get_object_content(filename, mode='rb'))
-                handle.flush()
-                transport.put(handle.name, target)
+            try:
+                data_node = load_node(uuid=uuid)
+            except exceptions.NotExistent:
+                data_node = find_data_node(inputs, uuid)
+
+            if data_node is None:
+                logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
+            else:
+                # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
+                # combination with the new `Transport.put_object_from_filelike`
+                # Since the content of the node could potentially be binary, we read the raw bytes and pass them on
+                with NamedTemporaryFile(mode='wb', dir=staging.abspath, delete=False) as handle:
+                    handle.write(data_node.get_object_content(filename, mode='rb'))
+                transfers[target] = handle.name
+
+        num_bytes += transport.put_many([(source, target) for target, source in transfers.items()])
+
+    message = '[submission of calculation {}] uploaded files'.format(node.pk)
+    _log_transfer_rate(logger, message, num_bytes, time.time() - time_start)
 
     if dry_run:
         if remote_copy_list:
@@ -335,6 +372,8 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
     :param retrieved_temporary_folder: the absolute path to a directory in which to store the files
         listed, if any, in the `retrieved_temporary_folder` of the jobs CalcInfo
     """
+    from logging import LoggerAdapter
+
     logger_extra = get_dblogger_extra(calculation)
     workdir = calculation.get_remote_workdir()
 
@@ -356,6 +395,8 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
 
     with transport:
         transport.chdir(workdir)
+        num_bytes = 0
+        time_start = time.time()
 
         # First, retrieve the files of folderdata
         retrieve_list = calculation.get_retrieve_list()
@@ -363,19 +404,23 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
         retrieve_singlefile_list = calculation.get_retrieve_singlefile_list()
 
         with SandboxFolder() as folder:
-            retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
+            num_bytes += retrieve_files_from_list(calculation, transport, folder.abspath, retrieve_list)
             # Here I retrieved everything; now I store them inside the calculation
             retrieved_files.put_object_from_tree(folder.abspath)
 
         # Second, retrieve the singlefiles, if any files were specified in the 'retrieve_temporary_list' key
         if retrieve_singlefile_list:
             with SandboxFolder() as folder:
-                _retrieve_singlefiles(calculation, transport, folder, retrieve_singlefile_list, logger_extra)
+                num_bytes += _retrieve_singlefiles(
+                    calculation, transport, folder, retrieve_singlefile_list, logger_extra
+                )
 
         # Retrieve the temporary files in the retrieved_temporary_folder if any files were
         # specified in the 'retrieve_temporary_list' key
         if retrieve_temporary_list:
-            retrieve_files_from_list(calculation, transport, retrieved_temporary_folder, retrieve_temporary_list)
+            num_bytes += retrieve_files_from_list(
+                calculation, transport, retrieved_temporary_folder, retrieve_temporary_list
+            )
 
             # Log the files that were retrieved in the temporary folder
             for filename in os.listdir(retrieved_temporary_folder):
@@ -384,6 +429,10 @@ def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
                     extra=logger_extra
                 )
 
+        message = '[retrieval of calc {}] retrieved files'.format(calculation.pk)
+        logger = LoggerAdapter(logger=execlogger, extra=logger_extra)
+        _log_transfer_rate(logger, message, num_bytes, time.time() - time_start)
+
         # Store everything
         execlogger.debug(
             '[retrieval of calc {}] '
@@ -495,7 +544,10 @@ def parse_results(process, retrieved_temporary_folder=None):
 
 
 def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_extra=None):
-    """Retrieve files specified through the singlefile list mechanism."""
+    """Retrieve files specified through the singlefile list mechanism.
+
+    :return: the number of bytes that were retrieved
+    """
     singlefile_list = []
     for (linkname, subclassname, filename) in retrieve_file_list:
         execlogger.debug(
@@ -504,15 +556,16 @@ def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_ext
             extra=logger_extra
         )
         localfilename = os.path.join(folder.abspath, os.path.split(filename)[1])
-        transport.get(filename, localfilename, ignore_nonexisting=True)
-        singlefile_list.append((linkname, subclassname, localfilename))
+        singlefile_list.append((linkname, subclassname, filename, localfilename))
+
+    num_bytes = transport.get_many([(item[2], item[3]) for item in singlefile_list], ignore_nonexisting=True)
 
     # ignore files that have not been retrieved
-    singlefile_list = [i for i in singlefile_list if os.path.exists(i[2])]
+    singlefile_list = [i for i in singlefile_list if os.path.exists(i[3])]
 
     # after retrieving from the cluster, I create the objects
     singlefiles = []
-    for (linkname, subclassname, filename) in singlefile_list:
+    for (linkname, subclassname, _, filename) in singlefile_list:
         cls = DataFactory(subclassname)
         singlefile = cls(file=filename)
         singlefile.add_incoming(job, link_type=LinkType.CREATE, link_label=linkname)
@@ -525,6 +578,8 @@ def _retrieve_singlefiles(job, transport, folder, retrieve_file_list, logger_ext
         )
         fil.store()
 
+    return num_bytes
+
 
 def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
     """
@@ -549,7 +604,12 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
     :param transport: the Transport instance.
     :param folder: an absolute path to a folder that contains the files to copy.
     :param retrieve_list: the list of files to retrieve.
+    :return: the number of bytes that were retrieved
     """
+    # Map each local destination onto its remote source, such that each destination is retrieved only once, from the
+    # source that would have been retrieved last, since the transport may retrieve the files concurrently
+    transfers = collections.OrderedDict()
+
     for item in retrieve_list:
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
@@ -581,4 +641,62 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
             transport.logger.debug(
                 "[retrieval of calc {}] Trying to retrieve remote item '{}'".format(calculation.pk, rem)
             )
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+            transfers[os.path.join(folder, loc)] = rem
+
+    # Transfers whose destinations overlap, because one is inside the other, are retrieved in separate consecutive calls
+    # in the order in which they were listed, since `get_many` may perform the transfers of a single call concurrently
+    batches, outermost = _group_overlapping_transfers(transfers)
+
+    for batch in batches:
+        transport.get_many(batch, ignore_nonexisting=True, archive=True)
+
+    return sum(get_local_size(localpath) for localpath in outermost)
+
+
+def _group_overlapping_transfers(transfers):
+    """Group transfers into consecutive batches, such that the local destinations within a batch do not overlap.
+
+    Each transfer is put in the batch after the last one with a destination that is equal to, contains or is contained
+    in its own destination, such that it is retrieved after it. Transfers without overlapping destinations all end up
+    in the first batch.
+
+    :param transfers: mapping of absolute local destination paths onto their remote source paths
+    :return: tuple of the list of batches, each a list of tuples of a remote source path and a local destination path,
+        and the list of the destinations that are not contained in another destination
+    """
+    batches = []
+    batch_of_path = {}
+    last_batch_below_path = {}
+    ancestors_of_path = {}
+
+    for localpath, remotepath in transfers.items():
+        path = os.path.normpath(localpath)
+        ancestors = []
+        parent = os.path.dirname(path)
+
+        while parent not in ancestors and parent != path:
+            ancestors.append(parent)
+            parent = os.path.dirname(parent)
+
+        overlapping = [batch_of_path[other] for other in [path] + ancestors if other in batch_of_path]
+        if path in last_batch_below_path:
+            overlapping.append(last_batch_below_path[path])
+
+        index = max(overlapping) + 1 if overlapping else 0
+
+        if index == len(batches):
+            batches.append([])
+
+        batches[index].append((remotepath, localpath))
+        batch_of_path[path] = index
+        ancestors_of_path[localpath] = ancestors
+
+        for ancestor in ancestors:
+            last_batch_below_path[ancestor] = max(last_batch_below_path.get(ancestor, index), index)
+
+    outermost = [
+        localpath for localpath, ancestors in ancestors_of_path.items()
+        if not any(ancestor in batch_of_path for ancestor in ancestors)
+    ]
+
+    return batches, outermost
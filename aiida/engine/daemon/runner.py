@@ -46,4 +46,7 @@ def start_daemon():
         LOGGER.info('Received a SystemError: %s', exception)
         runner.close()
 
+    # Write the last state change timestamp that may still be pending in the recorder
+    manager.get_process_state_change_recorder().flush()
+
     LOGGER.info('Daemon runner stopped')
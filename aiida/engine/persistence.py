@@ -115,7 +115,12 @@ class AiiDAPersister(plumpy.Persister):
                 'Failed to load the node for process<{}>: {}'.format(pid, traceback.format_exc())
             )
 
-        checkpoint = calculation.checkpoint
+        try:
+            checkpoint = calculation.checkpoint
+        except (IOError, OSError):
+            raise plumpy.PersistenceError(
+                'Failed to read the checkpoint for process<{}>: {}'.format(pid, traceback.format_exc())
+            )
 
         if checkpoint is None:
             raise plumpy.PersistenceError('Calculation<{}> does not have a saved checkpoint'.format(calculation.pk))
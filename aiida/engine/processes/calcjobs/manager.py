@@ -8,15 +8,165 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module containing utilities and classes relating to job calculations running on systems that require transport."""
+import collections
 import contextlib
+import json
 import logging
+import os
 import time
 
 from tornado import concurrent, gen
 
 from aiida.common import lang
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobManager', 'SharedJobsCache')
+
+# Interval in seconds at which a jobs list checks whether another runner finished polling the scheduler
+SHARED_CACHE_WAIT_INTERVAL = 1.
+
+
+class JobsSnapshot(collections.namedtuple('JobsSnapshot', ['timestamp', 'queried', 'jobs'])):
+    """The job states returned by a single scheduler poll.
+
+    The `timestamp` is the time at which the poll started, `queried` the set of job ids that were queried, or `None` if
+    all jobs of the user were queried, and `jobs` the mapping of job ids onto the `JobInfo` returned by the scheduler.
+    """
+
+    def covers(self, job_id):
+        """Return whether the poll queried the given job, such that its absence means the job is no longer running."""
+        return self.queried is None or job_id in self.queried
+
+
+class SharedJobsCache:
+    """Cache of scheduler job states, that is shared through the file system by the runners of the same profile.
+
+    For each authinfo, the cache stores the result of the last scheduler poll and the ids of the jobs each runner is
+    waiting on. A runner that needs to poll first takes the lock of the authinfo, queries the jobs of all runners and
+    stores the result, such that the other runners can use it instead of polling the scheduler themselves.
+    """
+
+    _SNAPSHOT = 'snapshot.json'
+    _LOCK = 'lock'
+    _REQUESTS = 'requests'
+
+    # Requests of runners that did not update them for this many seconds are considered to be from dead runners
+    REQUESTS_MAX_AGE = 600.
+
+    def __init__(self, dirpath, runner_id=None):
+        """Construct a cache stored in the given directory.
+
+        :param dirpath: absolute path of the directory in which to store the cache, which is created if needed
+        :param runner_id: identifier of this runner, unique among the runners sharing the cache, defaults to the pid
+        """
+        self._dirpath = dirpath
+        self._runner_id = runner_id if runner_id is not None else str(os.getpid())
+
+    def _get_path(self, authinfo_id, *parts):
+        """Return the path of an entry of the cache of the given authinfo, creating its directories if needed."""
+        dirpath = os.path.join(self._dirpath, str(authinfo_id), self._REQUESTS)
+        os.makedirs(dirpath, exist_ok=True)
+        return os.path.join(self._dirpath, str(authinfo_id), *parts)
+
+    @staticmethod
+    def _write(path, data):
+        """Atomically replace the content of the file at the given path with the data serialized as JSON."""
+        with open(path + '.tmp', 'w') as handle:
+            json.dump(data, handle)
+        os.replace(path + '.tmp', path)
+
+    @contextlib.contextmanager
+    def lock(self, authinfo_id):
+        """Try to take the lock of the given authinfo, that a runner should hold while polling the scheduler.
+
+        The lock is released when the context exits, or when the process holding it dies.
+
+        :param authinfo_id: the id of the authinfo
+        :return: context manager that yields True if the lock was taken, or False if another runner holds it
+        """
+        import fcntl
+
+        with open(self._get_path(authinfo_id, self._LOCK), 'w') as handle:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                yield False
+            else:
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def get_snapshot(self, authinfo_id):
+        """Return the result of the last scheduler poll for the given authinfo.
+
+        :param authinfo_id: the id of the authinfo
+        :return: a `JobsSnapshot` or None if the scheduler has not been polled yet
+        """
+        from aiida.schedulers.datastructures import JobInfo
+
+        try:
+            with open(self._get_path(authinfo_id, self._SNAPSHOT)) as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return None
+
+        queried = set(data['queried']) if data['queried'] is not None else None
+        jobs = {job_id: JobInfo.load_from_dict(job_info) for job_id, job_info in data['jobs'].items()}
+
+        return JobsSnapshot(data['timestamp'], queried, jobs)
+
+    def set_snapshot(self, authinfo_id, snapshot):
+        """Store the result of a scheduler poll for the given authinfo.
+
+        :param authinfo_id: the id of the authinfo
+        :param snapshot: a `JobsSnapshot`
+        """
+        data = {
+            'timestamp': snapshot.timestamp,
+            'queried': sorted(snapshot.queried) if snapshot.queried is not None else None,
+            'jobs': {job_id: job_info.get_dict() for job_id, job_info in snapshot.jobs.items()},
+        }
+        self._write(self._get_path(authinfo_id, self._SNAPSHOT), data)
+
+    def set_requested_job_ids(self, authinfo_id, job_ids):
+        """Store the ids of the jobs of the given authinfo whose state this runner is waiting on.
+
+        :param authinfo_id: the id of the authinfo
+        :param job_ids: list of job ids, if empty the requests of this runner are removed
+        """
+        path = self._get_path(authinfo_id, self._REQUESTS, self._runner_id)
+
+        if job_ids:
+            self._write(path, sorted(job_ids))
+        else:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def get_requested_job_ids(self, authinfo_id):
+        """Return the ids of the jobs of the given authinfo whose state any of the runners is waiting on.
+
+        :param authinfo_id: the id of the authinfo
+        :return: set of job ids
+        """
+        dirpath = self._get_path(authinfo_id, self._REQUESTS)
+        job_ids = set()
+
+        for filename in os.listdir(dirpath):
+            if filename.endswith('.tmp'):
+                continue
+
+            path = os.path.join(dirpath, filename)
+            try:
+                if time.time() - os.path.getmtime(path) > self.REQUESTS_MAX_AGE:
+                    continue
+                with open(path) as handle:
+                    job_ids.update(json.load(handle))
+            except (OSError, ValueError):
+                continue
+
+        return job_ids
 
 
 class JobsList:
@@ -34,9 +184,12 @@ class JobsList:
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+
+    If a :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache` is given, the instances of all runners that
+    share it poll the scheduler in turn, such that the minimum polling interval is respected across these runners.
     """
 
-    def __init__(self, authinfo, transport_queue, last_updated=None):
+    def __init__(self, authinfo, transport_queue, last_updated=None, shared_jobs_cache=None):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
@@ -45,6 +198,8 @@ class JobsList:
         :type: :class:`aiida.engine.transports.TransportQueue`
         :param last_updated: initialize the last updated timestamp
         :type: float
+        :param shared_jobs_cache: optional cache of job states shared with other runners
+        :type: :class:`aiida.engine.processes.calcjobs.manager.SharedJobsCache`
         """
         lang.type_check(last_updated, float, allow_none=True)
 
@@ -52,9 +207,11 @@ class JobsList:
         self._transport_queue = transport_queue
         self._loop = transport_queue.loop()
         self._logger = logging.getLogger(__name__)
+        self._shared_jobs_cache = shared_jobs_cache
 
         self._jobs_cache = {}
         self._job_update_requests = {}  # Mapping: {job_id: Future}
+        self._job_update_request_times = {}  # Mapping: {job_id: time at which the future was created}
         self._last_updated = last_updated
         self._update_handle = None
 
@@ -84,9 +241,11 @@ class JobsList:
         return self._last_updated
 
     @gen.coroutine
-    def _get_jobs_from_scheduler(self):
+    def _get_jobs_from_scheduler(self, job_ids=None):
         """Get the current jobs list from the scheduler.
 
+        :param job_ids: the ids of the jobs to query if the scheduler cannot query by user, defaults to the jobs of the
+            outstanding update requests
         :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
         :rtype: dict
         """
@@ -101,7 +260,7 @@ class JobsList:
             if scheduler.get_feature('can_query_by_user'):
                 kwargs['user'] = '$USER'
             else:
-                kwargs['jobs'] = self._get_jobs_with_scheduler()
+                kwargs['jobs'] = job_ids if job_ids is not None else self._get_jobs_with_scheduler()
 
             scheduler_response = scheduler.get_jobs(**kwargs)
 
@@ -115,6 +274,59 @@ class JobsList:
 
             raise gen.Return(jobs_cache)
 
+    @gen.coroutine
+    def _get_jobs_from_shared_cache(self):
+        """Get the current jobs list from the cache shared with other runners, polling the scheduler if it is due.
+
+        The scheduler is polled by at most one runner at a time, for the outstanding requests of all runners, and only
+        if the minimum update interval has elapsed since the last poll by any of them. Since a job that is not in the
+        result of a poll is considered to be no longer running, a request can only be resolved by a poll that queried
+        its job and that started after the request was made, such that a job that was submitted after the poll is not
+        mistaken for a finished one.
+
+        :return: tuple of the mapping of job ids to `JobInfo` instances and the list of job ids of the requests it
+            resolves
+        """
+        cache = self._shared_jobs_cache
+        authinfo_id = self._authinfo.pk
+        cache.set_requested_job_ids(authinfo_id, self._get_jobs_with_scheduler())
+
+        def is_due(snapshot):
+            return snapshot is None or time.time() - snapshot.timestamp >= self.get_minimum_update_interval()
+
+        while True:
+            snapshot = cache.get_snapshot(authinfo_id)
+
+            if not is_due(snapshot):
+                break
+
+            with cache.lock(authinfo_id) as locked:
+                if locked:
+                    # Another runner may have finished polling in the meantime
+                    snapshot = cache.get_snapshot(authinfo_id)
+
+                    if is_due(snapshot):
+                        timestamp = time.time()
+                        job_ids = cache.get_requested_job_ids(authinfo_id) | set(self._get_jobs_with_scheduler())
+                        jobs = yield self._get_jobs_from_scheduler(job_ids=sorted(job_ids))
+
+                        scheduler = self._authinfo.computer.get_scheduler()
+                        queried = None if scheduler.get_feature('can_query_by_user') else job_ids
+                        snapshot = JobsSnapshot(timestamp, queried, jobs)
+                        cache.set_snapshot(authinfo_id, snapshot)
+                    break
+
+            # Another runner is polling the scheduler, so wait for it to store the result
+            yield gen.sleep(SHARED_CACHE_WAIT_INTERVAL)
+
+        self._last_updated = snapshot.timestamp
+        resolved = [
+            job_id for job_id, requested in self._job_update_request_times.items()
+            if requested < snapshot.timestamp and snapshot.covers(str(job_id))
+        ]
+
+        raise gen.Return((snapshot.jobs, resolved))
+
     @gen.coroutine
     def _update_job_info(self):
         """Update all of the job information objects.
@@ -127,7 +339,11 @@ class JobsList:
                 return
 
             # Update our cache of the job states
-            self._jobs_cache = yield self._get_jobs_from_scheduler()
+            if self._shared_jobs_cache is None:
+                self._jobs_cache = yield self._get_jobs_from_scheduler()
+                resolved = list(self._job_update_requests)
+            else:
+                self._jobs_cache, resolved = yield self._get_jobs_from_shared_cache()
         except Exception as exception:
             # Set the exception on all the update futures
             for future in self._job_update_requests.values():
@@ -142,11 +358,19 @@ class JobsList:
 
             raise
         else:
-            for job_id, future in self._job_update_requests.items():
+            for job_id in resolved:
+                future = self._job_update_requests[job_id]
                 if not future.done():
                     future.set_result(self._jobs_cache.get(job_id, None))
         finally:
-            self._job_update_requests = {}
+            # Drop all requests that are done, which are the resolved, excepted and cancelled ones
+            for job_id, future in list(self._job_update_requests.items()):
+                if future.done():
+                    self._job_update_requests.pop(job_id)
+                    self._job_update_request_times.pop(job_id, None)
+
+            if self._shared_jobs_cache is not None:
+                self._shared_jobs_cache.set_requested_job_ids(self._authinfo.pk, self._get_jobs_with_scheduler())
 
     @contextlib.contextmanager
     def request_job_info_update(self, job_id):
@@ -159,6 +383,7 @@ class JobsList:
         """
         # Get or create the future
         request = self._job_update_requests.setdefault(job_id, concurrent.Future())
+        self._job_update_request_times.setdefault(job_id, time.time())
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
         try:
@@ -249,11 +474,20 @@ class JobManager:
     As long as a :py:class:`~aiida.engine.runners.Runner` will create a single ``JobManager`` instance and use that for
     its lifetime, the guarantees made by the ``JobsList`` about respecting the minimum polling interval of the scheduler
     will be maintained. Note, however, that since each ``Runner`` will create its own job manager, these guarantees
-    only hold per runner.
+    only hold per runner, unless the runners share a
+    :py:class:`~aiida.engine.processes.calcjobs.manager.SharedJobsCache`, in which case they hold across them.
     """
 
-    def __init__(self, transport_queue):
+    def __init__(self, transport_queue, shared_jobs_cache=None):
+        """Construct a job manager.
+
+        :param transport_queue: A transport queue
+        :type: :class:`aiida.engine.transports.TransportQueue`
+        :param shared_jobs_cache: optional cache of job states shared with the job managers of other runners
+        :type: :class:`aiida.engine.processes.calcjobs.manager.SharedJobsCache`
+        """
         self._transport_queue = transport_queue
+        self._shared_jobs_cache = shared_jobs_cache
         self._job_lists = {}
 
     def get_jobs_list(self, authinfo):
@@ -263,7 +497,8 @@ class JobManager:
         :return: a `JobsList` instance
         """
         if authinfo.id not in self._job_lists:
-            self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue)
+            jobs_list = JobsList(authinfo, self._transport_queue, shared_jobs_cache=self._shared_jobs_cache)
+            self._job_lists[authinfo.id] = jobs_list
 
         return self._job_lists[authinfo.id]
 
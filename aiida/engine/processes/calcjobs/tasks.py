@@ -189,8 +189,9 @@ def task_update_job(node, job_manager, cancellable):
             node.set_scheduler_state(JobState.DONE)
             job_done = True
         else:
-            node.set_last_job_info(job_info)
-            node.set_scheduler_state(job_info.job_state)
+            with node.batch_attribute_updates():
+                node.set_last_job_info(job_info)
+                node.set_scheduler_state(job_info.job_state)
             job_done = job_info.job_state == JobState.DONE
 
         raise Return(job_done)
@@ -333,8 +333,10 @@ class Process(plumpy.Process):
     def on_entered(self, from_state):
         # pylint: disable=cyclic-import
         from aiida.engine.utils import set_process_state_change_timestamp
-        self.update_node_state(self._state)
-        self._save_checkpoint()
+        # Write the new state and checkpoint at once and before the state change is broadcast by the super class
+        with self.node.batch_attribute_updates():
+            self.update_node_state(self._state)
+            self._save_checkpoint()
         # Update the latest process state change timestamp
         set_process_state_change_timestamp(self)
         super().on_entered(from_state)
@@ -387,8 +389,9 @@ class Process(plumpy.Process):
         if isinstance(result, int):
             self.node.set_exit_status(result)
         elif isinstance(result, ExitCode):
-            self.node.set_exit_status(result.status)
-            self.node.set_exit_message(result.message)
+            with self.node.batch_attribute_updates():
+                self.node.set_exit_status(result.status)
+                self.node.set_exit_message(result.message)
         else:
             raise ValueError('the result should be an integer, ExitCode or None, got {} {} {}'.format(
                 type(result), result, self.pid))
@@ -448,6 +451,19 @@ class Process(plumpy.Process):
         """
         return self.runner.submit(process, *args, **kwargs)
 
+    def submit_many(self, process, inputs):
+        """Submit the process for execution once for each of the given inputs.
+
+        The nodes of the processes are created in a single database transaction, see
+        :meth:`aiida.engine.runners.Runner.submit_many`.
+
+        :param process: process
+        :type process: :class:`aiida.engine.Process`
+        :param inputs: an iterable of dictionaries with the inputs of each process
+        :return: list of the nodes of the processes
+        """
+        return self.runner.submit_many(process, inputs)
+
     @property
     def runner(self):
         """Get process runner.
@@ -268,13 +268,17 @@ class WorkChain(Process):
         function will be bound with the awaitable and the runner will be asked to
         call it when the target is completed
         """
+        callbacks = []
+
         for awaitable in self._awaitables:
             if awaitable.target == AwaitableTarget.PROCESS:
-                callback = functools.partial(self._run_task, self.on_process_finished, awaitable)
-                self.runner.call_on_process_finish(awaitable.pk, callback)
+                callbacks.append((awaitable.pk, functools.partial(self._run_task, self.on_process_finished, awaitable)))
             else:
                 assert "invalid awaitable target '{}'".format(awaitable.target)
 
+        # Register all awaited processes at once, such that their termination is checked and subscribed to together
+        self.runner.call_on_processes_finish(callbacks)
+
     def on_process_finished(self, awaitable):
         """Callback function called by the runner when the process instance identified by pk is completed.
 
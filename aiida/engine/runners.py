@@ -13,7 +13,6 @@ import collections
 import functools
 import logging
 import signal
-import threading
 import uuid
 
 import kiwipy
@@ -21,7 +20,7 @@ import plumpy
 import tornado.ioloop
 
 from aiida.common import exceptions
-from aiida.orm import load_node
+from aiida.orm import ProcessNode, QueryBuilder
 from aiida.plugins.utils import PluginVersionProvider
 
 from .processes import futures, ProcessState
@@ -45,7 +44,18 @@ class Runner:  # pylint: disable=too-many-public-methods
     _controller = None
     _closed = False
 
-    def __init__(self, poll_interval=0, loop=None, communicator=None, rmq_submit=False, persister=None):
+    _TERMINATED_STATES = [state.value for state in (ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED)]
+
+    def __init__(
+        self,
+        poll_interval=0,
+        loop=None,
+        communicator=None,
+        rmq_submit=False,
+        persister=None,
+        transport_keep_alive=0,
+        shared_jobs_cache=None
+    ):  # pylint: disable=too-many-arguments
         """Construct a new runner.
 
         :param poll_interval: interval in seconds between polling for status of active sub processes
@@ -56,6 +66,9 @@ class Runner:  # pylint: disable=too-many-public-methods
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
         :type persister: :class:`plumpy.Persister`
+        :param transport_keep_alive: time in seconds that idle transports are kept open for reuse by later tasks
+        :param shared_jobs_cache: optional cache of scheduler job states that is shared with other runners
+        :type shared_jobs_cache: :class:`aiida.engine.processes.calcjobs.manager.SharedJobsCache`
         """
         assert not (rmq_submit and persister is None), \
             'Must supply a persister if you want to submit using communicator'
@@ -63,10 +76,12 @@ class Runner:  # pylint: disable=too-many-public-methods
         self._loop = loop if loop is not None else tornado.ioloop.IOLoop()
         self._poll_interval = poll_interval
         self._rmq_submit = rmq_submit
-        self._transport = transports.TransportQueue(self._loop)
-        self._job_manager = manager.JobManager(self._transport)
+        self._transport = transports.TransportQueue(self._loop, keep_alive=transport_keep_alive)
+        self._job_manager = manager.JobManager(self._transport, shared_jobs_cache=shared_jobs_cache)
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
+        self._polled_processes = {}
+        self._poll_handle = None
 
         if communicator is not None:
             self._communicator = plumpy.wrap_communicator(communicator, self._loop)
@@ -149,6 +164,7 @@ class Runner:  # pylint: disable=too-many-public-methods
     def close(self):
         """Close the runner by stopping the loop."""
         assert not self._closed
+        self._transport.close()
         self.stop()
         self._closed = True
 
@@ -185,6 +201,56 @@ class Runner:  # pylint: disable=too-many-public-methods
 
         return process.node
 
+    def submit_many(self, process, inputs):
+        """
+        Submit the process once for each of the given inputs to this runner immediately returning control to the
+        interpreter. The return value will be the list of calculation nodes of the submitted processes
+
+        All processes are instantiated, which creates their nodes with their input links, and checkpointed in a single
+        database transaction, instead of one transaction per process. Only after it is committed, the processes are
+        continued by sending their tasks to the daemon or by scheduling them on this runner. If any of the processes
+        fails to be instantiated, none of them is submitted.
+
+        :param process: the process class to submit
+        :param inputs: an iterable of dictionaries with the inputs to be passed to each process
+        :return: list of the calculation nodes of the processes
+        """
+        from aiida.manage.manager import get_manager
+
+        assert not utils.is_process_function(process), 'Cannot submit a process function'
+        assert not self._closed
+
+        processes = []
+
+        try:
+            with get_manager().get_backend().transaction():
+                for process_inputs in inputs:
+                    processes.append(self.instantiate_process(process, **process_inputs))
+
+                    if not processes[-1].metadata.store_provenance:
+                        raise exceptions.InvalidOperation('cannot submit a process with `store_provenance=False`')
+
+                    if processes[-1].metadata.get('dry_run', False):
+                        raise exceptions.InvalidOperation(
+                            'cannot submit a process from within another with `dry_run=True`'
+                        )
+
+                    if self._rmq_submit:
+                        self.persister.save_checkpoint(processes[-1])
+        except Exception:
+            for instance in processes:
+                instance.close()
+            raise
+
+        for instance in processes:
+            if self._rmq_submit:
+                instance.close()
+                self.controller.continue_process(instance.pid, nowait=False, no_reply=True)
+            else:
+                self.loop.add_callback(instance.step_until_terminated)
+
+        return [instance.node for instance in processes]
+
     def schedule(self, process, *args, **inputs):
         """
         Schedule a process to be executed by this runner
@@ -275,32 +341,73 @@ class Runner:  # pylint: disable=too-many-public-methods
         :param pk: pk of the process
         :param callback: function to be called upon process termination
         """
-        node = load_node(pk=pk)
+        self.call_on_processes_finish([(pk, callback)])
+
+    def call_on_processes_finish(self, callbacks):
+        """Schedule callbacks when the processes of the given pks are terminated.
+
+        This is equivalent to calling :meth:`call_on_process_finish` for each process, except that a single broadcast
+        subscriber listens for the state changes of all processes and the processes that are already terminated are
+        determined with a single query.
+
+        :param callbacks: iterable of tuples of the pk of a process and the function to be called upon its termination
+        :raises `~aiida.common.exceptions.NotExistent`: if there is no process node for any of the pks
+        """
+        pending = collections.OrderedDict()
         subscriber_identifier = str(uuid.uuid4())
-        event = threading.Event()
 
-        def inline_callback(event, *args, **kwargs):  # pylint: disable=unused-argument
-            """Callback to wrap the actual callback, that will always remove the subscriber that will be registered.
+        for pk, callback in callbacks:
+            pending.setdefault(pk, []).append(callback)
+
+        if not pending:
+            return
 
-            As soon as the callback is called successfully once, the `event` instance is toggled, such that if this
-            inline callback is called a second time, the actual callback is not called again.
+        # Neither a broadcast nor the polling would ever signal the termination of a process that does not exist
+        builder = QueryBuilder().append(ProcessNode, filters={'id': {'in': list(pending)}}, project='id')
+        missing = set(pending).difference(pk for pk, in builder.iterall())
+
+        if missing:
+            raise exceptions.NotExistent('no process nodes exist with the pks: {}'.format(sorted(missing)))
+
+        def inline_callback(pk):
+            """Callback to wrap the actual callbacks, that removes the subscriber once all callbacks have been called.
+
+            As soon as the callbacks of a process are called once, they are removed, such that if this inline callback
+            is called a second time for the same process, the actual callbacks are not called again.
             """
-            if event.is_set():
+            callbacks_process = pending.pop(pk, [])
+
+            if not callbacks_process:
                 return
 
             try:
-                callback()
+                for callback in callbacks_process:
+                    callback()
             finally:
-                event.set()
-                self._communicator.remove_broadcast_subscriber(subscriber_identifier)
+                if not pending:
+                    self._communicator.remove_broadcast_subscriber(subscriber_identifier)
+
+        def broadcast_subscriber(_communicator, _body, sender, _subject, _correlation_id):
+            """Call the callback of the sender if it is one of the processes whose termination is awaited."""
+            if sender in pending:
+                inline_callback(sender)
 
-        broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
-        for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
-            broadcast_filter.add_subject_filter('state_changed.*.{}'.format(state.value))
+        # A single filter matches the state changes to a terminated state of any sender, which is checked by the
+        # subscriber, since a filter can only match a single sender
+        broadcast_filter = kiwipy.BroadcastFilter(broadcast_subscriber)
+        for state in self._TERMINATED_STATES:
+            broadcast_filter.add_subject_filter('state_changed.*.{}'.format(state))
 
-        LOGGER.info('adding subscriber for broadcasts of %d', pk)
+        LOGGER.info('adding subscriber for broadcasts of %s', ', '.join(str(pk) for pk in pending))
         self._communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+
+        terminated = self._get_terminated_pks(pending)
+
+        for pk in list(pending):
+            if pk in terminated:
+                self._loop.add_callback(inline_callback, pk)
+            else:
+                self._poll_process(pk, functools.partial(inline_callback, pk))
 
     def get_process_future(self, pk):
         """Return a future for a process.
@@ -311,15 +418,51 @@ class Runner:  # pylint: disable=too-many-public-methods
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
 
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
+    def _poll_process(self, pk, callback):
+        """Add the process of the given pk to the processes whose termination is checked by the backup polling.
+
+        All processes that are awaited through this runner are polled together, see :meth:`_poll_processes`.
 
-        :param node: the process node
+        :param pk: pk of the process
         :param callback: callback to be called when process is terminated
         """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
-            self._loop.add_callback(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
+        self._polled_processes.setdefault(pk, []).append(callback)
+
+        if self._poll_handle is None:
+            self._poll_handle = self._loop.call_later(self._poll_interval, self._poll_processes)
+
+    def _poll_processes(self):
+        """Check which of the polled processes are terminated, call their callbacks and reschedule for the others.
+
+        The process states of all polled processes are retrieved with a single query, such that the cost of polling does
+        not grow with the number of processes that are awaited.
+        """
+        self._poll_handle = None
+
+        if not self._polled_processes:
+            return
+
+        for pk in self._get_terminated_pks(self._polled_processes):
+            LOGGER.info('Process<%d> confirmed to be terminated by backup polling mechanism', pk)
+            for callback in self._polled_processes.pop(pk):
+                self._loop.add_callback(callback)
+
+        if self._polled_processes:
+            self._poll_handle = self._loop.call_later(self._poll_interval, self._poll_processes)
+
+    def _get_terminated_pks(self, pks):
+        """Return the pks of the processes that are terminated.
+
+        :param pks: an iterable of process pks
+        :return: set of the pks of the processes among `pks` that are terminated
+        """
+        filters = {
+            'id': {
+                'in': list(pks)
+            },
+            'attributes.{}'.format(ProcessNode.PROCESS_STATE_KEY): {
+                'in': self._TERMINATED_STATES
+            },
+        }
+        builder = QueryBuilder().append(ProcessNode, filters=filters, project='id')
+        return {pk for pk, in builder.iterall()}
@@ -11,6 +11,7 @@
 from collections import namedtuple
 import contextlib
 import logging
+import time
 import traceback
 from tornado import concurrent, gen, ioloop
 
@@ -25,6 +26,9 @@ class TransportRequest:
         super().__init__()
         self.future = concurrent.Future()
         self.count = 0
+        self.open_handle = None
+        self.idle_handle = None
+        self.broken = False
 
 
 class TransportQueue:
@@ -37,21 +41,88 @@ class TransportQueue:
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    If a keep alive time is set, a transport is not closed as soon as the last
+    client is done with it, but is kept open for that many seconds.  Clients that
+    request the transport of the same authinfo in the meantime reuse the open
+    connection straight away, without having to wait for the safe open interval.
     """
     AuthInfoEntry = namedtuple('AuthInfoEntry', ['authinfo', 'transport', 'callbacks', 'callback_handle'])
 
-    def __init__(self, loop=None):
+    def __init__(self, loop=None, keep_alive=0):
         """
         :param loop: The event loop to use, will use `tornado.ioloop.IOLoop.current()` if not supplied
         :type loop: :class:`tornado.ioloop.IOLoop`
+        :param keep_alive: the time in seconds an idle transport is kept open for reuse, 0 closes it immediately
         """
         self._loop = loop if loop is not None else ioloop.IOLoop.current()
+        self._keep_alive = keep_alive
         self._transport_requests = {}
+        self._metrics = {'opened': 0, 'reused': 0, 'closed': 0, 'failed': 0, 'requests': 0, 'wait_time': 0.}
 
     def loop(self):
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    def get_metrics(self):
+        """Return the usage statistics of this transport queue.
+
+        The statistics are returned as a dictionary with the following keys:
+
+            * `requests`: the number of transport requests
+            * `opened`: the number of transports that were opened
+            * `reused`: the number of requests that were served by a transport that was already open
+            * `closed`: the number of transports that were closed
+            * `failed`: the number of transports that failed to open
+            * `wait_time`: the total time in seconds that requests waited for their transport
+
+        :return: dictionary with the usage statistics
+        """
+        return dict(self._metrics)
+
+    def close(self):
+        """Close all transports that are kept open but are not currently in use."""
+        for authinfo_id, transport_request in list(self._transport_requests.items()):
+            if transport_request.idle_handle is not None:
+                self._loop.remove_timeout(transport_request.idle_handle)
+                self._close_transport(authinfo_id, transport_request)
+
+    def _discard_request(self, authinfo_id, transport_request):
+        """Remove the given transport request, unless it has already been replaced by a newer one."""
+        if self._transport_requests.get(authinfo_id, None) is transport_request:
+            self._transport_requests.pop(authinfo_id)
+
+    def _close_transport(self, authinfo_id, transport_request):
+        """Close the transport of a transport request whose future has resolved and discard the request."""
+        self._discard_request(authinfo_id, transport_request)
+        transport_request.idle_handle = None
+
+        if transport_request.future.exception() is None and transport_request.future.result().is_open:
+            _LOGGER.debug('Transport request closing transport for authinfo<%d>', authinfo_id)
+            transport_request.future.result().close()
+            self._metrics['closed'] += 1
+            _LOGGER.debug('Transport queue metrics: %s', self._metrics)
+
+    def _get_idle_request(self, authinfo_id):
+        """Return the transport request for the given authinfo if it holds an idle transport that can be reused.
+
+        The request is no longer considered idle when it is returned. If the idle transport was closed in the meantime,
+        the request is discarded and None is returned.
+        """
+        transport_request = self._transport_requests.get(authinfo_id, None)
+
+        if transport_request is None or transport_request.idle_handle is None:
+            return transport_request
+
+        self._loop.remove_timeout(transport_request.idle_handle)
+        transport_request.idle_handle = None
+
+        if transport_request.future.result().is_open:
+            return transport_request
+
+        self._discard_request(authinfo_id, transport_request)
+        return None
+
     @contextlib.contextmanager
     def request_transport(self, authinfo):
         """
@@ -68,8 +139,8 @@ class TransportQueue:
         :param authinfo: The authinfo to be used to get transport
         :return: A future that can be yielded to give the transport
         """
-        open_callback_handle = None
-        transport_request = self._transport_requests.get(authinfo.id, None)
+        transport_request = self._get_idle_request(authinfo.id)
+        self._metrics['requests'] += 1
 
         if transport_request is None:
             # There is no existing request for this transport (i.e. on this authinfo)
@@ -81,6 +152,8 @@ class TransportQueue:
 
             def do_open():
                 """ Actually open the transport """
+                transport_request.open_handle = None
+
                 if transport_request.count > 0:
                     # The user still wants the transport so open it
                     _LOGGER.debug('Transport request opening transport for %s', authinfo)
@@ -88,15 +161,27 @@ class TransportQueue:
                         transport.open()
                     except Exception as exception:  # pylint: disable=broad-except
                         _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
+                        self._metrics['failed'] += 1
                         transport_request.future.set_exception(exception)
 
                         # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.id, None)
+                        self._discard_request(authinfo.id, transport_request)
                     else:
+                        self._metrics['opened'] += 1
                         transport_request.future.set_result(transport)
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
+            transport_request.open_handle = self._loop.call_later(safe_open_interval, do_open)
+        elif transport_request.future.done():
+            self._metrics['reused'] += 1
+
+        if not transport_request.future.done():
+            time_requested = time.time()
+
+            def record_wait_time(_):
+                self._metrics['wait_time'] += time.time() - time_requested
+
+            transport_request.future.add_done_callback(record_wait_time)
 
         try:
             transport_request.count += 1
@@ -106,6 +191,9 @@ class TransportQueue:
             raise
         except Exception:
             _LOGGER.error('Exception whilst using transport:\n%s', traceback.format_exc())
+            # The connection may be in a bad state, so make sure it is not reused by new requests
+            transport_request.broken = True
+            self._discard_request(authinfo.id, transport_request)
             raise
         finally:
             transport_request.count -= 1
@@ -113,9 +201,14 @@ class TransportQueue:
             # Check if there are no longer any users that want the transport
             if transport_request.count == 0:
                 if transport_request.future.done():
-                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
-                    transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    self._loop.remove_timeout(open_callback_handle)
-
-                self._transport_requests.pop(authinfo.id, None)
+                    keep_alive = self._keep_alive > 0 and not transport_request.broken
+                    if keep_alive and transport_request.future.exception() is None:
+                        transport_request.idle_handle = self._loop.call_later(
+                            self._keep_alive, self._close_transport, authinfo.id, transport_request
+                        )
+                    else:
+                        self._close_transport(authinfo.id, transport_request)
+                else:
+                    if transport_request.open_handle is not None:
+                        self._loop.remove_timeout(transport_request.open_handle)
+                    self._discard_request(authinfo.id, transport_request)
@@ -230,16 +230,91 @@ def loop_scope(loop):
         current.make_current()
 
 
+class ProcessStateChangeRecorder:
+    """Record the last time that a process of each process type changed its state in the global settings.
+
+    Every state change of every process would update the same settings row, which becomes a point of lock contention
+    when many processes run concurrently in several daemon workers. With a non-zero `interval`, the timestamps are
+    therefore aggregated in memory and written at most once every `interval` seconds, where a delayed call on the event
+    loop ensures that the most recent state change is written eventually. Without a loop or interval, every timestamp
+    is written immediately.
+    """
+
+    def __init__(self, loop=None, interval=0):
+        """Construct a new recorder.
+
+        :param loop: the event loop on which to schedule the delayed writes
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        :param interval: the minimum time in seconds between two writes of the settings
+        """
+        self._loop = loop
+        self._interval = interval
+        self._pending = {}
+        self._last_flush = None
+        self._flush_handle = None
+
+    def record(self, process_type):
+        """Record that a process of the given process type changed its state now.
+
+        :param process_type: the process type, either 'calculation' or 'work'
+        """
+        from aiida.common import timezone
+
+        self._pending[process_type] = timezone.datetime_to_isoformat(timezone.now())
+
+        if self._loop is None or self._interval <= 0:
+            self.flush()
+            return
+
+        # A write is already scheduled, which will write the timestamp that was just recorded
+        if self._flush_handle is not None:
+            return
+
+        delay = 0 if self._last_flush is None else self._last_flush + self._interval - self._loop.time()
+
+        if delay <= 0:
+            self.flush()
+        else:
+            self._flush_handle = self._loop.call_later(delay, self.flush)
+
+    def flush(self):
+        """Write the timestamps that were recorded since the last write to the global settings."""
+        from aiida.common.exceptions import UniquenessError
+        from aiida.manage.manager import get_manager  # pylint: disable=cyclic-import
+
+        if self._flush_handle is not None:
+            self._loop.remove_timeout(self._flush_handle)
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        if self._loop is not None:
+            self._last_flush = self._loop.time()
+
+        pending, self._pending = self._pending, {}
+        manager = get_manager().get_backend_manager().get_settings_manager()
+
+        for process_type, value in pending.items():
+            key = PROCESS_STATE_CHANGE_KEY.format(process_type)
+            description = PROCESS_STATE_CHANGE_DESCRIPTION.format(process_type)
+            try:
+                manager.set(key, value, description)
+            except UniquenessError as exception:
+                LOGGER.debug('could not update the {} setting because of a UniquenessError: {}'.format(key, exception))
+
+
 def set_process_state_change_timestamp(process):
     """
     Set the global setting that reflects the last time a process changed state, for the process type
     of the given process, to the current timestamp. The process type will be determined based on
     the class of the calculation node it has as its database container.
 
+    The timestamp is passed to the process state change recorder of the manager, which in a daemon worker writes it
+    with a limited rate, see :class:`ProcessStateChangeRecorder`.
+
     :param process: the Process instance that changed its state
     """
-    from aiida.common import timezone
-    from aiida.common.exceptions import UniquenessError
     from aiida.manage.manager import get_manager  # pylint: disable=cyclic-import
     from aiida.orm import ProcessNode, CalculationNode, WorkflowNode
 
@@ -253,15 +328,7 @@ def set_process_state_change_timestamp(process):
     else:
         raise ValueError('unsupported calculation node type {}'.format(type(process.node)))
 
-    key = PROCESS_STATE_CHANGE_KEY.format(process_type)
-    description = PROCESS_STATE_CHANGE_DESCRIPTION.format(process_type)
-    value = timezone.datetime_to_isoformat(timezone.now())
-
-    try:
-        manager = get_manager()
-        manager.get_backend_manager().get_settings_manager().set(key, value, description)
-    except UniquenessError as exception:
-        process.logger.debug('could not update the {} setting because of a UniquenessError: {}'.format(key, exception))
+    get_manager().get_process_state_change_recorder().record(process_type)
 
 
 def get_process_state_change_timestamp(process_type=None):
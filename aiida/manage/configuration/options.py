@@ -31,6 +31,22 @@ CONFIG_OPTIONS = {
         'description': 'The polling interval in seconds to be used by process runners',
         'global_only': False,
     },
+    'runner.state_change.interval': {
+        'key': 'runner_state_change_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 5,
+        'description': 'Minimum seconds between writes of the last process state change time by a daemon worker',
+        'global_only': False,
+    },
+    'transport.keep_alive': {
+        'key': 'transport_keep_alive',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Seconds that the engine keeps an idle transport open for reuse, 0 closes it at once',
+        'global_only': False,
+    },
     'daemon.default_workers': {
         'key': 'daemon_default_workers',
         'valid_type': 'int',
@@ -65,6 +81,14 @@ CONFIG_OPTIONS = {
         '(1GB) when creating large numbers of database records in one go.',
         'global_only': False,
     },
+    'repository.backend': {
+        'key': 'repository_backend',
+        'valid_type': 'string',
+        'valid_values': ['folder', 'objectstore'],
+        'default': 'folder',
+        'description': 'Repository backend for new nodes: a `folder` per node or a content-addressable `objectstore`',
+        'global_only': False,
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
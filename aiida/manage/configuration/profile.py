@@ -20,6 +20,7 @@ CIRCUS_PID_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.pid')
 DAEMON_PID_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'aiida-{}.pid')
 CIRCUS_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'circus-{}.log')
 DAEMON_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'aiida-{}.log')
+DAEMON_JOBS_CACHE_DIR_TEMPLATE = os.path.join(DAEMON_DIR, 'jobs-{}')
 CIRCUS_PORT_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.port')
 CIRCUS_SOCKET_FILE_TEMPATE = os.path.join(DAEMON_DIR, 'circus-{}.sockets')
 CIRCUS_CONTROLLER_SOCKET_TEMPLATE = 'circus.c.sock'
@@ -301,5 +302,6 @@ class Profile:  # pylint: disable=too-many-public-methods
             'daemon': {
                 'log': DAEMON_LOG_FILE_TEMPLATE.format(self.name),
                 'pid': DAEMON_PID_FILE_TEMPLATE.format(self.name),
+                'jobs': DAEMON_JOBS_CACHE_DIR_TEMPLATE.format(self.name),
             }
         }
@@ -8,12 +8,87 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Function to delete nodes from the database."""
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 from aiida.cmdline.utils import echo
 
+# Key of the setting in which the UUIDs of the nodes whose repository folders still have to be removed are stored
+DELETE_PENDING_KEY = 'delete|pending_repositories'
+DELETE_PENDING_DESCRIPTION = 'The UUIDs of deleted nodes whose repository folders were not yet removed'
 
-def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
+# Key of the setting in which the PKs of all the nodes of a deletion that is in progress are stored
+DELETE_NODES_KEY = 'delete|pending_nodes'
+DELETE_NODES_DESCRIPTION = 'The PKs of the nodes of a deletion that was started but not yet completed'
+
+
+def _erase_repository_folders(uuids, max_workers=None):
+    """Remove the repository folders of the nodes with the given UUIDs, in a pool of threads.
+
+    Folders that do not exist, for example those of nodes whose content is in the object store, are skipped.
+    """
+    from aiida.common.folders import RepositoryFolder
+    from aiida.orm.utils.repository import Repository
+
+    def erase(uuid):
+        RepositoryFolder(section=Repository._section_name, uuid=uuid).erase()  # pylint: disable=protected-access
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(erase, uuids))
+
+
+def remove_pending_repositories(max_workers=None):
+    """Remove the repository folders that were left behind by an interrupted call of :func:`delete_nodes`.
+
+    The UUIDs of nodes that still exist in the database are skipped, because the interruption happened before their
+    deletion was committed.
+
+    :param max_workers: the maximum number of threads that remove folders
+    :return: the number of repository folders that were removed
+    """
+    from aiida.common import exceptions
+    from aiida.manage.manager import get_manager
+    from aiida.orm import Node, QueryBuilder
+
+    settings = get_manager().get_backend_manager().get_settings_manager()
+
+    try:
+        uuids = set(settings.get(DELETE_PENDING_KEY).value)
+    except exceptions.NotExistent:
+        return 0
+
+    if uuids:
+        builder = QueryBuilder().append(Node, filters={'uuid': {'in': list(uuids)}}, project='uuid')
+        uuids.difference_update(uuid for uuid, in builder.iterall())
+        _erase_repository_folders(uuids, max_workers)
+
+    settings.delete(DELETE_PENDING_KEY)
+
+    return len(uuids)
+
+
+def _get_pending_nodes(settings):
+    """Return the PKs of the nodes of an interrupted call of :func:`delete_nodes` that still exist.
+
+    :param settings: the settings manager of the profile
+    :return: set of PKs
+    """
+    from aiida.common import exceptions
+    from aiida.orm import Node, QueryBuilder
+
+    try:
+        pks = settings.get(DELETE_NODES_KEY).value
+    except exceptions.NotExistent:
+        return set()
+
+    if not pks:
+        return set()
+
+    builder = QueryBuilder().append(Node, filters={'id': {'in': pks}}, project='id')
+    return {pk for pk, in builder.iterall()}
+
+
+def delete_nodes(pks, verbosity=0, dry_run=False, force=False, chunk_size=1000, max_workers=None, **kwargs):
     """Delete nodes by a list of pks.
 
     This command will delete not only the specified nodes, but also the ones that are
@@ -48,29 +123,51 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
         to the verbosity level set.
     :param bool force:
         Do not ask for confirmation to delete nodes.
+    :param int chunk_size: the maximum number of nodes that are deleted in a single transaction. If None, all nodes
+        are deleted in a single transaction.
+    :param int max_workers: the maximum number of threads that remove repository folders.
+
+    The nodes are deleted in chunks of increasing pk, each in its own transaction, so an interrupted deletion can leave
+    part of the nodes in the database. Therefore the PKs of all the nodes to delete are stored in the settings of the
+    profile before the first chunk is deleted and the setting is only removed once all chunks are deleted. The nodes
+    of an interrupted deletion that remain are deleted by the next call, even if the nodes that it started from no
+    longer exist, such that calling this function again with the same arguments completes it. Likewise, before the
+    nodes of a chunk are deleted, their UUIDs are stored in the settings of the profile and the setting is removed once
+    their repository folders have been removed. Folders left behind by an interruption are removed by the next call,
+    or explicitly with :func:`remove_pending_repositories`.
     """
     # pylint: disable=too-many-arguments,too-many-branches,too-many-locals,too-many-statements
     from aiida.backends.utils import delete_nodes_and_connections
-    from aiida.common import exceptions
-    from aiida.orm import Node, QueryBuilder, load_node
+    from aiida.manage.manager import get_manager
+    from aiida.orm import Node, QueryBuilder
     from aiida.tools.graph.graph_traversers import get_nodes_delete
 
+    settings = get_manager().get_backend_manager().get_settings_manager()
+    pending_pks = _get_pending_nodes(settings)
+
+    pks = list(pks)
+    builder = QueryBuilder().append(Node, filters={'id': {'in': pks}}, project='id')
+    existing_pks = {pk for pk, in builder.iterall()} if pks else set()
+
     starting_pks = []
     for pk in pks:
-        try:
-            load_node(pk)
-        except exceptions.NotExistent:
-            echo.echo_warning('warning: node with pk<{}> does not exist, skipping'.format(pk))
-        else:
+        if pk in existing_pks:
             starting_pks.append(pk)
+        else:
+            echo.echo_warning('warning: node with pk<{}> does not exist, skipping'.format(pk))
 
     # An empty set might be problematic for the queries done below.
-    if not starting_pks:
+    if not starting_pks and not pending_pks:
         if verbosity:
             echo.echo('Nothing to delete')
         return
 
-    pks_set_to_delete = get_nodes_delete(starting_pks, **kwargs)['nodes']
+    if pending_pks:
+        echo.echo_warning('resuming the interrupted deletion of {} remaining nodes'.format(len(pending_pks)))
+
+    # The remaining nodes of an interrupted deletion are starting nodes as well, such that the nodes that have to be
+    # deleted along with them are also deleted, even if they were linked to them after the interruption
+    pks_set_to_delete = set(get_nodes_delete(sorted(pending_pks.union(starting_pks)), **kwargs)['nodes'])
 
     if verbosity > 0:
         echo.echo(
@@ -106,21 +203,35 @@ def delete_nodes(pks, verbosity=0, dry_run=False, force=False, **kwargs):
             echo.echo('Exiting without deleting')
             return
 
-    # Recover the list of folders to delete before actually deleting the nodes. I will delete the folders only later,
-    # so that if there is a problem during the deletion of the nodes in the DB, I don't delete the folders
-    repositories = [load_node(pk)._repository for pk in pks_set_to_delete]  # pylint: disable=protected-access
+    remove_pending_repositories(max_workers)
+
+    pks_to_delete = sorted(pks_set_to_delete)
+    settings.set(DELETE_NODES_KEY, pks_to_delete, DELETE_NODES_DESCRIPTION)
+    chunk_size = chunk_size or len(pks_to_delete)
+    num_deleted = 0
 
     if verbosity > 0:
         echo.echo('Starting node deletion...')
-    delete_nodes_and_connections(pks_set_to_delete)
 
-    if verbosity > 0:
-        echo.echo('Nodes deleted from database, deleting files from the repository now...')
+    for index in range(0, len(pks_to_delete), chunk_size):
+        chunk = pks_to_delete[index:index + chunk_size]
+
+        # Record the folders to remove before deleting the nodes, but only remove them once the deletion is committed,
+        # such that a failure in the database does not leave nodes without their files
+        builder = QueryBuilder().append(Node, filters={'id': {'in': chunk}}, project='uuid')
+        uuids = [uuid for uuid, in builder.iterall()]
+        settings.set(DELETE_PENDING_KEY, uuids, DELETE_PENDING_DESCRIPTION)
+
+        delete_nodes_and_connections(chunk)
+        _erase_repository_folders(uuids, max_workers)
+        settings.delete(DELETE_PENDING_KEY)
+
+        num_deleted += len(chunk)
+
+        if verbosity > 0:
+            echo.echo('Deleted {}/{} nodes'.format(num_deleted, len(pks_to_delete)))
 
-    # If we are here, we managed to delete the entries from the DB.
-    # I can now delete the folders
-    for repository in repositories:
-        repository.erase(force=True)
+    settings.delete(DELETE_NODES_KEY)
 
     if verbosity > 0:
         echo.echo('Deletion completed.')
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Functions to recompute the hashes of large numbers of nodes in bulk."""
+import collections
+import time
+
+__all__ = ('RehashReport', 'count_nodes_to_rehash', 'rehash_nodes')
+
+# Key of the setting in which the id of the last node whose hash was written is stored, to allow resuming, together
+# with a digest of the filters of the rehash, such that it is only resumed by a rehash with the same filters
+REHASH_PROGRESS_KEY = 'rehash|last_pk'
+REHASH_PROGRESS_DESCRIPTION = 'The id of the last node that was rehashed by an interrupted bulk rehash and its filters'
+
+
+class RehashReport(collections.namedtuple('RehashReport', ['num_nodes', 'duration'])):
+    """Summary of a bulk rehash: the number of nodes that were rehashed and the wall time it took in seconds."""
+
+    @property
+    def throughput(self):
+        """Return the number of nodes that were rehashed per second."""
+        return self.num_nodes / self.duration if self.duration > 0 else float(self.num_nodes)
+
+
+def _get_filters_digest(node_classes, pks):
+    """Return a digest of the node classes and ids that a rehash is restricted to."""
+    from aiida.common.hashing import make_hash
+
+    if not isinstance(node_classes, (tuple, list)):
+        node_classes = (node_classes,)
+
+    classes = sorted('{}.{}'.format(cls.__module__, cls.__qualname__) for cls in node_classes)
+
+    return make_hash([classes, sorted(pks) if pks is not None else None])
+
+
+def _get_last_pk(node_classes, pks, resume):
+    """Return the id after which to start rehashing.
+
+    This is the stored progress if `resume` is True and the progress was stored by a rehash with the same filters,
+    otherwise the nodes of an interrupted rehash with other filters would be skipped.
+    """
+    from aiida.common import exceptions
+    from aiida.manage.manager import get_manager
+
+    if not resume:
+        return 0
+
+    try:
+        progress = get_manager().get_backend_manager().get_settings_manager().get(REHASH_PROGRESS_KEY).value
+    except exceptions.NotExistent:
+        return 0
+
+    if not isinstance(progress, dict) or progress.get('filters') != _get_filters_digest(node_classes, pks):
+        return 0
+
+    return progress['last_pk']
+
+
+def _initialize_worker(profile_name):
+    """Load the profile and its database environment in a worker process of the pool."""
+    from aiida.manage.configuration import load_profile
+    from aiida.manage.manager import get_manager
+
+    load_profile(profile_name)
+    get_manager().get_backend()
+
+
+def _compute_hashes(pks):
+    """Compute the hashes of the nodes with the given ids.
+
+    :param pks: list of node ids
+    :return: dictionary mapping each node id onto its hash
+    """
+    from aiida.orm import Node, QueryBuilder
+
+    builder = QueryBuilder().append(Node, filters={'id': {'in': pks}})
+    return {node.pk: node.get_hash() for node, in builder.iterall()}
+
+
+def _get_builder(node_classes, pks, last_pk):
+    """Return a query builder for the ids of the nodes to rehash that come after `last_pk`, in ascending order."""
+    from aiida.orm import QueryBuilder
+
+    filters = {'id': {'>': last_pk}}
+
+    if pks is not None:
+        filters = {'and': [filters, {'id': {'in': pks}}]}
+
+    builder = QueryBuilder().append(node_classes, filters=filters, project='id', tag='node')
+    builder.order_by({'node': {'id': 'asc'}})
+
+    return builder
+
+
+def _iter_batches(node_classes, pks, last_pk, batch_size):
+    """Yield lists of at most `batch_size` ids of the nodes to rehash, in ascending order.
+
+    The ids are paged on the id column instead of using a server side cursor, because the hashes of each batch are
+    committed while iterating, which would invalidate the cursor.
+    """
+    while True:
+        builder = _get_builder(node_classes, pks, last_pk).limit(batch_size)
+        batch = [pk for pk, in builder.all()]
+
+        if not batch:
+            return
+
+        yield batch
+        last_pk = batch[-1]
+
+
+def rehash_nodes(node_classes, pks=None, batch_size=1000, processes=1, resume=False, callback=None):
+    """Recompute the hashes of all nodes of the given classes and store them in their extras.
+
+    The ids of the nodes are retrieved in batches, the hashes of each batch are computed, optionally in a pool of
+    worker processes, and written back to the extras in a single database operation per batch. Batches are written in
+    order of increasing node id and after each batch its last id is stored in the settings of the profile. If the
+    rehash is interrupted, it can therefore be continued by calling this function again with the same filters and
+    `resume=True`. The stored progress is ignored by calls with other filters. The setting is removed once all nodes
+    have been rehashed.
+
+    :param node_classes: a node class or tuple of node classes; only nodes that are instances are rehashed
+    :param pks: optional list of node ids to restrict the rehash to
+    :param batch_size: the number of nodes whose hashes are computed and written together
+    :param processes: the number of worker processes that compute hashes; with 1 they are computed in this process
+    :param resume: if True, skip the nodes that were rehashed by a previous interrupted call
+    :param callback: optional callable that is called with the number of nodes after each batch that is written
+    :return: a :class:`RehashReport`
+    """
+    from aiida.common import exceptions
+    from aiida.common.hashing import _HASH_EXTRA_KEY
+    from aiida.manage.manager import get_manager
+
+    manager = get_manager()
+    settings = manager.get_backend_manager().get_settings_manager()
+    nodes = manager.get_backend().nodes
+    digest = _get_filters_digest(node_classes, pks)
+
+    def write(batch, hashes):
+        nodes.bulk_set_extra(_HASH_EXTRA_KEY, hashes)
+        settings.set(REHASH_PROGRESS_KEY, {'filters': digest, 'last_pk': batch[-1]}, REHASH_PROGRESS_DESCRIPTION)
+        if callback is not None:
+            callback(len(batch))
+
+    num_nodes = 0
+    start = time.time()
+    batches = _iter_batches(node_classes, pks, _get_last_pk(node_classes, pks, resume), batch_size)
+
+    if processes > 1:
+        import multiprocessing
+
+        # Spawn the workers such that they do not inherit the database connections of this process
+        context = multiprocessing.get_context('spawn')
+        initargs = (manager.get_profile().name,)
+
+        with context.Pool(processes, initializer=_initialize_worker, initargs=initargs) as pool:
+            # Keep a bounded number of batches in flight and write them in order, so the stored progress is valid
+            pending = collections.deque()
+
+            for batch in batches:
+                pending.append((batch, pool.apply_async(_compute_hashes, (batch,))))
+
+                if len(pending) >= 2 * processes:
+                    batch, result = pending.popleft()
+                    write(batch, result.get())
+                    num_nodes += len(batch)
+
+            while pending:
+                batch, result = pending.popleft()
+                write(batch, result.get())
+                num_nodes += len(batch)
+    else:
+        for batch in batches:
+            write(batch, _compute_hashes(batch))
+            num_nodes += len(batch)
+
+    try:
+        settings.delete(REHASH_PROGRESS_KEY)
+    except exceptions.NotExistent:
+        pass
+
+    return RehashReport(num_nodes, time.time() - start)
+
+
+def count_nodes_to_rehash(node_classes, pks=None, resume=False):
+    """Return the number of nodes that would be rehashed by :func:`rehash_nodes` with the same arguments.
+
+    :param node_classes: a node class or tuple of node classes; only nodes that are instances are counted
+    :param pks: optional list of node ids to restrict the count to
+    :param resume: if True, skip the nodes that were rehashed by a previous interrupted call
+    :return: the number of nodes
+    """
+    return _get_builder(node_classes, pks, _get_last_pk(node_classes, pks, resume)).count()
@@ -140,6 +140,34 @@ class Manager:
 
         return self._backend
 
+    def get_object_store(self):
+        """Return the object store of the file repository of the current profile.
+
+        :return: the object store instance
+        :rtype: :class:`aiida.repository.ObjectStore`
+        """
+        if self._object_store is None:
+            import os
+            from aiida.repository import ObjectStore
+            self._object_store = ObjectStore(os.path.join(self.get_profile().repository_path, 'container'))
+
+        return self._object_store
+
+    def get_process_state_change_recorder(self):
+        """Return the recorder of the last time that processes changed their state.
+
+        For a daemon worker, this is the recorder that was created with its daemon runner, which writes the timestamps
+        with a limited rate. Otherwise every timestamp is written immediately.
+
+        :return: the recorder instance
+        :rtype: :class:`aiida.engine.utils.ProcessStateChangeRecorder`
+        """
+        if self._process_state_change_recorder is None:
+            from aiida.engine.utils import ProcessStateChangeRecorder
+            self._process_state_change_recorder = ProcessStateChangeRecorder()
+
+        return self._process_state_change_recorder
+
     def get_persister(self):
         """Return the persister
 
@@ -277,7 +305,9 @@ class Manager:
         profile = self.get_profile()
         poll_interval = 0.0 if profile.is_test_profile else config.get_option('runner.poll.interval', profile.name)
 
-        settings = {'rmq_submit': False, 'poll_interval': poll_interval}
+        transport_keep_alive = config.get_option('transport.keep_alive', profile.name)
+
+        settings = {'rmq_submit': False, 'poll_interval': poll_interval, 'transport_keep_alive': transport_keep_alive}
         settings.update(kwargs)
 
         if 'communicator' not in settings:
@@ -301,9 +331,14 @@ class Manager:
         """
         import plumpy
         from aiida.engine import persistence
+        from aiida.engine.processes.calcjobs.manager import SharedJobsCache
+        from aiida.engine.utils import ProcessStateChangeRecorder
         from aiida.manage.external import rmq
 
-        runner = self.create_runner(rmq_submit=True, loop=loop)
+        # The job managers of all daemon workers of this profile share the job states polled from the schedulers
+        shared_jobs_cache = SharedJobsCache(self.get_profile().filepaths['daemon']['jobs'])
+
+        runner = self.create_runner(rmq_submit=True, loop=loop, shared_jobs_cache=shared_jobs_cache)
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
@@ -316,6 +351,16 @@ class Manager:
 
         runner.communicator.add_task_subscriber(task_receiver)
 
+        # Aggregate the state change timestamps of the processes of this worker and write them with a limited rate
+        profile = self.get_profile()
+        interval = self.get_config().get_option('runner.state_change.interval', profile.name)
+        interval = 0 if profile.is_test_profile else interval
+
+        if self._process_state_change_recorder is not None:
+            self._process_state_change_recorder.flush()
+
+        self._process_state_change_recorder = ProcessStateChangeRecorder(runner_loop, interval)
+
         return runner
 
     def close(self):
@@ -334,6 +379,8 @@ class Manager:
         self._process_controller = None
         self._persister = None
         self._runner = None
+        self._object_store = None
+        self._process_state_change_recorder = None
 
     def __init__(self):
         super().__init__()
@@ -346,6 +393,8 @@ class Manager:
         self._process_controller = None  # type: plumpy.RemoteProcessThreadController
         self._persister = None  # type: aiida.engine.persistence.AiiDAPersister
         self._runner = None  # type: aiida.engine.runners.Runner
+        self._object_store = None  # type: aiida.repository.ObjectStore
+        self._process_state_change_recorder = None  # type: aiida.engine.utils.ProcessStateChangeRecorder
 
 
 def get_manager():
@@ -11,8 +11,10 @@
 
 # pylint: disable=import-error,no-name-in-module
 from datetime import datetime
+import json
+
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import transaction, IntegrityError
+from django.db import connection, transaction, IntegrityError
 
 from aiida.backends.djsite.db import models
 from aiida.common import exceptions
@@ -210,7 +212,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.attributes[key] = value
-        self._flush_if_stored({'attributes'})
+        self._update_attributes_if_stored(updated={key: value})
 
     def set_attribute_many(self, attributes):
         """Set multiple attributes.
@@ -226,7 +228,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
             # We need to use `self.dbmodel` without the underscore, because otherwise the second iteration will refetch
             # what is in the database and we lose the initial changes.
             self.dbmodel.attributes[key] = value
-        self._flush_if_stored({'attributes'})
+        self._update_attributes_if_stored(updated=attributes)
 
     def reset_attributes(self, attributes):
         """Reset the attributes.
@@ -238,8 +240,9 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         if self.is_stored:
             attributes = clean_value(attributes)
 
+        deleted = set(self._dbmodel.attributes.keys()).difference(attributes.keys())
         self.dbmodel.attributes = attributes
-        self._flush_if_stored({'attributes'})
+        self._update_attributes_if_stored(updated=attributes, deleted=deleted)
 
     def delete_attribute(self, key):
         """Delete an attribute.
@@ -252,7 +255,7 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
         else:
-            self._flush_if_stored({'attributes'})
+            self._update_attributes_if_stored(deleted=(key,))
 
     def delete_attribute_many(self, keys):
         """Delete multiple attributes.
@@ -268,12 +271,13 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.attributes.pop(key)
 
-        self._flush_if_stored({'attributes'})
+        self._update_attributes_if_stored(deleted=keys)
 
     def clear_attributes(self):
         """Delete all attributes."""
-        self._dbmodel.attributes = {}
-        self._flush_if_stored({'attributes'})
+        deleted = list(self._dbmodel.attributes.keys())
+        self.dbmodel.attributes = {}
+        self._update_attributes_if_stored(deleted=deleted)
 
     def attributes_items(self):
         """Return an iterator over the attributes.
@@ -439,6 +443,36 @@ class DjangoNode(entities.DjangoModelEntity[models.DbNode], BackendNode):
         if self._dbmodel.is_saved():
             self._dbmodel._flush(fields)  # pylint: disable=protected-access
 
+    def _suspend_attributes_refresh(self):
+        return self._dbmodel.suspend_refresh('attributes')
+
+    def _write_attribute_updates(self, updated, deleted):
+        """Write changes to the attributes of the stored node to the database in a single partial update.
+
+        The attributes that were set are merged into the attributes column and those that were deleted are removed from
+        it, such that the other attributes are not rewritten.
+
+        :param updated: dictionary with the new values of the attributes that were set
+        :param deleted: the keys of the attributes that were deleted
+        """
+        if not updated and not deleted:
+            return
+
+        expression = 'attributes'
+        parameters = []
+
+        for key in deleted:
+            expression = '({} - %s::text)'.format(expression)
+            parameters.append(key)
+
+        parameters.extend([json.dumps(updated), self.id])
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE db_dbnode SET attributes = {} || %s::jsonb, mtime = NOW() WHERE id = %s'.format(expression),
+                parameters
+            )
+
     def add_incoming(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
 
@@ -515,6 +549,9 @@ class DjangoNodeCollection(BackendNodeCollection):
 
     ENTITY_CLASS = DjangoNode
 
+    # Maximum number of rows per multi-row insert statement of `store_many`
+    BULK_BATCH_SIZE = 1000
+
     def get(self, pk):
         """Return a Node entry from the collection with the given id
 
@@ -534,3 +571,59 @@ class DjangoNodeCollection(BackendNodeCollection):
             models.DbNode.objects.filter(pk=pk).delete()  # pylint: disable=no-member
         except ObjectDoesNotExist:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def store_many(self, nodes, links=None, with_transaction=True):
+        """Store multiple new nodes and links with a multi-row insert for each table instead of one insert per row.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target`
+            are `BackendNode` instances that are either already stored or included in `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        import contextlib
+        from aiida.backends.djsite.db.models import suppress_auto_now
+        from aiida.common import timezone
+
+        dbmodels = [node.dbmodel for node in nodes]
+        now = timezone.now()
+
+        # The modification time is set explicitly, such that nodes with a predefined `mtime` can be stored together
+        for dbmodel in dbmodels:
+            if dbmodel.mtime is None:
+                dbmodel.mtime = now
+
+        with transaction.atomic() if with_transaction else contextlib.suppress():
+            with suppress_auto_now([(models.DbNode, ['mtime'])]):
+                # On PostgreSQL this sets the primary keys of the model instances from the `RETURNING` clause
+                models.DbNode.objects.bulk_create(dbmodels, batch_size=self.BULK_BATCH_SIZE)
+
+            if links:
+                dblinks = [
+                    self.ENTITY_CLASS.LINK_CLASS(
+                        input_id=source.id, output_id=target.id, label=link_label, type=link_type.value
+                    ) for source, target, link_type, link_label in links
+                ]
+                try:
+                    with transaction.atomic():
+                        self.ENTITY_CLASS.LINK_CLASS.objects.bulk_create(dblinks, batch_size=self.BULK_BATCH_SIZE)
+                except IntegrityError as exception:
+                    raise exceptions.UniquenessError('failed to create the links: {}'.format(exception))
+
+    def bulk_set_extra(self, key, values):
+        """Set an extra to a different value for each of a set of stored nodes in a single database operation.
+
+        :param key: key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra
+        """
+        if not values:
+            return
+
+        pks = list(values.keys())
+        serialized = [json.dumps(clean_value(values[pk])) for pk in pks]
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                'UPDATE db_dbnode AS node SET extras = jsonb_set(node.extras, %s::text[], data.value) '
+                'FROM unnest(%s::integer[], %s::jsonb[]) AS data(id, value) WHERE node.id = data.id',
+                [[key], pks, serialized]
+            )
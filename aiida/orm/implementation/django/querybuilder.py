@@ -287,6 +287,14 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity == value)], else_=False)
+            if isinstance(value, str):
+                # The additional condition does not change the result, since the `case` is only true if it holds, but
+                # unlike the `case` it allows the database to use an expression index on the text value of the key, such
+                # as the one on `extras #>> '{_aiida_hash}'` that is used to find nodes with the same hash for caching.
+                expr = and_(casted_entity == value, expr)
+            elif isinstance(value, bool):
+                # Likewise for booleans, whose text value is `true` or `false`, such as the `paused` attribute
+                expr = and_(database_entity.astext == ('true' if value else 'false'), expr)
         elif operator == '>':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
             expr = case([(type_filter, casted_entity > value)], else_=False)
@@ -318,6 +326,9 @@ class DjangoQueryBuilder(BackendQueryBuilder):
         elif operator == 'in':
             type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
             expr = case([(type_filter, casted_entity.in_(value))], else_=False)
+            if all(isinstance(item, str) for item in value):
+                # See the equality operator, this allows the use of an index such as the one on `process_state`
+                expr = and_(casted_entity.in_(value), expr)
         elif operator == 'contains':
             expr = database_entity.cast(JSONB).contains(value)
         elif operator == 'has_key':
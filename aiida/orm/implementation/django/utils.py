@@ -8,6 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Utilities for the implementation of the Django backend."""
+import contextlib
 
 # pylint: disable=import-error,no-name-in-module
 from django.db import transaction, IntegrityError
@@ -41,6 +42,7 @@ class ModelWrapper:
         # Have to do it this way because we overwrite __setattr__
         object.__setattr__(self, '_model', model)
         object.__setattr__(self, '_auto_flush', auto_flush)
+        object.__setattr__(self, '_unrefreshed_fields', frozenset())
 
     def __getattr__(self, item):
         """Get an attribute of the model instance.
@@ -51,7 +53,7 @@ class ModelWrapper:
         :param item: the name of the model field
         :return: the value of the model's attribute
         """
-        if self.is_saved() and self._is_mutable_model_field(item):
+        if self.is_saved() and self._is_refreshed_field(item):
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
@@ -89,6 +91,33 @@ class ModelWrapper:
             except IntegrityError as exception:
                 raise exceptions.IntegrityError(str(exception))
 
+    @contextlib.contextmanager
+    def suspend_refresh(self, *fields):
+        """Return a context within which the given fields are not refreshed from the database when they are accessed.
+
+        The fields are refreshed once when entering the context. Changes that are made to their values in memory within
+        the context are therefore not lost when accessing them again, before they are written to the database.
+
+        :param fields: the names of the model fields
+        """
+        unrefreshed_fields = self._unrefreshed_fields
+
+        if self.is_saved():
+            self._ensure_model_uptodate(fields=fields)
+
+        object.__setattr__(self, '_unrefreshed_fields', unrefreshed_fields.union(fields))
+        try:
+            yield
+        finally:
+            object.__setattr__(self, '_unrefreshed_fields', unrefreshed_fields)
+
+    def _is_refreshed_field(self, field):
+        """Return whether the field is refreshed from the database when it is accessed.
+
+        :return: boolean, True if the field is a mutable model field whose refresh is not suspended.
+        """
+        return field not in self._unrefreshed_fields and self._is_mutable_model_field(field)
+
     def _is_mutable_model_field(self, field):
         """Return whether the field is a mutable field of the model.
 
@@ -10,17 +10,28 @@
 """Abstract BackendNode and BackendNodeCollection implementation."""
 
 import abc
+import collections
+import contextlib
 
 from . import backends
 
 __all__ = ('BackendNode', 'BackendNodeCollection')
 
+# Marker for the attributes that were deleted within `BackendNode.batch_attribute_updates`
+_DELETED = object()
+
 
 class BackendNode(backends.BackendEntity):
     """Wrapper around a `DbNode` instance to set and retrieve data independent of the database implementation."""
 
     # pylint: disable=too-many-public-methods
 
+    # The values of the attributes that were changed within `batch_attribute_updates` and that are not yet written
+    _attribute_updates = None
+
+    # The callables that are to be called once the changes within `batch_attribute_updates` have been written
+    _attribute_updates_callbacks = None
+
     @abc.abstractmethod
     def clone(self):
         """Return an unstored clone of ourselves.
@@ -96,6 +107,23 @@ class BackendNode(backends.BackendEntity):
         """
         self._dbmodel.description = value
 
+    @property
+    def repository_metadata(self):
+        """Return the node repository metadata.
+
+        :return: the virtual file hierarchy of the objects in the repository object store or `None` if the repository
+            content of the node is stored in a repository folder
+        """
+        return self._dbmodel.repository_metadata
+
+    @repository_metadata.setter
+    def repository_metadata(self, value):
+        """Set the repository metadata.
+
+        :param value: the new value to set
+        """
+        self._dbmodel.repository_metadata = value
+
     @abc.abstractproperty
     def computer(self):
         """Return the computer of this node.
@@ -251,6 +279,80 @@ class BackendNode(backends.BackendEntity):
         :return: an iterator with attribute keys
         """
 
+    @contextlib.contextmanager
+    def batch_attribute_updates(self):
+        """Return a context within which changes to the attributes of a stored node are written at once.
+
+        Outside of this context, every change to the attributes of a stored node is written to the database immediately.
+        Within it, the changes are only applied to the node in memory and when the context exits, the attributes that
+        were set or deleted are written with a single partial update of the attributes column. The attributes that were
+        not touched, however large they are, are not rewritten. Contexts can be nested, in which case the changes are
+        written when the outermost context exits. For an unstored node, the context has no effect.
+        """
+        if not self.is_stored or self._attribute_updates is not None:
+            yield
+            return
+
+        self._attribute_updates = collections.OrderedDict()
+        self._attribute_updates_callbacks = []
+
+        try:
+            with self._suspend_attributes_refresh():
+                yield
+        finally:
+            updates, self._attribute_updates = self._attribute_updates, None
+            callbacks, self._attribute_updates_callbacks = self._attribute_updates_callbacks, None
+            self._write_attribute_updates(
+                {key: value for key, value in updates.items() if value is not _DELETED},
+                [key for key, value in updates.items() if value is _DELETED],
+            )
+            for callback in callbacks:
+                callback()
+
+    def call_after_attribute_updates(self, callback):
+        """Call the given callable once the changes to the attributes that were made so far are written.
+
+        Within :meth:`batch_attribute_updates`, the callable is called when the outermost context exits, after the
+        changes have been written successfully. It is not called if writing them fails. Outside of the context, the
+        changes have already been written, so the callable is called immediately.
+
+        :param callback: a callable without arguments
+        """
+        if self._attribute_updates is None:
+            callback()
+        else:
+            self._attribute_updates_callbacks.append(callback)
+
+    def _update_attributes_if_stored(self, updated=None, deleted=()):
+        """Write the attributes that were set or deleted to the database, if the node is stored.
+
+        Within :meth:`batch_attribute_updates`, the changes are only recorded, to be written when the context exits.
+
+        :param updated: dictionary with the new values of the attributes that were set
+        :param deleted: the keys of the attributes that were deleted
+        """
+        if not self.is_stored:
+            return
+
+        if self._attribute_updates is None:
+            self._write_attribute_updates(updated or {}, deleted)
+            return
+
+        self._attribute_updates.update((key, _DELETED) for key in deleted)
+        self._attribute_updates.update(updated or {})
+
+    @abc.abstractmethod
+    def _suspend_attributes_refresh(self):
+        """Return a context within which the attributes are not refreshed from the database when they are accessed."""
+
+    @abc.abstractmethod
+    def _write_attribute_updates(self, updated, deleted):
+        """Write changes to the attributes of the stored node to the database in a single partial update.
+
+        :param updated: dictionary with the new values of the attributes that were set
+        :param deleted: the keys of the attributes that were deleted
+        """
+
     @abc.abstractproperty
     def extras(self):
         """Return the complete extras dictionary.
@@ -400,3 +502,25 @@ class BackendNodeCollection(backends.BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    @abc.abstractmethod
+    def store_many(self, nodes, links=None, with_transaction=True):
+        """Store multiple new nodes and links with a multi-row insert for each table instead of one insert per row.
+
+        .. note:: the attributes and extras of the nodes are not cleaned, this is the responsibility of the caller.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target`
+            are `BackendNode` instances that are either already stored or included in `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+
+    @abc.abstractmethod
+    def bulk_set_extra(self, key, values):
+        """Set an extra to a different value for each of a set of stored nodes in a single database operation.
+
+        .. warning:: This bypasses the ORM entities, so nodes that are already loaded will not reflect the change.
+
+        :param key: key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra
+        """
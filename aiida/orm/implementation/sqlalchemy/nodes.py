@@ -10,7 +10,11 @@
 """SqlAlchemy implementation of the `BackendNode` and `BackendNodeCollection` classes."""
 
 # pylint: disable=no-name-in-module,import-error
+import contextlib
 from datetime import datetime
+import json
+
+from sqlalchemy import text
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -212,8 +216,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
             value = clean_value(value)
 
         self._dbmodel.attributes[key] = value
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._update_attributes_if_stored(updated={key: value})
 
     def set_attribute_many(self, attributes):
         """Set multiple attributes.
@@ -228,8 +231,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key, value in attributes.items():
             self.dbmodel.attributes[key] = value
 
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._update_attributes_if_stored(updated=attributes)
 
     def reset_attributes(self, attributes):
         """Reset the attributes.
@@ -241,9 +243,9 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         if self.is_stored:
             attributes = clean_value(attributes)
 
+        deleted = set(self._dbmodel.attributes.keys()).difference(attributes.keys())
         self.dbmodel.attributes = attributes
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._update_attributes_if_stored(updated=attributes, deleted=deleted)
 
     def delete_attribute(self, key):
         """Delete an attribute.
@@ -256,8 +258,7 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         except KeyError as exception:
             raise AttributeError('attribute `{}` does not exist'.format(exception))
         else:
-            self._flag_field('attributes')
-            self._flush_if_stored()
+            self._update_attributes_if_stored(deleted=(key,))
 
     def delete_attribute_many(self, keys):
         """Delete multiple attributes.
@@ -273,12 +274,13 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         for key in keys:
             self.dbmodel.attributes.pop(key)
 
-        self._flag_field('attributes')
-        self._flush_if_stored()
+        self._update_attributes_if_stored(deleted=keys)
 
     def clear_attributes(self):
         """Delete all attributes."""
-        self._dbmodel.attributes = {}
+        deleted = list(self._dbmodel.attributes.keys())
+        self.dbmodel.attributes = {}
+        self._update_attributes_if_stored(deleted=deleted)
 
     def attributes_items(self):
         """Return an iterator over the attributes.
@@ -449,6 +451,42 @@ class SqlaNode(entities.SqlaModelEntity[models.DbNode], BackendNode):
         if self._dbmodel.is_saved():
             self._dbmodel.save()
 
+    @contextlib.contextmanager
+    def _suspend_attributes_refresh(self):
+        # Commits of the session, for example when storing other entities, should not expire the changed attributes
+        with sqla_utils.disable_expire_on_commit(get_scoped_session()), self._dbmodel.suspend_refresh('attributes'):
+            yield
+
+    def _write_attribute_updates(self, updated, deleted):
+        """Write changes to the attributes of the stored node to the database in a single partial update.
+
+        The attributes that were set are merged into the attributes column and those that were deleted are removed from
+        it, such that the other attributes are not rewritten.
+
+        :param updated: dictionary with the new values of the attributes that were set
+        :param deleted: the keys of the attributes that were deleted
+        """
+        if not updated and not deleted:
+            return
+
+        expression = 'attributes'
+        parameters = {'id': self.id, 'updated': json.dumps(updated)}
+
+        for index, key in enumerate(deleted):
+            expression = '({} - CAST(:deleted_{} AS text))'.format(expression, index)
+            parameters['deleted_{}'.format(index)] = key
+
+        sql = 'UPDATE db_dbnode SET attributes = {} || CAST(:updated AS jsonb), mtime = NOW() WHERE id = :id'
+        statement = text(sql.format(expression))
+
+        session = get_scoped_session()
+        session.execute(statement, parameters)
+        # The modification time was set by the database, so it has to be fetched again when it is next accessed
+        session.expire(self.dbmodel, ['mtime'])
+
+        if not session.transaction.nested:
+            session.commit()
+
     def add_incoming(self, source, link_type, link_label):
         """Add a link of the given type from a given node to ourself.
 
@@ -526,6 +564,9 @@ class SqlaNodeCollection(BackendNodeCollection):
 
     ENTITY_CLASS = SqlaNode
 
+    # Maximum number of rows per multi-row insert statement of `store_many`
+    BULK_BATCH_SIZE = 1000
+
     def get(self, pk):
         """Return a Node entry from the collection with the given id
 
@@ -550,3 +591,86 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent("Node with pk '{}' not found".format(pk))
+
+    def store_many(self, nodes, links=None, with_transaction=True):
+        """Store multiple new nodes and links with a multi-row insert for each table instead of one insert per row.
+
+        :param nodes: list of unstored `BackendNode` instances
+        :param links: optional list of tuples `(source, target, link_type, link_label)`, where `source` and `target`
+            are `BackendNode` instances that are either already stored or included in `nodes`
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        """
+        from sqlalchemy import insert
+        from sqlalchemy.orm import make_transient_to_detached
+        from aiida.common import timezone
+
+        session = get_scoped_session()
+        table = models.DbNode.__table__
+        columns = [column.key for column in table.columns if column.key != 'id']
+        dbmodels = [node.dbmodel for node in nodes]
+        now = timezone.now()
+        rows = []
+
+        for dbmodel in dbmodels:
+            if dbmodel.mtime is None:
+                dbmodel.mtime = now
+            # The foreign keys are normally populated from the relationships by the unit of work when flushing
+            dbmodel.user_id = dbmodel.user.id
+            dbmodel.dbcomputer_id = dbmodel.dbcomputer.id if dbmodel.dbcomputer is not None else None
+            rows.append({column: getattr(dbmodel, column) for column in columns})
+
+        pks = {}
+
+        try:
+            for index in range(0, len(rows), self.BULK_BATCH_SIZE):
+                statement = insert(table).values(rows[index:index + self.BULK_BATCH_SIZE])
+                pks.update({
+                    str(uuid): pk for pk, uuid in session.execute(statement.returning(table.c.id, table.c.uuid))
+                })
+
+            for dbmodel in dbmodels:
+                dbmodel.id = pks[str(dbmodel.uuid)]
+
+            if links:
+                link_rows = [{
+                    'input_id': source.id,
+                    'output_id': target.id,
+                    'label': link_label,
+                    'type': link_type.value
+                } for source, target, link_type, link_label in links]
+                for index in range(0, len(link_rows), self.BULK_BATCH_SIZE):
+                    statement = insert(models.DbLink.__table__).values(link_rows[index:index + self.BULK_BATCH_SIZE])
+                    session.execute(statement)
+
+            if with_transaction:
+                session.commit()
+        except SQLAlchemyError:
+            for dbmodel in dbmodels:
+                dbmodel.id = None
+            if with_transaction:
+                session.rollback()
+            raise
+
+        # The instances were inserted bypassing the session, so they now have to be attached to it as persistent
+        for dbmodel in dbmodels:
+            make_transient_to_detached(dbmodel)
+            session.add(dbmodel)
+
+    def bulk_set_extra(self, key, values):
+        """Set an extra to a different value for each of a set of stored nodes in a single database operation.
+
+        :param key: key of the extra
+        :param values: dictionary mapping the id of each node onto the value of the extra
+        """
+        if not values:
+            return
+
+        pks = list(values.keys())
+        serialized = [json.dumps(clean_value(values[pk])) for pk in pks]
+        statement = text(
+            'UPDATE db_dbnode AS node SET extras = jsonb_set(node.extras, CAST(:path AS text[]), data.value) '
+            'FROM unnest(CAST(:pks AS integer[]), CAST(:values AS jsonb[])) AS data(id, value) WHERE node.id = data.id'
+        )
+
+        with self.backend.transaction() as session:
+            session.execute(statement, {'path': [key], 'pks': pks, 'values': serialized})
@@ -45,6 +45,7 @@ class ModelWrapper:
         # Have to do it this way because we overwrite __setattr__
         object.__setattr__(self, '_model', model)
         object.__setattr__(self, '_auto_flush', auto_flush)
+        object.__setattr__(self, '_unrefreshed_fields', frozenset())
 
     def __getattr__(self, item):
         """Get an attribute of the model instance.
@@ -61,7 +62,7 @@ class ModelWrapper:
         if item == '_model':
             raise AttributeError()
 
-        if self.is_saved() and self._is_mutable_model_field(item) and not self._in_transaction():
+        if self.is_saved() and self._is_refreshed_field(item) and not self._in_transaction():
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
@@ -100,6 +101,34 @@ class ModelWrapper:
             self._model.session.rollback()
             raise exceptions.IntegrityError(str(exception))
 
+    @contextlib.contextmanager
+    def suspend_refresh(self, *fields):
+        """Return a context within which the given fields are not refreshed from the database when they are accessed.
+
+        The fields are refreshed once when entering the context, unless the current scope is within an open database
+        transaction. Changes that are made to their values in memory within the context are therefore not lost when
+        accessing them again, before they are written to the database.
+
+        :param fields: the names of the model fields
+        """
+        unrefreshed_fields = self._unrefreshed_fields
+
+        if self.is_saved() and not self._in_transaction():
+            self._ensure_model_uptodate(fields=fields)
+
+        object.__setattr__(self, '_unrefreshed_fields', unrefreshed_fields.union(fields))
+        try:
+            yield
+        finally:
+            object.__setattr__(self, '_unrefreshed_fields', unrefreshed_fields)
+
+    def _is_refreshed_field(self, field):
+        """Return whether the field is refreshed from the database when it is accessed.
+
+        :return: boolean, True if the field is a mutable model field whose refresh is not suspended.
+        """
+        return field not in self._unrefreshed_fields and self._is_mutable_model_field(field)
+
     def _is_mutable_model_field(self, field):
         """Return whether the field is a mutable field of the model.
 
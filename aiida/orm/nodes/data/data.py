@@ -68,7 +68,7 @@ class Data(Node):
         clone = self.__class__.from_backend_entity(backend_clone)
 
         clone.reset_attributes(copy.deepcopy(self.attributes))
-        clone.put_object_from_tree(self._repository._get_base_folder().abspath)  # pylint: disable=protected-access
+        clone._repository.clone(self._repository)  # pylint: disable=protected-access
 
         return clone
 
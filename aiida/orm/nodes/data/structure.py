@@ -12,6 +12,8 @@
 This module defines the classes for structures and all related
 functions to operate on them.
 """
+import collections
+import collections.abc
 import copy
 import functools
 import itertools
@@ -56,6 +58,29 @@ def _get_valid_cell(inputcell):
     return the_cell
 
 
+def _get_valid_positions(inputpositions):
+    """
+    Return the positions of sites in a valid format from a generic input.
+
+    :return: a float array of shape (N, 3)
+    :raise ValueError: whenever the format is not valid.
+    """
+    import numpy
+
+    try:
+        positions = numpy.array(inputpositions, dtype=float)
+    except (ValueError, TypeError):
+        raise ValueError('Positions must be a list of positions, each defined as a list of three coordinates.')
+
+    if positions.shape == (0,):
+        return positions.reshape(0, 3)
+
+    if positions.ndim != 2 or positions.shape[1] != 3:
+        raise ValueError('Positions must be a list of positions, each defined as a list of three coordinates.')
+
+    return positions
+
+
 def get_valid_pbc(inputpbc):
     """
     Return a list of three booleans for the periodic boundary conditions,
@@ -663,6 +688,60 @@ def ase_refine_cell(aseatoms, **kwargs):
     }
 
 
+def get_ase_tags(kinds):
+    """
+    Return the ASE tag of each of the given kinds.
+
+    The tag distinguishes kinds of the same element, e.g. for the kinds 'Fe1' and 'Fe2' the tags are 1 and 2.
+    Kinds whose name is the element itself, alloys and vacancies have no tag.
+
+    :param kinds: the list of kinds from the StructureData object.
+    :return: a list with for each kind an integer tag or None
+    """
+    from collections import defaultdict
+
+    # I create the list of tags
+    tag_list = []
+    used_tags = defaultdict(list)
+    for k in kinds:
+        # Skip alloys and vacancies
+        if k.is_alloy or k.has_vacancies:
+            tag_list.append(None)
+        # If the kind name is equal to the specie name,
+        # then no tag should be set
+        elif str(k.name) == str(k.symbols[0]):
+            tag_list.append(None)
+        else:
+            # Name is not the specie name
+            if k.name.startswith(k.symbols[0]):
+                try:
+                    new_tag = int(k.name[len(k.symbols[0])])
+                    tag_list.append(new_tag)
+                    used_tags[k.symbols[0]].append(new_tag)
+                    continue
+                except ValueError:
+                    pass
+            tag_list.append(k.symbols[0])  # I use a string as a placeholder
+
+    for i, _ in enumerate(tag_list):
+        # If it is a string, it is the name of the element,
+        # and I have to generate a new integer for this element
+        # and replace tag_list[i] with this new integer
+        if isinstance(tag_list[i], str):
+            # I get a list of used tags for this element
+            existing_tags = used_tags[tag_list[i]]
+            if existing_tags:
+                new_tag = max(existing_tags) + 1
+            else:  # empty list
+                new_tag = 1
+            # I store it also as a used tag!
+            used_tags[tag_list[i]].append(new_tag)
+            # I update the tag
+            tag_list[i] = new_tag
+
+    return tag_list
+
+
 def atom_kinds_to_html(atom_kind):
     """
 
@@ -721,6 +800,7 @@ class StructureData(Data):
 
     _dimensionality_label = {0: '', 1: 'length', 2: 'surface', 3: 'volume'}
     _internal_kind_tags = None
+    _columns_cache = None
 
     def __init__(
         self,
@@ -808,12 +888,27 @@ class StructureData(Data):
         Load the structure from a ASE object
         """
         if is_ase_atoms(aseatoms):
+            import numpy
+
             # Read the ase structure
             self.cell = aseatoms.cell
             self.pbc = aseatoms.pbc
             self.clear_kinds()  # This also calls clear_sites
-            for atom in aseatoms:
-                self.append_atom(ase=atom)
+
+            # Atoms with the same symbol, mass and tag get the same kind, so the kind is only determined once for each.
+            # ASE sets the mass to NaN for unstable species, which is replaced by None such that they can be compared.
+            symbols = aseatoms.get_chemical_symbols()
+            masses = [None if numpy.isnan(mass) else mass for mass in aseatoms.get_masses().tolist()]
+            tags = aseatoms.get_tags().tolist()
+
+            kind_names = {}
+            site_kind_names = []
+            for index, key in enumerate(zip(symbols, masses, tags)):
+                if key not in kind_names:
+                    kind_names[key] = self._get_or_append_kind(Kind(ase=aseatoms[index]), name_given=False)
+                site_kind_names.append(kind_names[key])
+
+            self._set_raw_sites(aseatoms.get_positions(), site_kind_names)
         else:
             raise TypeError('The value is not an ase.Atoms object')
 
@@ -905,6 +1000,11 @@ class StructureData(Data):
         self.pbc = [True, True, True]
         self.clear_kinds()
 
+        # Sites with the same species, occupations and kind name get the same kind, so it is only determined once
+        kind_names = {}
+        site_kind_names = []
+        positions = []
+
         required_pmg_version = parse_version('2019.3.13')
         current_pmg_version = parse_version(get_pymatgen_version())
         for site in struct.sites:
@@ -923,13 +1023,20 @@ class StructureData(Data):
             inputs = {
                 'symbols': [x.symbol for x in species_and_occu.keys()],
                 'weights': list(species_and_occu.values()),
-                'position': site.coords.tolist()
             }
 
             if kind_name is not None:
                 inputs['name'] = kind_name
 
-            self.append_atom(**inputs)
+            key = (tuple(inputs['symbols']), tuple(inputs['weights']), kind_name)
+
+            if key not in kind_names:
+                kind_names[key] = self._get_or_append_kind(Kind(**inputs), name_given=kind_name is not None)
+
+            site_kind_names.append(kind_names[key])
+            positions.append(site.coords)
+
+        self._set_raw_sites(positions, site_kind_names)
 
     def _validate(self):
         """
@@ -967,19 +1074,12 @@ class StructureData(Data):
                 )
 
         try:
-            # This will try to create the sites objects
-            sites = self.sites
+            # This will validate the positions and the kinds of the sites
+            _, kind_indices, kind_names = self._get_columns()
         except ValueError as exc:
             raise ValidationError('Unable to validate the sites: {}'.format(exc))
 
-        for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
-                raise ValidationError(
-                    'A site has kind {}, but no specie with that name exists'
-                    ''.format(site.kind_name)
-                )
-
-        kinds_without_sites = (set(k.name for k in kinds) - set(s.kind_name for s in sites))
+        kinds_without_sites = set(kind_names) - set(kind_names[index] for index in set(kind_indices.tolist()))
         if kinds_without_sites:
             raise ValidationError(
                 'The following kinds are defined, but there '
@@ -1240,7 +1340,8 @@ class StructureData(Data):
             used to group and/or order the symbols in the formula
         """
 
-        symbol_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
+        symbols = [kind.get_symbols_string() for kind in self.kinds]
+        symbol_list = [symbols[index] for index in self.get_kind_indices().tolist()]
 
         return get_formula(symbol_list, mode=mode, separator=separator)
 
@@ -1255,7 +1356,8 @@ class StructureData(Data):
 
         :return: a list of strings
         """
-        return [this_site.kind_name for this_site in self.sites]
+        _, kind_indices, kind_names = self._get_columns()
+        return [kind_names[index] for index in kind_indices.tolist()]
 
     def get_composition(self):
         """
@@ -1267,9 +1369,9 @@ class StructureData(Data):
 
         :returns: a dictionary with the composition
         """
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
-        composition = {symbol: symbols_list.count(symbol) for symbol in set(symbols_list)}
-        return composition
+        symbols = [kind.get_symbols_string() for kind in self.kinds]
+        composition = collections.Counter(symbols[index] for index in self.get_kind_indices().tolist())
+        return dict(composition)
 
     def get_ase(self):
         """
@@ -1355,7 +1457,7 @@ class StructureData(Data):
 
         new_kind = Kind(kind=kind)  # So we make a copy
 
-        if kind.name in [k.name for k in self.kinds]:
+        if kind.name in self.get_kind_names():
             raise ValueError('A kind with the same name ({}) already exists.'.format(kind.name))
 
         # If here, no exceptions have been raised, so I add the site.
@@ -1380,12 +1482,10 @@ class StructureData(Data):
             raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
 
         new_site = Site(site=site)  # So we make a copy
+        kind_names = self.get_kind_names()
 
-        if site.kind_name not in [kind.name for kind in self.kinds]:
-            raise ValueError(
-                "No kind with name '{}', available kinds are: "
-                '{}'.format(site.kind_name, [kind.name for kind in self.kinds])
-            )
+        if site.kind_name not in kind_names:
+            raise ValueError("No kind with name '{}', available kinds are: {}".format(site.kind_name, kind_names))
 
         # If here, no exceptions have been raised, so I add the site.
         self.attributes.setdefault('sites', []).append(new_site.get_raw())
@@ -1440,10 +1540,23 @@ class StructureData(Data):
             # all remaining parameters
             kind = Kind(**kwargs)
 
+        kind_name = self._get_or_append_kind(kind, name_given='name' in kwargs)
+        site = Site(kind_name=kind_name, position=position)
+        self.append_site(site)
+
+    def _get_or_append_kind(self, kind, name_given):
+        """
+        Return the name of the kind that a new site of the given kind should refer to,
+        appending the kind to the structure if necessary.
+
+        :param kind: the Kind object of the new site.
+        :param name_given: whether the name of the kind was specified explicitly, see :py:meth:`append_atom`.
+        :return: the name of the kind, which is the name of an identical existing kind if there is one.
+        """
         # I look for identical species only if the name is not specified
         _kinds = self.kinds
 
-        if 'name' not in kwargs:
+        if not name_given:
             # If the kind is identical to an existing one, I use the existing
             # one, otherwise I replace it
             exists_already = False
@@ -1475,7 +1588,7 @@ class StructureData(Data):
         else:  # 'name' was specified
             old_kind = None
             for existing_kind in _kinds:
-                if existing_kind.name == kwargs['name']:
+                if existing_kind.name == kind.name:
                     old_kind = existing_kind
                     break
             if old_kind is None:
@@ -1492,8 +1605,7 @@ class StructureData(Data):
                         ' (first difference: {})'.format(kind.name, firstdiff)
                     )
 
-        site = Site(kind_name=kind.name, position=position)
-        self.append_site(site)
+        return kind.name
 
     def clear_kinds(self):
         """
@@ -1524,13 +1636,12 @@ class StructureData(Data):
     @property
     def sites(self):
         """
-        Returns a list of sites.
+        Returns a read-only sequence of sites.
+
+        The Site objects are only created when they are accessed. To operate on
+        all sites at once, use :py:meth:`get_positions` and :py:meth:`get_kind_indices`.
         """
-        try:
-            raw_sites = self.get_attribute('sites')
-        except AttributeError:
-            raw_sites = []
-        return [Site(raw=i) for i in raw_sites]
+        return _SiteSequence(*self._get_columns())
 
     @property
     def kinds(self):
@@ -1580,7 +1691,138 @@ class StructureData(Data):
 
         :return: a list of strings.
         """
-        return [k.name for k in self.kinds]
+        return [kind['name'] for kind in self.get_attribute('kinds', [])]
+
+    def _get_columns(self):
+        """
+        Return the sites as columns: their positions, the index of the kind of
+        each site and the names of the kinds.
+
+        The columns are built in a single pass over the sites and are cached
+        once the node is stored, since it can then no longer be modified.
+
+        :return: a tuple with a float array of shape (N, 3), an integer array
+            of length N and a list of kind names
+        :raise ValueError: if a site is invalid or refers to a kind that does not exist
+        """
+        import numpy
+
+        if self._columns_cache is not None:
+            return self._columns_cache
+
+        raw_sites = self.get_attribute('sites', [])
+        kind_names = self.get_kind_names()
+        kind_indices_by_name = {name: index for index, name in enumerate(kind_names)}
+
+        try:
+            positions = [site['position'] for site in raw_sites]
+            site_kind_names = [site['kind_name'] for site in raw_sites]
+        except (KeyError, TypeError):
+            raise ValueError('Invalid raw sites, each site must be a dictionary with a position and a kind name')
+
+        try:
+            kind_indices = numpy.array([kind_indices_by_name[name] for name in site_kind_names], dtype=int)
+        except KeyError as exc:
+            raise ValueError('A site has kind {}, but no specie with that name exists'.format(exc.args[0]))
+
+        positions = _get_valid_positions(positions)
+        positions.flags.writeable = False
+        kind_indices.flags.writeable = False
+        columns = (positions, kind_indices, kind_names)
+
+        if self.is_stored:
+            self._columns_cache = columns
+
+        return columns
+
+    def _set_raw_sites(self, positions, kind_names):
+        """
+        Replace all sites with sites at the given positions with the given kind names.
+
+        :param positions: a list of positions, each a list of three floats.
+        :param kind_names: a list with the name of an existing kind for each position.
+        :raise ValueError: if the positions are invalid or their number differs from the number of kind names.
+        """
+        positions = _get_valid_positions(positions)
+
+        if len(positions) != len(kind_names):
+            raise ValueError(
+                'The number of positions ({}) differs from the number of sites ({})'.format(
+                    len(positions), len(kind_names)
+                )
+            )
+
+        raw_sites = [{
+            'position': tuple(position),
+            'kind_name': kind_name
+        } for position, kind_name in zip(positions.tolist(), kind_names)]
+        self.set_attribute('sites', raw_sites)
+
+    def get_positions(self):
+        """
+        Return the positions of all sites.
+
+        :return: a numpy float array of shape (N, 3) with the positions in
+            angstrom, in the order of the sites.
+        """
+        return self._get_columns()[0].copy()
+
+    def get_kind_indices(self):
+        """
+        Return the kind of each site as an index in the list of kinds
+        (in the same order of the ``self.kinds`` property).
+
+        :return: a numpy integer array of length N.
+        """
+        return self._get_columns()[1].copy()
+
+    def set_positions(self, positions):
+        """
+        Set the positions of all sites at once, keeping their kinds.
+
+        :param positions: an array of shape (N, 3) with the new positions in
+            angstrom, in the order of the sites.
+
+        :raises aiida.common.ModificationNotAllowed: if object is stored already
+        :raises ValueError: if the positions are invalid or their number differs from the number of sites
+        """
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        self._set_raw_sites(positions, [site['kind_name'] for site in self.get_attribute('sites', [])])
+
+    def set_sites(self, positions, kind_indices):
+        """
+        Replace all sites with sites at the given positions and of the given kinds.
+
+        This is the vectorized version of :py:meth:`append_site`: the kinds
+        have to be defined already, e.g. with :py:meth:`append_kind`.
+
+        :param positions: an array of shape (N, 3) with the positions of the sites in angstrom.
+        :param kind_indices: an integer array of length N with the index of the
+            kind of each site in the list of kinds (see ``self.kinds``).
+
+        :raises aiida.common.ModificationNotAllowed: if object is stored already
+        :raises ValueError: if the positions or kind indices are invalid
+        """
+        import numpy
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        kind_names = self.get_kind_names()
+        kind_indices = numpy.asarray(kind_indices)
+
+        if kind_indices.ndim != 1 or (kind_indices.size and not numpy.issubdtype(kind_indices.dtype, numpy.integer)):
+            raise ValueError('Kind indices must be a list of integers.')
+
+        if kind_indices.size and (kind_indices.min() < 0 or kind_indices.max() >= len(kind_names)):
+            raise ValueError('Kind indices must be between 0 and {}.'.format(len(kind_names) - 1))
+
+        self._set_raw_sites(positions, [kind_names[index] for index in kind_indices.tolist()])
 
     @property
     def cell(self):
@@ -1645,32 +1887,8 @@ class StructureData(Data):
 
         if not conserve_particle:
             raise NotImplementedError
-        else:
 
-            # test consistency of th enew input
-            n_sites = len(self.sites)
-            if n_sites != len(new_positions) and conserve_particle:
-                raise ValueError('the new positions should be as many as the previous structure.')
-
-            new_sites = []
-            for i in range(n_sites):
-                try:
-                    this_pos = [float(j) for j in new_positions[i]]
-                except ValueError:
-                    raise ValueError('Expecting a list of floats. Found instead {}'.format(new_positions[i]))
-
-                if len(this_pos) != 3:
-                    raise ValueError('Expecting a list of lists of length 3. found instead {}'.format(len(this_pos)))
-
-                # now append this Site to the new_site list.
-                new_site = Site(site=self.sites[i])  # So we make a copy
-                new_site.position = copy.deepcopy(this_pos)
-                new_sites.append(new_site)
-
-            # now clear the old sites, and substitute with the new ones
-            self.clear_sites()
-            for this_new_site in new_sites:
-                self.append_site(this_new_site)
+        self.set_positions(new_positions)
 
     @property
     def pbc(self):
@@ -1801,10 +2019,10 @@ class StructureData(Data):
         """
         from phonopy.structure.atoms import PhonopyAtoms  # pylint: disable=import-error
 
-        atoms = PhonopyAtoms(symbols=[_.kind_name for _ in self.sites])
+        atoms = PhonopyAtoms(symbols=self.get_site_kindnames())
         # Phonopy internally uses scaled positions, so you must store cell first!
         atoms.set_cell(self.cell)
-        atoms.set_positions([_.position for _ in self.sites])
+        atoms.set_positions(self.get_positions())
 
         return atoms
 
@@ -1818,12 +2036,29 @@ class StructureData(Data):
         """
         import ase
 
-        asecell = ase.Atoms(cell=self.cell, pbc=self.pbc)
-        _kinds = self.kinds
+        positions, kind_indices, _ = self._get_columns()
+
+        if not kind_indices.size:
+            return ase.Atoms(cell=self.cell, pbc=self.pbc)
+
+        kinds = self.kinds
+
+        for index in set(kind_indices.tolist()):
+            if kinds[index].is_alloy or kinds[index].has_vacancies:
+                raise ValueError('Cannot convert to ASE if the kind represents an alloy or it has vacancies.')
 
-        for site in self.sites:
-            asecell.append(site.get_ase(kinds=_kinds))
-        return asecell
+        kind_symbols = [str(kind.symbols[0]) for kind in kinds]
+        kind_masses = [kind.mass for kind in kinds]
+        kind_tags = [0 if tag is None else tag for tag in get_ase_tags(kinds)]
+
+        return ase.Atoms(
+            symbols=[kind_symbols[index] for index in kind_indices.tolist()],
+            positions=positions,
+            masses=[kind_masses[index] for index in kind_indices.tolist()],
+            tags=[kind_tags[index] for index in kind_indices.tolist()],
+            cell=self.cell,
+            pbc=self.pbc
+        )
 
     def _get_object_pymatgen(self, **kwargs):
         """
@@ -1871,42 +2106,45 @@ class StructureData(Data):
         if self.pbc != (True, True, True):
             raise ValueError('Periodic boundary conditions must apply in all three dimensions of real space')
 
-        species = []
+        positions, kind_indices, kind_names = self._get_columns()
+        kind_indices = kind_indices.tolist()
+        kinds = self.kinds
+
+        # The species are only determined once for each kind that is used by a site
+        kind_species = {}
         additional_kwargs = {}
 
-        if (kwargs.pop('add_spin', False) and any([n.endswith('1') or n.endswith('2') for n in self.get_kind_names()])):
+        if (kwargs.pop('add_spin', False) and any([n.endswith('1') or n.endswith('2') for n in kind_names])):
             # case when spins are defined -> no partial occupancy allowed
             from pymatgen import Specie
             oxidation_state = 0  # now I always set the oxidation_state to zero
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
+            for index in sorted(set(kind_indices)):
+                kind = kinds[index]
                 if len(kind.symbols) != 1 or (len(kind.weights) != 1 or sum(kind.weights) < 1.):
                     raise ValueError('Cannot set partial occupancies and spins at the same time')
-                species.append(
-                    Specie(
-                        kind.symbols[0],
-                        oxidation_state,
-                        properties={'spin': -1 if kind.name.endswith('1') else 1 if kind.name.endswith('2') else 0}
-                    )
+                kind_species[index] = Specie(
+                    kind.symbols[0],
+                    oxidation_state,
+                    properties={'spin': -1 if kind.name.endswith('1') else 1 if kind.name.endswith('2') else 0}
                 )
         else:
             # case when no spin are defined
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
-                species.append(dict(zip(kind.symbols, kind.weights)))
+            for index in sorted(set(kind_indices)):
+                kind = kinds[index]
+                kind_species[index] = dict(zip(kind.symbols, kind.weights))
             if any([
-                create_automatic_kind_name(self.get_kind(name).symbols,
-                                           self.get_kind(name).weights) != name for name in self.get_site_kindnames()
+                create_automatic_kind_name(kinds[index].symbols, kinds[index].weights) != kinds[index].name
+                for index in kind_species
             ]):
                 # add "kind_name" as a properties to each site, whenever
                 # the kind_name cannot be automatically obtained from the symbols
-                additional_kwargs['site_properties'] = {'kind_name': self.get_site_kindnames()}
+                additional_kwargs['site_properties'] = {'kind_name': [kind_names[index] for index in kind_indices]}
 
         if kwargs:
             raise ValueError('Unrecognized parameters passed to pymatgen converter: {}'.format(kwargs.keys()))
 
-        positions = [list(x.position) for x in self.sites]
-        return Structure(self.cell, species, positions, coords_are_cartesian=True, **additional_kwargs)
+        species = [kind_species[index] for index in kind_indices]
+        return Structure(self.cell, species, positions.tolist(), coords_are_cartesian=True, **additional_kwargs)
 
     def _get_object_pymatgen_molecule(self, **kwargs):
         """
@@ -1926,13 +2164,11 @@ class StructureData(Data):
         if kwargs:
             raise ValueError('Unrecognized parameters passed to pymatgen converter: {}'.format(kwargs.keys()))
 
-        species = []
-        for site in self.sites:
-            kind = self.get_kind(site.kind_name)
-            species.append(dict(zip(kind.symbols, kind.weights)))
+        positions, kind_indices, _ = self._get_columns()
+        kind_species = [dict(zip(kind.symbols, kind.weights)) for kind in self.kinds]
+        species = [kind_species[index] for index in kind_indices.tolist()]
 
-        positions = [list(site.position) for site in self.sites]
-        return Molecule(species, positions)
+        return Molecule(species, positions.tolist())
 
 
 class Kind:
@@ -2398,48 +2634,9 @@ class Site:
         .. note:: If any site is an alloy or has vacancies, a ValueError
             is raised (from the site.get_ase() routine).
         """
-        # pylint: disable=too-many-branches
-        from collections import defaultdict
         import ase
 
-        # I create the list of tags
-        tag_list = []
-        used_tags = defaultdict(list)
-        for k in kinds:
-            # Skip alloys and vacancies
-            if k.is_alloy or k.has_vacancies:
-                tag_list.append(None)
-            # If the kind name is equal to the specie name,
-            # then no tag should be set
-            elif str(k.name) == str(k.symbols[0]):
-                tag_list.append(None)
-            else:
-                # Name is not the specie name
-                if k.name.startswith(k.symbols[0]):
-                    try:
-                        new_tag = int(k.name[len(k.symbols[0])])
-                        tag_list.append(new_tag)
-                        used_tags[k.symbols[0]].append(new_tag)
-                        continue
-                    except ValueError:
-                        pass
-                tag_list.append(k.symbols[0])  # I use a string as a placeholder
-
-        for i, _ in enumerate(tag_list):
-            # If it is a string, it is the name of the element,
-            # and I have to generate a new integer for this element
-            # and replace tag_list[i] with this new integer
-            if isinstance(tag_list[i], str):
-                # I get a list of used tags for this element
-                existing_tags = used_tags[tag_list[i]]
-                if existing_tags:
-                    new_tag = max(existing_tags) + 1
-                else:  # empty list
-                    new_tag = 1
-                # I store it also as a used tag!
-                used_tags[tag_list[i]].append(new_tag)
-                # I update the tag
-                tag_list[i] = new_tag
+        tag_list = get_ase_tags(kinds)
 
         found = False
         for kind_candidate, tag_candidate in zip(kinds, tag_list):
@@ -2505,5 +2702,31 @@ class Site:
         return "kind name '{}' @ {},{},{}".format(self.kind_name, self.position[0], self.position[1], self.position[2])
 
 
+class _SiteSequence(collections.abc.Sequence):
+    """
+    A read-only sequence of the sites of a structure, built on the positions
+    and kind indices of the sites, that only creates the Site objects when
+    they are accessed.
+    """
+
+    def __init__(self, positions, kind_indices, kind_names):
+        self._positions = positions
+        self._kind_indices = kind_indices
+        self._kind_names = kind_names
+
+    def __len__(self):
+        return len(self._kind_indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        kind_name = self._kind_names[self._kind_indices[index]]
+        return Site(kind_name=kind_name, position=self._positions[index])
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 # get_structuredata_from_qeinput has been moved to:
 # aiida.tools.codespecific.quantumespresso.qeinputparser
@@ -32,7 +32,7 @@ from ..entities import Collection as EntityCollection
 from ..querybuilder import QueryBuilder
 from ..users import User
 
-__all__ = ('Node',)
+__all__ = ('Node', 'store_many')
 
 _NO_DEFAULT = tuple()
 
@@ -157,7 +157,12 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         self._incoming_cache = list()
 
         # Calls the initialisation from the RepositoryMixin
-        self._repository = Repository(uuid=self.uuid, is_stored=self.is_stored, base_path=self._repository_base_path)
+        self._repository = Repository(
+            uuid=self.uuid,
+            is_stored=self.is_stored,
+            base_path=self._repository_base_path,
+            metadata=self.backend_entity.repository_metadata
+        )
 
     def _validate(self):
         """Check if the attributes and files retrieved from the database are valid.
@@ -683,6 +688,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         :raises aiida.common.ModificationNotAllowed: if repository is immutable and `force=False`
         """
         self._repository.put_object_from_tree(path, key, contents_only, force)
+        self._update_repository_metadata()
 
     def put_object_from_file(self, path, key, mode=None, encoding=None, force=False):
         """Store a new object under `key` with contents of the file located at `path` on this file system.
@@ -712,6 +718,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
             )
 
         self._repository.put_object_from_file(path, key, mode, encoding, force)
+        self._update_repository_metadata()
 
     def put_object_from_filelike(self, handle, key, mode='w', encoding='utf8', force=False):
         """Store a new object under `key` with contents of filelike object `handle`.
@@ -727,6 +734,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         :raises aiida.common.ModificationNotAllowed: if repository is immutable and `force=False`
         """
         self._repository.put_object_from_filelike(handle, key, mode, encoding, force)
+        self._update_repository_metadata()
 
     def delete_object(self, key, force=False):
         """Delete the object from the repository.
@@ -739,6 +747,16 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         :raises aiida.common.ModificationNotAllowed: if repository is immutable and `force=False`
         """
         self._repository.delete_object(key, force)
+        self._update_repository_metadata()
+
+    def _update_repository_metadata(self):
+        """Persist the repository metadata if the node is stored and its repository content lives in the object store.
+
+        This is necessary after a forced modification of the repository of a stored node, since the metadata is part
+        of the database model of the node.
+        """
+        if self.is_stored and self._repository.uses_object_store:
+            self.backend_entity.repository_metadata = self._repository.metadata
 
     def add_comment(self, content, user=None):
         """Add a new comment.
@@ -1065,6 +1083,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
 
         try:
             links = self._incoming_cache
+            self._backend_entity.repository_metadata = self._repository.metadata
             self._backend_entity.store(links, with_transaction=with_transaction, clean=clean)
         except Exception:
             # I put back the files in the sandbox folder since the transaction did not succeed
@@ -1103,12 +1122,9 @@ class Node(Entity, metaclass=AbstractNodeMeta):
             if key != Sealable.SEALED_KEY:
                 self.set_attribute(key, value)
 
-        # The erase() removes the current content of the sandbox folder.
-        # If this was not done, the content of the sandbox folder could
-        # become mangled when copying over the content of the cache
-        # source repository folder.
-        self._repository.erase()
-        self.put_object_from_tree(cache_node._repository._get_base_folder().abspath)  # pylint: disable=protected-access
+        # The clone replaces the current content of the repository. If the cache source lives in the object store, only
+        # its repository metadata is copied, otherwise the content of its repository folder is copied.
+        self._repository.clone(cache_node._repository)  # pylint: disable=protected-access
 
         self._store(with_transaction=with_transaction, clean=False)
         self._add_outputs_from_cache(cache_node)
@@ -1149,7 +1165,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
                 for key, val in self.attributes_items()
                 if key not in self._hash_ignored_attributes and key not in self._updatable_attributes  # pylint: disable=unsupported-membership-test
             },
-            self._repository._get_base_folder(),  # pylint: disable=protected-access
+            self._repository._get_hashable_content(),  # pylint: disable=protected-access
             self.computer.uuid if self.computer is not None else None
         ]
         return objects
@@ -1218,6 +1234,7 @@ class Node(Entity, metaclass=AbstractNodeMeta):
         if not node_hash or not self._cachable:
             return iter(())
 
+        # The equality filter on the hash extra is served by the `db_dbnode_extras_aiida_hash_idx` expression index
         builder = QueryBuilder()
         builder.append(self.__class__, filters={'extras._aiida_hash': node_hash}, project='*', subclassing=False)
         nodes_identical = (n[0] for n in builder.iterall())
@@ -1330,3 +1347,103 @@ class Node(Entity, metaclass=AbstractNodeMeta):
                 'type': 'str'
             }
         }
+
+
+def store_many(nodes, with_transaction=True):
+    """Store multiple nodes, inserting the nodes and their incoming links with multi-row inserts.
+
+    The result is the same as calling `store` on each node in order, but the number of database round trips does not
+    scale with the number of nodes. Nodes that are already stored are skipped. The source node of each cached incoming
+    link has to either be stored already or precede the target node in `nodes`.
+
+    Nodes for which caching is enabled or whose class overrides `store` are stored individually with `store`, because
+    the former require a lookup of an equivalent node and the latter may rely on custom logic before storing.
+
+    :param nodes: an iterable of nodes
+    :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+    :return: the list of nodes
+    :raise aiida.common.ModificationNotAllowed: if the source node of a cached incoming link is neither stored nor
+        precedes the node in `nodes`.
+    """
+    import contextlib
+    from aiida.manage.caching import get_use_cache
+
+    nodes = list(nodes)
+    backend = get_manager().get_backend()
+    pending = []
+    pending_uuids = set()
+
+    def flush():
+        """Store the pending nodes in bulk."""
+        if pending:
+            _store_pending_nodes(backend, pending)
+            pending.clear()
+            pending_uuids.clear()
+
+    # `contextlib.suppress` provides empty context and can be replaced with `contextlib.nullcontext` after we drop
+    # support for python 3.6
+    with backend.transaction() if with_transaction else contextlib.suppress():
+        for node in nodes:
+            if node.is_stored:
+                continue
+
+            if type(node).store is not Node.store or get_use_cache(identifier=node.process_type):
+                flush()
+                node.store(with_transaction=False)
+                continue
+
+            # Call `validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
+            node.validate_storability()
+            node._validate()  # pylint: disable=protected-access
+
+            for link_triple in node._incoming_cache:  # pylint: disable=protected-access
+                if not link_triple.node.is_stored and link_triple.node.uuid not in pending_uuids:
+                    raise exceptions.ModificationNotAllowed(
+                        'Cannot store because source node of link triple {} is not stored'.format(link_triple)
+                    )
+
+            node.backend_entity.clean_values()
+            pending.append(node)
+            pending_uuids.add(node.uuid)
+
+        flush()
+
+    return nodes
+
+
+def _store_pending_nodes(backend, nodes):
+    """Store the repositories of validated nodes, insert them and their links in bulk and then set their hashes.
+
+    :param backend: the backend of the nodes
+    :param nodes: list of unstored nodes whose values have been cleaned
+    """
+    # pylint: disable=protected-access
+    stored_repositories = []
+
+    try:
+        for node in nodes:
+            node._repository.store()
+            stored_repositories.append(node)
+            node.backend_entity.repository_metadata = node._repository.metadata
+
+        links = [(link_triple.node.backend_entity, node.backend_entity, link_triple.link_type, link_triple.link_label)
+                 for node in nodes
+                 for link_triple in node._incoming_cache]
+        backend.nodes.store_many([node.backend_entity for node in nodes], links, with_transaction=False)
+    except Exception:
+        # Put back the files in the sandbox folders since the nodes were not stored
+        for node in stored_repositories:
+            node._repository.restore()
+        raise
+
+    for node in nodes:
+        node._incoming_cache = list()
+
+    # The hashes are computed once the nodes and their links are inserted, like in `Node._store`, because the hash of a
+    # process node includes those of its inputs, which may have been pending in this same call
+    backend.nodes.bulk_set_extra(_HASH_EXTRA_KEY, {node.pk: node.get_hash() for node in nodes})
+
+    if autogroup.CURRENT_AUTOGROUP is not None:
+        to_group = [node for node in nodes if autogroup.CURRENT_AUTOGROUP.is_to_be_grouped(node)]
+        if to_group:
+            autogroup.CURRENT_AUTOGROUP.get_or_create_group().add_nodes(to_group)
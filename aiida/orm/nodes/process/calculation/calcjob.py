@@ -387,8 +387,9 @@ class CalcJobNode(CalculationNode):
         if not isinstance(state, JobState):
             raise ValueError('scheduler state should be an instance of JobState, got: {}'.format(state))
 
-        self.set_attribute(self.SCHEDULER_STATE_KEY, state.value)
-        self.set_attribute(self.SCHEDULER_LAST_CHECK_TIME_KEY, timezone.datetime_to_isoformat(timezone.now()))
+        with self.batch_attribute_updates():
+            self.set_attribute(self.SCHEDULER_STATE_KEY, state.value)
+            self.set_attribute(self.SCHEDULER_LAST_CHECK_TIME_KEY, timezone.datetime_to_isoformat(timezone.now()))
 
     def get_scheduler_state(self):
         """Return the status of the calculation according to the cluster scheduler.
@@ -10,11 +10,14 @@
 """Module with `Node` sub class for processes."""
 
 import enum
+import functools
+import zlib
 
 from plumpy import ProcessState
 
 from aiida.common.links import LinkType
 from aiida.common.lang import classproperty
+from aiida.manage.manager import get_manager
 from aiida.orm.utils.mixins import Sealable
 
 from ..node import Node
@@ -35,6 +38,7 @@ class ProcessNode(Sealable, Node):
     # pylint: disable=too-many-public-methods,abstract-method
 
     CHECKPOINT_KEY = 'checkpoints'
+    CHECKPOINT_OBJECT_KEY = 'checkpoint_object'
     EXCEPTION_KEY = 'exception'
     EXIT_MESSAGE_KEY = 'exit_message'
     EXIT_STATUS_KEY = 'exit_status'
@@ -61,6 +65,7 @@ class ProcessNode(Sealable, Node):
         return super()._updatable_attributes + (
             cls.PROCESS_PAUSED_KEY,
             cls.CHECKPOINT_KEY,
+            cls.CHECKPOINT_OBJECT_KEY,
             cls.EXCEPTION_KEY,
             cls.EXIT_MESSAGE_KEY,
             cls.EXIT_STATUS_KEY,
@@ -365,22 +370,78 @@ class ProcessNode(Sealable, Node):
 
         :returns: checkpoint bundle if it exists, None otherwise
         """
-        return self.get_attribute(self.CHECKPOINT_KEY, None)
+        hashkey = self.get_attribute(self.CHECKPOINT_OBJECT_KEY, None)
+
+        if hashkey is None:
+            # Checkpoints that were set before they were written to the object store are stored in the attributes
+            return self.get_attribute(self.CHECKPOINT_KEY, None)
+
+        return zlib.decompress(get_manager().get_object_store().get_object_content(hashkey)).decode('utf-8')
 
     def set_checkpoint(self, checkpoint):
         """
         Set the checkpoint bundle set for the process
 
+        The checkpoint is compressed and written to the object store of the repository, and only its hash key is stored
+        in the attributes, such that the checkpoint does not weigh on the node table. If the checkpoint is identical to
+        the current one, nothing is written. The object of the previous checkpoint is released once the hash key of the
+        new one has been written to the database, which within :meth:`batch_attribute_updates` is when the outermost
+        context exits, such that the node never references an object that no longer exists.
+
         :param state: string representation of the stepper state info
         """
-        return self.set_attribute(self.CHECKPOINT_KEY, checkpoint)
+        object_store = get_manager().get_object_store()
+        # A checkpoint is written for every state transition, so the fastest compression level is used
+        content = zlib.compress(checkpoint.encode('utf-8'), 1)
+
+        hasher = object_store.get_hash()
+        hasher.update(content)
+        hashkey = hasher.hexdigest()
+        hashkey_current = self.get_attribute(self.CHECKPOINT_OBJECT_KEY, None)
+
+        if hashkey == hashkey_current:
+            if not object_store.has_object(hashkey):
+                object_store.add_reference(hashkey)
+                object_store.add_object(content)
+            return
+
+        # Identical checkpoints share their object, so it is reference counted and only deleted once fully released
+        object_store.add_reference(hashkey)
+        object_store.add_object(content)
+
+        with self.batch_attribute_updates():
+            self.set_attribute(self.CHECKPOINT_OBJECT_KEY, hashkey)
+            self._delete_attribute_if_exists(self.CHECKPOINT_KEY)
+
+        if hashkey_current is not None:
+            self.backend_entity.call_after_attribute_updates(
+                functools.partial(object_store.release_references, [hashkey_current])
+            )
 
     def delete_checkpoint(self):
         """
         Delete the checkpoint bundle set for the process
         """
+        hashkey = self.get_attribute(self.CHECKPOINT_OBJECT_KEY, None)
+
+        with self.batch_attribute_updates():
+            self._delete_attribute_if_exists(self.CHECKPOINT_OBJECT_KEY)
+            self._delete_attribute_if_exists(self.CHECKPOINT_KEY)
+
+        if hashkey is not None:
+            object_store = get_manager().get_object_store()
+            self.backend_entity.call_after_attribute_updates(
+                functools.partial(object_store.release_references, [hashkey])
+            )
+
+    def _delete_attribute_if_exists(self, key):
+        """
+        Delete the attribute with the given key, if it exists
+
+        :param key: name of the attribute
+        """
         try:
-            self.delete_attribute(self.CHECKPOINT_KEY)
+            self.delete_attribute(key)
         except AttributeError:
             pass
 
@@ -414,6 +475,23 @@ class ProcessNode(Sealable, Node):
         except AttributeError:
             pass
 
+    def batch_attribute_updates(self):
+        """
+        Return a context within which the changes to the attributes of the stored process node are written at once.
+
+        Every change to the attributes of a stored node is normally written to the database immediately. Within this
+        context, the changes are collected and written when the context exits, with a single partial update of only the
+        attributes that were changed. This is meant for state transitions of the process, which update several
+        attributes in a row, such that for example the checkpoint is not rewritten for every other update::
+
+            with node.batch_attribute_updates():
+                node.set_process_state(ProcessState.FINISHED)
+                node.set_exit_status(0)
+
+        :return: context manager
+        """
+        return self.backend_entity.batch_attribute_updates()
+
     @property
     def called(self):
         """
@@ -333,6 +333,10 @@ class QueryBuilder:
     # namely tag of first entity + _EDGE_TAG_DELIM + tag of second entity
     _EDGE_TAG_DELIM = '--'
     _VALID_PROJECTION_KEYS = ('func', 'cast')
+    _VALID_TRAVERSAL_KEYS = ('distinct', 'max_depth', 'link_types')
+    _RECURSIVE_JOINING_KEYWORDS = ('with_ancestors', 'with_descendants')
+    # The links that are followed by default when joining ancestors or descendants
+    _DEFAULT_TRAVERSAL_LINK_TYPES = (LinkType.CREATE.value, LinkType.INPUT_CALC.value)
 
     def __init__(self, backend=None, **kwargs):
         """
@@ -592,6 +596,7 @@ class QueryBuilder:
         edge_filters=None,
         edge_project=None,
         outerjoin=False,
+        traversal=None,
         **kwargs
     ):
         """
@@ -636,6 +641,17 @@ class QueryBuilder:
             The filters to apply on the edge. Also here, details in :meth:`.add_filter`.
         :param str edge_project:
             The project from the edges. API-details in :meth:`.add_projection`.
+        :param dict traversal:
+            Options for the recursive join of a vertice appended with `with_ancestors` or `with_descendants`,
+            which are applied while the graph is traversed instead of on the result. Valid keys are:
+
+            * `distinct`: if True, every pair of ancestor and descendant is returned once instead of once for every
+              path that connects them, and the `depth` of the edge is the minimal depth. This avoids enumerating all
+              paths, whose number grows combinatorially in graphs where nodes share inputs. The `path` of the edge
+              cannot be projected or filtered on.
+            * `max_depth`: only traverse up to this depth, which is zero for nodes that are directly linked, such that
+              the result is the same as filtering the edge with `{'depth': {'<=': max_depth}}`.
+            * `link_types`: the link types to follow, by default `create` and `input_calc`.
 
         A small usage example how this can be invoked::
 
@@ -838,6 +854,9 @@ class QueryBuilder:
                 joining_keyword = 'with_incoming'
                 joining_value = self._path[-1]['tag']
 
+            if traversal is not None:
+                traversal = self._get_traversal(joining_keyword, traversal)
+
         except Exception as exception:
             if self._debug:
                 print('DEBUG: Exception caught in append (part joining), cleaning up')
@@ -905,19 +924,68 @@ class QueryBuilder:
         else:
             path_type = classifiers['ormclass_type_string']
 
-        self._path.append(
-            dict(
-                entity_type=path_type,
-                tag=tag,
-                joining_keyword=joining_keyword,
-                joining_value=joining_value,
-                outerjoin=outerjoin,
-                edge_tag=edge_tag
-            )
+        path_spec = dict(
+            entity_type=path_type,
+            tag=tag,
+            joining_keyword=joining_keyword,
+            joining_value=joining_value,
+            outerjoin=outerjoin,
+            edge_tag=edge_tag
         )
 
+        # The traversal is only added when specified, such that the queryhelp of other queries does not change
+        if traversal is not None:
+            path_spec['traversal'] = traversal
+
+        self._path.append(path_spec)
+
         return self
 
+    def _get_traversal(self, joining_keyword, traversal):
+        """
+        Validate the traversal options of a recursive join and return them with defaults filled in.
+
+        :param joining_keyword: the joining keyword of the vertice, which has to be a recursive one
+        :param traversal: dictionary with the traversal options, see :meth:`.append`
+        :return: dictionary with all traversal options, with the link types as a list of strings
+        :raises InputValidationError: if the options are invalid
+        """
+        if joining_keyword not in self._RECURSIVE_JOINING_KEYWORDS:
+            raise InputValidationError(
+                'traversal can only be specified when joining with one of {}'.format(self._RECURSIVE_JOINING_KEYWORDS)
+            )
+
+        if not isinstance(traversal, dict):
+            raise InputValidationError('traversal has to be a dictionary, got {}'.format(type(traversal)))
+
+        for key in traversal:
+            if key not in self._VALID_TRAVERSAL_KEYS:
+                raise InputValidationError(
+                    '{} is not a valid key for traversal, valid keys are {}'.format(key, self._VALID_TRAVERSAL_KEYS)
+                )
+
+        distinct = traversal.get('distinct', False)
+        max_depth = traversal.get('max_depth', None)
+        link_types = traversal.get('link_types', None)
+
+        if not isinstance(distinct, bool):
+            raise InputValidationError('distinct has to be a boolean, got {}'.format(distinct))
+
+        if max_depth is not None and (not isinstance(max_depth, int) or isinstance(max_depth, bool) or max_depth < 0):
+            raise InputValidationError('max_depth has to be a non-negative integer, got {}'.format(max_depth))
+
+        if link_types is None:
+            link_types = list(self._DEFAULT_TRAVERSAL_LINK_TYPES)
+        else:
+            if not isinstance(link_types, (tuple, list, set)) or not link_types:
+                raise InputValidationError('link_types has to be a non-empty list of link types')
+            try:
+                link_types = [LinkType(link_type).value for link_type in link_types]
+            except ValueError as exception:
+                raise InputValidationError('invalid link type: {}'.format(exception))
+
+        return {'distinct': distinct, 'max_depth': max_depth, 'link_types': link_types}
+
     def order_by(self, order_by):
         """
         Set the entity to order by
@@ -1467,15 +1535,29 @@ class QueryBuilder:
         ).join(entity_to_join, aliased_edge.input_id == entity_to_join.id, isouter=isouterjoin)
         return aliased_edge
 
-    def _join_descendants_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
+    def _join_descendants_recursive(
+        self,
+        joined_entity,
+        entity_to_join,
+        isouterjoin,
+        filter_dict,
+        expand_path=False,
+        traversal=None,
+        expand_depth=True
+    ):
         """
         joining descendants using the recursive functionality
-        :TODO: Move the filters to be done inside the recursive query (for example on depth)
         :TODO: Pass an option to also show the path, if this is wanted.
-        """
 
+        :param traversal: the traversal options as returned by :meth:`._get_traversal`
+        :param expand_depth: whether the depth is used, which is only needed for a distinct traversal
+        """
+        # pylint: disable=too-many-arguments,too-many-locals
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node), 'with_ancestors')
 
+        distinct, max_depth, link_types = self._get_traversal_options(traversal, expand_path)
+        expand_depth = expand_depth or max_depth is not None or not distinct
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -1484,15 +1566,16 @@ class QueryBuilder:
         selection_walk_list = [
             link1.input_id.label('ancestor_id'),
             link1.output_id.label('descendant_id'),
-            type_cast(0, Integer).label('depth'),
         ]
+        if expand_depth:
+            selection_walk_list.append(type_cast(0, Integer).label('depth'))
         if expand_path:
             selection_walk_list.append(array((link1.input_id, link1.output_id)).label('path'))
 
         walk = select(selection_walk_list).select_from(join(node1, link1, link1.input_id == node1.id)).where(
             and_(
                 in_recursive_filters,  # I apply filters for speed here
-                link1.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value))  # I follow input and create links
+                link1.type.in_(link_types)  # By default I follow input and create links
             )
         ).cte(recursive=True)
 
@@ -1501,22 +1584,29 @@ class QueryBuilder:
         selection_union_list = [
             aliased_walk.c.ancestor_id.label('ancestor_id'),
             link2.output_id.label('descendant_id'),
-            (aliased_walk.c.depth + type_cast(1, Integer)).label('current_depth')
         ]
+        if expand_depth:
+            selection_union_list.append((aliased_walk.c.depth + type_cast(1, Integer)).label('current_depth'))
         if expand_path:
             selection_union_list.append((aliased_walk.c.path + array((link2.output_id,))).label('path'))
 
-        descendants_recursive = aliased(
-            aliased_walk.union_all(
-                select(selection_union_list).select_from(
-                    join(
-                        aliased_walk,
-                        link2,
-                        link2.input_id == aliased_walk.c.descendant_id,
-                    )
-                ).where(link2.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
+        union_filters = [link2.type.in_(link_types)]
+        if max_depth is not None:
+            # The depth limit is applied while walking, such that the walk stops at the maximum depth
+            union_filters.append(aliased_walk.c.depth < max_depth)
+
+        union_select = select(selection_union_list).select_from(
+            join(
+                aliased_walk,
+                link2,
+                link2.input_id == aliased_walk.c.descendant_id,
             )
-        )  # .alias()
+        ).where(and_(*union_filters))
+
+        if distinct:
+            descendants_recursive = self._get_distinct_walk(aliased_walk.union(union_select), expand_depth)
+        else:
+            descendants_recursive = aliased(aliased_walk.union_all(union_select))
 
         self._query = self._query.join(descendants_recursive,
                                        descendants_recursive.c.ancestor_id == joined_entity.id).join(
@@ -1526,15 +1616,29 @@ class QueryBuilder:
                                        )
         return descendants_recursive.c
 
-    def _join_ancestors_recursive(self, joined_entity, entity_to_join, isouterjoin, filter_dict, expand_path=False):
+    def _join_ancestors_recursive(
+        self,
+        joined_entity,
+        entity_to_join,
+        isouterjoin,
+        filter_dict,
+        expand_path=False,
+        traversal=None,
+        expand_depth=True
+    ):
         """
         joining ancestors using the recursive functionality
-        :TODO: Move the filters to be done inside the recursive query (for example on depth)
         :TODO: Pass an option to also show the path, if this is wanted.
 
+        :param traversal: the traversal options as returned by :meth:`._get_traversal`
+        :param expand_depth: whether the depth is used, which is only needed for a distinct traversal
         """
+        # pylint: disable=too-many-arguments,too-many-locals
         self._check_dbentities((joined_entity, self._impl.Node), (entity_to_join, self._impl.Node), 'with_ancestors')
 
+        distinct, max_depth, link_types = self._get_traversal_options(traversal, expand_path)
+        expand_depth = expand_depth or max_depth is not None or not distinct
+
         link1 = aliased(self._impl.Link)
         link2 = aliased(self._impl.Link)
         node1 = aliased(self._impl.Node)
@@ -1543,13 +1647,17 @@ class QueryBuilder:
         selection_walk_list = [
             link1.input_id.label('ancestor_id'),
             link1.output_id.label('descendant_id'),
-            type_cast(0, Integer).label('depth'),
         ]
+        if expand_depth:
+            selection_walk_list.append(type_cast(0, Integer).label('depth'))
         if expand_path:
             selection_walk_list.append(array((link1.output_id, link1.input_id)).label('path'))
 
         walk = select(selection_walk_list).select_from(join(node1, link1, link1.output_id == node1.id)).where(
-            and_(in_recursive_filters, link1.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
+            and_(
+                in_recursive_filters,  # I apply filters for speed here
+                link1.type.in_(link_types)  # By default I follow input and create links
+            )
         ).cte(recursive=True)
 
         aliased_walk = aliased(walk)
@@ -1557,23 +1665,30 @@ class QueryBuilder:
         selection_union_list = [
             link2.input_id.label('ancestor_id'),
             aliased_walk.c.descendant_id.label('descendant_id'),
-            (aliased_walk.c.depth + type_cast(1, Integer)).label('current_depth'),
         ]
+        if expand_depth:
+            selection_union_list.append((aliased_walk.c.depth + type_cast(1, Integer)).label('current_depth'))
         if expand_path:
             selection_union_list.append((aliased_walk.c.path + array((link2.input_id,))).label('path'))
 
-        ancestors_recursive = aliased(
-            aliased_walk.union_all(
-                select(selection_union_list).select_from(
-                    join(
-                        aliased_walk,
-                        link2,
-                        link2.output_id == aliased_walk.c.ancestor_id,
-                    )
-                ).where(link2.type.in_((LinkType.CREATE.value, LinkType.INPUT_CALC.value)))
-                # I can't follow RETURN or CALL links
+        # By default I can't follow RETURN or CALL links
+        union_filters = [link2.type.in_(link_types)]
+        if max_depth is not None:
+            # The depth limit is applied while walking, such that the walk stops at the maximum depth
+            union_filters.append(aliased_walk.c.depth < max_depth)
+
+        union_select = select(selection_union_list).select_from(
+            join(
+                aliased_walk,
+                link2,
+                link2.output_id == aliased_walk.c.ancestor_id,
             )
-        )
+        ).where(and_(*union_filters))
+
+        if distinct:
+            ancestors_recursive = self._get_distinct_walk(aliased_walk.union(union_select), expand_depth)
+        else:
+            ancestors_recursive = aliased(aliased_walk.union_all(union_select))
 
         self._query = self._query.join(ancestors_recursive,
                                        ancestors_recursive.c.descendant_id == joined_entity.id).join(
@@ -1583,6 +1698,70 @@ class QueryBuilder:
                                        )
         return ancestors_recursive.c
 
+    def _get_traversal_options(self, traversal, expand_path):
+        """
+        Return the options of a recursive join.
+
+        :param traversal: the traversal options as returned by :meth:`._get_traversal`, or None for the defaults
+        :param expand_path: whether the path is used
+        :return: tuple of whether the traversal is distinct, the maximum depth and the link types to follow
+        :raises InputValidationError: if the path is used in a distinct traversal
+        """
+        if traversal is None:
+            return False, None, self._DEFAULT_TRAVERSAL_LINK_TYPES
+
+        if traversal['distinct'] and expand_path:
+            raise InputValidationError('the path cannot be projected or filtered on in a distinct traversal')
+
+        return traversal['distinct'], traversal['max_depth'], traversal['link_types']
+
+    @staticmethod
+    def _get_distinct_walk(walk, expand_depth):
+        """
+        Return the walk of a distinct traversal with a single row for each pair of ancestor and descendant.
+
+        The walk is built with `UNION` instead of `UNION ALL`, so a node is only visited again when it is reached at
+        a depth at which it was not visited before. If the depth is used, the minimal depth of each pair is selected.
+
+        :param walk: the recursive common table expression of the walk
+        :param expand_depth: whether the walk has a depth column
+        """
+        aliased_walk = aliased(walk)
+
+        if not expand_depth:
+            return aliased_walk
+
+        return select([
+            aliased_walk.c.ancestor_id.label('ancestor_id'),
+            aliased_walk.c.descendant_id.label('descendant_id'),
+            sa_func.min(aliased_walk.c.depth).label('depth'),
+        ]).group_by(aliased_walk.c.ancestor_id, aliased_walk.c.descendant_id).alias()
+
+    def _is_column_used(self, tag, column_name):
+        """
+        Return whether a column of the entity with the given tag is filtered on, projected or ordered by.
+
+        :param tag: the tag of the entity
+        :param column_name: the name of the column
+        """
+
+        def is_filtered(filter_spec):
+            for key, value in filter_spec.items():
+                if key in ('and', 'or', '~or', '~and', '!and', '!or'):
+                    if any(is_filtered(sub_spec) for sub_spec in value):
+                        return True
+                elif key.split('.')[0] == column_name:
+                    return True
+            return False
+
+        if is_filtered(self._filters.get(tag, {})):
+            return True
+
+        if any(column_name in projection.keys() for projection in self._projections.get(tag, [])):
+            return True
+
+        return any(column_name in item.keys() for order_spec in self._order_by for item in order_spec.get(tag, []))
+
     def _join_group_members(self, joined_entity, entity_to_join, isouterjoin):
         """
         :param joined_entity:
@@ -1930,8 +2109,16 @@ class QueryBuilder:
                 # The default is False, cause it's super expensive
                 expand_path = ((self._filters[edge_tag].get('path', None) is not None) or
                                any(['path' in d.keys() for d in self._projections[edge_tag]]))
+                # In a distinct traversal, the depth is only computed when it is used
+                expand_depth = self._is_column_used(edge_tag, 'depth')
                 aliased_edge = connection_func(
-                    toconnectwith, alias, isouterjoin=isouterjoin, filter_dict=filter_dict, expand_path=expand_path
+                    toconnectwith,
+                    alias,
+                    isouterjoin=isouterjoin,
+                    filter_dict=filter_dict,
+                    expand_path=expand_path,
+                    traversal=verticespec.get('traversal', None),
+                    expand_depth=expand_depth
                 )
             else:
                 aliased_edge = connection_func(toconnectwith, alias, isouterjoin=isouterjoin)
@@ -10,11 +10,13 @@
 """Class that represents the repository of a `Node` instance."""
 
 import collections
+import copy
 import enum
+import io
 import os
 
 from aiida.common import exceptions
-from aiida.common.folders import RepositoryFolder, SandboxFolder
+from aiida.common.folders import Folder, RepositoryFolder, SandboxFolder
 
 
 class FileType(enum.Enum):
@@ -27,22 +29,168 @@ File = collections.namedtuple('File', ['name', 'type'])
 
 
 class Repository:
-    """Class that represents the repository of a `Node` instance."""
+    """Class that represents the repository of a `Node` instance.
+
+    The content of the repository can live in one of two places. Either it is stored in a folder that is dedicated to
+    the node, or the files are stored in the content-addressable object store of the profile, in which case the
+    hierarchy of the files is described by the repository metadata. The metadata is a nested dictionary that mirrors
+    the layout of a repository folder, where directories are represented by dictionaries and files by the hash key of
+    their content in the object store. A repository without metadata, i.e. `None`, uses a folder. Which of the two is
+    used for new nodes is determined by the `repository.backend` configuration option at the time of storing.
+    """
 
     # Name to be used for the Repository section
     _section_name = 'node'
 
-    def __init__(self, uuid, is_stored, base_path=None):
+    def __init__(self, uuid, is_stored, base_path=None, metadata=None):
         self._is_stored = is_stored
         self._base_path = base_path
         self._temp_folder = None
         self._repo_folder = RepositoryFolder(section=self._section_name, uuid=uuid)
+        self._metadata = copy.deepcopy(metadata)
+        self._export_folder = None
+        self._restore_from_sandbox = False
 
     def __del__(self):
-        """Clean the sandboxfolder if it was instantiated."""
+        """Clean the sandbox folders if they were instantiated."""
         if getattr(self, '_temp_folder', None) is not None:
             self._temp_folder.erase()
 
+        if getattr(self, '_export_folder', None) is not None:
+            self._export_folder.erase()
+
+    @property
+    def metadata(self):
+        """Return the repository metadata.
+
+        :return: a copy of the virtual file hierarchy of the objects in the object store or `None` if the content is
+            stored in a folder
+        """
+        return copy.deepcopy(self._metadata)
+
+    @property
+    def uses_object_store(self):
+        """Return whether the content of this repository lives in the object store.
+
+        :return: boolean, True if the content is described by metadata of the object store, False otherwise
+        """
+        return self._metadata is not None
+
+    @staticmethod
+    def _get_object_store():
+        """Return the object store of the current profile.
+
+        :return: instance of :class:`aiida.repository.ObjectStore`
+        """
+        from aiida.manage.manager import get_manager
+        return get_manager().get_object_store()
+
+    def _get_key_parts(self, key=None):
+        """Return the list of path components of the given key including the base path, if defined.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: list of path components with respect to the root of the repository metadata
+        """
+        parts = []
+
+        for path in (self._base_path, key):
+            if path:
+                parts.extend(part for part in path.split(os.sep) if part and part != os.curdir)
+
+        return parts
+
+    def _get_metadata_entry(self, key=None):
+        """Return the entry of the repository metadata corresponding to the given key.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: a dictionary for a directory or the hash key for a file
+        :raises FileNotFoundError: if no object with the given key exists
+        """
+        entry = self._metadata
+
+        for part in self._get_key_parts(key):
+            if not isinstance(entry, dict) or part not in entry:
+                raise FileNotFoundError('object {} does not exist'.format(key))
+            entry = entry[part]
+
+        return entry
+
+    def _get_metadata_directory(self, key=None):
+        """Return the directory entry of the repository metadata for the given key, creating it if necessary.
+
+        :param key: fully qualified identifier for the directory within the repository
+        :return: the dictionary representing the directory
+        :raises NotADirectoryError: if the key or one of its parents corresponds to a file
+        """
+        entry = self._metadata
+
+        for part in self._get_key_parts(key):
+            entry = entry.setdefault(part, {})
+            if not isinstance(entry, dict):
+                raise NotADirectoryError('object {} is not a directory'.format(key))
+
+        return entry
+
+    def _put_tree_in_object_store(self, path, directory):
+        """Recursively store the files of the directory at `path` in the object store and add them to `directory`.
+
+        :param path: absolute path of the directory on the local file system
+        :param directory: the dictionary in the repository metadata into which to add the content
+        """
+        object_store = self._get_object_store()
+
+        for entry in os.scandir(path):
+            if entry.is_dir():
+                self._put_tree_in_object_store(entry.path, directory.setdefault(entry.name, {}))
+            else:
+                directory[entry.name] = object_store.add_object_from_file(entry.path)
+
+    def _copy_tree_from_object_store(self, directory, path):
+        """Recursively write the objects of a directory in the repository metadata to the local file system.
+
+        :param directory: the dictionary in the repository metadata whose content to write
+        :param path: absolute path of the directory on the local file system into which to write the content
+        """
+        object_store = self._get_object_store()
+        os.makedirs(path, exist_ok=True)
+
+        for name, entry in directory.items():
+            if isinstance(entry, dict):
+                self._copy_tree_from_object_store(entry, os.path.join(path, name))
+            else:
+                object_store.copy_object_to_file(entry, os.path.join(path, name))
+
+    def copy_tree(self, path):
+        """Write the complete content of the repository, including its base path, to a directory.
+
+        :param path: absolute path of the directory on the local file system into which to write the content
+        """
+        if self.uses_object_store:
+            self._copy_tree_from_object_store(self._metadata, path)
+        else:
+            folder = self._repo_folder if self._is_stored else self._get_temp_folder()
+            if folder.exists():
+                Folder(path).insert_path(folder.abspath, '.')
+
+    def clone(self, repository):
+        """Replace the content of this repository with that of another repository.
+
+        If the source repository lives in the object store, only its metadata is copied and no file content is
+        duplicated, otherwise the files of the source are copied.
+
+        :param repository: the `Repository` instance whose content to copy
+        :raises aiida.common.ModificationNotAllowed: if repository is immutable
+        """
+        self.validate_mutability()
+
+        if repository.uses_object_store:
+            self._get_temp_folder().erase(create_empty_folder=True)
+            self._metadata = repository.metadata
+        else:
+            self._metadata = None
+            self.erase()
+            self.put_object_from_tree(repository._get_base_folder().abspath)  # pylint: disable=protected-access
+
     def validate_mutability(self):
         """Raise if the repository is immutable.
 
@@ -68,6 +216,18 @@ class Repository:
         :param key: fully qualified identifier for the object within the repository
         :return: a list of `File` named tuples representing the objects present in directory with the given key
         """
+        if self.uses_object_store:
+            directory = self._get_metadata_entry(key)
+
+            if not isinstance(directory, dict):
+                raise NotADirectoryError('object {} is not a directory'.format(key))
+
+            objects = [
+                File(name, FileType.DIRECTORY if isinstance(entry, dict) else FileType.FILE)
+                for name, entry in directory.items()
+            ]
+            return sorted(objects, key=lambda x: x.name)
+
         folder = self._get_base_folder()
 
         if key:
@@ -97,6 +257,22 @@ class Repository:
         :param key: fully qualified identifier for the object within the repository
         :param mode: the mode under which to open the handle
         """
+        if self.uses_object_store:
+            if any(character in mode for character in 'wax+'):
+                raise exceptions.ModificationNotAllowed('objects in the object store can only be opened for reading')
+
+            hashkey = self._get_metadata_entry(key)
+
+            if isinstance(hashkey, dict):
+                raise IsADirectoryError('object {} is a directory'.format(key))
+
+            handle = self._get_object_store().open(hashkey)
+
+            if 'b' in mode:
+                return handle
+
+            return io.TextIOWrapper(handle, encoding='utf8')
+
         return open(self._get_base_folder().get_abs_path(key), mode=mode)
 
     def get_object(self, key):
@@ -113,6 +289,10 @@ class Repository:
         except ValueError:
             directory, filename = None, key
 
+        if self.uses_object_store:
+            entry = self._get_metadata_entry(key)
+            return File(filename, FileType.DIRECTORY if isinstance(entry, dict) else FileType.FILE)
+
         folder = self._get_base_folder()
 
         if directory:
@@ -157,6 +337,15 @@ class Repository:
         if not os.path.isabs(path):
             raise ValueError('the `path` must be an absolute path')
 
+        if self.uses_object_store:
+            directory = self._get_metadata_directory(key)
+
+            if not contents_only:
+                directory = directory.setdefault(os.path.basename(os.path.normpath(path)), {})
+
+            self._put_tree_in_object_store(path, directory)
+            return
+
         folder = self._get_base_folder()
 
         if key:
@@ -225,6 +414,12 @@ class Repository:
 
         self.validate_object_key(key)
 
+        if self.uses_object_store:
+            dirname, filename = os.path.split(key)
+            directory = self._get_metadata_directory(dirname)
+            directory[filename] = self._get_object_store().add_object_from_filelike(handle, encoding=encoding or 'utf8')
+            return
+
         folder = self._get_base_folder()
 
         while os.sep in key:
@@ -248,6 +443,11 @@ class Repository:
 
         self.validate_object_key(key)
 
+        if self.uses_object_store:
+            dirname, filename = os.path.split(key)
+            self._get_metadata_entry(dirname).pop(filename, None)
+            return
+
         self._get_base_folder().remove_path(key)
 
     def erase(self, force=False):
@@ -262,14 +462,31 @@ class Repository:
         if not force:
             self.validate_mutability()
 
+        if self.uses_object_store:
+            self._get_metadata_directory().clear()
+            return
+
         self._get_base_folder().erase()
 
     def store(self):
-        """Store the contents of the sandbox folder into the repository folder."""
+        """Store the contents of the sandbox folder into the repository folder or object store.
+
+        If the `repository.backend` option is set to `objectstore`, the files are added to the object store and the
+        repository metadata is built, which the caller has to persist. Repositories that already have metadata, for
+        example because they were cloned from a stored repository, do not have to store any content.
+        """
+        from aiida.manage.configuration import get_config_option
+
         if self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is already stored')
 
-        self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+        if not self.uses_object_store and get_config_option('repository.backend') == 'objectstore':
+            self._metadata = {}
+            self._put_tree_in_object_store(self._get_temp_folder().abspath, self._metadata)
+            self._restore_from_sandbox = True
+        elif not self.uses_object_store:
+            self._repo_folder.replace_with_folder(self._get_temp_folder().abspath, move=True, overwrite=True)
+
         self._is_stored = True
 
     def restore(self):
@@ -277,15 +494,50 @@ class Repository:
         if not self._is_stored:
             raise exceptions.ModificationNotAllowed('repository is not yet stored')
 
-        self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+        if self._restore_from_sandbox:
+            # The original content is still in the sandbox folder. Any objects that were added to the object store
+            # are left there, which is harmless since objects are deduplicated and unreferenced by any node.
+            self._metadata = None
+            self._restore_from_sandbox = False
+        elif not self.uses_object_store:
+            self._temp_folder.replace_with_folder(self._repo_folder.abspath, move=True, overwrite=True)
+
         self._is_stored = False
 
+    def _get_hashable_content(self):
+        """Return an object representing the content of the repository that can be passed to `make_hash`.
+
+        For content in the object store this avoids writing all objects to a sandbox folder, as `_get_base_folder` would.
+
+        :return: an :class:`aiida.repository.ObjectTree` or a Folder object.
+        """
+        if not self.uses_object_store:
+            return self._get_base_folder()
+
+        from aiida.repository import ObjectTree
+
+        try:
+            directory = self._get_metadata_entry()
+        except FileNotFoundError:
+            directory = {}
+
+        return ObjectTree(self._get_object_store(), directory)
+
     def _get_base_folder(self):
         """Return the base sub folder in the repository.
 
+        .. note:: If the content lives in the object store, it is first written to a temporary sandbox folder, which
+            should be treated as read-only, since changes to it are not reflected in the repository.
+
         :return: a Folder object.
         """
-        if self._is_stored:
+        if self.uses_object_store:
+            if self._export_folder is None:
+                self._export_folder = SandboxFolder()
+            folder = self._export_folder
+            folder.erase(create_empty_folder=True)
+            self._copy_tree_from_object_store(self._metadata, folder.abspath)
+        elif self._is_stored:
             folder = self._repo_folder
         else:
             folder = self._get_temp_folder()
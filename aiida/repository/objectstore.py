@@ -0,0 +1,560 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Content-addressable object store for the file repository.
+
+Objects are identified by the SHA-256 hash of their content, which means that each unique file content is stored only
+once, regardless of how many nodes contain it. New objects are written as individual "loose" files, sharded over
+sub directories by the first two characters of their hash key. Loose objects can be concatenated into a small number
+of large pack files by calling :meth:`ObjectStore.pack_loose_objects`, after which each object costs a single row in
+the SQLite index of the container instead of an inode on the file system.
+
+The object store only knows about content. The mapping of file names and directory hierarchies onto hash keys is the
+responsibility of the client, which for nodes is stored in the database as the `repository_metadata` of the node.
+"""
+import collections
+import contextlib
+import hashlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+
+__all__ = ('ObjectStore', 'ObjectTree')
+
+
+class PackedObjectReader(io.RawIOBase):
+    """Read-only file-like object that gives access to the bytes of a single object within a pack file."""
+
+    def __init__(self, handle, offset, length):
+        """Construct a new reader for the object located at `offset` in the pack file opened with `handle`.
+
+        :param handle: binary file handle of the pack file, ownership is transferred to the reader
+        :param offset: byte offset of the start of the object in the pack file
+        :param length: length in bytes of the object
+        """
+        super().__init__()
+        self._handle = handle
+        self._offset = offset
+        self._length = length
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._length + offset
+        else:
+            raise ValueError('invalid whence value `{}`'.format(whence))
+
+        if position < 0:
+            raise ValueError('negative seek position {}'.format(position))
+
+        self._position = position
+        return self._position
+
+    def readinto(self, buffer):
+        remaining = self._length - self._position
+
+        if remaining <= 0:
+            return 0
+
+        size = min(len(buffer), remaining)
+        self._handle.seek(self._offset + self._position)
+        data = self._handle.read(size)
+        buffer[:len(data)] = data
+        self._position += len(data)
+
+        return len(data)
+
+    def close(self):
+        if not self.closed:
+            self._handle.close()
+        super().close()
+
+
+class ObjectStore:
+    """Content-addressable store of file objects in a directory on the local file system.
+
+    The layout of the container directory is::
+
+        container/
+            loose/          loose objects, sharded as `loose/ab/cdef...` by their hash key
+            packs/          pack files, named by their integer identifier, containing concatenated objects
+            sandbox/        temporary files of objects that are being written
+            packs.idx       SQLite database with the location (pack, offset, length) of each packed object, the
+                            persisted content digests of objects, see :meth:`ObjectStore.get_object_digests`, and the
+                            reference counts of transient objects, see :meth:`ObjectStore.add_reference`
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    PACK_SIZE_TARGET = 4 * 1024**3
+
+    # Maximum number of host parameters in a single SQLite statement, which is 999 for SQLite versions before 3.32
+    _QUERY_BATCH_SIZE = 500
+
+    _LOOSE_FOLDER = 'loose'
+    _PACKS_FOLDER = 'packs'
+    _SANDBOX_FOLDER = 'sandbox'
+    _PACK_INDEX = 'packs.idx'
+    _PACK_LOCK = '.lock'
+
+    def __init__(self, basepath):
+        """Construct a new instance for the container located at the given path.
+
+        :param basepath: absolute path of the container directory, which will be initialised if it does not exist
+        """
+        self._basepath = basepath
+        self.init_container()
+
+    def __repr__(self):
+        return '{}<{}>'.format(self.__class__.__name__, self._basepath)
+
+    @property
+    def basepath(self):
+        """Return the absolute path of the container directory."""
+        return self._basepath
+
+    @staticmethod
+    def get_hash():
+        """Return a new instance of the hash algorithm with which the hash keys of objects are computed."""
+        return hashlib.sha256()
+
+    def init_container(self):
+        """Create the folder structure and pack index of the container if they do not yet exist."""
+        for folder in (self._LOOSE_FOLDER, self._PACKS_FOLDER, self._SANDBOX_FOLDER):
+            os.makedirs(os.path.join(self._basepath, folder), exist_ok=True)
+
+        with contextlib.closing(self._get_index_connection()) as connection, connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS db_object '
+                '(hashkey TEXT PRIMARY KEY, pack_id INTEGER NOT NULL, offset INTEGER NOT NULL, length INTEGER NOT NULL)'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS db_digest '
+                '(hashkey TEXT NOT NULL, algorithm TEXT NOT NULL, digest BLOB NOT NULL, PRIMARY KEY (hashkey, algorithm))'
+            )
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS db_reference (hashkey TEXT PRIMARY KEY, count INTEGER NOT NULL)'
+            )
+
+    def _get_index_connection(self):
+        """Return a connection to the SQLite database of the pack index."""
+        return sqlite3.connect(os.path.join(self._basepath, self._PACK_INDEX), timeout=60)
+
+    def _get_loose_path(self, hashkey):
+        """Return the absolute path of the loose object with the given hash key."""
+        return os.path.join(self._basepath, self._LOOSE_FOLDER, hashkey[:2], hashkey[2:])
+
+    def _get_pack_path(self, pack_id):
+        """Return the absolute path of the pack file with the given identifier."""
+        return os.path.join(self._basepath, self._PACKS_FOLDER, str(pack_id))
+
+    def _get_pack_location(self, hashkey):
+        """Return the location of a packed object.
+
+        :param hashkey: the hash key of the object
+        :return: tuple of `(pack_id, offset, length)` or `None` if the object is not packed
+        """
+        with contextlib.closing(self._get_index_connection()) as connection:
+            return connection.execute('SELECT pack_id, offset, length FROM db_object WHERE hashkey = ?',
+                                      (hashkey,)).fetchone()
+
+    def has_object(self, hashkey):
+        """Return whether the container contains an object with the given hash key.
+
+        :param hashkey: the hash key of the object
+        :return: boolean, True if the object exists, False otherwise
+        """
+        return os.path.isfile(self._get_loose_path(hashkey)) or self._get_pack_location(hashkey) is not None
+
+    def add_object(self, content):
+        """Store a new object with the given content.
+
+        :param content: the content of the object as bytes
+        :return: the hash key of the object
+        """
+        return self.add_object_from_filelike(io.BytesIO(content))
+
+    def add_object_from_file(self, filepath):
+        """Store a new object with the content of the file at the given path.
+
+        :param filepath: absolute path of the file whose content to store
+        :return: the hash key of the object
+        """
+        with open(filepath, 'rb') as handle:
+            return self.add_object_from_filelike(handle)
+
+    def add_object_from_filelike(self, handle, encoding='utf8'):
+        """Store a new object with the content of the given file-like object.
+
+        The content is streamed in chunks into a temporary file while its hash is computed, such that the memory usage
+        does not depend on the size of the object. If an object with the same content already exists, the temporary
+        file is discarded, otherwise it is atomically moved to its final location.
+
+        :param handle: a file-like object opened in binary or text mode
+        :param encoding: the encoding to use in case `handle` returns text instead of bytes
+        :return: the hash key of the object
+        """
+        hasher = self.get_hash()
+        sandbox = os.path.join(self._basepath, self._SANDBOX_FOLDER)
+
+        with tempfile.NamedTemporaryFile(dir=sandbox, delete=False) as target:
+            try:
+                while True:
+                    chunk = handle.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode(encoding)
+                    hasher.update(chunk)
+                    target.write(chunk)
+            except Exception:
+                os.remove(target.name)
+                raise
+
+        hashkey = hasher.hexdigest()
+
+        if self.has_object(hashkey):
+            os.remove(target.name)
+        else:
+            filepath = self._get_loose_path(hashkey)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            os.replace(target.name, filepath)
+
+        return hashkey
+
+    def open(self, hashkey):
+        """Open a binary read-only handle to the object with the given hash key.
+
+        :param hashkey: the hash key of the object
+        :return: a binary file-like object that can be used as a context manager
+        :raises FileNotFoundError: if the object does not exist
+        """
+        try:
+            return open(self._get_loose_path(hashkey), 'rb')
+        except FileNotFoundError:
+            location = self._get_pack_location(hashkey)
+
+            if location is None:
+                raise FileNotFoundError('object with hash key `{}` does not exist'.format(hashkey))
+
+            pack_id, offset, length = location
+            return io.BufferedReader(PackedObjectReader(open(self._get_pack_path(pack_id), 'rb'), offset, length))
+
+    def get_object_content(self, hashkey):
+        """Return the content of the object with the given hash key.
+
+        :param hashkey: the hash key of the object
+        :return: the content as bytes
+        :raises FileNotFoundError: if the object does not exist
+        """
+        with self.open(hashkey) as handle:
+            return handle.read()
+
+    def copy_object_to_file(self, hashkey, filepath):
+        """Write the content of the object with the given hash key to a file on the local file system.
+
+        :param hashkey: the hash key of the object
+        :param filepath: absolute path of the file to write
+        :raises FileNotFoundError: if the object does not exist
+        """
+        with self.open(hashkey) as source, open(filepath, 'wb') as target:
+            shutil.copyfileobj(source, target, self.CHUNK_SIZE)
+
+    def get_object_digests(self, hashkeys, algorithm, constructor):
+        """Return a digest of the content of each of the given objects, computed with a custom hash algorithm.
+
+        Since objects are immutable, so are their digests. The digests are therefore persisted in the index of the
+        container the first time they are computed, and subsequent requests for the same objects and algorithm are
+        answered without reading their content. Digests that have to be computed are streamed in chunks, such that the
+        memory usage does not depend on the size of the objects.
+
+        :param hashkeys: an iterable of hash keys
+        :param algorithm: unique name of the hash algorithm, under which the digests are persisted. Changing how
+            `constructor` builds the hash object requires a new name, otherwise stale digests will be returned.
+        :param constructor: callable without arguments that returns a new hash object with `update` and `digest` methods
+        :return: dictionary mapping each hash key onto the digest of the content of the object as bytes
+        :raises FileNotFoundError: if one of the objects does not exist
+        """
+        hashkeys = list(set(hashkeys))
+        digests = {}
+
+        with contextlib.closing(self._get_index_connection()) as connection:
+            for index in range(0, len(hashkeys), self._QUERY_BATCH_SIZE):
+                batch = hashkeys[index:index + self._QUERY_BATCH_SIZE]
+                query = 'SELECT hashkey, digest FROM db_digest WHERE algorithm = ? AND hashkey IN ({})'.format(
+                    ', '.join(['?'] * len(batch))
+                )
+                digests.update(
+                    (hashkey, bytes(digest)) for hashkey, digest in connection.execute(query, [algorithm] + batch)
+                )
+
+            missing = []
+
+            for hashkey in hashkeys:
+                if hashkey in digests:
+                    continue
+
+                hasher = constructor()
+                with self.open(hashkey) as handle:
+                    while True:
+                        chunk = handle.read(self.CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        hasher.update(chunk)
+
+                digests[hashkey] = hasher.digest()
+                missing.append((hashkey, algorithm, digests[hashkey]))
+
+            if missing:
+                with connection:
+                    connection.executemany(
+                        'INSERT OR REPLACE INTO db_digest (hashkey, algorithm, digest) VALUES (?, ?, ?)', missing
+                    )
+
+        return digests
+
+    def iter_loose_hashkeys(self):
+        """Return an iterator over the hash keys of all loose objects."""
+        basepath = os.path.join(self._basepath, self._LOOSE_FOLDER)
+
+        for shard in sorted(os.listdir(basepath)):
+            for remainder in sorted(os.listdir(os.path.join(basepath, shard))):
+                yield shard + remainder
+
+    def iter_packed_hashkeys(self):
+        """Return an iterator over the hash keys of all packed objects."""
+        with contextlib.closing(self._get_index_connection()) as connection:
+            for (hashkey,) in connection.execute('SELECT hashkey FROM db_object ORDER BY hashkey'):
+                yield hashkey
+
+    def count_objects(self):
+        """Return the number of objects in the container.
+
+        :return: dictionary with the number of `loose` and `packed` objects and the number of `pack_files`
+        """
+        with contextlib.closing(self._get_index_connection()) as connection:
+            packed = connection.execute('SELECT COUNT(*) FROM db_object').fetchone()[0]
+
+        return {
+            'loose': sum(1 for _ in self.iter_loose_hashkeys()),
+            'packed': packed,
+            'pack_files': len(self._get_pack_ids()),
+        }
+
+    def _get_pack_ids(self):
+        """Return the sorted list of identifiers of the existing pack files."""
+        return sorted(
+            int(name) for name in os.listdir(os.path.join(self._basepath, self._PACKS_FOLDER)) if name.isdigit()
+        )
+
+    def _get_pack_id_to_write(self):
+        """Return the identifier of the pack file that new objects should be appended to."""
+        pack_ids = self._get_pack_ids()
+
+        if not pack_ids:
+            return 0
+
+        pack_id = pack_ids[-1]
+
+        if os.path.getsize(self._get_pack_path(pack_id)) >= self.PACK_SIZE_TARGET:
+            return pack_id + 1
+
+        return pack_id
+
+    @contextlib.contextmanager
+    def _lock_packs(self):
+        """Context manager that holds an exclusive lock on the pack files, such that only one process writes to them."""
+        import fcntl
+
+        with open(os.path.join(self._basepath, self._PACKS_FOLDER, self._PACK_LOCK), 'w') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def pack_loose_objects(self):
+        """Move all loose objects into pack files.
+
+        The objects are appended to the current pack file, starting a new one when it exceeds `PACK_SIZE_TARGET`. The
+        index is committed before the loose files are removed, so an interrupted packing operation leaves at most some
+        unreferenced bytes at the end of a pack file, which is harmless.
+
+        :return: the number of objects that were packed
+        """
+        count = 0
+
+        with self._lock_packs(), contextlib.closing(self._get_index_connection()) as connection:
+            hashkeys = list(self.iter_loose_hashkeys())
+            # Transient objects are not packed, such that their space is reclaimed when they are released. Their
+            # references are read after the loose objects are listed, since references are added before the objects.
+            transient = {hashkey for hashkey, in connection.execute('SELECT hashkey FROM db_reference')}
+            hashkeys = collections.deque(hashkey for hashkey in hashkeys if hashkey not in transient)
+            pack_id = self._get_pack_id_to_write()
+            packed = []
+
+            while hashkeys:
+                with open(self._get_pack_path(pack_id), 'ab') as pack:
+                    offset = pack.tell()
+
+                    while hashkeys and offset < self.PACK_SIZE_TARGET:
+                        hashkey = hashkeys.popleft()
+                        try:
+                            with open(self._get_loose_path(hashkey), 'rb') as source:
+                                shutil.copyfileobj(source, pack, self.CHUNK_SIZE)
+                        except FileNotFoundError:
+                            # The object was released concurrently after the loose objects were listed
+                            continue
+                        length = pack.tell() - offset
+                        packed.append((hashkey, pack_id, offset, length))
+                        offset += length
+
+                    pack.flush()
+                    os.fsync(pack.fileno())
+
+                pack_id += 1
+
+            with connection:
+                connection.executemany(
+                    'INSERT OR IGNORE INTO db_object (hashkey, pack_id, offset, length) VALUES (?, ?, ?, ?)', packed
+                )
+
+            for hashkey, _, _, _ in packed:
+                os.remove(self._get_loose_path(hashkey))
+                count += 1
+
+        return count
+
+    def delete_objects(self, hashkeys):
+        """Delete the objects with the given hash keys.
+
+        Loose objects are removed from the file system directly. Packed objects are only removed from the index; the
+        space they occupy in the pack file is not reclaimed.
+
+        .. warning:: The container does not keep track of which nodes reference an object. The caller has to make sure
+            that the objects are not referenced by the `repository_metadata` of any node.
+
+        :param hashkeys: an iterable of hash keys
+        """
+        with contextlib.closing(self._get_index_connection()) as connection, connection:
+            self._delete_objects(connection, list(hashkeys))
+
+    def _delete_objects(self, connection, hashkeys):
+        """Delete the objects with the given hash keys within the current transaction of the index connection."""
+        for hashkey in hashkeys:
+            try:
+                os.remove(self._get_loose_path(hashkey))
+            except FileNotFoundError:
+                pass
+
+        connection.executemany('DELETE FROM db_object WHERE hashkey = ?', [(hashkey,) for hashkey in hashkeys])
+        connection.executemany('DELETE FROM db_digest WHERE hashkey = ?', [(hashkey,) for hashkey in hashkeys])
+
+    def add_reference(self, hashkey):
+        """Increment the reference count of the transient object with the given hash key.
+
+        Transient objects, such as process checkpoints, are replaced often. They are not packed, such that their space
+        is reclaimed when they are deleted by :meth:`release_references` once no longer referenced. Since objects with
+        the same content share a hash key, the reference has to be added before the object itself is added, such that a
+        concurrent release of another reference cannot delete the object.
+
+        :param hashkey: the hash key of the object
+        """
+        with contextlib.closing(self._get_index_connection()) as connection, connection:
+            connection.execute('INSERT OR IGNORE INTO db_reference (hashkey, count) VALUES (?, 0)', (hashkey,))
+            connection.execute('UPDATE db_reference SET count = count + 1 WHERE hashkey = ?', (hashkey,))
+
+    def release_references(self, hashkeys):
+        """Decrement the reference counts of the transient objects with the given hash keys.
+
+        The objects that are no longer referenced are deleted, including objects without a reference count.
+
+        :param hashkeys: an iterable of hash keys
+        :return: the list of hash keys of the objects that were deleted
+        """
+        hashkeys = list(hashkeys)
+        deleted = []
+
+        with contextlib.closing(self._get_index_connection()) as connection, connection:
+            for hashkey in hashkeys:
+                connection.execute('UPDATE db_reference SET count = count - 1 WHERE hashkey = ?', (hashkey,))
+                row = connection.execute('SELECT count FROM db_reference WHERE hashkey = ?', (hashkey,)).fetchone()
+                if row is None or row[0] <= 0:
+                    deleted.append(hashkey)
+
+            # The objects are deleted while the index is locked by the updates above, such that a concurrent
+            # `add_reference` for the same hash key waits until the objects and their references are removed
+            self._delete_objects(connection, deleted)
+            connection.executemany('DELETE FROM db_reference WHERE hashkey = ?', [(hashkey,) for hashkey in deleted])
+
+        return deleted
+
+
+class ObjectTree:
+    """Directory hierarchy whose files are objects in an :class:`ObjectStore`.
+
+    The hierarchy is described by a nested dictionary, where each key is the name of a file or directory. The value of a
+    directory is again a dictionary and the value of a file is the hash key of the object with its content. This is the
+    format of the `repository_metadata` of nodes. Instances can be passed to :func:`aiida.common.hashing.make_hash`,
+    which will return the same hash as for a :class:`aiida.common.folders.Folder` with the same content.
+    """
+
+    def __init__(self, object_store, directory):
+        """Construct a new tree.
+
+        :param object_store: the :class:`ObjectStore` that contains the objects referenced by `directory`
+        :param directory: the nested dictionary describing the hierarchy
+        """
+        self._object_store = object_store
+        self._directory = directory
+
+    def __repr__(self):
+        return '{}<{!r}>'.format(self.__class__.__name__, self._object_store)
+
+    @property
+    def object_store(self):
+        """Return the object store that contains the objects of this tree."""
+        return self._object_store
+
+    @property
+    def directory(self):
+        """Return the nested dictionary describing the hierarchy."""
+        return self._directory
+
+    def iter_hashkeys(self, ignored=()):
+        """Return an iterator over the hash keys of all files in the tree.
+
+        :param ignored: names of files and directories, at any depth, that should be skipped
+        """
+
+        def iterate(directory):
+            for name, entry in directory.items():
+                if name in ignored:
+                    continue
+                if isinstance(entry, dict):
+                    for hashkey in iterate(entry):
+                        yield hashkey
+                else:
+                    yield entry
+
+        return iterate(self._directory)
@@ -96,10 +96,14 @@ class AiidaApi(Api):
           configuration and PREFIX
         """
 
+        from aiida.restapi.common.utils import NODE_CACHE
         from aiida.restapi.resources import ProcessNode, CalcJobNode, Computer, User, Group, Node, ServerInfo
 
         self.app = app
 
+        # Results cached by a previously configured api may belong to a database that has since been reset
+        NODE_CACHE.clear()
+
         super().__init__(app=app, prefix=kwargs['PREFIX'], catch_all_404s=True)
 
         self.add_resource(
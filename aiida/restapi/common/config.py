@@ -37,6 +37,9 @@ CACHING_TIMEOUTS = {  # Caching timeouts in seconds
     'codes': 10,
 }
 
+# Seconds during which the node namespace and statistics are served from cache without checking for modified nodes
+NODE_CACHE_TIMEOUT = 10
+
 # IO tree
 MAX_TREE_DEPTH = 5
 
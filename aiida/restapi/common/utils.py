@@ -17,6 +17,7 @@ from wrapt import decorator
 
 from aiida.common.exceptions import InputValidationError, ValidationError
 from aiida.manage.manager import get_manager
+from aiida.restapi.common.config import NODE_CACHE_TIMEOUT
 from aiida.restapi.common.exceptions import RestValidationError, \
     RestInputValidationError
 
@@ -87,6 +88,89 @@ class DatetimePrecision:
         self.precision = precision
 
 
+class NodeCache:
+    """
+    Cache of results that are computed from the nodes in the database, such
+    as the node namespace and the creation statistics.
+
+    A cached result is returned without any query for `timeout` seconds. After
+    that, a watermark of the nodes is queried, which is the largest id of the
+    rows of the node statistics table. Since the triggers that maintain that
+    table insert a row whenever a node is stored or deleted, or its type, user
+    or creation time is changed, the watermark changes with every change of the
+    nodes that the cached results depend on. It is read from the primary key
+    index of the table, so it does not require a scan of any table. If the
+    watermark did not change since the result was computed, the result is
+    returned and kept for another `timeout` seconds, otherwise it is recomputed.
+    """
+
+    def __init__(self, timeout):
+        """
+        :param timeout: number of seconds during which a result is returned
+            without checking the watermark
+        """
+        import threading
+
+        self.timeout = timeout
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_watermark():
+        """
+        Return the watermark of the nodes, which changes whenever nodes are
+        added or deleted, or their type, user or creation time is changed.
+
+        :return: the largest id of the node statistics table, or None if it is empty
+        """
+        from sqlalchemy import text
+
+        session = get_manager().get_backend().get_session()
+
+        return session.execute(text('SELECT MAX(id) FROM db_dbnodestatistics')).scalar()
+
+    def get(self, key, function, *args, **kwargs):
+        """
+        Return the cached result for `key`, computing it with `function` if it
+        is missing or the nodes changed since it was computed.
+
+        :param key: hashable key of the result, which should include the arguments
+        :param function: callable that computes the result from the arguments
+        :return: the result
+        """
+        import time
+
+        key = (get_manager().get_profile().name, key)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and now < entry[1]:
+            return entry[0]
+
+        watermark = self.get_watermark()
+
+        if entry is None or entry[2] != watermark:
+            entry = (function(*args, **kwargs), None, watermark)
+
+        entry = (entry[0], now + self.timeout, watermark)
+
+        with self._lock:
+            self._entries[key] = entry
+
+        return entry[0]
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Cache of the node namespace and statistics, shared by all requests served by this process
+NODE_CACHE = NodeCache(NODE_CACHE_TIMEOUT)
+
+
 class Utils:
     """
     A class that gathers all the utility functions for parsing URI,
@@ -238,7 +322,16 @@ class Utils:
         return (resource_type, page, node_id, query_type)
 
     def validate_request(
-        self, limit=None, offset=None, perpage=None, page=None, query_type=None, is_querystring_defined=False
+        self,
+        limit=None,
+        offset=None,
+        perpage=None,
+        page=None,
+        query_type=None,
+        is_querystring_defined=False,
+        cursor=None,
+        count='exact',
+        response_format='json'
     ):
         # pylint: disable=fixme,no-self-use,too-many-arguments,too-many-branches
         """
@@ -265,6 +358,18 @@ class Utils:
         # 4. No querystring if query type = projectable_properties'
         if query_type in ('projectable_properties',) and is_querystring_defined:
             raise RestInputValidationError('projectable_properties requests do not allow specifying a query string')
+        # 5. cursor based pagination replaces pages and offsets
+        if cursor is not None and (page is not None or offset is not None):
+            raise RestValidationError('cursor key is incompatible with pages and offset')
+        # 6. only the listings of entities can be paginated with a cursor or streamed
+        if (cursor is not None or response_format != 'json') and query_type not in ('default', 'incoming', 'outgoing'):
+            raise RestValidationError('cursor and format keys are only supported for listings')
+        if response_format == 'ndjson' and page is not None:
+            raise RestValidationError('streamed responses cannot be requested for a page')
+        if count not in ('exact', 'estimate'):
+            raise RestInputValidationError("count has to be either 'exact' or 'estimate'")
+        if response_format not in ('json', 'ndjson'):
+            raise RestInputValidationError("format has to be either 'json' or 'ndjson'")
 
     def paginate(self, page, perpage, total_count):
         """
@@ -332,13 +437,15 @@ class Utils:
 
         return (limit, offset, rel_pages)
 
-    def build_headers(self, rel_pages=None, url=None, total_count=None):
+    def build_headers(self, rel_pages=None, url=None, total_count=None, next_cursor=None):
         """
         Construct the header dictionary for an HTTP response. It includes related
         pages, total count of results (before pagination).
 
         :param rel_pages: a dictionary defining related pages (first, prev, next, last)
         :param url: (string) the full url, i.e. the url that the client uses to get Rest resources
+        :param next_cursor: continuation token of the results that follow the
+            current ones, when paginating with a cursor
         """
 
         ## Type validation
@@ -362,6 +469,8 @@ class Utils:
         # rel_pages cannot be defined without url
         if rel_pages is not None and url is None:
             raise InputValidationError("'rel_pages' parameter requires 'url' parameter to be defined")
+        if next_cursor is not None and url is None:
+            raise InputValidationError("'next_cursor' parameter requires 'url' parameter to be defined")
 
         headers = {}
 
@@ -403,6 +512,15 @@ class Utils:
             else:
                 pass
 
+        # set the continuation token and the link to the next results
+        if next_cursor is not None:
+            (path, query_string, question_mark) = split_url(url)
+            fields = [field for field in query_string.split('&') if field and not field.startswith('cursor=')]
+            fields.append('cursor={}'.format(next_cursor))
+            headers['X-Next-Cursor'] = next_cursor
+            headers['Link'] = '<{}?{}>; rel=next'.format(path, '&'.join(fields))
+            expose_header.extend(['X-Next-Cursor', 'Link'])
+
         # to expose header access in cross-domain requests
         headers['Access-Control-Expose-Headers'] = ','.join(expose_header)
 
@@ -446,6 +564,38 @@ class Utils:
 
         return response
 
+    @staticmethod
+    def build_stream_response(entries, headers=None):
+        """
+        Build a response that streams entries as newline delimited JSON, one
+        entry per line, while they are being retrieved from the database.
+
+        :param entries: an iterable of dictionaries, typically a generator
+        :param headers: dictionary for additional header k,v pairs
+
+        :return: a Flask response object
+        """
+        from flask import Response, json, stream_with_context
+
+        if headers is not None and not isinstance(headers, dict):
+            raise InputValidationError('header must be a dictionary')
+
+        def generate():
+            # The session is closed by `close_session` when the resource returns, before the body is streamed
+            try:
+                for entry in entries:
+                    yield json.dumps(entry) + '\n'
+            finally:
+                get_manager().get_backend().get_session().close()
+
+        response = Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        if headers is not None:
+            for key, val in headers.items():
+                response.headers[key] = val
+
+        return response
+
     @staticmethod
     def build_datetime_filter(dtobj):
         """
@@ -509,6 +659,9 @@ class Utils:
         extras = None
         extras_filter = None
         full_type = None
+        cursor = None
+        count = 'exact'
+        response_format = 'json'
 
         # io tree limit parameters
         tree_in_limit = None
@@ -562,6 +715,12 @@ class Utils:
             raise RestInputValidationError('You cannot specify extras_filter more than once')
         if 'full_type' in field_counts.keys() and field_counts['full_type'] > 1:
             raise RestInputValidationError('You cannot specify full_type more than once')
+        if 'cursor' in field_counts.keys() and field_counts['cursor'] > 1:
+            raise RestInputValidationError('You cannot specify cursor more than once')
+        if 'count' in field_counts.keys() and field_counts['count'] > 1:
+            raise RestInputValidationError('You cannot specify count more than once')
+        if 'format' in field_counts.keys() and field_counts['format'] > 1:
+            raise RestInputValidationError('You cannot specify format more than once')
 
         ## Extract results
         for field in field_list:
@@ -653,6 +812,24 @@ class Utils:
                 else:
                     raise RestInputValidationError("only assignment operator '=' is permitted after 'extras_filter'")
 
+            elif field[0] == 'cursor':
+                if field[1] == '=':
+                    cursor = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'cursor'")
+
+            elif field[0] == 'count':
+                if field[1] == '=':
+                    count = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'count'")
+
+            elif field[0] == 'format':
+                if field[1] == '=':
+                    response_format = field[2]
+                else:
+                    raise RestInputValidationError("only assignment operator '=' is permitted after 'format'")
+
             else:
 
                 ## Construct the filter entry.
@@ -681,7 +858,8 @@ class Utils:
 
         return (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor, count,
+            response_format
         )
 
     def parse_query_string(self, query_string):
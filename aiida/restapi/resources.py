@@ -148,7 +148,8 @@ class BaseResource(Resource):
         # pylint: disable=unused-variable
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor, count,
+            response_format
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -158,7 +159,10 @@ class BaseResource(Resource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
+            count=count,
+            response_format=response_format
         )
 
         ## Treat the projectable_properties case which does not imply access to the DataBase
@@ -175,19 +179,31 @@ class BaseResource(Resource):
             self.trans.set_query(filters=filters, orders=orderby, node_id=node_id)
 
             ## Count results
-            total_count = self.trans.get_total_count()
+            total_count = self.trans.get_total_count(estimate=(count == 'estimate'))
+
+            ## Stream all results (after the cursor if given) in batches
+            if response_format == 'ndjson':
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                return self.utils.build_stream_response(self.trans.iter_results(limit), headers=headers)
 
             ## Pagination (if required)
-            if page is not None:
+            if cursor is not None:
+                self.trans.set_cursor(cursor)
+                self.trans.set_limit_offset(limit=limit)
+                results = self.trans.get_results()
+                next_cursor = self.trans.get_next_cursor(results)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, next_cursor=next_cursor)
+            elif page is not None:
                 (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
                 headers = self.utils.build_headers(rel_pages=rel_pages, url=request.url, total_count=total_count)
+                results = self.trans.get_results()
             else:
                 self.trans.set_limit_offset(limit=limit, offset=offset)
                 headers = self.utils.build_headers(url=request.url, total_count=total_count)
-
-            ## Retrieve results
-            results = self.trans.get_results()
+                results = self.trans.get_results()
 
         ## Build response and return it
         data = dict(
@@ -235,7 +251,8 @@ class Node(BaseResource):
 
         (
             limit, offset, perpage, orderby, filters, download_format, download, filename, tree_in_limit,
-            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type
+            tree_out_limit, attributes, attributes_filter, extras, extras_filter, full_type, cursor, count,
+            response_format
         ) = self.utils.parse_query_string(query_string)
 
         ## Validate request
@@ -245,7 +262,10 @@ class Node(BaseResource):
             perpage=perpage,
             page=page,
             query_type=query_type,
-            is_querystring_defined=(bool(query_string))
+            is_querystring_defined=(bool(query_string)),
+            cursor=cursor,
+            count=count,
+            response_format=response_format
         )
 
         ## Treat the projectable properties case which does not imply access to the DataBase
@@ -298,10 +318,27 @@ class Node(BaseResource):
             )
 
             ## Count results
-            total_count = self.trans.get_total_count()
+            total_count = self.trans.get_total_count(estimate=(count == 'estimate'))
+
+            ## Stream all results (after the cursor if given) in batches
+            if response_format == 'ndjson':
+                if cursor is not None:
+                    self.trans.set_cursor(cursor)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count)
+                entries = (
+                    self._nest_projections(entry, attributes, attributes_filter, extras, extras_filter)
+                    for entry in self.trans.iter_results(limit)
+                )
+                return self.utils.build_stream_response(entries, headers=headers)
 
             ## Pagination (if required)
-            if page is not None:
+            if cursor is not None:
+                self.trans.set_cursor(cursor)
+                self.trans.set_limit_offset(limit=limit)
+                results = self.trans.get_results()
+                next_cursor = self.trans.get_next_cursor(results)
+                headers = self.utils.build_headers(url=request.url, total_count=total_count, next_cursor=next_cursor)
+            elif page is not None:
                 (limit, offset, rel_pages) = self.utils.paginate(page, perpage, total_count)
                 self.trans.set_limit_offset(limit=limit, offset=offset)
 
@@ -335,23 +372,9 @@ class Node(BaseResource):
 
                 headers = self.utils.build_headers(url=request.url, total_count=total_count)
 
-            if attributes_filter is not None and attributes:
-                for node in results['nodes']:
-                    node['attributes'] = {}
-                    if not isinstance(attributes_filter, list):
-                        attributes_filter = [attributes_filter]
-                    for attr in attributes_filter:
-                        node['attributes'][str(attr)] = node['attributes.' + str(attr)]
-                        del node['attributes.' + str(attr)]
-
-            if extras_filter is not None and extras:
+            if (attributes_filter is not None and attributes) or (extras_filter is not None and extras):
                 for node in results['nodes']:
-                    node['extras'] = {}
-                    if not isinstance(extras_filter, list):
-                        extras_filter = [extras_filter]
-                    for extra in extras_filter:
-                        node['extras'][str(extra)] = node['extras.' + str(extra)]
-                        del node['extras.' + str(extra)]
+                    self._nest_projections(node, attributes, attributes_filter, extras, extras_filter)
 
         ## Build response
         data = dict(
@@ -367,6 +390,33 @@ class Node(BaseResource):
 
         return self.utils.build_response(status=200, headers=headers, data=data)
 
+    @staticmethod
+    def _nest_projections(node, attributes, attributes_filter, extras, extras_filter):
+        """
+        Nest the projected attributes and extras of a node entry under the
+        'attributes' and 'extras' keys, like when all of them are projected.
+
+        :param node: dictionary of the projections of a node, which is modified
+        :return: the node entry
+        """
+        if attributes_filter is not None and attributes:
+            node['attributes'] = {}
+            if not isinstance(attributes_filter, list):
+                attributes_filter = [attributes_filter]
+            for attr in attributes_filter:
+                node['attributes'][str(attr)] = node['attributes.' + str(attr)]
+                del node['attributes.' + str(attr)]
+
+        if extras_filter is not None and extras:
+            node['extras'] = {}
+            if not isinstance(extras_filter, list):
+                extras_filter = [extras_filter]
+            for extra in extras_filter:
+                node['extras'][str(extra)] = node['extras.' + str(extra)]
+                del node['extras.' + str(extra)]
+
+        return node
+
 
 class Computer(BaseResource):
     """ Resource for Computer """
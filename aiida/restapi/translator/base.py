@@ -40,6 +40,10 @@ class BaseTranslator:
     _is_qb_initialized = False
     _is_id_query = None
     _total_count = None
+    _is_count_estimated = False
+    _is_cursor_query = False
+    _cursor_filters = None
+    _limit = None
 
     def __init__(self, **kwargs):
         """
@@ -100,12 +104,19 @@ class BaseTranslator:
         self.qbobj.__init__(**self._query_help)
         self._is_qb_initialized = True
 
-    def count(self):
+    def count(self, estimate=False):
         """
         Count the number of rows returned by the query and set total_count
+
+        :param estimate: if True, use the estimate of the query planner instead
+            of counting the rows, which does not scale with their number
         """
         if self._is_qb_initialized:
-            self._total_count = self.qbobj.count()
+            if estimate:
+                self._total_count = self._estimate_count()
+                self._is_count_estimated = True
+            else:
+                self._total_count = self.qbobj.count()
         else:
             raise InvalidOperation('query builder object has not been initialized.')
 
@@ -122,18 +133,45 @@ class BaseTranslator:
 
             #    @cache.memoize(timeout=CACHING_TIMEOUTS[self.__label__])
 
-    def get_total_count(self):
+    def get_total_count(self, estimate=False):
         """
         Returns the number of rows of the query.
 
+        :param estimate: if True, return the estimate of the query planner
+            instead of the exact number of rows
         :return: total_count
         """
         ## Count the results if needed
         if not self._total_count:
-            self.count()
+            self.count(estimate=estimate)
 
         return self._total_count
 
+    def _estimate_count(self):
+        """
+        Returns the number of rows of the query as estimated by the query
+        planner of PostgreSQL from the table statistics in `pg_class`, without
+        executing the query.
+
+        :return: the estimated number of rows
+        """
+        import json
+
+        query = self.qbobj.get_query()
+        statement = query.statement.compile(dialect=query.session.get_bind().dialect)
+        cursor = query.session.connection().connection.cursor()
+
+        try:
+            cursor.execute('EXPLAIN (FORMAT JSON) {}'.format(statement), statement.params)
+            plan = cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return int(plan[0]['Plan']['Plan Rows'])
+
     def set_filters(self, filters=None):
         """
         Add filters in query_help.
@@ -386,6 +424,8 @@ class BaseTranslator:
             except ValueError:
                 raise InputValidationError('Offset value must be an integer')
 
+        self._limit = limit
+
         if self._is_qb_initialized:
             if limit is not None:
                 self.qbobj.limit(limit)
@@ -412,7 +452,7 @@ class BaseTranslator:
             raise InvalidOperation('query builder object has not been initialized.')
 
         results = []
-        if self._total_count > 0:
+        if self._total_count > 0 or self._is_count_estimated:
             for res in self.qbobj.dict():
                 tmp = res[label]
 
@@ -453,6 +493,197 @@ class BaseTranslator:
         data = self.get_formatted_result(self._result_type)
         return data
 
+    def iter_results(self, limit=None):
+        """
+        Yields the entries of the results one by one. They are retrieved in
+        batches of at most `limit_default` entries, where each batch continues
+        after the last entry of the previous one, such that no batch has to
+        skip over the rows that precede it.
+
+        :param limit: largest number of entries to yield, all of them by default
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                raise InputValidationError('Limit value must be an integer')
+
+        if self._total_count is None:
+            self.count()
+
+        if not self._is_cursor_query:
+            self.set_cursor()
+
+        while limit is None or limit > 0:
+            batch_size = self.limit_default if limit is None else min(limit, self.limit_default)
+            self.qbobj.limit(batch_size)
+            entries = self._get_entries(self.get_formatted_result(self._result_type))
+
+            yield from entries
+
+            if len(entries) < batch_size:
+                return
+
+            if limit is not None:
+                limit -= len(entries)
+
+            self.set_cursor(self.get_cursor(entries[-1]))
+
+    @staticmethod
+    def _get_entries(results):
+        """
+        :param results: the dictionary returned by `get_formatted_result`
+        :return: the list of entries of the results
+        """
+        return next(iter(results.values()), [])
+
+    def _get_cursor_order(self):
+        """
+        Returns the ordering of the results on which the continuation tokens
+        are based, which is by ascending `id` unless another order is set.
+
+        :return: list of (column, direction) pairs
+        """
+        from collections import OrderedDict
+
+        tag = self._result_type
+        order = self._query_help['order_by'].get(tag)
+
+        if not order:
+            order = self._query_help['order_by'][tag] = OrderedDict([(PK_DBSYNONYM, 'asc')])
+
+        projections = self._query_help['project'].get(tag, [])
+
+        for column in order:
+            if '.' in column:
+                raise RestValidationError('results cannot be paginated with a cursor when ordered by {}'.format(column))
+            if '**' not in projections and column not in projections:
+                raise RestValidationError(
+                    'results cannot be paginated with a cursor when ordered by {}, which is '
+                    'not projected'.format(column)
+                )
+
+        return [[column, direction] for column, direction in order.items()]
+
+    @staticmethod
+    def _encode_cursor(order, values):
+        """
+        Returns an opaque continuation token of the given values of the order
+        columns. It is a hexadecimal encoding of JSON, prefixed with a letter,
+        such that it can be passed in the query string without quotes.
+        """
+        import datetime
+        import json
+        import uuid
+
+        serialized = []
+
+        for value in values:
+            if value is None:
+                raise RestValidationError('results cannot be paginated with a cursor when ordered by null values')
+            if isinstance(value, datetime.datetime):
+                value = {'datetime': value.isoformat()}
+            elif isinstance(value, uuid.UUID):
+                value = str(value)
+            serialized.append(value)
+
+        token = json.dumps({'order': order, 'values': serialized}, separators=(',', ':'))
+
+        return 'c' + token.encode('utf-8').hex()
+
+    @staticmethod
+    def _decode_cursor(cursor, order):
+        """
+        Returns the values of the order columns encoded by `_encode_cursor`.
+
+        :raise RestInputValidationError: if the token is invalid or was created
+            for a different ordering
+        """
+        import json
+        from dateutil import parser as dtparser
+
+        try:
+            if not cursor.startswith('c'):
+                raise ValueError
+            token = json.loads(bytes.fromhex(cursor[1:]).decode('utf-8'))
+            values = [
+                dtparser.parse(value['datetime']) if isinstance(value, dict) else value for value in token['values']
+            ]
+            token_order = token['order']
+        except (AttributeError, KeyError, TypeError, ValueError):
+            raise RestInputValidationError('invalid cursor {}'.format(cursor))
+
+        if token_order != order or len(values) != len(order):
+            raise RestInputValidationError('the cursor was created for a different ordering of the results')
+
+        return values
+
+    def set_cursor(self, cursor=None):
+        """
+        Restricts the query to the rows that follow the row from which the
+        continuation token was created, in the order of the query. Unlike an
+        offset, this is a filter on the order columns, which can be satisfied
+        by an index scan no matter how deep into the results the token is.
+
+        :param cursor: continuation token returned by `get_cursor`, or 'start'
+            or None to start from the first row
+        """
+        if not self._is_qb_initialized:
+            raise InvalidOperation('query builder object has not been initialized.')
+
+        tag = self._result_type
+        order = self._get_cursor_order()
+
+        # Keep the filters of the query, to which the filter of each token is added
+        if self._cursor_filters is None:
+            self._cursor_filters = self._query_help['filters'].get(tag, {})
+
+        filters = self._cursor_filters
+
+        if cursor not in (None, 'start'):
+            values = self._decode_cursor(cursor, order)
+            clauses = []
+
+            # (a, b) > (x, y) is expanded to a > x OR (a == x AND b > y), taking into account the order direction
+            for index, (column, direction) in enumerate(order):
+                clause = {previous: {'==': value} for (previous, _), value in zip(order[:index], values)}
+                clause[column] = {'>' if direction == 'asc' else '<': values[index]}
+                clauses.append(clause)
+
+            keyset = clauses[0] if len(clauses) == 1 else {'or': clauses}
+            filters = {'and': [filters, keyset]} if filters else keyset
+
+        self._query_help['filters'][tag] = filters
+        self._is_cursor_query = True
+        self.init_qb()
+
+    def get_cursor(self, entry):
+        """
+        Returns the continuation token of the results that follow the given entry.
+
+        :param entry: an entry of the results
+        """
+        order = self._get_cursor_order()
+        return self._encode_cursor(order, [entry[column] for column, _ in order])
+
+    def get_next_cursor(self, results):
+        """
+        Returns the continuation token of the results that follow the given
+        results of a query that was paginated with a cursor.
+
+        :param results: the dictionary returned by `get_results`
+        :return: the token, or None if there are no further results
+        """
+        entries = self._get_entries(results)
+
+        if not self._is_cursor_query or self._limit is None or len(entries) < self._limit:
+            return None
+
+        return self.get_cursor(entries[-1])
+
     def _check_id_validity(self, node_id):
         """
         Checks whether id corresponds to an object of the expected type,
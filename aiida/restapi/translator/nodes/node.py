@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Translator for node"""
+import threading
+
 from aiida import orm
 from aiida.common.exceptions import InputValidationError, ValidationError, InvalidOperation
 from aiida.manage.manager import get_manager
@@ -42,6 +44,10 @@ class NodeTranslator(BaseTranslator):
     _download = None
     _filename = None
 
+    # Subclasses of each translator class, which are discovered only once per process since it imports all modules
+    _subclasses_registry = {}
+    _subclasses_lock = threading.Lock()
+
     def __init__(self, **kwargs):
         """
         Initialise the parameters.
@@ -69,7 +75,11 @@ class NodeTranslator(BaseTranslator):
                          \- CalculationTranslator
         """
 
-        self._subclasses = self._get_subclasses()
+        with NodeTranslator._subclasses_lock:
+            if self.__class__ not in NodeTranslator._subclasses_registry:
+                NodeTranslator._subclasses_registry[self.__class__] = self._get_subclasses()
+
+        self._subclasses = NodeTranslator._subclasses_registry[self.__class__]
         self._backend = get_manager().get_backend()
 
     def set_query_type(
@@ -577,20 +587,22 @@ class NodeTranslator(BaseTranslator):
         return results
 
     def get_statistics(self, user_pk=None):
-        """Return statistics for a given node"""
+        """Return statistics for a given node, cached until nodes are added, modified or deleted"""
+        from aiida.restapi.common.utils import NODE_CACHE
 
         qmanager = self._backend.query_manager
-        return qmanager.get_creation_statistics(user_pk=user_pk)
+        return NODE_CACHE.get(('statistics', user_pk), qmanager.get_creation_statistics, user_pk=user_pk)
 
     @staticmethod
     def get_namespace():
         """
-        return full_types of the nodes
+        return full_types of the nodes, cached until nodes are added, modified or deleted
         """
 
         from aiida.restapi.common.identifiers import get_node_namespace
+        from aiida.restapi.common.utils import NODE_CACHE
 
-        return get_node_namespace().get_description()
+        return NODE_CACHE.get('namespace', lambda: get_node_namespace().get_description())
 
     def get_io_tree(self, uuid_pattern, tree_in_limit, tree_out_limit):
         # pylint: disable=too-many-statements,too-many-locals
@@ -158,12 +158,18 @@ def validate_traversal_rules(ruleset=GraphTraversalRules.DEFAULT, **kwargs):
     return valid_output
 
 
-def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_forward=(), links_backward=()):
+def traverse_graph(
+    starting_pks, max_iterations=None, get_links=False, links_forward=(), links_backward=(), in_database=True
+):
     """
     This function will return the set of all nodes that can be connected
     to a list of initial nodes through any sequence of specified links.
     Optionally, it may also return the links that connect these nodes.
 
+    By default the traversal runs in the database, through the query manager of the backend, such that only the final
+    sets of nodes and links are transferred. The rule based implementation of :py:mod:`aiida.tools.graph.age_rules`,
+    which performs a `QueryBuilder` query with the pks found so far for each iteration, is used as a fallback.
+
     :type starting_pks: list or tuple or set
     :param starting_pks: Contains the (valid) pks of the starting nodes.
 
@@ -182,12 +188,17 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
     :type links_backward: aiida.common.links.LinkType
     :param links_backward:
         List with all the links that should be traversed in the backward direction.
+
+    :param bool in_database:
+        Pass False to traverse the graph with the rule based implementation instead of in the database.
     """
-    # pylint: disable=too-many-locals,too-many-statements,too-many-branches
+    # pylint: disable=too-many-locals,too-many-statements,too-many-branches,too-many-arguments
     from aiida import orm
     from aiida.tools.graph.age_entities import Basket
     from aiida.tools.graph.age_rules import UpdateRule, RuleSequence, RuleSaveWalkers, RuleSetWalkers
     from aiida.common import exceptions
+    from aiida.manage.manager import get_manager
+    from aiida.orm.utils.links import LinkQuadruple
 
     if max_iterations is None:
         max_iterations = inf
@@ -222,6 +233,17 @@ def traverse_graph(starting_pks, max_iterations=None, get_links=False, links_for
         raise TypeError('one of the starting_pks is not of type int:\n {}'.format(starting_pks))
     operational_set = set(starting_pks)
 
+    if in_database:
+        backend = get_manager().get_backend()
+        nodes, links = backend.query_manager.traverse_graph(
+            operational_set,
+            links_forward=filters_forwards['type']['in'],
+            links_backward=filters_backwards['type']['in'],
+            max_iterations=None if max_iterations is inf else max_iterations,
+            get_links=get_links
+        )
+        return {'nodes': nodes, 'links': {LinkQuadruple(*link) for link in links} if get_links else None}
+
     query_nodes = orm.QueryBuilder()
     query_nodes.append(orm.Node, project=['id'], filters={'id': {'in': operational_set}})
     existing_pks = set(query_nodes.all(flat=True))
@@ -10,6 +10,7 @@
 # pylint: disable=too-many-branches
 """Utility functions and classes to interact with AiiDA export archives."""
 
+import collections
 import os
 import sys
 import tarfile
@@ -19,13 +20,13 @@ from wrapt import decorator
 
 from aiida.common import json
 from aiida.common.exceptions import ContentNotExistent, InvalidOperation
-from aiida.common.folders import SandboxFolder
+from aiida.common.folders import RepositoryFolder, SandboxFolder
 
 from aiida.tools.importexport.common.config import NODES_EXPORT_SUBFOLDER
 from aiida.tools.importexport.common.exceptions import CorruptArchive
 from aiida.tools.importexport.common.progress_bar import get_progress_bar, close_progress_bar
 
-__all__ = ('Archive', 'extract_zip', 'extract_tar', 'extract_tree')
+__all__ = ('Archive', 'extract_zip', 'extract_tar', 'extract_tree', 'copy_node_repositories')
 
 
 class Archive:
@@ -284,7 +285,7 @@ def get_file_iterator(file_handle, folderpath, silent=True, **kwargs):  # pylint
     return get_progress_bar(iterable=file_handle.namelist(), unit='files', leave=False, disable=silent)
 
 
-def extract_zip(infile, folder, nodes_export_subfolder=None, **kwargs):
+def extract_zip(infile, folder, nodes_export_subfolder=None, extract_repository=True, **kwargs):
     """Extract the nodes to be imported from a zip file.
 
     :param infile: file path
@@ -296,6 +297,10 @@ def extract_zip(infile, folder, nodes_export_subfolder=None, **kwargs):
     :param nodes_export_subfolder: name of the subfolder for AiiDA nodes
     :type nodes_export_subfolder: str
 
+    :param extract_repository: if False, only the metadata files are extracted and not the repository contents of the
+        nodes, which can be copied directly from the archive with :func:`copy_node_repositories`
+    :type extract_repository: bool
+
     :param silent: suppress progress bar
     :type silent: bool
 
@@ -318,7 +323,7 @@ def extract_zip(infile, folder, nodes_export_subfolder=None, **kwargs):
 
             file_iterator = get_file_iterator(file_handle=handle, folderpath=folder.abspath, **kwargs)
 
-            for membername in file_iterator:
+            for membername in file_iterator if extract_repository else ():
                 # Check that we are only exporting nodes within the subfolder!
                 # TODO: better check such that there are no .. in the
                 # path; use probably the folder limit checks
@@ -333,7 +338,7 @@ def extract_zip(infile, folder, nodes_export_subfolder=None, **kwargs):
     close_progress_bar(leave=False)
 
 
-def extract_tar(infile, folder, nodes_export_subfolder=None, **kwargs):
+def extract_tar(infile, folder, nodes_export_subfolder=None, extract_repository=True, **kwargs):
     """
     Extract the nodes to be imported from a (possibly zipped) tar file.
 
@@ -346,6 +351,10 @@ def extract_tar(infile, folder, nodes_export_subfolder=None, **kwargs):
     :param nodes_export_subfolder: name of the subfolder for AiiDA nodes
     :type nodes_export_subfolder: str
 
+    :param extract_repository: if False, only the metadata files are extracted and not the repository contents of the
+        nodes, which can be copied directly from the archive with :func:`copy_node_repositories`
+    :type extract_repository: bool
+
     :param silent: suppress progress bar
     :type silent: bool
 
@@ -368,7 +377,7 @@ def extract_tar(infile, folder, nodes_export_subfolder=None, **kwargs):
 
             file_iterator = get_file_iterator(file_handle=handle, folderpath=folder.abspath, **kwargs)
 
-            for member in file_iterator:
+            for member in file_iterator if extract_repository else ():
                 if member.isdev():
                     # safety: skip if character device, block device or FIFO
                     print('WARNING, device found inside the import file: {}'.format(member.name), file=sys.stderr)
@@ -392,7 +401,7 @@ def extract_tar(infile, folder, nodes_export_subfolder=None, **kwargs):
     close_progress_bar(leave=False)
 
 
-def extract_tree(infile, folder):
+def extract_tree(infile, folder, extract_repository=True):
     """Prepare to import nodes from plain file system tree by copying in the given sandbox folder.
 
     .. note:: the contents of the unpacked archive directory are copied into the sandbox folder, because the files will
@@ -406,5 +415,222 @@ def extract_tree(infile, folder):
 
     :param folder: a temporary folder to which the archive contents are copied
     :type folder: :py:class:`~aiida.common.folders.SandboxFolder`
+
+    :param extract_repository: if False, only the metadata files are copied and not the repository contents of the
+        nodes, which can be copied directly from the archive directory with :func:`copy_node_repositories`
+    :type extract_repository: bool
+    """
+    if extract_repository:
+        folder.replace_with_folder(infile, move=False, overwrite=True)
+        return
+
+    for filename in (Archive.FILENAME_METADATA, Archive.FILENAME_DATA):
+        filepath = os.path.abspath(os.path.join(infile, filename))
+        if os.path.isfile(filepath):
+            folder.insert_path(filepath, filename)
+
+
+def _get_member_path(name, nodes_export_subfolder):
+    """Return the UUID of the node and the relative path in its repository of an archive member.
+
+    :param name: the name of the member in the archive
+    :param nodes_export_subfolder: name of the subfolder for AiiDA nodes
+    :return: tuple of the UUID and the relative path, which is an empty string for the repository folder itself, or
+        `None` if the member is not part of a node repository
     """
-    folder.replace_with_folder(infile, move=False, overwrite=True)
+    parts = os.path.normpath(name).split(os.sep)
+
+    if len(parts) < 4 or parts[0] != nodes_export_subfolder:
+        return None
+
+    # Safety: skip paths that would end up outside of the repository folder of the node
+    if os.pardir in parts:
+        print('WARNING, invalid path found inside the import file: {}'.format(name), file=sys.stderr)
+        return None
+
+    return ''.join(parts[1:4]), os.path.join(*parts[4:]) if len(parts) > 4 else ''
+
+
+def _prepare_repository_folder(uuid):
+    """Return the repository folder of the node with the given UUID, emptied and created."""
+    from aiida.orm.utils.repository import Repository
+
+    folder = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
+    folder.erase()
+    folder.create()
+    return folder
+
+
+def _write_repository_file(folder, path, source):
+    """Write the content of a file handle or bytes to a path in a repository folder."""
+    import shutil
+
+    filepath = folder.get_abs_path(path)
+    os.makedirs(os.path.dirname(filepath), mode=folder.mode_dir, exist_ok=True)
+
+    with open(filepath, 'wb') as handle:
+        if isinstance(source, bytes):
+            handle.write(source)
+        else:
+            shutil.copyfileobj(source, handle)
+
+    os.chmod(filepath, folder.mode_file)
+
+
+def _copy_from_tree(infile, uuids, nodes_export_subfolder, move, executor):
+    """Copy the repository folders of the nodes from an archive directory."""
+    from aiida.orm.utils.repository import Repository
+    from aiida.tools.importexport.common.utils import export_shard_uuid
+
+    sources = {uuid: os.path.join(infile, nodes_export_subfolder, export_shard_uuid(uuid)) for uuid in uuids}
+
+    for uuid, source in sources.items():
+        if not os.path.isdir(source):
+            raise CorruptArchive(
+                'Unable to find the repository folder for Node with UUID={} in the exported file'.format(uuid)
+            )
+
+    def copy(uuid):
+        folder = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
+        folder.replace_with_folder(os.path.abspath(sources[uuid]), move=move, overwrite=True)
+
+    list(executor.map(copy, uuids))
+
+
+def _copy_from_zip(infile, uuids, nodes_export_subfolder, executor):
+    """Copy the repository folders of the nodes from a zip archive, reading the members with one handle per thread."""
+    import threading
+
+    members = collections.defaultdict(list)
+    # The archive may have many members, so they are matched against a set of the UUIDs and not the list
+    uuids_set = set(uuids)
+
+    with zipfile.ZipFile(infile, 'r', allowZip64=True) as handle:
+        for name in handle.namelist():
+            member_path = _get_member_path(name, nodes_export_subfolder)
+            if member_path is not None and member_path[0] in uuids_set:
+                members[member_path[0]].append((name, member_path[1]))
+
+    for uuid in uuids:
+        if uuid not in members:
+            raise CorruptArchive(
+                'Unable to find the repository folder for Node with UUID={} in the exported file'.format(uuid)
+            )
+
+    local = threading.local()
+    handles = []
+
+    def copy(uuid):
+        if not hasattr(local, 'handle'):
+            local.handle = zipfile.ZipFile(infile, 'r', allowZip64=True)
+            handles.append(local.handle)
+
+        folder = _prepare_repository_folder(uuid)
+
+        for name, path in members[uuid]:
+            if name.endswith('/'):
+                os.makedirs(folder.get_abs_path(path), mode=folder.mode_dir, exist_ok=True)
+            else:
+                with local.handle.open(name) as source:
+                    _write_repository_file(folder, path, source)
+
+    try:
+        list(executor.map(copy, uuids))
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _copy_from_tar(infile, uuids, nodes_export_subfolder, executor, max_pending=64, max_buffer_size=2**24):
+    """Copy the repository folders of the nodes from a tar archive.
+
+    Since the members of a (compressed) tar archive can only be read efficiently in order, they are read in a single
+    pass by this thread and the files are written by the executor. At most `max_pending` files of at most
+    `max_buffer_size` bytes are held in memory, larger files are written directly.
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    folders = dict(zip(uuids, executor.map(_prepare_repository_folder, uuids)))
+    found = set()
+    pending = set()
+
+    with tarfile.open(infile, 'r:*', format=tarfile.PAX_FORMAT) as handle:
+        for member in handle:
+            member_path = _get_member_path(member.name, nodes_export_subfolder)
+
+            if member_path is None or member_path[0] not in folders:
+                continue
+
+            if not (member.isdir() or member.isfile()):
+                # safety: in export, I set dereference=True therefore there should be no links or devices
+                print('WARNING, non regular file found inside the import file: {}'.format(member.name), file=sys.stderr)
+                continue
+
+            uuid, path = member_path
+            folder = folders[uuid]
+            found.add(uuid)
+
+            if member.isdir():
+                os.makedirs(folder.get_abs_path(path), mode=folder.mode_dir, exist_ok=True)
+            elif member.size > max_buffer_size:
+                _write_repository_file(folder, path, handle.extractfile(member))
+            else:
+                pending.add(executor.submit(_write_repository_file, folder, path, handle.extractfile(member).read()))
+
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+
+    for future in pending:
+        future.result()
+
+    for uuid in uuids:
+        if uuid not in found:
+            raise CorruptArchive(
+                'Unable to find the repository folder for Node with UUID={} in the exported file'.format(uuid)
+            )
+
+
+def copy_node_repositories(infile, uuids, nodes_export_subfolder=None, move=False, max_workers=None):
+    """Copy the repository folders of the nodes with the given UUIDs from an archive to the repository.
+
+    The repository contents are copied directly from a zip or tar archive, without extracting it to a temporary folder
+    first, or from an archive directory, which may also be the sandbox folder into which an archive was extracted. The
+    files are written by a pool of threads. Existing repository folders of the nodes are replaced.
+
+    :param infile: path to a zip or tar archive or an archive directory
+    :type infile: str
+
+    :param uuids: the UUIDs of the nodes
+    :type uuids: list
+
+    :param nodes_export_subfolder: name of the subfolder for AiiDA nodes
+    :type nodes_export_subfolder: str
+
+    :param move: if True and `infile` is a directory, the repository folders are moved instead of copied
+    :type move: bool
+
+    :param max_workers: the maximum number of threads that write files, by default determined by the executor
+    :type max_workers: int
+
+    :raises `~aiida.tools.importexport.common.exceptions.CorruptArchive`: if the archive misses the repository folder
+        of one of the nodes
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    nodes_export_subfolder = nodes_export_subfolder or NODES_EXPORT_SUBFOLDER
+    uuids = [str(uuid) for uuid in uuids]
+
+    if not uuids:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if os.path.isdir(infile):
+            _copy_from_tree(infile, uuids, nodes_export_subfolder, move, executor)
+        elif tarfile.is_tarfile(infile):
+            _copy_from_tar(infile, uuids, nodes_export_subfolder, executor)
+        elif zipfile.is_zipfile(infile):
+            _copy_from_zip(infile, uuids, nodes_export_subfolder, executor)
+        else:
+            raise CorruptArchive('unrecognized archive format')
@@ -17,10 +17,9 @@ import time
 from aiida import get_version, orm
 from aiida.common import json
 from aiida.common.exceptions import LicensingException
-from aiida.common.folders import RepositoryFolder, SandboxFolder, Folder
+from aiida.common.folders import SandboxFolder, Folder
 from aiida.common.lang import type_check
 from aiida.common.log import override_log_formatter, LOG_LEVEL_REPORT
-from aiida.orm.utils.repository import Repository
 
 from aiida.tools.importexport.common import exceptions, get_progress_bar, close_progress_bar
 from aiida.tools.importexport.common.config import EXPORT_VERSION, NODES_EXPORT_SUBFOLDER
@@ -30,12 +29,12 @@ from aiida.tools.importexport.common.config import (
 from aiida.tools.importexport.common.config import (
     get_all_fields_info, file_fields_to_model_fields, entity_names_to_entities, model_fields_to_file_fields
 )
-from aiida.tools.importexport.common.utils import export_shard_uuid
 from aiida.tools.importexport.dbexport.utils import (
     check_licenses, fill_in_query, serialize_dict, check_process_nodes_sealed, summary, EXPORT_LOGGER, ExportFileFormat,
-    deprecated_parameters
+    deprecated_parameters, export_node_repositories
 )
 
+from .stream import export_data_stream
 from .zip import ZipFolder
 
 __all__ = ('export', 'EXPORT_LOGGER', 'ExportFileFormat')
@@ -93,6 +92,14 @@ def export(
         Default: True, *include* logs in export.
     :type include_logs: bool
 
+    :param stream: Write the database entries and repository files in batches, instead of collecting them in memory
+        first. The memory usage of a streaming export does not depend on the size of the archive. Default: False.
+    :type stream: bool
+
+    :param batch_size: The number of entities that are retrieved from the database and written at a time, when
+        ``stream`` is True. Default: 1000.
+    :type batch_size: int
+
     :param kwargs: graph traversal rules. See :const:`aiida.common.links.GraphTraversalRules` what rule names
         are toggleable and what the defaults are.
 
@@ -293,6 +300,8 @@ def export_tree(
     silent=False,
     include_comments=True,
     include_logs=True,
+    stream=False,
+    batch_size=1000,
     **kwargs
 ):
     """Export the entries passed in the 'entities' list to a file tree.
@@ -327,6 +336,14 @@ def export_tree(
         Default: True, *include* logs in export.
     :type include_logs: bool
 
+    :param stream: Write the database entries and repository files in batches, instead of collecting them in memory
+        first. The memory usage of a streaming export does not depend on the size of the archive. Default: False.
+    :type stream: bool
+
+    :param batch_size: The number of entities that are retrieved from the database and written at a time, when
+        ``stream`` is True. Default: 1000.
+    :type batch_size: int
+
     :param kwargs: graph traversal rules. See :const:`aiida.common.links.GraphTraversalRules` what rule names
         are toggleable and what the defaults are.
 
@@ -359,7 +376,7 @@ def export_tree(
 
     type_check(folder, (Folder, ZipFolder), msg='`folder` must be specified and given as an AiiDA Folder entity')
 
-    all_fields_info, unique_identifiers = get_all_fields_info()
+    all_fields_info, _ = get_all_fields_info()
 
     entities_starting_set = defaultdict(set)
 
@@ -430,6 +447,51 @@ def export_tree(
     node_ids_to_be_exported = traverse_output['nodes']
     graph_traversal_rules = traverse_output['rules']
 
+    # TODO (Spyros) To see better! Especially for functional licenses
+    # Check the licenses of exported data.
+    if allowed_licenses is not None or forbidden_licenses is not None:
+        builder = orm.QueryBuilder()
+        builder.append(
+            orm.Node, project=['id', 'attributes.source.license'], filters={'id': {
+                'in': node_ids_to_be_exported
+            }}
+        )
+        # Skip those nodes where the license is not set (this is the standard behavior with Django)
+        node_licenses = list((a, b) for [a, b] in builder.all() if b is not None)
+        check_licenses(node_licenses, allowed_licenses, forbidden_licenses)
+
+    if stream:
+        progress_bar.update()
+
+        if not node_ids_to_be_exported and not entities_starting_set:
+            EXPORT_LOGGER.log(msg='Nothing to store, exiting...', level=LOG_LEVEL_REPORT)
+            return
+
+        EXPORT_LOGGER.log(
+            msg='Streaming the export of {} Nodes in batches of {}.'.format(len(node_ids_to_be_exported), batch_size),
+            level=LOG_LEVEL_REPORT
+        )
+
+        export_data_stream(
+            folder,
+            node_ids_to_be_exported,
+            traverse_output['links'],
+            entities_starting_set,
+            include_comments=include_comments,
+            include_logs=include_logs,
+            batch_size=batch_size,
+            silent=silent
+        )
+        _write_metadata(folder, entities_starting_set, graph_traversal_rules, include_comments, include_logs)
+
+        close_progress_bar(leave=False)
+
+        # Reset logging level
+        if silent:
+            logging.disable(level=logging.NOTSET)
+
+        return
+
     # A utility dictionary for mapping PK to UUID.
     if node_ids_to_be_exported:
         qbuilder = orm.QueryBuilder().append(
@@ -530,19 +592,6 @@ def export_tree(
         )
         entries_to_add[given_entity] = builder
 
-    # TODO (Spyros) To see better! Especially for functional licenses
-    # Check the licenses of exported data.
-    if allowed_licenses is not None or forbidden_licenses is not None:
-        builder = orm.QueryBuilder()
-        builder.append(
-            orm.Node, project=['id', 'attributes.source.license'], filters={'id': {
-                'in': node_ids_to_be_exported
-            }}
-        )
-        # Skip those nodes where the license is not set (this is the standard behavior with Django)
-        node_licenses = list((a, b) for [a, b] in builder.all() if b is not None)
-        check_licenses(node_licenses, allowed_licenses, forbidden_licenses)
-
     ############################################################
     ##### Start automatic recursive export data generation #####
     ############################################################
@@ -606,24 +655,30 @@ def export_tree(
     EXPORT_LOGGER.debug('GATHERING NODE ATTRIBUTES AND EXTRAS...')
     node_attributes = {}
     node_extras = {}
+    node_repository_metadata = {}
 
     # Another QueryBuilder query to get the attributes and extras. TODO: See if this can be optimized
     if all_node_pks:
         all_nodes_query = orm.QueryBuilder().append(
-            orm.Node, filters={'id': {
+            orm.Node,
+            filters={'id': {
                 'in': all_node_pks
-            }}, project=['id', 'attributes', 'extras']
+            }},
+            project=['id', 'attributes', 'extras', 'repository_metadata']
         )
 
         progress_bar = get_progress_bar(total=all_nodes_query.count(), disable=silent)
         progress_bar.set_description_str('Exporting Attributes and Extras', refresh=False)
 
-        for node_pk, attributes, extras in all_nodes_query.iterall():
+        for node_pk, attributes, extras, repository_metadata in all_nodes_query.iterall():
             progress_bar.update()
 
             node_attributes[str(node_pk)] = attributes
             node_extras[str(node_pk)] = extras
 
+            if repository_metadata is not None:
+                node_repository_metadata[node_pk_2_uuid_mapping[node_pk]] = repository_metadata
+
     EXPORT_LOGGER.debug('GATHERING GROUP ELEMENTS...')
     groups_uuid = defaultdict(list)
     # If a group is in the exported data, we export the group/node correlation
@@ -678,25 +733,7 @@ def export_tree(
         # fhandle.write(json.dumps(data, cls=UUIDEncoder))
         fhandle.write(json.dumps(data))
 
-    # Turn sets into lists to be able to export them as JSON metadata.
-    for entity, entity_set in entities_starting_set.items():
-        entities_starting_set[entity] = list(entity_set)
-
-    metadata = {
-        'aiida_version': get_version(),
-        'export_version': EXPORT_VERSION,
-        'all_fields_info': all_fields_info,
-        'unique_identifiers': unique_identifiers,
-        'export_parameters': {
-            'graph_traversal_rules': graph_traversal_rules,
-            'entities_starting_set': entities_starting_set,
-            'include_comments': include_comments,
-            'include_logs': include_logs
-        }
-    }
-
-    with folder.open('metadata.json', 'w') as fhandle:
-        fhandle.write(json.dumps(metadata))
+    _write_metadata(folder, entities_starting_set, graph_traversal_rules, include_comments, include_logs)
 
     EXPORT_LOGGER.debug('ADDING REPOSITORY FILES TO EXPORT ARCHIVE...')
 
@@ -707,27 +744,45 @@ def export_tree(
         progress_bar = get_progress_bar(total=len(all_node_uuids), disable=silent)
         pbar_base_str = 'Exporting repository - '
 
-        for uuid in all_node_uuids:
-            sharded_uuid = export_shard_uuid(uuid)
-
+        def update_progress_bar(uuid):
             progress_bar.set_description_str(pbar_base_str + 'UUID={}'.format(uuid.split('-')[0]), refresh=False)
             progress_bar.update()
 
-            # Important to set create=False, otherwise creates twice a subfolder. Maybe this is a bug of insert_path?
-            thisnodefolder = nodesubfolder.get_subfolder(sharded_uuid, create=False, reset_limit=True)
-
-            # Make sure the node's repository folder was not deleted
-            src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
-            if not src.exists():
-                raise exceptions.ArchiveExportError(
-                    'Unable to find the repository folder for Node with UUID={} in the local repository'.format(uuid)
-                )
-
-            # In this way, I copy the content of the folder, and not the folder itself
-            thisnodefolder.insert_path(src=src.abspath, dest_name='.')
+        repositories = [(uuid, node_repository_metadata.get(uuid, None)) for uuid in all_node_uuids]
+        export_node_repositories(nodesubfolder, repositories, callback=update_progress_bar)
 
     close_progress_bar(leave=False)
 
     # Reset logging level
     if silent:
         logging.disable(level=logging.NOTSET)
+
+
+def _write_metadata(folder, entities_starting_set, graph_traversal_rules, include_comments, include_logs):
+    """Write the ``metadata.json`` file of the export archive.
+
+    :param folder: the folder in which to write the archive content
+    :param entities_starting_set: dictionary of the uuids of the entities that were explicitly given to the export,
+        keyed by entity name
+    :param graph_traversal_rules: the graph traversal rules that were applied
+    :param include_comments: whether the comments of the nodes were exported
+    :param include_logs: whether the logs of the nodes were exported
+    """
+    all_fields_info, unique_identifiers = get_all_fields_info()
+
+    metadata = {
+        'aiida_version': get_version(),
+        'export_version': EXPORT_VERSION,
+        'all_fields_info': all_fields_info,
+        'unique_identifiers': unique_identifiers,
+        'export_parameters': {
+            'graph_traversal_rules': graph_traversal_rules,
+            # Turn sets into lists to be able to export them as JSON metadata.
+            'entities_starting_set': {entity: list(entity_set) for entity, entity_set in entities_starting_set.items()},
+            'include_comments': include_comments,
+            'include_logs': include_logs
+        }
+    }
+
+    with folder.open('metadata.json', 'w') as fhandle:
+        fhandle.write(json.dumps(metadata))
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Streaming export of the database content, whose memory usage does not depend on the size of the archive."""
+import collections
+import os
+import shutil
+
+from aiida import orm
+from aiida.common import json
+from aiida.common.folders import SandboxFolder
+from aiida.tools.importexport.common import get_progress_bar
+from aiida.tools.importexport.common.config import (
+    NODES_EXPORT_SUBFOLDER, NODE_ENTITY_NAME, GROUP_ENTITY_NAME, COMPUTER_ENTITY_NAME, USER_ENTITY_NAME,
+    LOG_ENTITY_NAME, COMMENT_ENTITY_NAME
+)
+from aiida.tools.importexport.common.config import (
+    get_all_fields_info, file_fields_to_model_fields, entity_names_to_entities, model_fields_to_file_fields
+)
+from aiida.tools.importexport.dbexport.utils import serialize_dict, check_process_nodes_sealed, export_node_repositories
+
+__all__ = ('DataWriter', 'export_data_stream')
+
+
+class DataWriter:
+    """Write the content of the ``data.json`` file of an export archive incrementally.
+
+    The file is a nested JSON object, whose innermost containers, e.g. the exported nodes or the links, can be very
+    large. Items are appended to these containers in batches and each container is spooled to a separate file in a
+    directory on disk. Once all items have been added, :meth:`write` assembles the containers into the final document,
+    such that the memory usage is independent of the number of items.
+
+    Containers are identified by their path, the tuple of keys that leads to them from the top level object.
+    """
+
+    def __init__(self, dirpath):
+        """Construct a new writer.
+
+        :param dirpath: absolute path of an existing directory in which to spool the containers
+        """
+        self._dirpath = dirpath
+        self._filepaths = {}
+        self._types = {}
+        self._children = collections.defaultdict(list)
+        self._counts = collections.Counter()
+
+        for key in ('node_attributes', 'node_extras', 'export_data', 'groups_uuid'):
+            self._declare((key,), dict)
+        self._declare(('links_uuid',), list)
+
+    def _declare(self, path, container_type):
+        """Declare the container at the given path, including its parents if they did not exist yet.
+
+        :param path: tuple of keys that leads to the container
+        :param container_type: either `dict` or `list`
+        :raises TypeError: if the container was already declared with a different type
+        """
+        if path in self._types:
+            if self._types[path] is not container_type:
+                raise TypeError('container {} is not a {}'.format(path, container_type.__name__))
+            return
+
+        if len(path) > 1:
+            self._declare(path[:-1], dict)
+
+        self._types[path] = container_type
+        self._children[path[:-1]].append(path)
+
+    def _append(self, path, container_type, serialized):
+        """Append already serialized items to the spooled file of a container.
+
+        :param path: tuple of keys that leads to the container
+        :param container_type: either `dict` or `list`
+        :param serialized: list of serialized items
+        """
+        self._declare(path, container_type)
+
+        if not serialized:
+            return
+
+        if path not in self._filepaths:
+            self._filepaths[path] = os.path.join(self._dirpath, '{}.json'.format(len(self._filepaths)))
+
+        with open(self._filepaths[path], 'a', encoding='utf8') as handle:
+            for item in serialized:
+                if self._counts[path]:
+                    handle.write(',')
+                handle.write(item)
+                self._counts[path] += 1
+
+    def update(self, path, items):
+        """Add the items of a mapping to the dictionary at the given path.
+
+        :param path: tuple of keys that leads to the dictionary
+        :param items: iterable of key, value tuples; the keys are converted to strings
+        """
+        self._append(path, dict, ['{}:{}'.format(json.dumps(str(key)), json.dumps(value)) for key, value in items])
+
+    def extend(self, path, values):
+        """Add values to the list at the given path.
+
+        :param path: tuple of keys that leads to the list
+        :param values: iterable of values
+        """
+        self._append(path, list, [json.dumps(value) for value in values])
+
+    def count(self, path):
+        """Return the number of items that were added directly to the container at the given path."""
+        return self._counts[path]
+
+    def write(self, handle, path=()):
+        """Write the JSON document, or the container at the given path, to a text handle.
+
+        :param handle: text handle to write to
+        :param path: tuple of keys that leads to the container to write, by default the complete document
+        """
+        is_list = self._types.get(path, dict) is list
+        handle.write('[' if is_list else '{')
+
+        separator = ''
+
+        if path in self._filepaths:
+            with open(self._filepaths[path], 'r', encoding='utf8') as source:
+                shutil.copyfileobj(source, handle)
+            separator = ','
+
+        for child in self._children[path]:
+            handle.write('{}{}:'.format(separator, json.dumps(str(child[-1]))))
+            self.write(handle, child)
+            separator = ','
+
+        handle.write(']' if is_list else '}')
+
+
+def _get_project_cols(entity_name):
+    """Return the columns to project in a query for the exported fields of an entity, starting with the id."""
+    all_fields_info, _ = get_all_fields_info()
+    renaming = file_fields_to_model_fields[entity_name]
+    return ['id'] + [renaming.get(field, field) for field in all_fields_info[entity_name]]
+
+
+def _iter_entities(entity_name, filters, batch_size):
+    """Yield the id and serialized exported fields of the entities matching the filters, in batches.
+
+    :param entity_name: the name of the entity in the export archive
+    :param filters: the query builder filters for the entities
+    :param batch_size: the number of rows to fetch from the database at a time
+    :return: generator of tuples of the id and the dictionary of fields
+    """
+    project_cols = _get_project_cols(entity_name)
+    builder = orm.QueryBuilder().append(
+        entity_names_to_entities[entity_name], filters=filters, project=project_cols, tag=entity_name
+    )
+
+    for row in builder.iterall(batch_size=batch_size):
+        fields = dict(zip(project_cols, row))
+        yield fields['id'], serialize_dict(
+            fields, remove_fields=['id'], rename_fields=model_fields_to_file_fields[entity_name]
+        )
+
+
+def _get_foreign_fields(entity_name):
+    """Return a dictionary of the fields of an entity that reference other entities onto the referenced entity name.
+
+    References to nodes are omitted, because entities are only ever exported for nodes that are exported anyway.
+    """
+    all_fields_info, _ = get_all_fields_info()
+    return {
+        field: info['requires']
+        for field, info in all_fields_info[entity_name].items()
+        if info.get('requires', NODE_ENTITY_NAME) != NODE_ENTITY_NAME
+    }
+
+
+def _add_references(references, foreign_fields, fields):
+    """Add the ids of the entities referenced by the fields of an exported entity to the sets of `references`."""
+    for field, required_entity in foreign_fields.items():
+        if fields.get(field) is not None:
+            references[required_entity].add(fields[field])
+
+
+def _write_entities(writer, entity_name, filters, batch_size, references=None):
+    """Write the entities matching the filters to the writer, in batches.
+
+    :param writer: the :class:`DataWriter` to write to
+    :param entity_name: the name of the entity in the export archive
+    :param filters: the query builder filters for the entities
+    :param batch_size: the number of entities to fetch from the database and write at a time
+    :param references: optional dictionary of sets of ids, keyed by entity name, to which the ids of the entities
+        referenced through foreign keys are added
+    """
+    foreign_fields = _get_foreign_fields(entity_name)
+    batch = []
+
+    for pk, fields in _iter_entities(entity_name, filters, batch_size):
+        batch.append((pk, fields))
+
+        if references is not None:
+            _add_references(references, foreign_fields, fields)
+
+        if len(batch) >= batch_size:
+            writer.update(('export_data', entity_name), batch)
+            batch = []
+
+    writer.update(('export_data', entity_name), batch)
+
+
+def _iter_chunks(values, chunk_size):
+    """Yield consecutive lists of at most `chunk_size` of the given values."""
+    values = list(values)
+    for index in range(0, len(values), chunk_size):
+        yield values[index:index + chunk_size]
+
+
+def export_data_stream(
+    folder,
+    node_ids,
+    links,
+    entities_starting_set,
+    include_comments=True,
+    include_logs=True,
+    batch_size=1000,
+    silent=False
+):  # pylint: disable=too-many-arguments
+    """Write the database content of an export to ``data.json`` and the node repositories, in batches.
+
+    The nodes are processed in batches of `batch_size`: for every batch, the exported fields, the attributes, the
+    extras and the related logs and comments are queried and spooled to disk, and the repository files of the nodes are
+    added to the archive, before the next batch is retrieved. Links and group memberships are written in the same way.
+    The resulting ``data.json`` has the same content as the one written by a non streaming export.
+
+    :param folder: the folder in which to write the archive content
+    :type folder: :py:class:`~aiida.common.folders.Folder` or
+        :py:class:`~aiida.tools.importexport.dbexport.zip.ZipFolder`
+    :param node_ids: set of the ids of the nodes to export
+    :param links: iterable of the links to export, as :py:class:`~aiida.common.links.LinkQuadruple`
+    :param entities_starting_set: dictionary of the uuids of the entities that were explicitly given to the export,
+        keyed by entity name
+    :param include_comments: whether to export the comments of the nodes
+    :param include_logs: whether to export the logs of the nodes
+    :param batch_size: the number of entities to fetch from the database and write at a time
+    :param silent: suppress the progress bar
+    :return: the number of exported database entries
+    """
+    # pylint: disable=too-many-locals,too-many-statements
+    nodesubfolder = folder.get_subfolder(NODES_EXPORT_SUBFOLDER, create=True, reset_limit=True)
+    references = collections.defaultdict(set)
+    node_project = _get_project_cols(NODE_ENTITY_NAME)
+    node_foreign_fields = _get_foreign_fields(NODE_ENTITY_NAME)
+
+    with SandboxFolder() as sandbox:
+        writer = DataWriter(sandbox.abspath)
+
+        progress_bar = get_progress_bar(total=len(node_ids), disable=silent)
+        progress_bar.set_description_str('Exporting Nodes and repositories', refresh=False)
+
+        for chunk in _iter_chunks(sorted(node_ids), batch_size):
+            builder = orm.QueryBuilder().append(
+                orm.Node,
+                filters={'id': {
+                    'in': chunk
+                }},
+                project=node_project + ['attributes', 'extras', 'repository_metadata']
+            )
+
+            entries, attributes, extras, repositories, process_nodes = [], [], [], [], set()
+
+            for row in builder.iterall(batch_size=batch_size):
+                fields = dict(zip(node_project, row))
+                node_attributes, node_extras, repository_metadata = row[len(node_project):]
+                entry = serialize_dict(
+                    fields, remove_fields=['id'], rename_fields=model_fields_to_file_fields[NODE_ENTITY_NAME]
+                )
+
+                entries.append((fields['id'], entry))
+                attributes.append((fields['id'], node_attributes))
+                extras.append((fields['id'], node_extras))
+
+                _add_references(references, node_foreign_fields, entry)
+
+                if entry['node_type'].startswith('process.'):
+                    process_nodes.add(fields['id'])
+
+                repositories.append((entry['uuid'], repository_metadata))
+
+            export_node_repositories(nodesubfolder, repositories, callback=lambda _: progress_bar.update())
+
+            check_process_nodes_sealed(process_nodes)
+
+            writer.update(('export_data', NODE_ENTITY_NAME), entries)
+            writer.update(('node_attributes',), attributes)
+            writer.update(('node_extras',), extras)
+
+            if include_logs:
+                _write_entities(writer, LOG_ENTITY_NAME, {'dbnode_id': {'in': chunk}}, batch_size)
+
+            if include_comments:
+                _write_entities(writer, COMMENT_ENTITY_NAME, {'dbnode_id': {'in': chunk}}, batch_size, references)
+
+        if GROUP_ENTITY_NAME in entities_starting_set:
+            group_uuids = entities_starting_set[GROUP_ENTITY_NAME]
+            _write_entities(writer, GROUP_ENTITY_NAME, {'uuid': {'in': group_uuids}}, batch_size, references)
+
+            builder = orm.QueryBuilder()
+            builder.append(orm.Group, filters={'uuid': {'in': group_uuids}}, project='uuid', tag='groups')
+            builder.append(orm.Node, project='uuid', with_group='groups')
+
+            memberships = collections.defaultdict(list)
+            for group_uuid, node_uuid in builder.iterall(batch_size=batch_size):
+                memberships[group_uuid].append(node_uuid)
+
+                if len(memberships[group_uuid]) >= batch_size:
+                    writer.extend(('groups_uuid', group_uuid), memberships.pop(group_uuid))
+
+            for group_uuid, node_uuids in memberships.items():
+                writer.extend(('groups_uuid', group_uuid), node_uuids)
+
+        # Computers are exported if they were given explicitly or if they are referenced by one of the nodes
+        computer_filters = []
+        if references[COMPUTER_ENTITY_NAME]:
+            computer_filters.append({'id': {'in': list(references[COMPUTER_ENTITY_NAME])}})
+        if entities_starting_set.get(COMPUTER_ENTITY_NAME):
+            computer_filters.append({'uuid': {'in': list(entities_starting_set[COMPUTER_ENTITY_NAME])}})
+        if computer_filters:
+            _write_entities(writer, COMPUTER_ENTITY_NAME, {'or': computer_filters}, batch_size)
+
+        if references[USER_ENTITY_NAME]:
+            _write_entities(writer, USER_ENTITY_NAME, {'id': {'in': list(references[USER_ENTITY_NAME])}}, batch_size)
+
+        for chunk in _iter_chunks(links, batch_size):
+            pks = {link.source_id for link in chunk} | {link.target_id for link in chunk}
+            builder = orm.QueryBuilder().append(orm.Node, filters={'id': {'in': list(pks)}}, project=['id', 'uuid'])
+            uuids = dict(builder.all())
+            writer.extend(('links_uuid',), [{
+                'input': uuids[link.source_id],
+                'output': uuids[link.target_id],
+                'label': link.link_label,
+                'type': link.link_type
+            } for link in chunk])
+
+        with open(sandbox.get_abs_path('data.json'), 'w', encoding='utf8') as handle:
+            writer.write(handle)
+
+        folder.insert_path(sandbox.get_abs_path('data.json'), 'data.json')
+
+    return sum(writer.count(('export_data', entity_name)) for entity_name in entity_names_to_entities)
@@ -13,10 +13,13 @@ from enum import Enum
 import warnings
 
 from aiida.orm import QueryBuilder, ProcessNode
+from aiida.orm.utils.repository import Repository
+from aiida.common.folders import Folder, RepositoryFolder, SandboxFolder
 from aiida.common.log import AIIDA_LOGGER, LOG_LEVEL_REPORT, override_log_formatter
 from aiida.common.warnings import AiidaDeprecationWarning
 
 from aiida.tools.importexport.common import exceptions
+from aiida.tools.importexport.common.utils import export_shard_uuid
 from aiida.tools.importexport.common.config import (
     file_fields_to_model_fields, entity_names_to_entities, get_all_fields_info
 )
@@ -286,6 +289,70 @@ def check_process_nodes_sealed(nodes):
 
 
 @override_log_formatter('%(message)s')
+def export_node_repository(nodesubfolder, uuid, repository_metadata=None):
+    """Add the repository content of a node to the subfolder of the archive that contains the node repositories.
+
+    :param nodesubfolder: the subfolder of the archive for the node repositories
+    :type nodesubfolder: :py:class:`~aiida.common.folders.Folder` or
+        :py:class:`~aiida.tools.importexport.dbexport.zip.ZipFolder`
+    :param uuid: the UUID of the node
+    :param repository_metadata: the repository metadata of the node, if its content lives in the object store
+
+    :raises `~aiida.tools.importexport.common.exceptions.ArchiveExportError`: if the repository folder of the node does
+        not exist.
+    """
+    # Important to set create=False, otherwise creates twice a subfolder. Maybe this is a bug of insert_path?
+    thisnodefolder = nodesubfolder.get_subfolder(export_shard_uuid(uuid), create=False, reset_limit=True)
+
+    # The content of nodes whose repository lives in the object store is written from the object store
+    if repository_metadata is not None:
+        with SandboxFolder() as sandbox:
+            Repository(uuid, True, metadata=repository_metadata).copy_tree(sandbox.abspath)
+            thisnodefolder.insert_path(src=sandbox.abspath, dest_name='.')
+        return
+
+    # Make sure the node's repository folder was not deleted
+    src = RepositoryFolder(section=Repository._section_name, uuid=uuid)  # pylint: disable=protected-access
+    if not src.exists():
+        raise exceptions.ArchiveExportError(
+            'Unable to find the repository folder for Node with UUID={} in the local repository'.format(uuid)
+        )
+
+    # In this way, I copy the content of the folder, and not the folder itself
+    thisnodefolder.insert_path(src=src.abspath, dest_name='.')
+
+
+def export_node_repositories(nodesubfolder, repositories, callback=None, max_workers=None):
+    """Add the repository contents of a number of nodes to the subfolder of the archive that contains them.
+
+    If the archive is written to a folder on disk, the repositories are copied by a pool of threads. The entries of a
+    zip archive have to be written one at a time, so then they are copied in this thread.
+
+    :param nodesubfolder: the subfolder of the archive for the node repositories
+    :type nodesubfolder: :py:class:`~aiida.common.folders.Folder` or
+        :py:class:`~aiida.tools.importexport.dbexport.zip.ZipFolder`
+    :param repositories: iterable of tuples of the UUID and the repository metadata of each node
+    :param callback: optional callable that is called with the UUID of each node whose repository has been copied
+    :param max_workers: the maximum number of threads that copy repositories, by default determined by the executor
+
+    :raises `~aiida.tools.importexport.common.exceptions.ArchiveExportError`: if the repository folder of a node does
+        not exist.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def copy(repository):
+        uuid, repository_metadata = repository
+        export_node_repository(nodesubfolder, uuid, repository_metadata)
+        return uuid
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        copied = executor.map(copy, repositories) if isinstance(nodesubfolder, Folder) else map(copy, repositories)
+
+        for uuid in copied:
+            if callback is not None:
+                callback(uuid)
+
+
 def summary(file_format, outfile, **kwargs):
     """Print summary for export"""
     from tabulate import tabulate
@@ -18,24 +18,21 @@ import zipfile
 from itertools import chain
 
 from aiida.common import timezone, json
-from aiida.common.folders import SandboxFolder, RepositoryFolder
-from aiida.common.links import LinkType, validate_link_label
+from aiida.common.folders import SandboxFolder
 from aiida.common.log import override_log_formatter
 from aiida.common.utils import grouper, get_object_from_string
 from aiida.manage.configuration import get_config_option
-from aiida.orm.utils.repository import Repository
 from aiida.orm import QueryBuilder, Node, Group, ImportGroup
 
 from aiida.tools.importexport.common import exceptions, get_progress_bar, close_progress_bar
-from aiida.tools.importexport.common.archive import extract_tree, extract_tar, extract_zip
+from aiida.tools.importexport.common.archive import extract_tree, extract_tar, extract_zip, copy_node_repositories
 from aiida.tools.importexport.common.config import DUPL_SUFFIX, EXPORT_VERSION, NODES_EXPORT_SUBFOLDER, BAR_FORMAT
 from aiida.tools.importexport.common.config import (
     NODE_ENTITY_NAME, GROUP_ENTITY_NAME, COMPUTER_ENTITY_NAME, USER_ENTITY_NAME, LOG_ENTITY_NAME, COMMENT_ENTITY_NAME
 )
 from aiida.tools.importexport.common.config import entity_names_to_signatures
-from aiida.tools.importexport.common.utils import export_shard_uuid
 from aiida.tools.importexport.dbimport.utils import (
-    deserialize_field, merge_comment, merge_extras, start_summary, result_summary, IMPORT_LOGGER
+    deserialize_field, merge_comment, merge_extras, start_summary, result_summary, validate_links, IMPORT_LOGGER
 )
 
 
@@ -48,6 +45,7 @@ def import_data_dj(
     extras_mode_new='import',
     comment_mode='newest',
     silent=False,
+    extract_archive=False,
     **kwargs
 ):
     """Import exported AiiDA archive to the AiiDA database and repository.
@@ -91,6 +89,11 @@ def import_data_dj(
     :param silent: suppress progress bar and summary.
     :type silent: bool
 
+    :param extract_archive: if True, the complete archive is extracted to a temporary folder before importing. By
+        default only the metadata files are extracted and the repository contents of the new nodes are copied directly
+        from the archive to the repository.
+    :type extract_archive: bool
+
     :return: New and existing Nodes and Links.
     :rtype: dict
 
@@ -130,12 +133,26 @@ def import_data_dj(
     # The sandbox has to remain open until the end
     with SandboxFolder() as folder:
         if os.path.isdir(in_path):
-            extract_tree(in_path, folder)
+            extract_tree(in_path, folder, extract_repository=extract_archive)
         else:
             if tarfile.is_tarfile(in_path):
-                extract_tar(in_path, folder, silent=silent, nodes_export_subfolder=NODES_EXPORT_SUBFOLDER, **kwargs)
+                extract_tar(
+                    in_path,
+                    folder,
+                    silent=silent,
+                    nodes_export_subfolder=NODES_EXPORT_SUBFOLDER,
+                    extract_repository=extract_archive,
+                    **kwargs
+                )
             elif zipfile.is_zipfile(in_path):
-                extract_zip(in_path, folder, silent=silent, nodes_export_subfolder=NODES_EXPORT_SUBFOLDER, **kwargs)
+                extract_zip(
+                    in_path,
+                    folder,
+                    silent=silent,
+                    nodes_export_subfolder=NODES_EXPORT_SUBFOLDER,
+                    extract_repository=extract_archive,
+                    **kwargs
+                )
             else:
                 raise exceptions.ImportValidationError(
                     'Unable to detect the input file format, it is neither a '
@@ -427,6 +444,15 @@ def import_data_dj(
                 if model_name == NODE_ENTITY_NAME:
                     IMPORT_LOGGER.debug('STORING NEW NODE REPOSITORY FILES...')
 
+                    # Before storing entries in the DB, I store the files (if these are nodes).
+                    # Note: only for new entries!
+                    progress_bar.set_description_str(pbar_base_str + 'Repository', refresh=True)
+                    repository_source = folder.abspath if extract_archive else in_path
+                    new_node_uuids = [object_.uuid for object_ in objects_to_create]
+                    copy_node_repositories(
+                        repository_source, new_node_uuids, NODES_EXPORT_SUBFOLDER, move=extract_archive
+                    )
+
                     # NEW NODES
                     for object_ in objects_to_create:
                         import_entry_uuid = object_.uuid
@@ -436,22 +462,6 @@ def import_data_dj(
                         progress_bar.update()
                         pbar_node_base_str = pbar_base_str + 'UUID={} - '.format(import_entry_uuid.split('-')[0])
 
-                        # Before storing entries in the DB, I store the files (if these are nodes).
-                        # Note: only for new entries!
-                        subfolder = folder.get_subfolder(
-                            os.path.join(NODES_EXPORT_SUBFOLDER, export_shard_uuid(import_entry_uuid))
-                        )
-                        if not subfolder.exists():
-                            raise exceptions.CorruptArchive(
-                                'Unable to find the repository folder for Node with UUID={} in the exported '
-                                'file'.format(import_entry_uuid)
-                            )
-                        destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
-                        # Replace the folder, possibly destroying existing previous folders, and move the files
-                        # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
-                        progress_bar.set_description_str(pbar_node_base_str + 'Repository', refresh=True)
-                        destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
-
                         # For DbNodes, we also have to store its attributes
                         IMPORT_LOGGER.debug('STORING NEW NODE ATTRIBUTES...')
                         progress_bar.set_description_str(pbar_node_base_str + 'Attributes', refresh=True)
@@ -567,38 +577,10 @@ def import_data_dj(
 
             IMPORT_LOGGER.debug('STORING NODE LINKS...')
             import_links = data['links_uuid']
-            links_to_store = []
-
-            # Needed, since QueryBuilder does not yet work for recently saved Nodes
-            existing_links_raw = models.DbLink.objects.all().values_list('input', 'output', 'label', 'type')
-            existing_links = {(l[0], l[1], l[2], l[3]) for l in existing_links_raw}
-            existing_outgoing_unique = {(l[0], l[3]) for l in existing_links_raw}
-            existing_outgoing_unique_pair = {(l[0], l[2], l[3]) for l in existing_links_raw}
-            existing_incoming_unique = {(l[1], l[3]) for l in existing_links_raw}
-            existing_incoming_unique_pair = {(l[1], l[2], l[3]) for l in existing_links_raw}
-
-            calculation_node_types = 'process.calculation.'
-            workflow_node_types = 'process.workflow.'
-            data_node_types = 'data.'
-
-            link_mapping = {
-                LinkType.CALL_CALC: (workflow_node_types, calculation_node_types, 'unique_triple', 'unique'),
-                LinkType.CALL_WORK: (workflow_node_types, workflow_node_types, 'unique_triple', 'unique'),
-                LinkType.CREATE: (calculation_node_types, data_node_types, 'unique_pair', 'unique'),
-                LinkType.INPUT_CALC: (data_node_types, calculation_node_types, 'unique_triple', 'unique_pair'),
-                LinkType.INPUT_WORK: (data_node_types, workflow_node_types, 'unique_triple', 'unique_pair'),
-                LinkType.RETURN: (workflow_node_types, data_node_types, 'unique_pair', 'unique_triple'),
-            }
-
-            if import_links:
-                progress_bar = get_progress_bar(total=len(import_links), disable=silent)
-                pbar_base_str = 'Links - '
+            links_to_validate = []
 
             for link in import_links:
                 # Check for dangling Links within the, supposed, self-consistent archive
-                progress_bar.set_description_str(pbar_base_str + 'label={}'.format(link['label']), refresh=False)
-                progress_bar.update()
-
                 try:
                     in_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['input']]
                     out_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['output']]
@@ -610,98 +592,42 @@ def import_data_dj(
                         'label={}, type={})'.format(link['input'], link['output'], link['label'], link['type'])
                     )
 
-                # Check if link already exists, skip if it does
-                # This is equivalent to an existing triple link (i.e. unique_triple from below)
-                if (in_id, out_id, link['label'], link['type']) in existing_links:
-                    continue
-
-                # Since backend specific Links (DbLink) are not validated upon creation, we will now validate them.
-                try:
-                    validate_link_label(link['label'])
-                except ValueError as why:
-                    raise exceptions.ImportValidationError('Error during Link label validation: {}'.format(why))
-
-                source = models.DbNode.objects.get(id=in_id)
-                target = models.DbNode.objects.get(id=out_id)
-
-                if source.uuid == target.uuid:
-                    raise exceptions.ImportValidationError('Cannot add a link to oneself')
-
-                link_type = LinkType(link['type'])
-                type_source, type_target, outdegree, indegree = link_mapping[link_type]
-
-                # Check if source Node is a valid type
-                if not source.node_type.startswith(type_source):
-                    raise exceptions.ImportValidationError(
-                        'Cannot add a {} link from {} to {}'.format(link_type, source.node_type, target.node_type)
-                    )
-
-                # Check if target Node is a valid type
-                if not target.node_type.startswith(type_target):
-                    raise exceptions.ImportValidationError(
-                        'Cannot add a {} link from {} to {}'.format(link_type, source.node_type, target.node_type)
-                    )
-
-                # If the outdegree is `unique` there cannot already be any other outgoing link of that type,
-                # i.e., the source Node may not have a LinkType of current LinkType, going out, existing already.
-                if outdegree == 'unique' and (in_id, link['type']) in existing_outgoing_unique:
-                    raise exceptions.ImportValidationError(
-                        'Node<{}> already has an outgoing {} link'.format(source.uuid, link_type)
-                    )
+                links_to_validate.append((in_id, out_id, link['label'], link['type']))
 
-                # If the outdegree is `unique_pair`,
-                # then the link labels for outgoing links of this type should be unique,
-                # i.e., the source Node may not have a LinkType of current LinkType, going out,
-                # that also has the current Link label, existing already.
-                elif outdegree == 'unique_pair' and \
-                (in_id, link['label'], link['type']) in existing_outgoing_unique_pair:
-                    raise exceptions.ImportValidationError(
-                        'Node<{}> already has an outgoing {} link with label "{}"'.format(
-                            source.uuid, link_type, link['label']
-                        )
-                    )
-
-                # If the indegree is `unique` there cannot already be any other incoming links of that type,
-                # i.e., the target Node may not have a LinkType of current LinkType, coming in, existing already.
-                if indegree == 'unique' and (out_id, link['type']) in existing_incoming_unique:
-                    raise exceptions.ImportValidationError(
-                        'Node<{}> already has an incoming {} link'.format(target.uuid, link_type)
-                    )
-
-                # If the indegree is `unique_pair`,
-                # then the link labels for incoming links of this type should be unique,
-                # i.e., the target Node may not have a LinkType of current LinkType, coming in
-                # that also has the current Link label, existing already.
-                elif indegree == 'unique_pair' and \
-                (out_id, link['label'], link['type']) in existing_incoming_unique_pair:
-                    raise exceptions.ImportValidationError(
-                        'Node<{}> already has an incoming {} link with label "{}"'.format(
-                            target.uuid, link_type, link['label']
-                        )
-                    )
+            # Retrieve the linked nodes and the links that are relevant for the validation of the new links in batches.
+            # Needed, since QueryBuilder does not yet work for recently saved Nodes
+            input_ids = {link[0] for link in links_to_validate}
+            output_ids = {link[1] for link in links_to_validate}
+            linked_nodes = {}
+            existing_links = set()
+
+            for ids in grouper(batch_size, input_ids.union(output_ids)):
+                nodes = models.DbNode.objects.filter(id__in=ids).values_list('id', 'uuid', 'node_type')
+                linked_nodes.update({pk: (str(uuid), node_type) for pk, uuid, node_type in nodes})
+
+            for ids in grouper(batch_size, input_ids):
+                existing_links.update(
+                    models.DbLink.objects.filter(input_id__in=ids).values_list('input', 'output', 'label', 'type')
+                )
 
-                # New link
-                links_to_store.append(
-                    models.DbLink(input_id=in_id, output_id=out_id, label=link['label'], type=link['type'])
+            for ids in grouper(batch_size, output_ids):
+                existing_links.update(
+                    models.DbLink.objects.filter(output_id__in=ids).values_list('input', 'output', 'label', 'type')
                 )
-                if 'Link' not in ret_dict:
-                    ret_dict['Link'] = {'new': []}
-                ret_dict['Link']['new'].append((in_id, out_id))
 
-                # Add new Link to sets of existing Links 'input PK', 'output PK', 'label', 'type'
-                existing_links.add((in_id, out_id, link['label'], link['type']))
-                existing_outgoing_unique.add((in_id, link['type']))
-                existing_outgoing_unique_pair.add((in_id, link['label'], link['type']))
-                existing_incoming_unique.add((out_id, link['type']))
-                existing_incoming_unique_pair.add((out_id, link['label'], link['type']))
+            progress_bar = get_progress_bar(total=len(links_to_validate), disable=silent) if links_to_validate else None
+            new_links = validate_links(links_to_validate, linked_nodes, existing_links, progress_bar)
 
-            # Store new links
-            if links_to_store:
-                IMPORT_LOGGER.debug('   (%d new links...)', len(links_to_store))
+            if new_links:
+                ret_dict['Link'] = {'new': [(in_id, out_id) for in_id, out_id, _, _ in new_links]}
 
-                models.DbLink.objects.bulk_create(links_to_store, batch_size=batch_size)
-            else:
-                IMPORT_LOGGER.debug('   (0 new links...)')
+            # Store new links
+            IMPORT_LOGGER.debug('   (%d new links...)', len(new_links))
+            links_to_store = [
+                models.DbLink(input_id=in_id, output_id=out_id, label=label, type=link_type)
+                for in_id, out_id, label, link_type in new_links
+            ]
+            models.DbLink.objects.bulk_create(links_to_store, batch_size=batch_size)
 
             IMPORT_LOGGER.debug('STORING GROUP ELEMENTS...')
 
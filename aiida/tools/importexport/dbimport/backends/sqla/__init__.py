@@ -18,16 +18,14 @@ import zipfile
 from itertools import chain
 
 from aiida.common import timezone, json
-from aiida.common.folders import SandboxFolder, RepositoryFolder
-from aiida.common.links import LinkType
+from aiida.common.folders import SandboxFolder
 from aiida.common.log import override_log_formatter
-from aiida.common.utils import get_object_from_string
+from aiida.common.utils import get_object_from_string, grouper
+from aiida.manage.configuration import get_config_option
 from aiida.orm import QueryBuilder, Node, Group, ImportGroup
-from aiida.orm.utils.links import link_triple_exists, validate_link
-from aiida.orm.utils.repository import Repository
 
 from aiida.tools.importexport.common import exceptions, get_progress_bar, close_progress_bar
-from aiida.tools.importexport.common.archive import extract_tree, extract_tar, extract_zip
+from aiida.tools.importexport.common.archive import extract_tree, extract_tar, extract_zip, copy_node_repositories
 from aiida.tools.importexport.common.config import DUPL_SUFFIX, EXPORT_VERSION, NODES_EXPORT_SUBFOLDER, BAR_FORMAT
 from aiida.tools.importexport.common.config import (
     NODE_ENTITY_NAME, GROUP_ENTITY_NAME, COMPUTER_ENTITY_NAME, USER_ENTITY_NAME, LOG_ENTITY_NAME, COMMENT_ENTITY_NAME
@@ -36,9 +34,8 @@ from aiida.tools.importexport.common.config import (
     entity_names_to_signatures, signatures_to_entity_names, entity_names_to_sqla_schema, file_fields_to_model_fields,
     entity_names_to_entities
 )
-from aiida.tools.importexport.common.utils import export_shard_uuid
 from aiida.tools.importexport.dbimport.utils import (
-    deserialize_field, merge_comment, merge_extras, start_summary, result_summary, IMPORT_LOGGER
+    deserialize_field, merge_comment, merge_extras, start_summary, result_summary, validate_links, IMPORT_LOGGER
 )
 from aiida.tools.importexport.dbimport.backends.sqla.utils import validate_uuid
 
@@ -52,6 +49,7 @@ def import_data_sqla(
     extras_mode_new='import',
     comment_mode='newest',
     silent=False,
+    extract_archive=False,
     **kwargs
 ):
     """Import exported AiiDA archive to the AiiDA database and repository.
@@ -95,6 +93,11 @@ def import_data_sqla(
     :param silent: suppress progress bar and summary.
     :type silent: bool
 
+    :param extract_archive: if True, the complete archive is extracted to a temporary folder before importing. By
+        default only the metadata files are extracted and the repository contents of the new nodes are copied directly
+        from the archive to the repository.
+    :type extract_archive: bool
+
     :return: New and existing Nodes and Links.
     :rtype: dict
 
@@ -109,6 +112,7 @@ def import_data_sqla(
     :raises `~aiida.tools.importexport.common.exceptions.ImportUniquenessError`: if a new unique entity can not be
         created.
     """
+    from sqlalchemy import insert
     from aiida.backends.sqlalchemy.models.node import DbNode, DbLink
     from aiida.backends.sqlalchemy.utils import flag_modified
 
@@ -134,12 +138,26 @@ def import_data_sqla(
     # The sandbox has to remain open until the end
     with SandboxFolder() as folder:
         if os.path.isdir(in_path):
-            extract_tree(in_path, folder)
+            extract_tree(in_path, folder, extract_repository=extract_archive)
         else:
             if tarfile.is_tarfile(in_path):
-                extract_tar(in_path, folder, silent=silent, nodes_export_subfolder=NODES_EXPORT_SUBFOLDER, **kwargs)
+                extract_tar(
+                    in_path,
+                    folder,
+                    silent=silent,
+                    nodes_export_subfolder=NODES_EXPORT_SUBFOLDER,
+                    extract_repository=extract_archive,
+                    **kwargs
+                )
             elif zipfile.is_zipfile(in_path):
-                extract_zip(in_path, folder, silent=silent, nodes_export_subfolder=NODES_EXPORT_SUBFOLDER, **kwargs)
+                extract_zip(
+                    in_path,
+                    folder,
+                    silent=silent,
+                    nodes_export_subfolder=NODES_EXPORT_SUBFOLDER,
+                    extract_repository=extract_archive,
+                    **kwargs
+                )
             else:
                 raise exceptions.ImportValidationError(
                     'Unable to detect the input file format, it is neither a '
@@ -497,6 +515,15 @@ def import_data_sqla(
                 if entity_name == NODE_ENTITY_NAME:
                     IMPORT_LOGGER.debug('STORING NEW NODE REPOSITORY FILES & ATTRIBUTES...')
 
+                    # Before storing entries in the DB, I store the files (if these are nodes).
+                    # Note: only for new entries!
+                    progress_bar.set_description_str(pbar_base_str + 'Repository', refresh=True)
+                    repository_source = folder.abspath if extract_archive else in_path
+                    new_node_uuids = [object_.uuid for object_ in objects_to_create]
+                    copy_node_repositories(
+                        repository_source, new_node_uuids, NODES_EXPORT_SUBFOLDER, move=extract_archive
+                    )
+
                     # NEW NODES
                     for object_ in objects_to_create:
                         import_entry_uuid = object_.uuid
@@ -506,22 +533,6 @@ def import_data_sqla(
                         progress_bar.update()
                         pbar_node_base_str = pbar_base_str + 'UUID={} - '.format(import_entry_uuid.split('-')[0])
 
-                        # Before storing entries in the DB, I store the files (if these are nodes).
-                        # Note: only for new entries!
-                        subfolder = folder.get_subfolder(
-                            os.path.join(NODES_EXPORT_SUBFOLDER, export_shard_uuid(import_entry_uuid))
-                        )
-                        if not subfolder.exists():
-                            raise exceptions.CorruptArchive(
-                                'Unable to find the repository folder for Node with UUID={} in the exported '
-                                'file'.format(import_entry_uuid)
-                            )
-                        destdir = RepositoryFolder(section=Repository._section_name, uuid=import_entry_uuid)
-                        # Replace the folder, possibly destroying existing previous folders, and move the files
-                        # (faster if we are on the same filesystem, and in any case the source is a SandboxFolder)
-                        progress_bar.set_description_str(pbar_node_base_str + 'Repository', refresh=True)
-                        destdir.replace_with_folder(subfolder.abspath, move=True, overwrite=True)
-
                         # For Nodes, we also have to store Attributes!
                         IMPORT_LOGGER.debug('STORING NEW NODE ATTRIBUTES...')
                         progress_bar.set_description_str(pbar_node_base_str + 'Attributes', refresh=True)
@@ -650,16 +661,10 @@ def import_data_sqla(
             IMPORT_LOGGER.debug('STORING NODE LINKS...')
 
             import_links = data['links_uuid']
-
-            if import_links:
-                progress_bar = get_progress_bar(total=len(import_links), disable=silent)
-                pbar_base_str = 'Links - '
+            links_to_validate = []
 
             for link in import_links:
                 # Check for dangling Links within the, supposed, self-consistent archive
-                progress_bar.set_description_str(pbar_base_str + 'label={}'.format(link['label']), refresh=False)
-                progress_bar.update()
-
                 try:
                     in_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['input']]
                     out_id = foreign_ids_reverse_mappings[NODE_ENTITY_NAME][link['output']]
@@ -671,28 +676,43 @@ def import_data_sqla(
                         'label={}, type={})'.format(link['input'], link['output'], link['label'], link['type'])
                     )
 
-                # Since backend specific Links (DbLink) are not validated upon creation, we will now validate them.
-                source = QueryBuilder().append(Node, filters={'id': in_id}, project='*').first()[0]
-                target = QueryBuilder().append(Node, filters={'id': out_id}, project='*').first()[0]
-                link_type = LinkType(link['type'])
+                links_to_validate.append((in_id, out_id, link['label'], link['type']))
 
-                # Check for existence of a triple link, i.e. unique triple.
-                # If it exists, then the link already exists, continue to next link, otherwise, validate link.
-                if link_triple_exists(source, target, link_type, link['label']):
-                    continue
+            # Retrieve the linked nodes and the links that are relevant for the validation of the new links in batches
+            batch_size = get_config_option('db.batch_size')
+            input_ids = {link[0] for link in links_to_validate}
+            output_ids = {link[1] for link in links_to_validate}
+            linked_nodes = {}
+            existing_links = set()
 
-                try:
-                    validate_link(source, target, link_type, link['label'])
-                except ValueError as why:
-                    raise exceptions.ImportValidationError('Error occurred during Link validation: {}'.format(why))
+            for ids in grouper(batch_size, input_ids.union(output_ids)):
+                nodes = session.query(DbNode.id, DbNode.uuid, DbNode.node_type).filter(DbNode.id.in_(ids))
+                linked_nodes.update({pk: (str(uuid), node_type) for pk, uuid, node_type in nodes})
+
+            link_columns = (DbLink.input_id, DbLink.output_id, DbLink.label, DbLink.type)
+
+            for ids in grouper(batch_size, input_ids):
+                existing_links.update(session.query(*link_columns).filter(DbLink.input_id.in_(ids)))
+
+            for ids in grouper(batch_size, output_ids):
+                existing_links.update(session.query(*link_columns).filter(DbLink.output_id.in_(ids)))
+
+            progress_bar = get_progress_bar(total=len(links_to_validate), disable=silent) if links_to_validate else None
+            new_links = validate_links(links_to_validate, linked_nodes, existing_links, progress_bar)
 
-                # New link
-                session.add(DbLink(input_id=in_id, output_id=out_id, label=link['label'], type=link['type']))
-                if 'Link' not in ret_dict:
-                    ret_dict['Link'] = {'new': []}
-                ret_dict['Link']['new'].append((in_id, out_id))
+            if new_links:
+                ret_dict['Link'] = {'new': [(in_id, out_id) for in_id, out_id, _, _ in new_links]}
 
-            IMPORT_LOGGER.debug('   (%d new links...)', len(ret_dict.get('Link', {}).get('new', [])))
+            # Store new links with multi-row inserts, since backend specific links are not validated upon creation
+            IMPORT_LOGGER.debug('   (%d new links...)', len(new_links))
+            for links in grouper(batch_size, new_links):
+                rows = [{
+                    'input_id': in_id,
+                    'output_id': out_id,
+                    'label': label,
+                    'type': link_type
+                } for in_id, out_id, label, link_type in links]
+                session.execute(insert(DbLink.__table__).values(rows))
 
             IMPORT_LOGGER.debug('STORING GROUP ELEMENTS...')
 
@@ -14,6 +14,7 @@ import os
 import click
 from tabulate import tabulate
 
+from aiida.common.links import LinkType, validate_link_label
 from aiida.common.log import AIIDA_LOGGER, LOG_LEVEL_REPORT
 from aiida.common.utils import get_new_uuid
 from aiida.orm import QueryBuilder, Comment
@@ -22,6 +23,17 @@ from aiida.tools.importexport.common import exceptions
 
 IMPORT_LOGGER = AIIDA_LOGGER.getChild('import')
 
+# For each link type, the node type prefixes of valid source and target nodes and the outdegree and indegree character,
+# as defined in :func:`aiida.orm.utils.links.validate_link`
+LINK_TYPE_RULES = {
+    LinkType.CALL_CALC: ('process.workflow.', 'process.calculation.', 'unique_triple', 'unique'),
+    LinkType.CALL_WORK: ('process.workflow.', 'process.workflow.', 'unique_triple', 'unique'),
+    LinkType.CREATE: ('process.calculation.', 'data.', 'unique_pair', 'unique'),
+    LinkType.INPUT_CALC: ('data.', 'process.calculation.', 'unique_triple', 'unique_pair'),
+    LinkType.INPUT_WORK: ('data.', 'process.workflow.', 'unique_triple', 'unique_pair'),
+    LinkType.RETURN: ('process.workflow.', 'data.', 'unique_pair', 'unique_triple'),
+}
+
 
 def merge_comment(incoming_comment, comment_mode):
     """ Merge comment according comment_mode
@@ -186,6 +198,95 @@ def merge_extras(old_extras, new_extras, mode):
     return final_extras
 
 
+def validate_links(links, nodes, existing_links, progress_bar=None):
+    """Validate the links to import and return those that do not yet exist.
+
+    The validation is equivalent to :func:`aiida.orm.utils.links.validate_link`, but the links are checked against sets
+    of the existing links, such that no database query is required per link. Links that already exist, including those
+    that occur earlier in `links`, are skipped.
+
+    :param links: list of tuples `(input_id, output_id, label, type)` of the links to import
+    :param nodes: dictionary mapping the id of each linked node onto a tuple of its UUID and node type
+    :param existing_links: iterable of tuples `(input_id, output_id, label, type)` of at least the existing links that
+        are outgoing from the input nodes or incoming into the output nodes of `links`
+    :param progress_bar: optional progress bar that is updated for each link
+    :return: list of tuples `(input_id, output_id, label, type)` of the new links
+    :raises `~aiida.tools.importexport.common.exceptions.ImportValidationError`: if a link is invalid
+    """
+    existing_links = set(existing_links)
+    existing_outgoing_unique = {(link[0], link[3]) for link in existing_links}
+    existing_outgoing_unique_pair = {(link[0], link[2], link[3]) for link in existing_links}
+    existing_incoming_unique = {(link[1], link[3]) for link in existing_links}
+    existing_incoming_unique_pair = {(link[1], link[2], link[3]) for link in existing_links}
+
+    new_links = []
+
+    for link in links:
+        in_id, out_id, label, type_value = link
+
+        if progress_bar is not None:
+            progress_bar.set_description_str('Links - label={}'.format(label), refresh=False)
+            progress_bar.update()
+
+        # Check if link already exists, skip if it does
+        # This is equivalent to an existing triple link (i.e. unique_triple from below)
+        if link in existing_links:
+            continue
+
+        try:
+            validate_link_label(label)
+        except ValueError as why:
+            raise exceptions.ImportValidationError('Error during Link label validation: {}'.format(why))
+
+        source_uuid, source_type = nodes[in_id]
+        target_uuid, target_type = nodes[out_id]
+
+        if source_uuid == target_uuid:
+            raise exceptions.ImportValidationError('Cannot add a link to oneself')
+
+        link_type = LinkType(type_value)
+        type_source, type_target, outdegree, indegree = LINK_TYPE_RULES[link_type]
+
+        if not source_type.startswith(type_source) or not target_type.startswith(type_target):
+            raise exceptions.ImportValidationError(
+                'Cannot add a {} link from {} to {}'.format(link_type, source_type, target_type)
+            )
+
+        # If the outdegree is `unique` there cannot already be any other outgoing link of that type
+        if outdegree == 'unique' and (in_id, type_value) in existing_outgoing_unique:
+            raise exceptions.ImportValidationError(
+                'Node<{}> already has an outgoing {} link'.format(source_uuid, link_type)
+            )
+
+        # If the outdegree is `unique_pair`, the labels of the outgoing links of that type should be unique
+        if outdegree == 'unique_pair' and (in_id, label, type_value) in existing_outgoing_unique_pair:
+            raise exceptions.ImportValidationError(
+                'Node<{}> already has an outgoing {} link with label "{}"'.format(source_uuid, link_type, label)
+            )
+
+        # If the indegree is `unique` there cannot already be any other incoming link of that type
+        if indegree == 'unique' and (out_id, type_value) in existing_incoming_unique:
+            raise exceptions.ImportValidationError(
+                'Node<{}> already has an incoming {} link'.format(target_uuid, link_type)
+            )
+
+        # If the indegree is `unique_pair`, the labels of the incoming links of that type should be unique
+        if indegree == 'unique_pair' and (out_id, label, type_value) in existing_incoming_unique_pair:
+            raise exceptions.ImportValidationError(
+                'Node<{}> already has an incoming {} link with label "{}"'.format(target_uuid, link_type, label)
+            )
+
+        new_links.append(link)
+
+        existing_links.add(link)
+        existing_outgoing_unique.add((in_id, type_value))
+        existing_outgoing_unique_pair.add((in_id, label, type_value))
+        existing_incoming_unique.add((out_id, type_value))
+        existing_incoming_unique_pair.add((out_id, label, type_value))
+
+    return new_links
+
+
 def deserialize_attributes(attributes_data, conversion_data):
     """Deserialize attributes"""
     import datetime
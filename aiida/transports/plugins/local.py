@@ -19,12 +19,14 @@ Local transport
 ### we should instead keep track internally of the 'current working directory'
 ### in the exact same way as paramiko does already.
 
+import contextlib
 import errno
 import io
 import os
 import shutil
 import subprocess
 import glob
+import tempfile
 
 from aiida.transports import cli as transport_cli
 from aiida.transports.transport import Transport, TransportInternalError
@@ -759,6 +761,46 @@ class LocalTransport(Transport):
 
         return proc.stdin, proc.stdout, proc.stderr, proc
 
+    @contextlib.contextmanager
+    def _exec_command_stream(self, command):
+        """
+        Execute a command and return a context manager that yields its standard output as a binary stream.
+
+        The standard error is written to a temporary file, such that the command cannot block on a full pipe while its
+        output is being read.
+
+        :param str command: execute the command given as a string
+        :raise OSError: if the command exits with a non-zero exit status
+        """
+        # pylint: disable=subprocess-popen-preexec-fn
+        from aiida.common.escaping import escape_for_bash
+
+        bash_command = self._bash_command_str + '-c ' + escape_for_bash(command)
+
+        with tempfile.TemporaryFile() as stderr:
+            proc = subprocess.Popen(
+                bash_command,
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+                cwd=self.getcwd(),
+                start_new_session=True
+            )
+
+            try:
+                yield proc.stdout
+                # Consume any trailing output, such that the command does not fail writing to a closed pipe
+                proc.stdout.read()
+            finally:
+                proc.stdout.close()
+                retval = proc.wait()
+
+            if retval != 0:
+                stderr.seek(0)
+                stderr_text = stderr.read().decode('utf-8')
+                raise OSError('command `{}` failed with exit status {}: {}'.format(command, retval, stderr_text))
+
     def exec_command_wait(self, command, **kwargs):
         """
         Executes the specified command and waits for it to finish.
@@ -9,9 +9,11 @@
 ###########################################################################
 """Plugin for transport over SSH (and SFTP for file transfer)."""
 # pylint: disable=too-many-lines
+import contextlib
 import glob
 import io
 import os
+import threading
 from stat import S_ISDIR, S_ISREG
 
 import click
@@ -201,9 +203,20 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 'help': 'SSH key policy if host is not known.',
                 'non_interactive_default': True
             }
+        ),
+        (
+            'transfer_channels', {
+                'type': click.IntRange(min=1),
+                'prompt': 'File transfer channels',
+                'help': 'Maximum number of SFTP channels used to transfer multiple files concurrently.',
+                'non_interactive_default': True
+            }
         )
     ]
 
+    # Default maximum number of SFTP channels that are opened to transfer multiple files concurrently
+    _DEFAULT_TRANSFER_CHANNELS = 4
+
     @classmethod
     def _get_username_suggestion_string(cls, computer):
         """
@@ -324,6 +337,13 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         """
         return 'RejectPolicy'
 
+    @classmethod
+    def _get_transfer_channels_suggestion_string(cls, computer):  # pylint: disable=unused-argument
+        """
+        Return as a suggestion the default number of file transfer channels.
+        """
+        return str(cls._DEFAULT_TRANSFER_CHANNELS)
+
     @classmethod
     def _get_gss_auth_suggestion_string(cls, computer):
         """
@@ -365,6 +385,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param transfer_channels: (optional, default self._DEFAULT_TRANSFER_CHANNELS)
+           the maximum number of SFTP channels used to transfer multiple files concurrently
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -376,6 +398,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         self._sftp = None
         self._proxy = None
+        self._channels = threading.local()
+        self._transfer_channels = kwargs.pop('transfer_channels', self._DEFAULT_TRANSFER_CHANNELS)
 
         self._machine = kwargs.pop('machine')
 
@@ -471,9 +495,56 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
     @property
     def sftp(self):
+        """Return the SFTP channel, which is the channel of the current thread while running concurrent transfers."""
         if not self._is_open:
             raise TransportInternalError('Error, sftp method called for SshTransport without opening the channel first')
-        return self._sftp
+        channel = getattr(self._channels, 'sftp', None)
+        return channel if channel is not None else self._sftp
+
+    def _run_transfers(self, method, transfers, **kwargs):
+        """
+        Run the transfers concurrently in a pool of threads.
+
+        Each thread opens its own SFTP channel on the existing SSH connection, with the same working directory as the
+        main channel, which is used by all transport methods that are called from that thread.
+
+        :param method: the bound transfer method, e.g. :meth:`put` or :meth:`get`
+        :param transfers: list of tuples of source and destination paths
+        :param kwargs: keyword arguments that are passed to each call of the transfer method
+        """
+        from concurrent import futures
+
+        max_workers = min(self._transfer_channels, len(transfers))
+
+        if max_workers <= 1:
+            super()._run_transfers(method, transfers, **kwargs)
+            return
+
+        cwd = self.getcwd()
+        channels = []
+
+        def transfer(source, destination):
+            """Perform a single transfer, opening the SFTP channel of this thread if it does not exist yet."""
+            if getattr(self._channels, 'sftp', None) is None:
+                channel = self.sshclient.open_sftp()
+                channels.append(channel)
+                channel.chdir(cwd)
+                self._channels.sftp = channel
+            method(source, destination, **kwargs)
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = [executor.submit(transfer, source, destination) for source, destination in transfers]
+                done, not_done = futures.wait(results, return_when=futures.FIRST_EXCEPTION)
+
+                for result in not_done:
+                    result.cancel()
+
+                for result in done:
+                    result.result()
+        finally:
+            for channel in channels:
+                channel.close()
 
     def __str__(self):
         """
@@ -1242,6 +1313,31 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         return stdin, stdout, stderr, channel
 
+    @contextlib.contextmanager
+    def _exec_command_stream(self, command):
+        """
+        Execute a command and return a context manager that yields its standard output as a binary stream.
+
+        :param str command: execute the command given as a string
+        :raise OSError: if the command exits with a non-zero exit status
+        """
+        stdin, stdout, stderr, channel = self._exec_command_internal(command)
+        stdin.channel.shutdown_write()
+
+        try:
+            yield stdout
+            # Consume any trailing output, such that the exit status is not blocked by unread data
+            stdout.read()
+        except Exception:
+            channel.close()
+            raise
+
+        retval = channel.recv_exit_status()
+
+        if retval != 0:
+            stderr_text = stderr.read().decode('utf-8')
+            raise OSError('command `{}` failed with exit status {}: {}'.format(command, retval, stderr_text))
+
     def exec_command_wait(self, command, stdin=None, combine_stderr=False, bufsize=-1):  # pylint: disable=arguments-differ
         """
         Executes the specified command and waits for it to finish.
@@ -9,6 +9,7 @@
 ###########################################################################
 """Transport interface."""
 import abc
+import collections
 import os
 import re
 import fnmatch
@@ -20,6 +21,10 @@ from aiida.common.lang import classproperty
 
 __all__ = ('Transport',)
 
+# Maximum length of the list of paths passed to a single `tar` command when retrieving files through an archive, which
+# keeps the command well below the limit on the length of a single command line argument
+ARCHIVE_PATHS_MAX_LENGTH = 32768
+
 
 def validate_positive_number(ctx, param, value):  # pylint: disable=unused-argument
     """Validate that the number passed to this parameter is a positive number.
@@ -34,6 +39,26 @@ def validate_positive_number(ctx, param, value):  # pylint: disable=unused-argum
         raise BadParameter('{} is not a valid positive number'.format(value))
 
 
+def get_local_size(path):
+    """Return the total size in bytes of the local file or of all files in the local folder at the given path.
+
+    :param path: absolute path of a local file or folder
+    :return: the size in bytes, which is 0 if the path does not exist
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    size = 0
+
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            if os.path.isfile(filepath):
+                size += os.path.getsize(filepath)
+
+    return size
+
+
 class Transport(abc.ABC):
     """Abstract class for a generic transport (ssh, local, ...) ontains the set of minimal methods."""
     # pylint: disable=too-many-public-methods
@@ -430,6 +455,138 @@ class Transport(abc.ABC):
         """
         raise NotImplementedError
 
+    def get_many(self, transfers, ignore_nonexisting=False, archive=False):
+        """
+        Retrieve multiple files or folders from remote sources to local destinations.
+
+        The transfers may be performed concurrently and in any order, so the local destinations should not overlap.
+
+        With `archive=True`, the sources are first retrieved as gzipped tar archives that are created on the remote and
+        streamed to the local destinations, which takes a single round trip for many files instead of several per file.
+        This is only possible for sources that are relative paths within the working directory and for destinations
+        that do not exist yet. Other transfers, or all of them if the transport cannot stream archives or creating the
+        archive fails, are retrieved one by one.
+
+        :param transfers: iterable of tuples of a remote source path and an absolute local destination path
+        :param ignore_nonexisting: if True, remote sources that do not exist are skipped instead of raising
+        :param archive: if True, retrieve the sources through streamed tar archives where possible
+        :return: the total size in bytes of the local destinations after the transfer
+        """
+        transfers = list(transfers)
+        remaining = self._get_many_archive(transfers, ignore_nonexisting) if archive else transfers
+        self._run_transfers(self.get, remaining, ignore_nonexisting=ignore_nonexisting)
+        return sum(get_local_size(localpath) for _, localpath in transfers)
+
+    def _get_many_archive(self, transfers, ignore_nonexisting):
+        """
+        Retrieve the transfers that can be retrieved through streamed tar archives and return the remaining ones.
+
+        :param transfers: list of tuples of a remote source path and an absolute local destination path
+        :param ignore_nonexisting: if True, remote sources that do not exist are skipped instead of raising
+        :return: list of the transfers that still have to be retrieved one by one
+        :raise IOError: if a source does not exist and `ignore_nonexisting` is False
+        """
+        import shutil
+        import tarfile
+        import zlib
+
+        eligible = []
+        remaining = []
+
+        for remotepath, localpath in transfers:
+            source = os.path.normpath(remotepath) if remotepath else ''
+            if (
+                source and source != '.' and not os.path.isabs(source) and source.split('/')[0] != '..' and
+                not self.has_magic(source) and os.path.isabs(localpath) and not os.path.lexists(localpath)
+            ):
+                eligible.append((source, localpath))
+            else:
+                remaining.append((remotepath, localpath))
+
+        if not eligible:
+            return remaining
+
+        try:
+            retrieved = self._extract_archives(eligible)
+        except (NotImplementedError, EOFError, OSError, tarfile.TarError, zlib.error) as exception:
+            self.logger.debug('retrieving through an archive failed, retrieving one by one: {}'.format(exception))
+            for _, localpath in eligible:
+                if os.path.isdir(localpath) and not os.path.islink(localpath):
+                    shutil.rmtree(localpath)
+                elif os.path.lexists(localpath):
+                    os.remove(localpath)
+            return remaining + eligible
+
+        for source, _ in eligible:
+            if source not in retrieved and not ignore_nonexisting:
+                raise IOError('The remote path {} does not exist'.format(source))
+
+        return remaining
+
+    def _extract_archives(self, transfers):
+        """
+        Stream gzipped tar archives of the remote sources and extract their members onto the local destinations.
+
+        The sources are archived by running `tar` on the remote, with symbolic links dereferenced like :meth:`get` does.
+        Archive members are only extracted if they are one of the sources or are contained in one of them.
+
+        :param transfers: list of tuples of a normalized relative remote source path and an absolute local destination
+        :return: set of the sources that were found in the archives
+        """
+        import shutil
+        import tarfile
+        from aiida.common.escaping import escape_for_bash
+
+        destinations = collections.defaultdict(list)
+        for source, localpath in transfers:
+            destinations[source].append(localpath)
+
+        retrieved = set()
+        batches = [[]]
+        length = 0
+
+        for source in destinations:
+            if batches[-1] and length + len(source) > ARCHIVE_PATHS_MAX_LENGTH:
+                batches.append([])
+                length = 0
+            batches[-1].append(source)
+            length += len(source) + 3
+
+        for batch in batches:
+            command = 'tar -czhf - --hard-dereference --ignore-failed-read -- {}'.format(
+                ' '.join(escape_for_bash(source) for source in batch)
+            )
+
+            with self._exec_command_stream(command) as stream, tarfile.open(fileobj=stream, mode='r|gz') as archive:
+                for member in archive:
+                    parts = os.path.normpath(member.name).split('/')
+                    extracted = None
+
+                    # Match the member with the sources it corresponds to, which are the member itself or its parents
+                    for index in range(len(parts), 0, -1):
+                        source = '/'.join(parts[:index])
+
+                        if source not in destinations:
+                            continue
+
+                        retrieved.add(source)
+
+                        for localpath in destinations[source]:
+                            target = os.path.join(localpath, *parts[index:])
+
+                            if member.isdir():
+                                os.makedirs(target, exist_ok=True)
+                            elif member.isfile():
+                                os.makedirs(os.path.dirname(target), exist_ok=True)
+                                if extracted is None:
+                                    with archive.extractfile(member) as handle, open(target, 'wb') as target_handle:
+                                        shutil.copyfileobj(handle, target_handle)
+                                    extracted = target
+                                else:
+                                    shutil.copyfile(extracted, target)
+
+        return retrieved
+
     def getfile(self, remotepath, localpath, *args, **kwargs):
         """
         Retrieve a file from remote source to local destination
@@ -603,6 +760,19 @@ class Transport(abc.ABC):
         """
         raise NotImplementedError
 
+    def put_many(self, transfers):
+        """
+        Put multiple files or folders from local sources to remote destinations.
+
+        The transfers may be performed concurrently and in any order, so the remote destinations should not overlap.
+
+        :param transfers: iterable of tuples of an absolute local source path and a remote destination path
+        :return: the total size in bytes of the local sources
+        """
+        transfers = list(transfers)
+        self._run_transfers(self.put, transfers)
+        return sum(get_local_size(localpath) for localpath, _ in transfers)
+
     def putfile(self, localpath, remotepath, *args, **kwargs):
         """
         Put a file from local src to remote dst.
@@ -623,6 +793,31 @@ class Transport(abc.ABC):
         """
         raise NotImplementedError
 
+    def _exec_command_stream(self, command):
+        """
+        Execute a command and return a context manager that yields its standard output as a binary stream.
+
+        When the context exits, an `OSError` is raised if the command failed. Transports that cannot stream the output
+        of a command do not implement this, in which case bulk retrievals fall back to retrieving files one by one.
+
+        :param str command: execute the command given as a string
+        :raise NotImplementedError: if the transport does not support streaming the output of a command
+        """
+        raise NotImplementedError
+
+    def _run_transfers(self, method, transfers, **kwargs):
+        """
+        Call the transfer method for each pair of source and destination in turn.
+
+        Plugins that can transfer multiple files over a single connection concurrently should override this method.
+
+        :param method: the bound transfer method, e.g. :meth:`put` or :meth:`get`
+        :param transfers: list of tuples of source and destination paths
+        :param kwargs: keyword arguments that are passed to each call of the transfer method
+        """
+        for source, destination in transfers:
+            method(source, destination, **kwargs)
+
     def remove(self, path):
         """
         Remove the file at the given path. This only works on files;
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Configuration file for the benchmarks.
+
+The benchmarks are expensive, so they are skipped unless they are explicitly requested with the `--benchmark-only` or
+`--benchmark-enable` options of `pytest-benchmark`, as in the benchmark workflow. Otherwise they would also run as part
+of the normal test suite, which collects all tests in the `tests` folder.
+"""
+import os
+
+import pytest
+
+BENCHMARK_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmarks in this folder unless they are explicitly requested."""
+    if config.getoption('benchmark_only', default=False) or config.getoption('benchmark_enable', default=False):
+        return
+
+    skip = pytest.mark.skip(reason='benchmarks only run with the `--benchmark-only` or `--benchmark-enable` option')
+
+    for item in items:
+        if str(item.fspath).startswith(BENCHMARK_DIRECTORY + os.sep):
+            item.add_marker(skip)
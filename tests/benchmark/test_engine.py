@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Benchmarks for the state transitions of processes and recording them with
+:class:`aiida.engine.utils.ProcessStateChangeRecorder`.
+
+Run with `pytest tests/benchmark --benchmark-only`. Each worker is emulated by a thread with its own database connection
+and recorder. The `immediate` case writes the settings row for every transition, like a recorder with interval zero,
+the `rate_limited` case uses the default interval of daemon workers. The state change benchmark only records the state
+changes, the process benchmark runs work chains to completion on a runner with persistence per worker, such that each
+transition also writes the state and checkpoint of the process node. The number of transitions or processes per second
+is reported in the `extra_info` of the benchmark.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from unittest import mock
+
+import pytest
+from tornado.ioloop import IOLoop
+
+from aiida.engine import WorkChain
+from aiida.engine.utils import ProcessStateChangeRecorder, loop_scope
+from aiida.manage.manager import Manager, get_manager
+
+NUMBER_OF_WORKERS = 8
+NUMBER_OF_TRANSITIONS = 250
+NUMBER_OF_PROCESSES = 25
+
+# The recorder of each worker thread, which replaces the single recorder of the manager of a daemon worker
+WORKER = threading.local()
+
+
+class TransitionWorkChain(WorkChain):
+    """Work chain with a single empty step, which only goes through the state transitions of a process."""
+
+    @classmethod
+    def define(cls, spec):
+        super().define(spec)
+        spec.outline(cls.step)
+
+    def step(self):
+        """Do nothing."""
+
+
+def record_state_changes(interval):
+    """Record the state changes of `NUMBER_OF_TRANSITIONS` transitions like a daemon worker with the given interval."""
+    loop = IOLoop()
+    recorder = ProcessStateChangeRecorder(loop, interval)
+
+    try:
+        for _ in range(NUMBER_OF_TRANSITIONS):
+            recorder.record('work')
+        recorder.flush()
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize('interval', [0, 5], ids=['immediate', 'rate_limited'])
+@pytest.mark.benchmark(group='engine')
+def test_state_change_throughput(benchmark, interval):
+    """Benchmark the state change transitions of concurrent workers."""
+
+    def run():
+        with ThreadPoolExecutor(NUMBER_OF_WORKERS) as executor:
+            list(executor.map(record_state_changes, [interval] * NUMBER_OF_WORKERS))
+
+    benchmark.pedantic(run, rounds=5)
+    transitions = NUMBER_OF_WORKERS * NUMBER_OF_TRANSITIONS
+    benchmark.extra_info['transitions_per_second'] = transitions / benchmark.stats.stats.mean
+
+
+def run_processes(interval):
+    """Run `NUMBER_OF_PROCESSES` processes to completion like a daemon worker with the given interval."""
+    loop = IOLoop()
+    WORKER.recorder = ProcessStateChangeRecorder(loop, interval)
+    runner = get_manager().create_runner(loop=loop)
+
+    try:
+        # The processes are executed directly instead of with `Runner.run`, which installs signal handlers that can only
+        # be installed in the main thread
+        with loop_scope(loop):
+            for _ in range(NUMBER_OF_PROCESSES):
+                process = runner.instantiate_process(TransitionWorkChain)
+                process.execute()
+                assert process.node.is_finished_ok
+        WORKER.recorder.flush()
+    finally:
+        runner.close()
+        loop.close()
+
+
+@pytest.mark.parametrize('interval', [0, 5], ids=['immediate', 'rate_limited'])
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='engine')
+def test_process_throughput(benchmark, interval):
+    """Benchmark running processes through their state transitions end to end in concurrent workers."""
+
+    def run():
+        with ThreadPoolExecutor(NUMBER_OF_WORKERS) as executor:
+            list(executor.map(run_processes, [interval] * NUMBER_OF_WORKERS))
+
+    with mock.patch.object(Manager, 'get_process_state_change_recorder', lambda _: WORKER.recorder):
+        benchmark.pedantic(run, rounds=3)
+
+    processes = NUMBER_OF_WORKERS * NUMBER_OF_PROCESSES
+    benchmark.extra_info['processes_per_second'] = processes / benchmark.stats.stats.mean
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Benchmarks for traversing the provenance graph with :func:`aiida.tools.graph.graph_traversers.traverse_graph`.
+
+Run with `pytest tests/benchmark --benchmark-only`. The synthetic graphs consist of layers of data nodes, where each
+data node of a layer is created by a calculation that takes two data nodes of the previous layer as inputs. The graph
+is traversed from a single data node of the first layer, following the links in both directions, once in the database
+and once with the rule based implementation.
+"""
+import pytest
+
+from aiida import orm
+from aiida.common.links import LinkType
+from aiida.tools.graph.graph_traversers import traverse_graph
+
+# Tuples of the number of data nodes per layer and the number of layers, giving graphs of 100, 1000 and 10000 nodes
+GRAPH_SIZES = [(10, 5), (50, 10), (250, 20)]
+
+
+def create_layered_graph(width, layers):
+    """Create a layered provenance graph and return the pk of the first data node of the first layer."""
+    previous = [orm.Data() for _ in range(width)]
+    nodes = list(previous)
+
+    for _ in range(layers - 1):
+        current = []
+
+        for index in range(width):
+            calculation = orm.CalculationNode()
+            calculation.add_incoming(previous[index], LinkType.INPUT_CALC, 'left')
+            calculation.add_incoming(previous[(index + 1) % width], LinkType.INPUT_CALC, 'right')
+            data = orm.Data()
+            data.add_incoming(calculation, LinkType.CREATE, 'result')
+            nodes.extend([calculation, data])
+            current.append(data)
+
+        previous = current
+
+    orm.store_many(nodes)
+
+    return nodes[0].pk
+
+
+@pytest.mark.parametrize('in_database', [True, False], ids=['database', 'rules'])
+@pytest.mark.parametrize('width,layers', GRAPH_SIZES, ids=['100', '1000', '10000'])
+@pytest.mark.usefixtures('clear_database_before_test')
+@pytest.mark.benchmark(group='graph')
+def test_traverse_graph(benchmark, width, layers, in_database):
+    """Benchmark traversing a layered graph of increasing size."""
+    starting_pk = create_layered_graph(width, layers)
+    links = [LinkType.INPUT_CALC, LinkType.CREATE]
+
+    result = benchmark.pedantic(
+        traverse_graph, ([starting_pk],), {
+            'get_links': True,
+            'links_forward': links,
+            'links_backward': links,
+            'in_database': in_database
+        },
+        rounds=3
+    )
+
+    assert len(result['nodes']) == width * (2 * layers - 1)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Benchmarks for hashing the file content of repositories with :func:`aiida.common.hashing.make_hash`.
+
+Run with `pytest tests/benchmark --benchmark-only`. The `large_file` cases measure the cost of streaming the content
+of a single big file, the `many_files` cases the per-file overhead. For the object store, the `rehash` cases measure
+hashing the same content a second time, which uses the content digests persisted by the object store.
+"""
+import os
+
+import pytest
+
+from aiida.common.folders import Folder
+from aiida.common.hashing import make_hash
+from aiida.repository import ObjectStore, ObjectTree
+
+LARGE_FILE_SIZE = 64 * 1024**2
+MANY_FILES_NUMBER = 1000
+MANY_FILES_SIZE = 1024
+
+
+def _generate_content(name):
+    """Return the list of `(filename, content)` tuples of the benchmark case with the given name."""
+    if name == 'large_file':
+        return [('large_file', os.urandom(LARGE_FILE_SIZE))]
+
+    return [('file_{}'.format(index), os.urandom(MANY_FILES_SIZE)) for index in range(MANY_FILES_NUMBER)]
+
+
+@pytest.fixture(params=['large_file', 'many_files'])
+def content(request):
+    """Return the content of a benchmark case."""
+    return _generate_content(request.param)
+
+
+@pytest.mark.benchmark(group='hashing')
+def test_hash_folder(benchmark, tmp_path, content):
+    """Benchmark hashing a folder on the local file system."""
+    for filename, filecontent in content:
+        (tmp_path / filename).write_bytes(filecontent)
+
+    benchmark(make_hash, Folder(str(tmp_path)))
+
+
+@pytest.mark.benchmark(group='hashing')
+def test_hash_object_tree(benchmark, tmp_path, content):
+    """Benchmark hashing the content of an object store for the first time."""
+
+    def setup():
+        object_store = ObjectStore(str(tmp_path / 'container'))
+        object_store.delete_objects(list(object_store.iter_loose_hashkeys()))
+        directory = {filename: object_store.add_object(filecontent) for filename, filecontent in content}
+        return (ObjectTree(object_store, directory),), {}
+
+    benchmark.pedantic(make_hash, setup=setup, rounds=5)
+
+
+@pytest.mark.benchmark(group='hashing')
+def test_rehash_object_tree(benchmark, tmp_path, content):
+    """Benchmark hashing the content of an object store whose content digests have already been computed."""
+    object_store = ObjectStore(str(tmp_path / 'container'))
+    tree = ObjectTree(
+        object_store, {filename: object_store.add_object(filecontent) for filename, filecontent in content}
+    )
+    make_hash(tree)
+
+    benchmark(make_hash, tree)
@@ -16,7 +16,7 @@ from click.testing import CliRunner
 from aiida.backends.testbase import AiidaTestCase
 from aiida.cmdline.commands import cmd_database
 from aiida.common.links import LinkType
-from aiida.orm import Data, CalculationNode, WorkflowNode
+from aiida.orm import Data, CalculationNode, QueryBuilder, WorkflowNode
 
 
 class TestVerdiDatabasaIntegrity(AiidaTestCase):
@@ -170,3 +170,35 @@ class TestVerdiDatabasaIntegrity(AiidaTestCase):
         result = self.cli_runner.invoke(cmd_database.detect_invalid_nodes, [])
         self.assertNotEqual(result.exit_code, 0)
         self.assertIsNotNone(result.exception)
+
+
+class TestVerdiDatabaseRefreshStatistics(AiidaTestCase):
+    """Tests for `verdi database refresh-statistics`."""
+
+    def setUp(self):
+        self.cli_runner = CliRunner()
+
+    def test_refresh_statistics(self):
+        """Test that the statistics are rebuilt with the nodes in the database."""
+        node = Data().store()
+        CalculationNode().store()
+
+        result = self.cli_runner.invoke(cmd_database.database_refresh_statistics, [])
+        self.assertClickResultNoException(result)
+
+        statistics = self.backend.query_manager.get_creation_statistics()
+        self.assertIn('rebuilt the creation statistics of {} nodes'.format(statistics['total']), result.output)
+        builder = QueryBuilder().append(Data, subclassing=False)
+        self.assertEqual(statistics['types'][node.node_type], builder.count())
+
+    def test_refresh_statistics_compact(self):
+        """Test that the compacted statistics still count the nodes in the database."""
+        node = Data().store()
+
+        result = self.cli_runner.invoke(cmd_database.database_refresh_statistics, ['--compact'])
+        self.assertClickResultNoException(result)
+
+        statistics = self.backend.query_manager.get_creation_statistics()
+        self.assertIn('compacted the creation statistics of {} nodes'.format(statistics['total']), result.output)
+        builder = QueryBuilder().append(Data, subclassing=False)
+        self.assertEqual(statistics['types'][node.node_type], builder.count())
@@ -141,6 +141,21 @@ class TestVerdiExport(AiidaTestCase):
         finally:
             delete_temporary_file(filename)
 
+    def test_create_stream(self):
+        """Test that creating an archive in streaming mode works."""
+        filename = next(tempfile._get_candidate_names())  # pylint: disable=protected-access
+        try:
+            options = [
+                '-X', self.code.pk, '-Y', self.computer.pk, '-G', self.group.pk, '-N', self.node.pk, '--stream',
+                filename
+            ]
+            result = self.cli_runner.invoke(cmd_export.create, options)
+            self.assertIsNone(result.exception, ''.join(traceback.format_exception(*result.exc_info)))
+            self.assertTrue(os.path.isfile(filename))
+            self.assertFalse(zipfile.ZipFile(filename).testzip(), None)
+        finally:
+            delete_temporary_file(filename)
+
     def test_migrate_versions_old(self):
         """Migrating archives with a version older than the current should work."""
         archives = []
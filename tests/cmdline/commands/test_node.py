@@ -579,6 +579,66 @@ class TestVerdiRehash(AiidaTestCase):
         self.assertClickResultNoException(result)
         self.assertTrue('{} nodes'.format(expected_node_count) in result.output)
 
+    def test_rehash_batch_size(self):
+        """The hashes should be written to the extras of all nodes, also when spread over multiple batches."""
+        from aiida.orm import load_node
+
+        nodes = [self.node_base, self.node_bool_true, self.node_bool_false, self.node_float, self.node_int]
+        for node in nodes:
+            node.clear_hash()
+
+        options = ['-f', '--batch-size', '2']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('5 nodes' in result.output)
+
+        for node in nodes:
+            self.assertEqual(load_node(node.pk).get_extra('_aiida_hash'), node.get_hash())
+
+    def _interrupt_rehash(self, num_batches):
+        """Rehash all nodes in batches of a single node like `verdi node rehash` and interrupt it after some batches."""
+        from aiida.manage.database.rehash import rehash_nodes
+        from aiida.orm import Data, ProcessNode
+
+        batches = []
+
+        def interrupt(num_nodes):
+            batches.append(num_nodes)
+            if len(batches) == num_batches:
+                raise RuntimeError('interrupted')
+
+        with self.assertRaises(RuntimeError):
+            rehash_nodes((Data, ProcessNode), batch_size=1, callback=interrupt)
+
+    def test_rehash_resume(self):
+        """With `--resume` only the nodes after the stored progress of an interrupted rehash should be rehashed."""
+        self._interrupt_rehash(3)
+
+        options = ['-f', '--resume']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('2 nodes' in result.output)
+
+        # The progress should have been removed after completion, so resuming again starts from scratch
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('5 nodes' in result.output)
+
+    def test_rehash_resume_other_filters(self):
+        """With `--resume` the progress of an interrupted rehash with other filters should be ignored."""
+        self._interrupt_rehash(3)
+
+        # Both boolean nodes come before the stored progress of the interrupted rehash of all nodes
+        options = ['-f', '--resume', '-e', 'aiida.data:bool']
+        result = self.cli_runner.invoke(cmd_node.rehash, options)
+        self.assertClickResultNoException(result)
+        self.assertTrue('2 nodes' in result.output)
+
+        # The progress of the interrupted rehash was overwritten, so it is no longer resumed either
+        result = self.cli_runner.invoke(cmd_node.rehash, ['-f', '--resume'])
+        self.assertClickResultNoException(result)
+        self.assertTrue('5 nodes' in result.output)
+
     def test_rehash_entry_point_no_matches(self):
         """Limiting the queryset by defining explicit entry point, with no nodes should exit with non-zero status."""
         options = ['-f', '-e', 'aiida.data:structure']
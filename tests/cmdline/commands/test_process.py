@@ -272,6 +272,30 @@ class TestVerdiProcess(AiidaTestCase):
             self.assertClickResultNoException(result)
             self.assertEqual(len(get_result_lines(result)), 1)
 
+    def test_list_summary(self):
+        """Test the summary option of the list command."""
+        from aiida.engine import ProcessState
+
+        # By default only the active states are counted, each of which has two entries
+        result = self.cli_runner.invoke(cmd_process.process_list, ['-r', '--summary'])
+        self.assertClickResultNoException(result)
+        counts = dict(line.split() for line in get_result_lines(result))
+        self.assertEqual(counts, {'created': '2', 'running': '2', 'waiting': '2'})
+
+        result = self.cli_runner.invoke(cmd_process.process_list, ['-r', '--summary', '--all'])
+        self.assertClickResultNoException(result)
+        counts = dict(line.split() for line in get_result_lines(result))
+        self.assertEqual(counts, {state.value: '2' for state in ProcessState})
+
+        # The filters should apply to the counts
+        result = self.cli_runner.invoke(cmd_process.process_list, ['-r', '--summary', '--failed'])
+        self.assertClickResultNoException(result)
+        self.assertEqual([line.split() for line in get_result_lines(result)], [['finished', '1']])
+
+        result = self.cli_runner.invoke(cmd_process.process_list, ['--summary', '--all', '-G', str(self.group.pk)])
+        self.assertClickResultNoException(result)
+        self.assertIn('Total results: 1', result.output)
+
     def test_process_show(self):
         """Test verdi process show"""
         # We must choose a Node we can store
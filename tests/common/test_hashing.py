@@ -26,6 +26,7 @@ except ImportError:
 
 from aiida.common.hashing import make_hash, float_to_text
 from aiida.common.folders import SandboxFolder
+from aiida.repository import ObjectStore, ObjectTree
 from aiida.backends.testbase import AiidaTestCase
 from aiida.orm import Dict
 
@@ -210,6 +211,39 @@ class MakeHashTest(unittest.TestCase):
             self.assertNotEqual(make_hash(folder), folder_hash)
             self.assertEqual(make_hash(folder, ignored_folder_content=['file3.npy', 'some_subdir']), folder_hash)
 
+    def test_folder_large_file(self):
+        """Files larger than the chunk size in which they are read should hash as their complete content."""
+        with SandboxFolder(sandbox_in_repo=False) as folder:
+            with folder.open('file1', 'wb') as fhandle:
+                fhandle.write(b'0123456789' * 100000)
+
+            self.assertEqual(make_hash(folder), '8ec1936fb106ad17e6bc45bc2dc6a479fa7246ece8ed402b902606b65a38a438')
+
+    def test_object_tree(self):
+        """An ObjectTree should have the same hash as a Folder with the same content."""
+        with SandboxFolder(sandbox_in_repo=False) as folder:
+            object_store = ObjectStore(folder.get_abs_path('container'))
+            directory = {
+                'file1': object_store.add_object(b''),
+                'file2': object_store.add_object(b'hello there!\n'),
+            }
+            tree = ObjectTree(object_store, directory)
+            self.assertEqual(make_hash(tree), '47d9cdb2247e75eca492035f60f09fdd0daf87bbba40bb658d2d7e84f21f26c5')
+
+            directory['some_subdir'] = {'file3': object_store.add_object(b'content')}
+            self.assertNotEqual(make_hash(tree), '47d9cdb2247e75eca492035f60f09fdd0daf87bbba40bb658d2d7e84f21f26c5')
+            self.assertEqual(
+                make_hash(tree, ignored_folder_content=['some_subdir']),
+                '47d9cdb2247e75eca492035f60f09fdd0daf87bbba40bb658d2d7e84f21f26c5'
+            )
+
+            # Hashing again should give the same result using the digests persisted by the object store
+            object_store.pack_loose_objects()
+            self.assertEqual(
+                make_hash(tree, ignored_folder_content=['some_subdir']),
+                '47d9cdb2247e75eca492035f60f09fdd0daf87bbba40bb658d2d7e84f21f26c5'
+            )
+
 
 class CheckDBRoundTrip(AiidaTestCase):
     """
@@ -215,3 +215,16 @@ def create_profile() -> Profile:
         return Profile(name, profile_dictionary)
 
     return _create_profile
+
+
+@pytest.fixture
+def use_object_store():
+    """Configure the current profile to store the repository content of new nodes in the object store."""
+    config = get_config()
+    profile = config.current_profile
+    config.set_option('repository.backend', 'objectstore', scope=profile.name)
+
+    try:
+        yield
+    finally:
+        config.unset_option('repository.backend', scope=profile.name)
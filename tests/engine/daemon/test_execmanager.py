@@ -8,6 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for the :mod:`aiida.engine.daemon.execmanager` module."""
+import collections
 import os
 import pytest
 
@@ -43,7 +44,9 @@ def test_retrieve_files_from_list(tmp_path_factory, generate_calculation_node):
 
     with LocalTransport() as transport:
         transport.chdir(str(source))
-        execmanager.retrieve_files_from_list(node, transport, str(target), retrieve_list)
+        num_bytes = execmanager.retrieve_files_from_list(node, transport, str(target), retrieve_list)
+
+    assert num_bytes == len(content_a) + len(content_b)
 
     assert sorted(os.listdir(str(target))) == sorted(['file_a.txt', 'sub'])
     assert os.listdir(str(target / 'sub')) == ['folder']
@@ -54,3 +57,68 @@ def test_retrieve_files_from_list(tmp_path_factory, generate_calculation_node):
 
     with open(str(target / 'file_a.txt'), 'rb') as handle:
         assert handle.read() == content_a
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_retrieve_files_from_list_nested(tmp_path_factory, generate_calculation_node):
+    """Test the `retrieve_files_from_list` function for entries whose destinations are nested in each other."""
+    node = generate_calculation_node()
+
+    retrieve_list = [
+        'sub',
+        ('sub/*.txt', 'sub', 1),
+        ('sub/folder/file_b.txt', 'sub/folder/file_b.txt', 0),
+    ]
+
+    source = tmp_path_factory.mktemp('source')
+    target = tmp_path_factory.mktemp('target')
+
+    content_b = b'content_b'
+    content_c = b'content_c'
+
+    os.makedirs(str(source / 'sub' / 'folder'))
+
+    with open(str(source / 'sub' / 'folder' / 'file_b.txt'), 'wb') as handle:
+        handle.write(content_b)
+
+    with open(str(source / 'sub' / 'file_c.txt'), 'wb') as handle:
+        handle.write(content_c)
+
+    with LocalTransport() as transport:
+        transport.chdir(str(source))
+        num_bytes = execmanager.retrieve_files_from_list(node, transport, str(target), retrieve_list)
+
+    assert num_bytes == len(content_b) + len(content_c)
+
+    assert os.listdir(str(target)) == ['sub']
+    assert sorted(os.listdir(str(target / 'sub'))) == ['file_c.txt', 'folder']
+    assert os.listdir(str(target / 'sub' / 'folder')) == ['file_b.txt']
+
+    with open(str(target / 'sub' / 'folder' / 'file_b.txt'), 'rb') as handle:
+        assert handle.read() == content_b
+
+    with open(str(target / 'sub' / 'file_c.txt'), 'rb') as handle:
+        assert handle.read() == content_c
+
+
+def test_group_overlapping_transfers():
+    """Test that transfers with overlapping destinations are grouped in consecutive batches in the listed order."""
+    # pylint: disable=protected-access
+    transfers = collections.OrderedDict([
+        ('/target/sub', 'sub'),
+        ('/target/sub/folder', 'sub/folder'),
+        ('/target/other', 'other'),
+        ('/target/sub/folder/file', 'sub/folder/file'),
+        ('/target/sub/file', 'sub/file'),
+        ('/target', '.'),
+    ])
+
+    batches, outermost = execmanager._group_overlapping_transfers(transfers)
+
+    assert batches == [
+        [('sub', '/target/sub'), ('other', '/target/other')],
+        [('sub/folder', '/target/sub/folder'), ('sub/file', '/target/sub/file')],
+        [('sub/folder/file', '/target/sub/folder/file')],
+        [('.', '/target')],
+    ]
+    assert outermost == ['/target']
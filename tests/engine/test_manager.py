@@ -9,14 +9,16 @@
 ###########################################################################
 """Tests for the classes in `aiida.engine.processes.calcjobs.manager`."""
 
+import tempfile
 import time
 
 import tornado
 
 from aiida.orm import AuthInfo, User
 from aiida.backends.testbase import AiidaTestCase
-from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
+from aiida.engine.processes.calcjobs.manager import JobManager, JobsList, JobsSnapshot, SharedJobsCache
 from aiida.engine.transports import TransportQueue
+from aiida.schedulers.datastructures import JobInfo, JobState
 
 
 class TestJobManager(AiidaTestCase):
@@ -76,3 +78,65 @@ class TestJobsList(AiidaTestCase):
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         self.assertEqual(jobs_list.last_updated, last_updated)
+
+    def test_shared_jobs_cache(self):
+        """Test that the job states polled by another runner are used to resolve the requests made before the poll."""
+        with tempfile.TemporaryDirectory() as dirpath:
+            cache = SharedJobsCache(dirpath, runner_id='this')
+            jobs_list = JobsList(self.auth_info, self.transport_queue, shared_jobs_cache=cache)
+
+            with jobs_list.request_job_info_update('1') as request_covered, \
+                    jobs_list.request_job_info_update('2') as request_uncovered:
+
+                self.assertEqual(SharedJobsCache(dirpath).get_requested_job_ids(self.auth_info.pk), set())
+
+                job_info = JobInfo()
+                job_info.job_id = '1'
+                job_info.job_state = JobState.RUNNING
+
+                # The other runner only queried job `1`, so the absence of job `2` does not mean it is done
+                snapshot = JobsSnapshot(time.time(), {'1'}, {'1': job_info})
+                SharedJobsCache(dirpath, runner_id='other').set_snapshot(self.auth_info.pk, snapshot)
+
+                self.loop.run_sync(jobs_list._update_job_info)  # pylint: disable=protected-access
+
+                self.assertTrue(request_covered.done())
+                self.assertEqual(request_covered.result().job_state, JobState.RUNNING)
+                self.assertFalse(request_uncovered.done())
+                self.assertEqual(jobs_list.last_updated, snapshot.timestamp)
+
+                # The outstanding request is published, such that the runner that polls next includes it
+                self.assertEqual(cache.get_requested_job_ids(self.auth_info.pk), {'2'})
+
+
+def test_shared_jobs_cache_lock(tmp_path):
+    """Test that only one runner at a time can take the lock of an authinfo."""
+    cache = SharedJobsCache(str(tmp_path), runner_id='this')
+    other = SharedJobsCache(str(tmp_path), runner_id='other')
+
+    with cache.lock(1) as locked:
+        assert locked
+
+        with other.lock(1) as other_locked:
+            assert not other_locked
+
+        with other.lock(2) as other_locked:
+            assert other_locked
+
+    with other.lock(1) as other_locked:
+        assert other_locked
+
+
+def test_shared_jobs_cache_requests(tmp_path):
+    """Test that the requested job ids of all runners are combined and that removed requests are dropped."""
+    cache = SharedJobsCache(str(tmp_path), runner_id='this')
+    other = SharedJobsCache(str(tmp_path), runner_id='other')
+
+    cache.set_requested_job_ids(1, ['1', '2'])
+    other.set_requested_job_ids(1, ['2', '3'])
+    other.set_requested_job_ids(2, ['4'])
+    assert cache.get_requested_job_ids(1) == {'1', '2', '3'}
+
+    cache.set_requested_job_ids(1, [])
+    assert other.get_requested_job_ids(1) == {'2', '3'}
+    assert cache.get_snapshot(1) is None
@@ -65,3 +65,98 @@ class TestAiiDAPersister(AiidaTestCase):
 
         self.persister.delete_checkpoint(process.pid)
         self.assertEqual(process.node.checkpoint, None)
+
+    def test_checkpoint_object_store(self):
+        """Test that the checkpoint is written to the object store and deleted from it with the checkpoint."""
+        from aiida.manage.manager import get_manager
+
+        process = DummyProcess()
+        node = process.node
+        object_store = get_manager().get_object_store()
+
+        self.persister.save_checkpoint(process)
+        hashkey = node.get_attribute(node.CHECKPOINT_OBJECT_KEY)
+
+        self.assertNotIn(node.CHECKPOINT_KEY, node.attributes)
+        self.assertTrue(object_store.has_object(hashkey))
+
+        # Saving an unchanged checkpoint should not write anything
+        mtime = node.mtime
+        self.persister.save_checkpoint(process)
+        self.assertEqual(node.get_attribute(node.CHECKPOINT_OBJECT_KEY), hashkey)
+        self.assertEqual(node.mtime, mtime)
+
+        self.persister.delete_checkpoint(process.pid)
+        self.assertNotIn(node.CHECKPOINT_OBJECT_KEY, node.attributes)
+        self.assertFalse(object_store.has_object(hashkey))
+
+    def test_checkpoint_write_failure(self):
+        """Test that the previous checkpoint is kept if writing the new one to the database fails.
+
+        The object of the previous checkpoint should only be released once the hash key of the new one is written, which
+        within a batch of attribute updates is when the outermost batch exits.
+        """
+        import zlib
+        from unittest.mock import patch
+        from aiida.manage.manager import get_manager
+        from aiida.orm import Node, QueryBuilder
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess()
+        node = process.node
+        object_store = get_manager().get_object_store()
+
+        bundle_saved = self.persister.save_checkpoint(process)
+        hashkey = node.get_attribute(node.CHECKPOINT_OBJECT_KEY)
+
+        backend_class = type(node.backend_entity)
+        with patch.object(backend_class, '_write_attribute_updates', side_effect=RuntimeError('database failure')):
+            with self.assertRaises(RuntimeError):
+                with node.batch_attribute_updates():
+                    node.set_checkpoint('{}')
+                    self.assertTrue(object_store.has_object(hashkey))
+
+        self.assertTrue(object_store.has_object(hashkey))
+
+        # The database should still reference the object of the previous checkpoint
+        builder = QueryBuilder().append(Node, filters={'id': node.pk}, project=['attributes.checkpoint_object'])
+        self.assertEqual(builder.one()[0], hashkey)
+        content = zlib.decompress(object_store.get_object_content(hashkey)).decode('utf-8')
+        self.assertDictEqual(bundle_saved, serialize.deserialize(content))
+
+    def test_checkpoint_shared_object(self):
+        """Test that an object shared by identical checkpoints is only deleted once no checkpoint references it."""
+        from aiida.manage.manager import get_manager
+
+        node_one = DummyProcess().node
+        node_two = DummyProcess().node
+        object_store = get_manager().get_object_store()
+
+        node_one.set_checkpoint('{}')
+        node_two.set_checkpoint('{}')
+        hashkey = node_one.get_attribute(node_one.CHECKPOINT_OBJECT_KEY)
+        self.assertEqual(node_two.get_attribute(node_two.CHECKPOINT_OBJECT_KEY), hashkey)
+
+        node_one.delete_checkpoint()
+        self.assertTrue(object_store.has_object(hashkey))
+        self.assertEqual(node_two.checkpoint, '{}')
+
+        node_two.delete_checkpoint()
+        self.assertFalse(object_store.has_object(hashkey))
+
+    def test_load_checkpoint_attribute(self):
+        """Test that a checkpoint that is stored in the attributes of the node can still be loaded."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess()
+        bundle_saved = self.persister.save_checkpoint(process)
+
+        process.node.delete_checkpoint()
+        process.node.set_attribute(process.node.CHECKPOINT_KEY, serialize.serialize(bundle_saved))
+
+        self.assertDictEqual(bundle_saved, self.persister.load_checkpoint(process.node.pk))
+
+        # Saving the checkpoint again should move it to the object store
+        self.persister.save_checkpoint(process)
+        self.assertNotIn(process.node.CHECKPOINT_KEY, process.node.attributes)
+        self.assertDictEqual(bundle_saved, self.persister.load_checkpoint(process.node.pk))
@@ -9,14 +9,17 @@
 ###########################################################################
 # pylint: disable=redefined-outer-name
 """Module to test process runners."""
+import functools
 import threading
+from unittest import mock
 
 import plumpy
 import pytest
 
+from aiida.common import exceptions
 from aiida.engine import Process
 from aiida.manage.manager import get_manager
-from aiida.orm import WorkflowNode
+from aiida.orm import Data, WorkflowNode
 
 
 @pytest.fixture
@@ -68,3 +71,86 @@ def test_call_on_process_finish(create_runner):
 
     assert not future.exc_info()
     assert future.result()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_call_on_processes_finish_not_existent(create_runner):
+    """Test that awaiting a pk that is not that of an existing process raises instead of waiting indefinitely."""
+    runner = create_runner()
+    process = WorkflowNode().store()
+    data = Data().store()
+
+    with pytest.raises(exceptions.NotExistent):
+        runner.call_on_processes_finish([(process.pk, lambda: None), (data.pk, lambda: None)])
+
+    runner.close()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_call_on_processes_finish_subject(create_runner):
+    """Test that only broadcasts of a state change to a terminated state call the callback of the process."""
+    runner = create_runner()
+    node = WorkflowNode().store()
+    called = []
+    subscribers = {}
+
+    with mock.patch.object(runner.communicator, 'add_broadcast_subscriber', side_effect=subscribers.__setitem__):
+        with mock.patch.object(runner, '_poll_process'):
+            runner.call_on_processes_finish([(node.pk, functools.partial(called.append, node.pk))])
+
+    (subscriber,) = subscribers.keys()
+
+    for subject in ['finished', 'progress.running.finished', 'state_changed.running.waiting']:
+        subscriber(runner.communicator, None, node.pk, subject, None)
+    assert called == []
+
+    with mock.patch.object(runner.communicator, 'remove_broadcast_subscriber'):
+        subscriber(runner.communicator, None, node.pk, 'state_changed.running.finished', None)
+    assert called == [node.pk]
+
+    runner.close()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_poll_processes(create_runner):
+    """Test that the backup polling mechanism checks all awaited processes together and only calls back once."""
+    # pylint: disable=protected-access
+    runner = create_runner(poll_interval=0.1)
+    nodes = [WorkflowNode().store() for _ in range(3)]
+    nodes[0].set_process_state(plumpy.ProcessState.FINISHED)
+    nodes[1].set_process_state(plumpy.ProcessState.KILLED)
+    called = []
+
+    for node in nodes:
+        runner._poll_process(node.pk, functools.partial(called.append, node.pk))
+
+    runner.loop.call_later(1, the_hans_klok_comeback, runner.loop)
+    runner.loop.start()
+
+    assert sorted(called) == sorted([nodes[0].pk, nodes[1].pk])
+    assert list(runner._polled_processes) == [nodes[2].pk]
+    runner.close()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_submit_many(create_runner):
+    """Test that `submit_many` submits a process for each of the inputs and that they can be awaited together."""
+    runner = create_runner()
+    nodes = runner.submit_many(Proc, [{}, {}, {}])
+    finished = []
+
+    assert len(nodes) == 3
+    assert all(node.is_stored for node in nodes)
+
+    def process_done(pk):
+        finished.append(pk)
+        if len(finished) == len(nodes):
+            runner.loop.stop()
+
+    runner.call_on_processes_finish([(node.pk, functools.partial(process_done, node.pk)) for node in nodes])
+    runner.loop.call_later(5, the_hans_klok_comeback, runner.loop)
+    runner.loop.start()
+
+    assert sorted(finished) == sorted(node.pk for node in nodes)
+    assert all(node.is_finished_ok for node in nodes)
+    runner.close()
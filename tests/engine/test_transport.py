@@ -8,6 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Module to test transport."""
+from tornado import gen
 from tornado.gen import coroutine, Return
 
 from aiida.backends.testbase import AiidaTestCase
@@ -139,3 +140,52 @@ class TestTransportQueue(AiidaTestCase):
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval  # pylint: disable=protected-access
+
+    def test_keep_alive(self):
+        """Test that with a keep alive time an idle transport is reused by later requests and closed afterwards."""
+        queue = TransportQueue(keep_alive=0.25)
+        loop = queue.loop()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+            raise Return(trans)
+
+        trans1 = loop.run_sync(lambda: test())  # pylint: disable=unnecessary-lambda
+        self.assertTrue(trans1.is_open)
+
+        trans2 = loop.run_sync(lambda: test())  # pylint: disable=unnecessary-lambda
+        self.assertIs(trans1, trans2)
+        self.assertTrue(trans2.is_open)
+
+        loop.run_sync(lambda: gen.sleep(0.5))
+        self.assertFalse(trans2.is_open)
+
+        metrics = queue.get_metrics()
+        self.assertEqual(metrics['requests'], 2)
+        self.assertEqual(metrics['opened'], 1)
+        self.assertEqual(metrics['reused'], 1)
+        self.assertEqual(metrics['closed'], 1)
+
+    def test_keep_alive_close(self):
+        """Test that closing the queue closes idle transports and that a closed transport is not reused."""
+        queue = TransportQueue(keep_alive=60)
+        loop = queue.loop()
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+            raise Return(trans)
+
+        trans1 = loop.run_sync(lambda: test())  # pylint: disable=unnecessary-lambda
+        trans1.close()
+
+        trans2 = loop.run_sync(lambda: test())  # pylint: disable=unnecessary-lambda
+        self.assertIsNot(trans1, trans2)
+        self.assertTrue(trans2.is_open)
+
+        queue.close()
+        self.assertFalse(trans2.is_open)
+        self.assertEqual(queue.get_metrics()['opened'], 2)
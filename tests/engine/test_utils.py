@@ -10,12 +10,13 @@
 # pylint: disable=global-statement
 """Test engine utilities such as the exponential backoff mechanism."""
 from tornado.ioloop import IOLoop
-from tornado.gen import coroutine
+from tornado.gen import coroutine, sleep
 
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.engine import calcfunction, workfunction
 from aiida.engine.utils import exponential_backoff_retry, is_process_function
+from aiida.engine.utils import ProcessStateChangeRecorder, get_process_state_change_timestamp
 
 ITERATION = 0
 MAX_ITERATIONS = 3
@@ -84,3 +85,40 @@ class TestExponentialBackoffRetry(AiidaTestCase):
         self.assertEqual(is_process_function(normal_function), False)
         self.assertEqual(is_process_function(calc_function), True)
         self.assertEqual(is_process_function(work_function), True)
+
+
+class TestProcessStateChangeRecorder(AiidaTestCase):
+    """Tests for the :class:`aiida.engine.utils.ProcessStateChangeRecorder`."""
+
+    def test_record(self):
+        """Test that without loop every timestamp is written immediately."""
+        recorder = ProcessStateChangeRecorder()
+
+        recorder.record('work')
+        timestamp = get_process_state_change_timestamp('work')
+        self.assertIsNotNone(timestamp)
+
+        recorder.record('work')
+        self.assertGreater(get_process_state_change_timestamp('work'), timestamp)
+
+    def test_record_interval(self):
+        """Test that with an interval the timestamps are written with a limited rate but eventually."""
+        loop = IOLoop()
+        recorder = ProcessStateChangeRecorder(loop, interval=0.5)
+
+        # The first timestamp is written immediately, the next only after the interval
+        recorder.record('calculation')
+        timestamp = get_process_state_change_timestamp('calculation')
+        recorder.record('calculation')
+        self.assertEqual(get_process_state_change_timestamp('calculation'), timestamp)
+
+        loop.run_sync(lambda: sleep(1))
+        self.assertGreater(get_process_state_change_timestamp('calculation'), timestamp)
+
+        # Flushing writes pending timestamps at once
+        timestamp = get_process_state_change_timestamp('calculation')
+        recorder.record('calculation')
+        self.assertEqual(get_process_state_change_timestamp('calculation'), timestamp)
+        recorder.flush()
+        self.assertGreater(get_process_state_change_timestamp('calculation'), timestamp)
+        loop.close()
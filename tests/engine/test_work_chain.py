@@ -21,7 +21,7 @@ from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
 from aiida.common.links import LinkType
 from aiida.common.utils import Capturing
-from aiida.engine import ExitCode, Process, ToContext, WorkChain, if_, while_, return_, launch, calcfunction
+from aiida.engine import ExitCode, Process, ToContext, WorkChain, if_, while_, return_, launch, calcfunction, append_
 from aiida.engine.persistence import ObjectLoader
 from aiida.manage.manager import get_manager
 from aiida.orm import load_node, Bool, Float, Int, Str
@@ -769,6 +769,43 @@ class TestWorkchain(AiidaTestCase):
 
         run_and_check_success(Workchain)
 
+    def test_submit_many(self):
+        """Test that the processes submitted with `submit_many` can be awaited through the context."""
+        test_case = self
+
+        class SimpleWc(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.input('value', valid_type=Int)
+                spec.outline(cls.result)
+                spec.outputs.dynamic = True
+
+            def result(self):
+                self.out('result', self.inputs.value)
+
+        class Workchain(WorkChain):
+
+            @classmethod
+            def define(cls, spec):
+                super().define(spec)
+                spec.outline(cls.begin, cls.result)
+
+            def begin(self):
+                values = [Int(value).store() for value in range(5)]
+                nodes = self.submit_many(SimpleWc, [{'value': value} for value in values])
+                test_case.assertTrue(all(node.is_stored for node in nodes))
+
+                for node in nodes:
+                    self.to_context(children=append_(node))
+
+            def result(self):
+                values = [child.outputs.result.value for child in self.ctx.children]
+                test_case.assertEqual(sorted(values), list(range(5)))
+
+        run_and_check_success(Workchain)
+
     def test_namespace_nondb_mapping(self):
         """
         Regression test for a bug in _flatten_inputs
@@ -523,6 +523,72 @@ class TestBackendNode(AiidaTestCase):
         rereloaded = self.backend.nodes.get(node.pk)
         self.assertIn('extra_three', rereloaded.extras.keys())
 
+    def get_stored_attributes(self, node):
+        """Return the attributes of the node as they are stored in the database."""
+        from aiida.orm import Node, QueryBuilder
+        return QueryBuilder().append(Node, filters={'id': node.pk}, project='attributes').first()[0]
+
+    def test_batch_attribute_updates(self):
+        """Test that changes to the attributes within `batch_attribute_updates` are only written when it exits."""
+        node = self.create_node().store()
+        node.set_attribute_many({'attribute_one': 1, 'attribute_two': 2, 'attribute_three': 3})
+
+        with node.batch_attribute_updates():
+            node.set_attribute('attribute_one', 'one')
+            node.set_attribute('attribute_four', 4)
+            node.delete_attribute('attribute_two')
+            node.set_attribute('attribute_two', 'two')
+            node.delete_attribute('attribute_three')
+
+            with node.batch_attribute_updates():
+                node.set_attribute('attribute_five', 5)
+
+            # The changes are visible in memory but are not yet written to the database
+            self.assertEqual(
+                node.attributes, {
+                    'attribute_one': 'one',
+                    'attribute_two': 'two',
+                    'attribute_four': 4,
+                    'attribute_five': 5
+                }
+            )
+            self.assertEqual(
+                self.get_stored_attributes(node), {
+                    'attribute_one': 1,
+                    'attribute_two': 2,
+                    'attribute_three': 3
+                }
+            )
+
+        expected = {'attribute_one': 'one', 'attribute_two': 'two', 'attribute_four': 4, 'attribute_five': 5}
+        self.assertEqual(node.attributes, expected)
+        self.assertEqual(self.get_stored_attributes(node), expected)
+        self.assertEqual(self.backend.nodes.get(node.pk).attributes, expected)
+
+    def test_batch_attribute_updates_unstored(self):
+        """Test that `batch_attribute_updates` has no effect on an unstored node."""
+        node = self.create_node()
+
+        with node.batch_attribute_updates():
+            node.set_attribute('attribute_one', 1)
+
+        self.assertEqual(node.attributes, {'attribute_one': 1})
+        node.store()
+        self.assertEqual(self.get_stored_attributes(node), {'attribute_one': 1})
+
+    def test_attribute_update_partial(self):
+        """Test that changing an attribute of a stored node does not overwrite other attributes in the database."""
+        node = self.create_node().store()
+        node.set_attribute_many({'attribute_one': 1, 'attribute_two': 2})
+
+        # Change another attribute through another instance, which the original instance will not know about
+        reloaded = self.backend.nodes.get(node.pk)
+        reloaded.set_attribute('attribute_three', 3)
+
+        node.set_attribute('attribute_one', 'one')
+        node.delete_attribute('attribute_two')
+        self.assertEqual(self.get_stored_attributes(node), {'attribute_one': 'one', 'attribute_three': 3})
+
     def test_extras(self):
         """Test the `BackendNode.extras` property."""
         node = self.create_node()
@@ -770,3 +836,16 @@ class TestBackendNode(AiidaTestCase):
         # Reload the node yet again and verify that the `attribute_three` attribute is still there
         rereloaded = self.backend.nodes.get(node.pk)
         self.assertIn('attribute_three', rereloaded.attributes.keys())
+
+    def test_bulk_set_extra(self):
+        """Test setting an extra to a different value for multiple nodes at once."""
+        node_one = self.create_node().store()
+        node_two = self.create_node().store()
+        node_two.set_extra('existing', True)
+        node_unaffected = self.create_node().store()
+
+        self.backend.nodes.bulk_set_extra('key', {node_one.pk: 'one', node_two.pk: None})
+
+        self.assertEqual(self.backend.nodes.get(node_one.pk).extras, {'key': 'one'})
+        self.assertEqual(self.backend.nodes.get(node_two.pk).extras, {'existing': True, 'key': None})
+        self.assertEqual(self.backend.nodes.get(node_unaffected.pk).extras, {})
@@ -9,6 +9,7 @@
 ###########################################################################
 # pylint: disable=too-many-public-methods
 """Tests for the Node ORM class."""
+import io
 import os
 import tempfile
 
@@ -16,7 +17,7 @@ import pytest
 
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions, LinkType
-from aiida.orm import Data, Log, Node, User, CalculationNode, WorkflowNode, load_node
+from aiida.orm import Data, Log, Node, User, CalculationNode, WorkflowNode, load_node, store_many
 from aiida.orm.utils.links import LinkTriple
 
 
@@ -828,3 +829,86 @@ def test_store_from_cache():
     assert clone.is_stored
     assert clone.get_cache_source() == data.uuid
     assert data.get_hash() == clone.get_hash()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_store_many():
+    """Test storing multiple nodes and the links between them in bulk."""
+    stored = Data().store()
+
+    calculation = CalculationNode()
+    calculation.add_incoming(stored, LinkType.INPUT_CALC, 'input')
+
+    outputs = []
+    for index in range(3):
+        output = Data()
+        output.set_attribute('index', index)
+        output.put_object_from_filelike(io.StringIO('content {}'.format(index)), 'file.txt')
+        output.add_incoming(calculation, LinkType.CREATE, 'output_{}'.format(index))
+        outputs.append(output)
+
+    assert store_many([stored, calculation] + outputs) == [stored, calculation] + outputs
+
+    for index, output in enumerate(outputs):
+        assert output.is_stored
+        loaded = load_node(output.pk)
+        assert loaded.uuid == output.uuid
+        assert loaded.get_attribute('index') == index
+        assert loaded.get_object_content('file.txt') == 'content {}'.format(index)
+        assert loaded.get_extra('_aiida_hash') == loaded.get_hash()
+        assert loaded.get_incoming().one().node.pk == calculation.pk
+
+    assert load_node(calculation.pk).get_incoming().one().node.pk == stored.pk
+    assert {entry.link_label for entry in calculation.get_outgoing().all()} == {'output_0', 'output_1', 'output_2'}
+
+    # Stored nodes can still be modified where allowed
+    outputs[0].set_extra('key', 'value')
+    assert load_node(outputs[0].pk).get_extra('key') == 'value'
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_store_many_hash():
+    """Test that bulk storing unstored nodes sets the hash extra to the hash of each node."""
+    nodes = []
+    for index in range(3):
+        node = Data()
+        node.set_attribute('index', index)
+        nodes.append(node)
+
+    store_many(nodes)
+
+    for node in nodes:
+        assert node.is_stored
+        assert node.get_extra('_aiida_hash') == node._get_hash()  # pylint: disable=protected-access
+        assert load_node(node.pk).get_extra('_aiida_hash') == node._get_hash()  # pylint: disable=protected-access
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_store_many_hash_pending_input():
+    """Test that the hash of a process node is computed when its input is stored in the same call.
+
+    The hash of a process node includes the hashes of its inputs, so it can only be computed once they are stored.
+    """
+    data = Data()
+    data.set_attribute('key', 'value')
+    calculation = CalculationNode()
+    calculation.add_incoming(data, LinkType.INPUT_CALC, 'input')
+
+    store_many([data, calculation])
+
+    assert calculation.get_hash() is not None
+    assert load_node(calculation.pk).get_extra('_aiida_hash') == calculation.get_hash()
+    assert load_node(data.pk).get_extra('_aiida_hash') == data.get_hash()
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_store_many_unstored_parent():
+    """Test that bulk storing raises if the source of a link is neither stored nor precedes the target."""
+    calculation = CalculationNode()
+    output = Data()
+    output.add_incoming(calculation, LinkType.CREATE, 'output')
+
+    with pytest.raises(exceptions.ModificationNotAllowed):
+        store_many([output, calculation])
+
+    assert not output.is_stored
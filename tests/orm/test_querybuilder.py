@@ -868,6 +868,54 @@ class TestAttributes(AiidaTestCase):
             res = [str(_) for _, in qb.all()]
             self.assertEqual(set(res), set((n_arr.uuid,)))
 
+    def test_attribute_string_equality_negation(self):
+        """Negating an equality filter on a string should also match nodes with a different type or without the key."""
+        key = 'value_test_attr_negation'
+        n_str, n_str2, n_int, n_none = [orm.Data() for _ in range(4)]
+        n_str.set_attribute(key, '1')
+        n_str2.set_attribute(key, 'one')
+        n_int.set_attribute(key, 1)
+
+        nodes = (n_str, n_str2, n_int, n_none)
+        for node in nodes:
+            node.store()
+
+        filters = {'id': {'in': [node.pk for node in nodes]}, 'attributes.{}'.format(key): {'!==': '1'}}
+        qb = orm.QueryBuilder().append(orm.Node, filters=filters, project='uuid')
+        res = [str(_) for _, in qb.all()]
+        self.assertEqual(set(res), set((n_str2.uuid, n_int.uuid, n_none.uuid)))
+
+    def test_attribute_string_in_and_boolean_negation(self):
+        """Negating `in` on strings and equality on booleans should also match other types or a missing key."""
+        key = 'value_test_attr_in_negation'
+        n_str, n_str2, n_true, n_false, n_none = [orm.Data() for _ in range(5)]
+        n_str.set_attribute(key, 'true')
+        n_str2.set_attribute(key, 'waiting')
+        n_true.set_attribute(key, True)
+        n_false.set_attribute(key, False)
+
+        nodes = (n_str, n_str2, n_true, n_false, n_none)
+        for node in nodes:
+            node.store()
+
+        pks = {'in': [node.pk for node in nodes]}
+
+        filters = {'id': pks, 'attributes.{}'.format(key): {'in': ['running', 'waiting']}}
+        qb = orm.QueryBuilder().append(orm.Node, filters=filters, project='uuid')
+        self.assertEqual(set(str(_) for _, in qb.all()), set((n_str2.uuid,)))
+
+        filters = {'id': pks, 'attributes.{}'.format(key): {'!in': ['running', 'waiting']}}
+        qb = orm.QueryBuilder().append(orm.Node, filters=filters, project='uuid')
+        self.assertEqual(set(str(_) for _, in qb.all()), set((n_str.uuid, n_true.uuid, n_false.uuid, n_none.uuid)))
+
+        filters = {'id': pks, 'attributes.{}'.format(key): True}
+        qb = orm.QueryBuilder().append(orm.Node, filters=filters, project='uuid')
+        self.assertEqual(set(str(_) for _, in qb.all()), set((n_true.uuid,)))
+
+        filters = {'id': pks, 'attributes.{}'.format(key): {'!==': True}}
+        qb = orm.QueryBuilder().append(orm.Node, filters=filters, project='uuid')
+        self.assertEqual(set(str(_) for _, in qb.all()), set((n_str.uuid, n_str2.uuid, n_false.uuid, n_none.uuid)))
+
 
 class QueryBuilderLimitOffsetsTest(AiidaTestCase):
 
@@ -1293,6 +1341,75 @@ class QueryBuilderPath(AiidaTestCase):
         # qb.add_filter('edge', {'depth': 5})
         # self.assertTrue(set(next(zip(*qb.all()))), set([5]))
 
+    def test_query_path_traversal(self):
+        """Test the traversal options of recursive joins on a graph where the calculations share their input."""
+        from aiida.common.exceptions import InputValidationError
+
+        # The data node `source` is the input of `width` calculations, whose outputs are all inputs of a last
+        # calculation that creates `target`, so there are `width` paths from `source` to `target`
+        width = 4
+        source = orm.Data().store()
+        last = orm.CalculationNode()
+        calculations = []
+        intermediates = []
+
+        for index in range(width):
+            calculation = orm.CalculationNode()
+            calculation.add_incoming(source, link_type=LinkType.INPUT_CALC, link_label='source')
+            calculation.store()
+            intermediate = orm.Data()
+            intermediate.add_incoming(calculation, link_type=LinkType.CREATE, link_label='result')
+            intermediate.store()
+            last.add_incoming(intermediate, link_type=LinkType.INPUT_CALC, link_label='input_{}'.format(index))
+            calculations.append(calculation)
+            intermediates.append(intermediate)
+
+        last.store()
+        target = orm.Data()
+        target.add_incoming(last, link_type=LinkType.CREATE, link_label='result')
+        target.store()
+
+        def get_builder(traversal=None, **kwargs):
+            builder = orm.QueryBuilder().append(orm.Node, filters={'id': source.pk}, tag='source')
+            return builder.append(orm.Node, with_ancestors='source', traversal=traversal, **kwargs)
+
+        self.assertEqual(get_builder(filters={'id': target.pk}).count(), width)
+        self.assertEqual(get_builder({'distinct': True}, filters={'id': target.pk}).count(), 1)
+        self.assertEqual(get_builder({'distinct': True}).count(), 2 * width + 2)
+
+        # The minimal depth of every descendant
+        builder = get_builder({'distinct': True}, project='id', edge_project='depth')
+        depths = dict(builder.all())
+        self.assertEqual(depths[target.pk], 3)
+        self.assertEqual({depths[node.pk] for node in intermediates}, {1})
+
+        # The maximal depth is applied while traversing and gives the same result as filtering the depth
+        builder = get_builder({'max_depth': 1}, project='id')
+        self.assertEqual({pk for pk, in builder.all()}, {node.pk for node in calculations + intermediates})
+        self.assertEqual(get_builder({'max_depth': 1}).count(), get_builder(edge_filters={'depth': {'<=': 1}}).count())
+
+        # Only follow the input links, so only the direct descendants are found
+        self.assertEqual(get_builder({'distinct': True, 'link_types': [LinkType.INPUT_CALC]}).count(), width)
+
+        # The same options apply to ancestors
+        builder = orm.QueryBuilder().append(orm.Node, filters={'id': target.pk}, tag='target')
+        builder.append(orm.Node, with_descendants='target', filters={'id': source.pk}, traversal={'distinct': True})
+        self.assertEqual(builder.count(), 1)
+
+        # The traversal options survive a round trip through the queryhelp
+        builder = get_builder({'distinct': True}, filters={'id': target.pk})
+        self.assertEqual(orm.QueryBuilder(**builder.queryhelp).count(), 1)
+
+        with self.assertRaises(InputValidationError):
+            get_builder({'distinct': True}, edge_project='path').count()
+
+        for traversal in [{'invalid': True}, {'max_depth': -1}, {'distinct': 'yes'}, {'link_types': ['invalid']}]:
+            with self.assertRaises(InputValidationError):
+                get_builder(traversal)
+
+        with self.assertRaises(InputValidationError):
+            orm.QueryBuilder().append(orm.Node, tag='source').append(orm.Node, traversal={'distinct': True})
+
 
 class TestConsistency(AiidaTestCase):
 
@@ -1339,6 +1456,7 @@ class TestManager(AiidaTestCase):
 
         I try to implement it in a way that does not depend on the past state.
         """
+        import datetime
         from collections import defaultdict
 
         # pylint: disable=protected-access
@@ -1347,7 +1465,7 @@ class TestManager(AiidaTestCase):
             n.store()
             statistics['total'] += 1
             statistics['types'][n._plugin_type_string] += 1  # pylint: disable=no-member
-            statistics['ctime_by_day'][n.ctime.strftime('%Y-%m-%d')] += 1
+            statistics['ctime_by_day'][n.ctime.astimezone(datetime.timezone.utc).strftime('%Y-%m-%d')] += 1
 
         qmanager = self.backend.query_manager
         current_db_statistics = qmanager.get_creation_statistics()
@@ -1379,13 +1497,14 @@ class TestManager(AiidaTestCase):
 
         I try to implement it in a way that does not depend on the past state.
         """
+        import datetime
         from collections import defaultdict
 
         def store_and_add(n, statistics):
             n.store()
             statistics['total'] += 1
             statistics['types'][n._plugin_type_string] += 1  # pylint: disable=no-member,protected-access
-            statistics['ctime_by_day'][n.ctime.strftime('%Y-%m-%d')] += 1
+            statistics['ctime_by_day'][n.ctime.astimezone(datetime.timezone.utc).strftime('%Y-%m-%d')] += 1
 
         current_db_statistics = self.backend.query_manager.get_creation_statistics()
         types = defaultdict(int)
@@ -1410,6 +1529,78 @@ class TestManager(AiidaTestCase):
 
         self.assertEqual(new_db_statistics, expected_db_statistics)
 
+    def test_statistics_user_and_deletion(self):
+        """Test that the statistics can be restricted to a user and account for deleted and rebuilt nodes."""
+        from aiida.manage.database.delete.nodes import delete_nodes
+
+        qmanager = self.backend.query_manager
+        user = orm.User(email='statistics@aiida.net').store()
+
+        nodes = [orm.Data(user=user).store() for _ in range(3)]
+        statistics = qmanager.get_creation_statistics(user_pk=user.pk)
+        self.assertEqual(statistics['total'], 3)
+        self.assertEqual(statistics['types'], {nodes[0].node_type: 3})
+
+        delete_nodes([nodes[0].pk], force=True)
+        statistics = qmanager.get_creation_statistics(user_pk=user.pk)
+        self.assertEqual(statistics['total'], 2)
+        self.assertEqual(sum(statistics['ctime_by_day'].values()), 2)
+
+        total = qmanager.get_creation_statistics()['total']
+        self.assertEqual(total, orm.QueryBuilder().append(orm.Node).count())
+
+        qmanager.refresh_creation_statistics()
+        self.assertEqual(qmanager.get_creation_statistics()['total'], total)
+        self.assertEqual(qmanager.get_creation_statistics(user_pk=user.pk)['total'], 2)
+
+    def test_statistics_compaction(self):
+        """Test that reading the statistics does not write and that compacting them leaves them unchanged."""
+        from sqlalchemy import text
+
+        qmanager = self.backend.query_manager
+        session = self.backend.get_session()
+
+        def count_rows():
+            return session.execute(text('SELECT COUNT(*) FROM db_dbnodestatistics')).scalar()
+
+        qmanager.refresh_creation_statistics(rebuild=False)
+
+        for _ in range(3):
+            orm.Data().store()
+
+        rows = count_rows()
+        statistics = qmanager.get_creation_statistics()
+        self.assertEqual(count_rows(), rows)
+
+        qmanager.refresh_creation_statistics(rebuild=False)
+        self.assertEqual(qmanager.get_creation_statistics(), statistics)
+        self.assertLess(count_rows(), rows)
+
+    def test_statistics_compaction_on_read(self):
+        """Test that the statistics are compacted on read once enough rows accumulated since the last compaction."""
+        from unittest.mock import patch
+        from sqlalchemy import text
+
+        qmanager = self.backend.query_manager
+        session = self.backend.get_session()
+
+        def count_uncompacted_rows():
+            return session.execute(text('SELECT COUNT(*) FROM db_dbnodestatistics WHERE NOT compacted')).scalar()
+
+        qmanager.refresh_creation_statistics(rebuild=False)
+        statistics = qmanager.get_creation_statistics()
+
+        orm.Data().store()
+        with patch.object(qmanager, 'CREATION_STATISTICS_COMPACT_THRESHOLD', 2):
+            qmanager.get_creation_statistics()
+            self.assertEqual(count_uncompacted_rows(), 1)
+
+            orm.Data().store()
+            statistics_new = qmanager.get_creation_statistics()
+            self.assertEqual(count_uncompacted_rows(), 0)
+
+        self.assertEqual(statistics_new['total'], statistics['total'] + 2)
+
 
 class TestDoubleStar(AiidaTestCase):
     """
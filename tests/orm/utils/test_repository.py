@@ -9,12 +9,15 @@
 ###########################################################################
 """Tests for the `Repository` utility class."""
 
+import io
 import os
 import shutil
 import tempfile
 
+import pytest
+
 from aiida.backends.testbase import AiidaTestCase
-from aiida.orm import Node, Data
+from aiida.orm import Node, Data, load_node
 from aiida.orm.utils.repository import File, FileType
 from aiida.common.exceptions import ModificationNotAllowed
 
@@ -191,3 +194,50 @@ class TestRepository(AiidaTestCase):
         self.assertEqual(sorted(node.list_object_names('subdir')), ['a.txt', 'b.txt', 'nested'])
 
         self.assertRaises(ModificationNotAllowed, node._repository.erase)  # pylint: disable=protected-access
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'use_object_store')
+def test_store_object_store():
+    """Test that the content of a node stored with the object store is described by its repository metadata."""
+    node = Data()
+    node.put_object_from_filelike(io.StringIO('content'), 'file.txt')
+    node.put_object_from_filelike(io.StringIO('content'), os.path.join('subdir', 'copy.txt'))
+    node.store()
+
+    metadata = node.backend_entity.repository_metadata
+    assert sorted(metadata['path'].keys()) == ['file.txt', 'subdir']
+    assert metadata['path']['file.txt'] == metadata['path']['subdir']['copy.txt']
+
+    loaded = load_node(node.pk)
+    assert loaded.list_objects() == [File('file.txt', FileType.FILE), File('subdir', FileType.DIRECTORY)]
+    assert loaded.get_object(os.path.join('subdir', 'copy.txt')) == File('copy.txt', FileType.FILE)
+    assert loaded.get_object_content('file.txt') == 'content'
+    assert loaded.get_object_content('file.txt', mode='rb') == b'content'
+
+    with pytest.raises(ModificationNotAllowed):
+        loaded.put_object_from_filelike(io.StringIO('content'), 'other.txt')
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'use_object_store')
+def test_object_store_force_modification():
+    """Test that forced modifications of the repository of a stored node update its repository metadata."""
+    node = Data().store()
+    node.put_object_from_filelike(io.BytesIO(b'content'), 'file.txt', mode='wb', force=True)
+
+    assert load_node(node.pk).get_object_content('file.txt') == 'content'
+
+
+@pytest.mark.usefixtures('clear_database_before_test', 'use_object_store')
+def test_object_store_clone():
+    """Test that cloning a node whose content lives in the object store only copies the repository metadata."""
+    node = Data()
+    node.put_object_from_filelike(io.StringIO('content'), 'file.txt')
+    node.store()
+
+    clone = node.clone()
+    assert clone._repository.uses_object_store  # pylint: disable=protected-access
+    clone.store()
+
+    assert clone.backend_entity.repository_metadata == node.backend_entity.repository_metadata
+    assert clone.get_object_content('file.txt') == 'content'
+    assert clone.get_hash() == node.get_hash()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.repository.objectstore` module."""
+import hashlib
+import io
+
+import pytest
+
+from aiida.repository import ObjectStore
+
+
+@pytest.fixture
+def object_store(tmp_path):
+    """Return an object store in a temporary directory."""
+    return ObjectStore(str(tmp_path / 'container'))
+
+
+def test_add_object(object_store):
+    """Test that objects are keyed by the hash of their content and stored only once."""
+    content = b'some content'
+    hashkey = object_store.add_object(content)
+
+    assert hashkey == hashlib.sha256(content).hexdigest()
+    assert object_store.has_object(hashkey)
+    assert object_store.get_object_content(hashkey) == content
+
+    assert object_store.add_object_from_filelike(io.BytesIO(content)) == hashkey
+    assert object_store.count_objects() == {'loose': 1, 'packed': 0, 'pack_files': 0}
+
+
+def test_add_object_from_filelike_text(object_store):
+    """Test that text handles are encoded before being stored."""
+    hashkey = object_store.add_object_from_filelike(io.StringIO('some content'))
+    assert object_store.get_object_content(hashkey) == b'some content'
+
+
+def test_open_non_existent(object_store):
+    """Test that opening a non-existing object raises."""
+    with pytest.raises(FileNotFoundError):
+        object_store.open(hashlib.sha256(b'non-existent').hexdigest())
+
+
+def test_pack_loose_objects(object_store):
+    """Test that packed objects can still be read and that loose objects are removed."""
+    contents = [b'a', b'bb' * 100000, b'', b'ccc']
+    hashkeys = [object_store.add_object(content) for content in contents]
+
+    assert object_store.pack_loose_objects() == len(contents)
+    assert object_store.count_objects() == {'loose': 0, 'packed': len(contents), 'pack_files': 1}
+
+    for hashkey, content in zip(hashkeys, contents):
+        assert object_store.has_object(hashkey)
+        assert object_store.get_object_content(hashkey) == content
+
+    with object_store.open(hashkeys[1]) as handle:
+        handle.seek(199998)
+        assert handle.read() == b'bb'
+
+    # Adding an object that is already packed should not create a new loose object
+    object_store.add_object(contents[0])
+    assert object_store.count_objects()['loose'] == 0
+
+
+def test_delete_objects(object_store):
+    """Test deleting both loose and packed objects."""
+    hashkey_packed = object_store.add_object(b'packed')
+    object_store.pack_loose_objects()
+    hashkey_loose = object_store.add_object(b'loose')
+
+    object_store.delete_objects([hashkey_packed, hashkey_loose])
+
+    assert not object_store.has_object(hashkey_packed)
+    assert not object_store.has_object(hashkey_loose)
+
+
+def test_release_references(object_store):
+    """Test that a transient object is only deleted once all its references are released and is never packed."""
+    content = b'transient'
+    hasher = object_store.get_hash()
+    hasher.update(content)
+    hashkey = hasher.hexdigest()
+
+    object_store.add_reference(hashkey)
+    object_store.add_object(content)
+    object_store.add_reference(hashkey)
+    object_store.add_object(content)
+
+    object_store.pack_loose_objects()
+    assert object_store.count_objects()['loose'] == 1
+
+    assert object_store.release_references([hashkey]) == []
+    assert object_store.has_object(hashkey)
+
+    assert object_store.release_references([hashkey]) == [hashkey]
+    assert not object_store.has_object(hashkey)
+    assert object_store.count_objects()['loose'] == 0
+
+
+def test_get_object_digests(object_store):
+    """Test that digests are computed over the full content and persisted, such that they are only computed once."""
+    contents = [b'a', b'bb' * 100000]
+    hashkeys = [object_store.add_object(content) for content in contents]
+    constructed = []
+
+    def constructor():
+        constructed.append(True)
+        return hashlib.md5()
+
+    digests = object_store.get_object_digests(hashkeys, 'md5', constructor)
+    assert digests == {hashkey: hashlib.md5(content).digest() for hashkey, content in zip(hashkeys, contents)}
+    assert len(constructed) == 2
+
+    object_store.pack_loose_objects()
+    assert object_store.get_object_digests(hashkeys, 'md5', constructor) == digests
+    assert len(constructed) == 2
+
+    # Digests are persisted per algorithm
+    assert object_store.get_object_digests(hashkeys[:1], 'sha1', hashlib.sha1) == {
+        hashkeys[0]: hashlib.sha1(contents[0]).digest()
+    }
@@ -482,6 +482,87 @@ class RESTApiTestSuite(RESTApiTestCase):
             self, 'computers', '/computers/page/4?perpage=2&orderby=+id', expected_errormsg=expected_error
         )
 
+    def test_computers_list_cursor(self):
+        """
+        Follow the continuation tokens of the computers listing, which should
+        return all computers exactly once in the order of their id.
+        """
+        url = self.get_url_prefix() + '/computers?limit=2&cursor=start'
+        uuids = []
+
+        with self.app.test_client() as client:
+            while url is not None:
+                rv_response = client.get(url)
+                response = json.loads(rv_response.data)
+                uuids.extend([computer['uuid'] for computer in response['data']['computers']])
+                cursor = rv_response.headers.get('X-Next-Cursor')
+                url = None if cursor is None else self.get_url_prefix() + '/computers?limit=2&cursor=' + cursor
+
+        self.assertEqual(uuids, [computer['uuid'] for computer in self.get_dummy_data()['computers']])
+
+    def test_nodes_list_cursor_orderby(self):
+        """
+        Follow the links to the next results of the nodes listing when ordered
+        by descending creation time.
+        """
+        url = self.get_url_prefix() + '/nodes?limit=3&orderby=-ctime&cursor=start'
+        ids = []
+
+        with self.app.test_client() as client:
+            while url is not None:
+                rv_response = client.get(url)
+                response = json.loads(rv_response.data)
+                ids.extend([node['id'] for node in response['data']['nodes']])
+                link = rv_response.headers.get('Link')
+                url = None if link is None else link[link.index('<') + 1:link.index('>')]
+
+        builder = orm.QueryBuilder().append(orm.Node, tag='node', project='id')
+        builder.order_by({'node': [{'ctime': 'desc'}, {'id': 'asc'}]})
+        self.assertEqual(ids, [pk for pk, in builder.all()])
+
+    def test_computers_list_cursor_invalid(self):
+        """
+        An invalid continuation token or one created for a different ordering
+        should return an error message.
+        """
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers?cursor=cabc', expected_errormsg='invalid cursor cabc'
+        )
+
+        with self.app.test_client() as client:
+            rv_response = client.get(self.get_url_prefix() + '/computers?limit=1&cursor=start')
+            cursor = rv_response.headers['X-Next-Cursor']
+
+        expected_error = 'the cursor was created for a different ordering of the results'
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers?orderby=-name&cursor=' + cursor, expected_errormsg=expected_error
+        )
+
+    def test_computers_list_cursor_page(self):
+        """
+        Pages and continuation tokens cannot be combined.
+        """
+        expected_error = 'cursor key is incompatible with pages and offset'
+        RESTApiTestCase.process_test(
+            self, 'computers', '/computers/page/1?cursor=start', expected_errormsg=expected_error
+        )
+
+    def test_nodes_list_ndjson(self):
+        """
+        Stream the nodes as newline delimited JSON, which should contain one
+        line for each node, in the requested order.
+        """
+        with self.app.test_client() as client:
+            rv_response = client.get(self.get_url_prefix() + '/nodes?format=ndjson&orderby=-id&count=estimate')
+            lines = rv_response.data.decode('utf-8').splitlines()
+
+        self.assertEqual(rv_response.mimetype, 'application/x-ndjson')
+        self.assertIsInstance(int(rv_response.headers['X-Total-Count']), int)
+
+        builder = orm.QueryBuilder().append(orm.Node, tag='node', project='id')
+        builder.order_by({'node': {'id': 'desc'}})
+        self.assertEqual([json.loads(line)['id'] for line in lines], [pk for pk, in builder.all()])
+
     ############### list filters ########################
     def test_computers_filter_id1(self):
         """
@@ -9,8 +9,12 @@
 ###########################################################################
 """Tests for the `aiida.restapi.translator` module."""
 # pylint: disable=invalid-name
+import pytest
+
+from aiida.restapi.common.config import API_CONFIG
+from aiida.restapi.common.utils import NodeCache
 from aiida.restapi.translator.nodes.node import NodeTranslator
-from aiida.orm import Data
+from aiida.orm import Data, Node, QueryBuilder
 
 
 def test_get_all_download_formats():
@@ -22,3 +26,43 @@ def test_get_all_download_formats_missing_get_export_formats(monkeypatch):
     """Test `get_all_download_formats` does not except if a `Data` class does not implement `get_export_formats`."""
     monkeypatch.delattr(Data, 'get_export_formats')
     NodeTranslator.get_all_download_formats()
+
+
+def test_subclasses_discovered_once():
+    """Test that the subclasses of a translator are discovered only once per process."""
+    first = NodeTranslator(**API_CONFIG)
+    second = NodeTranslator(**API_CONFIG)
+    assert first._subclasses is second._subclasses  # pylint: disable=protected-access
+    assert 'StructureTranslator' in first._subclasses  # pylint: disable=protected-access
+
+
+@pytest.mark.usefixtures('clear_database_before_test')
+def test_node_cache():
+    """Test that results of the `NodeCache` are recomputed only when the watermark of the nodes changes."""
+    calls = []
+
+    def count_nodes():
+        calls.append(True)
+        return QueryBuilder().append(Node).count()
+
+    cache = NodeCache(timeout=0)
+    assert cache.get('count', count_nodes) == 0
+    assert cache.get('count', count_nodes) == 0
+    assert len(calls) == 1
+
+    node = Data().store()
+    assert cache.get('count', count_nodes) == 1
+    assert len(calls) == 2
+
+    Node.objects.delete(node.pk)
+    assert cache.get('count', count_nodes) == 0
+    assert len(calls) == 3
+
+    # Within the timeout the result is returned without checking the watermark
+    cache = NodeCache(timeout=3600)
+    assert cache.get('count', count_nodes) == 0
+    Data().store()
+    assert cache.get('count', count_nodes) == 0
+
+    cache.clear()
+    assert cache.get('count', count_nodes) == 1
@@ -1809,6 +1809,90 @@ class TestStructureDataLock(AiidaTestCase):
         b.pbc = [True, True, True]
 
 
+class TestStructureDataColumns(AiidaTestCase):
+    """Tests the vectorized getters and setters of the sites of a structure."""
+
+    def test_get_positions_and_kind_indices(self):
+        """Test that positions and kind indices are returned as arrays in the order of the sites."""
+        import numpy
+
+        a = StructureData(cell=((2., 0., 0.), (0., 2., 0.), (0., 0., 2.)))
+        a.append_atom(symbols='Ba', position=(0., 0., 0.))
+        a.append_atom(symbols='Ti', position=(1., 1., 1.))
+        a.append_atom(symbols='Ba', position=(0., 1., 0.))
+
+        numpy.testing.assert_array_equal(a.get_positions(), [[0., 0., 0.], [1., 1., 1.], [0., 1., 0.]])
+        numpy.testing.assert_array_equal(a.get_kind_indices(), [0, 1, 0])
+        self.assertEqual(a.get_kind_names(), ['Ba', 'Ti'])
+        self.assertEqual(a.get_site_kindnames(), ['Ba', 'Ti', 'Ba'])
+        self.assertEqual(a.get_composition(), {'Ba': 2, 'Ti': 1})
+
+        # The sites are a read-only sequence that creates the Site objects on access
+        self.assertEqual(len(a.sites), 3)
+        self.assertEqual(a.sites[-1].kind_name, 'Ba')
+        self.assertEqual(a.sites[1].position, (1., 1., 1.))
+        self.assertEqual([site.kind_name for site in a.sites[1:]], ['Ti', 'Ba'])
+
+        a.store()
+        numpy.testing.assert_array_equal(a.get_kind_indices(), [0, 1, 0])
+
+        # The arrays that are returned are copies, so modifying them does not change the structure
+        positions = a.get_positions()
+        positions[0] = [3., 3., 3.]
+        numpy.testing.assert_array_equal(a.get_positions()[0], [0., 0., 0.])
+
+    def test_set_positions(self):
+        """Test setting the positions of all sites at once."""
+        import numpy
+
+        a = StructureData(cell=((2., 0., 0.), (0., 2., 0.), (0., 0., 2.)))
+        a.append_atom(symbols='Ba', position=(0., 0., 0.))
+        a.append_atom(symbols='Ti', position=(1., 1., 1.))
+
+        a.set_positions(numpy.array([[0.5, 0.5, 0.5], [1.5, 1.5, 1.5]]))
+        self.assertEqual(a.sites[0].position, (0.5, 0.5, 0.5))
+        self.assertEqual(a.get_site_kindnames(), ['Ba', 'Ti'])
+
+        with self.assertRaises(ValueError):
+            a.set_positions([[0., 0., 0.]])
+
+        with self.assertRaises(ValueError):
+            a.set_positions([[0., 0.], [1., 1.]])
+
+        a.store()
+
+        with self.assertRaises(ModificationNotAllowed):
+            a.set_positions([[0., 0., 0.], [1., 1., 1.]])
+
+    def test_set_sites(self):
+        """Test replacing all sites at once by positions and kind indices."""
+        import numpy
+
+        a = StructureData(cell=((2., 0., 0.), (0., 2., 0.), (0., 0., 2.)))
+        a.append_kind(Kind(symbols='Ba', name='Ba'))
+        a.append_kind(Kind(symbols='Ti', name='Ti'))
+
+        positions = numpy.random.random((100, 3))
+        kind_indices = numpy.arange(100) % 2
+
+        a.set_sites(positions, kind_indices)
+        numpy.testing.assert_array_almost_equal(a.get_positions(), positions)
+        numpy.testing.assert_array_equal(a.get_kind_indices(), kind_indices)
+        self.assertEqual(a.get_formula(), 'Ba50Ti50')
+
+        with self.assertRaises(ValueError):
+            a.set_sites(positions, numpy.arange(100) % 3)
+
+        with self.assertRaises(ValueError):
+            a.set_sites(positions, kind_indices[:10])
+
+        with self.assertRaises(ValueError):
+            a.set_sites(positions, kind_indices.astype(float))
+
+        a.store()
+        self.assertEqual(len(a.sites), 100)
+
+
 class TestStructureDataReload(AiidaTestCase):
     """
     Tests the creation of StructureData, converting it to a raw format and
@@ -2045,3 +2045,89 @@ class TestNodeDeletion(AiidaTestCase):
         with Capturing():
             delete_nodes((node_list[3].pk,), force=True, create_forward=True)
         self._check_existence(uuids_check_existence, uuids_check_deleted)
+
+    def test_chunked_case(self):
+        """Test that deleting in chunks of a single node removes all nodes and their repository folders."""
+        from aiida.common.folders import RepositoryFolder
+        from aiida.orm.utils.repository import Repository
+
+        node_list = self._create_long_graph(5)
+        folders = [RepositoryFolder(section=Repository._section_name, uuid=node.uuid) for node in node_list[3:]]
+        uuids_check_existence = [n.uuid for n in node_list[:3]]
+        uuids_check_deleted = [n.uuid for n in node_list[3:]]
+        with Capturing():
+            delete_nodes((node_list[3].pk,), force=True, chunk_size=1, create_forward=True)
+        self._check_existence(uuids_check_existence, uuids_check_deleted)
+        self.assertFalse(any(folder.exists() for folder in folders))
+
+    def test_interrupted_case(self):
+        """Test that an interrupted chunked deletion is completed by calling it again with the same arguments."""
+        from unittest import mock
+        from aiida.backends import utils
+
+        node_list = self._create_long_graph(5)
+        delete_nodes_and_connections = utils.delete_nodes_and_connections
+        chunks = []
+
+        def interrupt_after_first_chunk(pks):
+            if chunks:
+                raise RuntimeError('interrupted')
+            chunks.append(pks)
+            delete_nodes_and_connections(pks)
+
+        # Deleting the data node `D1` also deletes its creator and everything downstream. The data node is stored before
+        # its creator, so it has the lowest pk and is the only node that is deleted before the interruption.
+        with mock.patch.object(utils, 'delete_nodes_and_connections', interrupt_after_first_chunk):
+            with self.assertRaises(RuntimeError), Capturing():
+                delete_nodes((node_list[2].pk,), force=True, chunk_size=1)
+
+        self.assertEqual(chunks, [[node_list[2].pk]])
+        self._check_existence([n.uuid for n in node_list[:2] + node_list[3:]], [node_list[2].uuid])
+
+        with Capturing() as output:
+            delete_nodes((node_list[2].pk,), force=True, chunk_size=1)
+        self._check_existence([node_list[0].uuid], [n.uuid for n in node_list[1:]])
+        self.assertTrue(any('resuming the interrupted deletion' in line for line in output.stdout_lines))
+
+    def test_interrupted_case_new_starting_nodes(self):
+        """Test that the remaining nodes of an interrupted deletion are traversed like the starting nodes.
+
+        The nodes that are linked to the remaining nodes after the interruption have to be deleted along with them.
+        """
+        from aiida.manage.database.delete.nodes import DELETE_NODES_KEY
+        from aiida.manage.manager import get_manager
+
+        data = orm.Data().store()
+        calculation = orm.CalculationNode()
+        calculation.add_incoming(data, link_type=LinkType.INPUT_CALC, link_label='input')
+        calculation.store()
+
+        # Emulate a deletion of the data node that was interrupted before any node was deleted
+        settings = get_manager().get_backend_manager().get_settings_manager()
+        settings.set(DELETE_NODES_KEY, [data.pk])
+
+        with Capturing():
+            delete_nodes((), force=True)
+        self._check_existence([], [data.uuid, calculation.uuid])
+
+    def test_remove_pending_repositories(self):
+        """Test that the repository folders left behind by an interrupted deletion are removed."""
+        from aiida.common.folders import RepositoryFolder
+        from aiida.common.utils import get_new_uuid
+        from aiida.manage.database.delete.nodes import DELETE_PENDING_KEY, remove_pending_repositories
+        from aiida.manage.manager import get_manager
+        from aiida.orm.utils.repository import Repository
+
+        existing = RepositoryFolder(section=Repository._section_name, uuid=orm.Data().store().uuid)
+        orphan = RepositoryFolder(section=Repository._section_name, uuid=get_new_uuid())
+        existing.create()
+        orphan.create()
+
+        # Emulate a deletion that was interrupted after the nodes were deleted but before the folders were removed
+        settings = get_manager().get_backend_manager().get_settings_manager()
+        settings.set(DELETE_PENDING_KEY, [existing.uuid, orphan.uuid])
+
+        self.assertEqual(remove_pending_repositories(), 1)
+        self.assertFalse(orphan.exists())
+        self.assertTrue(existing.exists())
+        self.assertEqual(remove_pending_repositories(), 0)
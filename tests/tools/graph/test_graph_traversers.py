@@ -9,6 +9,7 @@
 ###########################################################################
 """Tests for aiida.tools.graph.graph_traversers"""
 
+from aiida.common.exceptions import NotExistent
 from aiida.common.links import LinkType
 from aiida.backends.testbase import AiidaTestCase
 from aiida.tools.graph.graph_traversers import traverse_graph, get_nodes_delete
@@ -367,6 +368,69 @@ class TestTraverseGraph(AiidaTestCase):
         with self.assertRaises(TypeError):
             _ = traverse_graph([test_node], links_backward=['not a link'])
 
+    def test_traversal_in_database(self):
+        """Test that the traversal in the database gives the same nodes and links as the rule based traversal."""
+        nodes_dict = create_minimal_graph()
+
+        all_links = [
+            LinkType.INPUT_CALC, LinkType.CALL_CALC, LinkType.CREATE, LinkType.INPUT_WORK, LinkType.CALL_WORK,
+            LinkType.RETURN
+        ]
+        cases = [
+            ((nodes_dict['data_i'].pk,), all_links, ()),
+            ((nodes_dict['data_o'].pk,), (), all_links),
+            ((nodes_dict['calc_0'].pk,), [LinkType.CREATE], [LinkType.CALL_CALC, LinkType.CALL_WORK]),
+            ((nodes_dict['work_1'].pk, nodes_dict['data_o'].pk), all_links, all_links),
+        ]
+
+        for starting_pks, links_forward, links_backward in cases:
+            for max_iterations in [None, 0, 1, 2]:
+                kwargs = {
+                    'max_iterations': max_iterations,
+                    'get_links': True,
+                    'links_forward': links_forward,
+                    'links_backward': links_backward,
+                }
+                self.assertEqual(
+                    traverse_graph(list(starting_pks), in_database=True, **kwargs),
+                    traverse_graph(list(starting_pks), in_database=False, **kwargs),
+                )
+
+        with self.assertRaises(NotExistent):
+            traverse_graph([nodes_dict['data_i'].pk, -1], links_forward=all_links)
+
+    def test_traversal_in_database_failure(self):
+        """Test that a failing traversal in the database does not leave the session with an aborted transaction.
+
+        Only the statements of the traversal should be rolled back, not the changes that are pending in the session.
+        """
+        from unittest import mock
+        from sqlalchemy import text
+        from sqlalchemy.exc import DBAPIError
+        from aiida.backends.general.abstractqueries import AbstractQueryManager
+
+        nodes_dict = create_minimal_graph()
+        starting_pks = [nodes_dict['data_i'].pk]
+        links = [LinkType.INPUT_CALC, LinkType.CREATE]
+        expected = traverse_graph(starting_pks, links_forward=links, in_database=True)
+
+        def fail(session, *_):
+            session.execute(text('SELECT 1 / 0'))
+
+        session = self.backend.get_session()
+        session.execute(text('CREATE TEMPORARY TABLE traverse_graph_pending (id integer)'))
+        session.execute(text('INSERT INTO traverse_graph_pending (id) VALUES (1)'))
+
+        try:
+            with mock.patch.object(AbstractQueryManager, '_traverse_graph_nodes', staticmethod(fail)):
+                with self.assertRaises(DBAPIError):
+                    traverse_graph(starting_pks, links_forward=links, in_database=True)
+
+            self.assertEqual(session.execute(text('SELECT COUNT(*) FROM traverse_graph_pending')).scalar(), 1)
+            self.assertEqual(traverse_graph(starting_pks, links_forward=links, in_database=True), expected)
+        finally:
+            session.rollback()
+
     def test_empty_input(self):
         """Testing empty input."""
 
@@ -8,12 +8,19 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for the Archive class."""
+import io
+import os
 
+from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common.exceptions import InvalidOperation
-from aiida.tools.importexport import Archive, CorruptArchive
+from aiida.common.folders import RepositoryFolder, SandboxFolder
+from aiida.orm.utils.repository import Repository
+from aiida.tools.importexport import Archive, CorruptArchive, copy_node_repositories, export
+from aiida.tools.importexport.dbexport import export_tree
 
 from tests.utils.archives import get_archive_file
+from tests.utils.configuration import with_temp_dir
 
 
 class TestCommonArchive(AiidaTestCase):
@@ -38,3 +45,39 @@ class TestCommonArchive(AiidaTestCase):
         with self.assertRaises(CorruptArchive):
             with Archive(filepath) as archive:
                 archive.version_format  # pylint: disable=pointless-statement
+
+
+class TestCopyNodeRepositories(AiidaTestCase):
+    """Tests for :py:func:`~aiida.tools.importexport.common.archive.copy_node_repositories`."""
+
+    @with_temp_dir
+    def test_copy_node_repositories(self, temp_dir):
+        """Test copying repositories from each archive format directly into the repository."""
+        node = orm.FolderData()
+        node.put_object_from_filelike(io.StringIO('content'), 'sub/file.txt')
+        node.store()
+
+        folder = RepositoryFolder(section=Repository._section_name, uuid=node.uuid)  # pylint: disable=protected-access
+        filepath = folder.get_abs_path(os.path.join('path', 'sub', 'file.txt'))
+
+        for file_format in ['zip', 'tar.gz']:
+            filename = os.path.join(temp_dir, 'export.{}'.format(file_format))
+            export([node], filename=filename, file_format=file_format, silent=True)
+
+            folder.erase()
+            copy_node_repositories(filename, [node.uuid])
+
+            with open(filepath, 'r', encoding='utf8') as handle:
+                self.assertEqual(handle.read(), 'content')
+
+        with SandboxFolder() as sandbox:
+            export_tree([node], folder=sandbox, silent=True)
+
+            folder.erase()
+            copy_node_repositories(sandbox.abspath, [node.uuid])
+
+            with open(filepath, 'r', encoding='utf8') as handle:
+                self.assertEqual(handle.read(), 'content')
+
+            with self.assertRaises(CorruptArchive):
+                copy_node_repositories(sandbox.abspath, [orm.Int(1).store().uuid])
@@ -19,7 +19,7 @@ from aiida.common.folders import SandboxFolder
 from aiida.common.links import LinkType
 from aiida.common.utils import get_new_uuid
 from aiida.tools.importexport import import_data, export
-from aiida.tools.importexport.common.exceptions import DanglingLinkError
+from aiida.tools.importexport.common.exceptions import DanglingLinkError, ImportValidationError
 
 from tests.utils.configuration import with_temp_dir
 from tests.tools.importexport.utils import get_all_node_links
@@ -755,3 +755,49 @@ class TestLinks(AiidaTestCase):
             '(in, out, label, type): {}'.format(len(links), links)
         )
         self.assertListEqual(sorted(links), sorted(before_links))
+
+    @with_temp_dir
+    def test_import_link_validation(self, temp_dir):
+        """Test that duplicate links in an archive are imported once and that invalid links are rejected."""
+        calc = orm.CalculationNode().store()
+        data = orm.Int(1)
+        data.add_incoming(calc, LinkType.CREATE, 'result')
+        data.store()
+        calc.seal()
+
+        filename = os.path.join(temp_dir, 'export.aiida')
+        export([data], filename=filename, file_format='tar.gz', silent=True)
+
+        def write_archive(links, archive):
+            """Write a copy of the archive with the given additional links."""
+            unpack = SandboxFolder()
+            with tarfile.open(filename, 'r:gz', format=tarfile.PAX_FORMAT) as tar:
+                tar.extractall(unpack.abspath)
+
+            with open(unpack.get_abs_path('data.json'), 'r', encoding='utf8') as fhandle:
+                archive_data = json.load(fhandle)
+            archive_data['links_uuid'].extend(links)
+
+            with open(unpack.get_abs_path('data.json'), 'wb') as fhandle:
+                json.dump(archive_data, fhandle)
+
+            with tarfile.open(archive, 'w:gz', format=tarfile.PAX_FORMAT) as tar:
+                tar.add(unpack.abspath, arcname='')
+
+        link = {'input': calc.uuid, 'output': data.uuid, 'label': 'result', 'type': LinkType.CREATE.value}
+        duplicate = os.path.join(temp_dir, 'duplicate.aiida')
+        write_archive([link], duplicate)
+
+        # A second `create` link with a different label violates the unique indegree of `create` links
+        invalid = os.path.join(temp_dir, 'invalid.aiida')
+        write_archive([dict(link, label='other')], invalid)
+
+        self.reset_database()
+
+        import_data(duplicate, silent=True)
+        self.assertEqual(len(get_all_node_links()), 1)
+
+        self.reset_database()
+
+        with self.assertRaises(ImportValidationError):
+            import_data(invalid, silent=True)
@@ -8,6 +8,7 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Simple tests for the export and import routines"""
+import io
 import os
 import shutil
 import tarfile
@@ -181,3 +182,50 @@ class TestSimple(AiidaTestCase):
         folder = SandboxFolder()
         with self.assertRaises(LicensingException):
             export_tree([struct], folder=folder, silent=True, forbidden_licenses=crashing_filter)
+
+    @with_temp_dir
+    def test_stream(self, temp_dir):
+        """Test that a streaming export writes the same data as a regular one and that it can be imported."""
+        from aiida.common.folders import SandboxFolder
+        from aiida.common.links import LinkType
+        from aiida.tools.importexport.common.config import NODES_EXPORT_SUBFOLDER
+        from aiida.tools.importexport.common.utils import export_shard_uuid
+        from aiida.tools.importexport.dbexport import export_tree
+
+        struct = orm.StructureData()
+        struct.put_object_from_filelike(io.StringIO('content'), 'file.txt')
+        struct.store()
+        struct.add_comment('comment')
+
+        calc = orm.CalcJobNode()
+        calc.computer = self.computer
+        calc.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 1})
+        calc.add_incoming(struct, link_type=LinkType.INPUT_CALC, link_label='link')
+        calc.store()
+        calc.seal()
+        calc.logger.critical('log')
+
+        group = orm.Group(label='stream').store()
+        group.add_nodes([calc])
+
+        data = []
+        for stream in (False, True):
+            with SandboxFolder() as folder:
+                export_tree([group], folder=folder, silent=True, stream=stream, batch_size=1)
+                shard = os.path.join(NODES_EXPORT_SUBFOLDER, export_shard_uuid(struct.uuid))
+                self.assertTrue(os.path.isdir(folder.get_abs_path(shard)))
+                with open(folder.get_abs_path('data.json'), 'r', encoding='utf8') as handle:
+                    data.append(json.load(handle))
+
+        self.assertEqual(data[0], data[1])
+
+        filename = os.path.join(temp_dir, 'export.aiida')
+        export([group], filename=filename, silent=True, stream=True)
+
+        self.clean_db()
+        self.create_user()
+
+        import_data(filename, silent=True)
+        self.assertEqual(orm.load_node(struct.uuid).get_object_content('file.txt'), 'content')
+        self.assertEqual(len(orm.load_node(calc.uuid).get_incoming().all()), 1)
+        self.assertEqual(orm.load_group(group.uuid).count(), 1)
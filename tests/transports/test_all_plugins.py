@@ -1278,6 +1278,92 @@ class TestPutGetTree(unittest.TestCase):
                 transport.gettree(os.path.join(dir_remote, 'sub/path'), os.path.join(dir_local, 'sub/path'))
 
 
+class TestPutGetMany(unittest.TestCase):
+    """
+    Test to verify whether the put_many and get_many functions transfer all files and folders.
+    """
+
+    @run_for_all_plugins
+    def test_put_and_get_many(self, custom_transport):  # pylint: disable=no-self-use
+        """Test putting and getting multiple files and folders at once."""
+        import os
+        import tempfile
+
+        contents = {'file_{}.txt'.format(index): 'content {}'.format(index).encode() * index for index in range(10)}
+
+        with tempfile.TemporaryDirectory() as dir_source, tempfile.TemporaryDirectory() as dir_remote, \
+                tempfile.TemporaryDirectory() as dir_target:
+
+            os.makedirs(os.path.join(dir_source, 'sub', 'folder'))
+
+            for filename, content in contents.items():
+                with open(os.path.join(dir_source, filename), 'wb') as handle:
+                    handle.write(content)
+
+            with open(os.path.join(dir_source, 'sub', 'folder', 'nested.txt'), 'wb') as handle:
+                handle.write(b'nested')
+
+            filenames = list(contents.keys()) + ['sub']
+            num_bytes = sum(len(content) for content in contents.values()) + len(b'nested')
+
+            with custom_transport as transport:
+                transport.chdir(dir_remote)
+
+                transfers = [(os.path.join(dir_source, filename), filename) for filename in filenames]
+                assert transport.put_many(transfers) == num_bytes
+                assert sorted(transport.listdir('.')) == sorted(filenames)
+
+                transfers = [(filename, os.path.join(dir_target, filename)) for filename in filenames]
+                transfers.append(('non_existing.txt', os.path.join(dir_target, 'non_existing.txt')))
+                assert transport.get_many(transfers, ignore_nonexisting=True) == num_bytes
+
+            assert sorted(os.listdir(dir_target)) == sorted(filenames)
+
+            for filename, content in contents.items():
+                with open(os.path.join(dir_target, filename), 'rb') as handle:
+                    assert handle.read() == content
+
+            with open(os.path.join(dir_target, 'sub', 'folder', 'nested.txt'), 'rb') as handle:
+                assert handle.read() == b'nested'
+
+    @run_for_all_plugins
+    def test_get_many_archive(self, custom_transport):
+        """Test getting multiple files and folders through an archive, which falls back to getting them one by one."""
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as dir_remote, tempfile.TemporaryDirectory() as dir_target:
+            os.makedirs(os.path.join(dir_remote, 'sub', 'folder'))
+
+            with open(os.path.join(dir_remote, 'file.txt'), 'wb') as handle:
+                handle.write(b'content')
+
+            with open(os.path.join(dir_remote, 'sub', 'folder', 'nested.txt'), 'wb') as handle:
+                handle.write(b'nested')
+
+            transfers = [
+                ('file.txt', os.path.join(dir_target, 'file.txt')),
+                ('sub/folder', os.path.join(dir_target, 'folder')),
+                ('sub/folder/nested.txt', os.path.join(dir_target, 'renamed.txt')),
+                ('non_existing.txt', os.path.join(dir_target, 'non_existing.txt')),
+            ]
+
+            with custom_transport as transport:
+                transport.chdir(dir_remote)
+                assert transport.get_many(transfers, ignore_nonexisting=True, archive=True) == 19
+
+                with self.assertRaises(IOError):
+                    transport.get_many(transfers[-1:], archive=True)
+
+            assert sorted(os.listdir(dir_target)) == ['file.txt', 'folder', 'renamed.txt']
+            assert os.listdir(os.path.join(dir_target, 'folder')) == ['nested.txt']
+
+            for filepath, content in [('file.txt', b'content'), ('folder/nested.txt', b'nested'),
+                                      ('renamed.txt', b'nested')]:
+                with open(os.path.join(dir_target, filepath), 'rb') as handle:
+                    assert handle.read() == content
+
+
 class TestExecuteCommandWait(unittest.TestCase):
     """
     Test some simple command executions and stdin/stdout management.
@@ -61,3 +61,23 @@ def test_gotocomputer():
             """echo '  ** /remote_dir/' ; echo '  ** seems to have been deleted, I logout...' ; fi" """
         )
         assert cmd_str == expected_str
+
+
+def test_get_many_archive(tmp_path):
+    """Test that files are retrieved through an archive, leaving no transfers to be retrieved one by one."""
+    source = tmp_path / 'source'
+    target = tmp_path / 'target'
+    (source / 'sub').mkdir(parents=True)
+    target.mkdir()
+
+    for index in range(10):
+        (source / 'sub' / 'file_{}.txt'.format(index)).write_text('content {}'.format(index))
+
+    transfers = [('sub/file_{}.txt'.format(index), str(target / 'file_{}.txt'.format(index))) for index in range(10)]
+
+    with LocalTransport() as transport:
+        transport.chdir(str(source))
+        assert transport._get_many_archive(transfers, ignore_nonexisting=False) == []  # pylint: disable=protected-access
+
+    for index in range(10):
+        assert (target / 'file_{}.txt'.format(index)).read_text() == 'content {}'.format(index)